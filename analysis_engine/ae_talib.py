@@ -1,18 +1,231 @@
 """
 TA-Lib wrappers
+
+When TA-Lib is not installed the wrappers use the pure NumPy
+functions in ``analysis_engine.np_talib`` which are numerically
+validated against TA-Lib. ``ae_talib.BACKEND`` is ``talib`` or
+``numpy`` depending on which one was loaded.
+
+``ae_talib.cached`` memoizes a wrapper's result for the current
+bar so indicators making the same call share one computation
+(see ``analysis_engine.ta_cache``).
+
+``ae_talib.multi`` computes a wrapper for a list of periods at once
+and returns a ``(periods, bars)`` matrix for parameter sweeps.
+``ae_talib.rows`` computes a wrapper for each row of ``(rows, bars)``
+input matrices like the aligned prices of many tickers.
 """
 
-# for unittests, allow passing the mocks into the runtime if not found
+import numpy as np
+import analysis_engine.np_talib as np_talib
+
+# fall back to the pure numpy implementations if talib is not found
 try:
     import talib as ta
+    BACKEND = 'talib'
 except Exception:
-    import analysis_engine.mocks.mock_talib as ta
-# end of loading talib or mocks
+    import analysis_engine.np_talib as ta
+    BACKEND = 'numpy'
+# end of loading talib or the numpy backend
+
+# streaming kernels for bar-by-bar updates: ae_talib.stream.WILLR(...)
+import analysis_engine.stream_talib as stream  # noqa
 import spylunking.log.setup_logging as log_utils
 
 log = log_utils.build_colorized_logger(name=__name__)
 
 
+def set_read_only(
+        res):
+    """set_read_only
+
+    Mark a shared result (or each array in a tuple
+    of results) as read-only
+
+    :param res: ``numpy.ndarray`` or tuple of arrays
+    """
+    for values in (res if isinstance(res, tuple) else (res,)):
+        if hasattr(values, 'setflags'):
+            values.setflags(write=False)
+    return res
+# end of set_read_only
+
+
+def cached(
+        ohlcv,
+        func,
+        inputs,
+        num_points,
+        **kwargs):
+    """cached
+
+    Call a wrapper in this module (like ``WILLR``) over the
+    trailing ``num_points`` rows of the bar's shared
+    ``analysis_engine.ohlcv_bundle.OHLCVBundle`` and memoize the
+    result in the bundle's ``analysis_engine.ta_cache.TACache``.
+    Indicators making the same call on the same bar share one
+    read-only result
+
+    .. code-block:: python
+
+        real = ae_talib.cached(
+            ohlcv=ohlcv,
+            func='WILLR',
+            inputs={
+                'high': 'high',
+                'low': 'low',
+                'close': 'open'
+            },
+            num_points=14,
+            timeperiod=14)
+
+    :param ohlcv: ``OHLCVBundle`` for the bar
+    :param func: name of the wrapper function
+    :param inputs: dictionary of wrapper argument names
+        to the bundle's column names
+    :param num_points: number of trailing rows
+    :param kwargs: keyword arguments for the wrapper
+    """
+    def compute():
+        args = {
+            arg: ohlcv.window(col, num_points)
+            for arg, col in inputs.items()
+        }
+        args.update(kwargs)
+        return set_read_only(globals()[func](**args))
+    # end of compute
+
+    cache = ohlcv.ta_cache
+    if cache is None:
+        return compute()
+    key = (
+        func,
+        ohlcv.uses_data,
+        ohlcv.start_row + ohlcv.num_rows - 1,
+        num_points,
+        tuple(sorted(inputs.items())),
+        tuple(sorted(kwargs.items())))
+    return cache.get(
+        key=key,
+        compute=compute)
+# end of cached
+
+
+def multi(
+        func,
+        timeperiods,
+        *inputs,
+        verbose=False):
+    """multi
+
+    Call a wrapper in this module (like ``WILLR`` or ``RSI``) for
+    every period in ``timeperiods`` and return the results as a
+    ``(len(timeperiods), len(inputs[0]))`` ``numpy.float64`` matrix.
+    With the ``numpy`` backend functions with an
+    ``analysis_engine.np_talib`` ``<func>_MULTI`` version (``WILLR``
+    and ``RSI``) share one pass over the inputs for all the periods.
+    Otherwise each period is a separate call
+
+    .. code-block:: python
+
+        willr = ae_talib.multi(
+            'WILLR',
+            [10, 14, 20],
+            high,
+            low,
+            close)
+        willr_14 = willr[1]
+
+    :param func: name of the wrapper function
+    :param timeperiods: list of periods
+    :param inputs: input arrays in the wrapper's argument order
+    :param verbose: show logs
+    """
+    timeperiods = [
+        int(timeperiod)
+        for timeperiod in timeperiods
+    ]
+    if verbose:
+        log.info(
+            f'multi - {func} periods={len(timeperiods)}')
+    num_values = len(inputs[0]) if inputs else 0
+    if not timeperiods:
+        return np.empty(
+            (0, num_values),
+            dtype=np.float64)
+    multi_func = getattr(np_talib, f'{func}_MULTI', None)
+    if BACKEND == 'numpy' and multi_func:
+        return multi_func(
+            *inputs,
+            timeperiods=timeperiods)
+    wrapper = globals()[func]
+    return np.vstack([
+        np.asarray(
+            wrapper(*inputs, timeperiod=timeperiod),
+            dtype=np.float64)
+        for timeperiod in timeperiods
+    ])
+# end of multi
+
+
+def rows(
+        func,
+        timeperiod,
+        *inputs,
+        verbose=False):
+    """rows
+
+    Call a wrapper in this module (like ``WILLR`` or ``RSI``) for
+    each row of ``(rows, bars)`` input matrices (like the aligned
+    prices of many tickers from
+    ``analysis_engine.ticker_matrix.TickerMatrix``) and return the
+    results as a ``(rows, bars)`` ``numpy.float64`` matrix. With the
+    ``numpy`` backend functions with an ``analysis_engine.np_talib``
+    ``<func>_ROWS`` version (``WILLR`` and ``RSI``) compute all the
+    rows at once. Otherwise each row is a separate call
+
+    .. code-block:: python
+
+        willr = ae_talib.rows(
+            'WILLR',
+            14,
+            highs,
+            lows,
+            closes)
+        spy_willr = willr[0]
+
+    :param func: name of the wrapper function
+    :param timeperiod: period for every row
+    :param inputs: ``(rows, bars)`` input matrices in the
+        wrapper's argument order
+    :param verbose: show logs
+    """
+    timeperiod = int(timeperiod)
+    shape = np.shape(inputs[0]) if inputs else (0, 0)
+    if verbose:
+        log.info(
+            f'rows - {func} timeperiod={timeperiod} shape={shape}')
+    if shape[0] == 0:
+        return np.empty(
+            shape,
+            dtype=np.float64)
+    rows_func = getattr(np_talib, f'{func}_ROWS', None)
+    if BACKEND == 'numpy' and rows_func:
+        return rows_func(
+            *inputs,
+            timeperiod=timeperiod)
+    wrapper = globals()[func]
+    return np.vstack([
+        np.asarray(
+            wrapper(
+                *[np.ascontiguousarray(values[row]) for values in inputs],
+                timeperiod=timeperiod),
+            dtype=np.float64)
+        for row in range(shape[0])
+    ])
+# end of rows
+
+
 """
 Overlap
 
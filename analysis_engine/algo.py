@@ -76,6 +76,83 @@ datasets from the redis pipeline:
         df_status, use_df = self.get_subscribed_dataset(
             dataset=dataset)
 
+**Indicator Mode**
+
+- ``self.indicator_mode`` - use an algorithm config to set
+    ``process`` (default), ``incremental``, ``precompute`` or
+    ``full_series``. With ``incremental``
+    the ``IndicatorProcessor`` seeds each supported indicator
+    once per minute dataset and then advances its rolling
+    state one bar at a time instead of re-computing over the
+    whole trailing window on every minute. With ``precompute``
+    supported indicators compute their full output column
+    and buy/sell labels in one call before the minute loop,
+    which then only looks up each bar's signals. With
+    ``full_series`` every indicator with a streaming kernel
+    follows the whole series, so recursive indicators
+    (like ``EMA`` or ``RSI``) report different values than
+    ``process``
+
+**Multi-Ticker Workers**
+
+- ``self.ticker_workers`` - use an algorithm config to set the
+    number of forked processes for running multiple tickers in
+    parallel (``0`` or ``1`` runs tickers one after another). In
+    this mode each ticker trades with its own copy of the balance
+    and ``self.ticker_balances`` holds each ticker's ending balance
+
+**Cross-Ticker Indicators**
+
+- ``self.cross_ticker`` - use an algorithm config to set
+    ``true`` for ``daily`` timeseries backtests on many tickers.
+    Before the first ticker runs, the ``IndicatorProcessor`` aligns
+    every ticker's ``daily`` dataset into ``(tickers, dates)``
+    matrices (``analysis_engine.ticker_matrix.TickerMatrix``) and
+    computes the batched indicators (like ``williamsr`` and
+    ``rsi``) for all the tickers at once. Each day then looks up
+    the ticker's values and fills ``self.latest_buys`` and
+    ``self.latest_sells`` like ``indicator_mode=precompute``
+
+**Trading History Mode**
+
+- ``self.history_mode`` - use an algorithm config to set
+    ``dict`` (default) or ``columnar``. With ``columnar`` the
+    ``self.order_history`` is an
+    ``analysis_engine.trade_history_recorder.TradeHistoryRecorder``
+    that stores each history key in a typed column instead of
+    keeping one dictionary per bar. Use ``self.get_history()``
+    for the ``list`` of dictionaries and ``self.get_history_df()``
+    for a ``pandas.DataFrame``
+- ``self.flat_reports`` - use an algorithm config to set ``true``
+    with ``columnar`` to write each bar's indicator report values
+    from ``IndicatorProcessor.get_flat_report()`` straight into the
+    history columns instead of copying the report dictionary into
+    every history record. In this mode ``self.latest_ind_report``
+    only has the ``buys``, ``sells`` and identifier keys, use
+    ``self.get_latest_ind_report()`` for the indicator values
+
+**Streaming Datasets**
+
+- ``self.stream_window`` - use an algorithm config to set the
+    number of recent dataset nodes each ticker keeps in
+    ``self.last_handle_data`` (``0`` keeps every node). Use it with
+    ``handle_data`` on a lazy iterator of ``(ticker, node)`` tuples
+    (see ``analysis_engine.stream_datasets``) so the datasets are
+    only loaded as the algorithm reaches them. Streamed datasets
+    always run in this process, so ``self.ticker_workers`` and
+    ``self.cross_ticker`` are not used (a warning is logged)
+
+**Performance Counters**
+
+- ``self.perf`` - ``analysis_engine.perf_counters.PerfCounters``
+    with the wall time of each backtest phase (``load``,
+    ``seed``, ``bar``, ``indicator``, ``process``, ``trade`` and
+    ``history``) and each indicator. The summary is in
+    ``self.get_result()['perf']`` and the published
+    ``Trading Performance Report``. Use an algorithm config to set
+    ``perf_counters`` (default ``true``) and ``trace_memory``
+    (default ``false``) for ``tracemalloc`` snapshots
+
 **Balance Information**
 
 - ``self.balance`` - current algorithm account balance
@@ -110,7 +187,8 @@ datasets from the redis pipeline:
     a value for selling if a ``minimum`` number of indicators
     detect a value that is within a sell condition
 - ``self.latest_ind_report`` - latest dictionary of values
-    from the ``IndicatorProcessor.process()``
+    from the ``IndicatorProcessor.process()`` (see
+    ``self.get_latest_ind_report()`` with ``flat_reports``)
 - ``self.latest_buys`` - latest indicators saying buy
 - ``self.latest_sells`` - latest indicators saying sell
 - ``self.num_latest_buys`` - latest number of indicators saying buy
@@ -144,13 +222,20 @@ Indicator buy and sell records in ``self.latest_buys`` and
 import os
 import json
 import datetime
+import collections
+import multiprocessing
 import pandas as pd
 import analysis_engine.consts as ae_consts
 import analysis_engine.utils as ae_utils
+import analysis_engine.bar_cursor as bar_cursor
 import analysis_engine.load_history_dataset as load_history_utils
 import analysis_engine.get_data_from_redis_key as redis_get
 import analysis_engine.indicators.indicator_processor as ind_processor
 import analysis_engine.build_trade_history_entry as history_utils
+import analysis_engine.trade_history_recorder as history_recorder
+import analysis_engine.position_ledger as position_ledger
+import analysis_engine.stream_datasets as stream_datasets
+import analysis_engine.perf_counters as perf_utils
 import analysis_engine.plot_trading_history as plot_trading_history
 import analysis_engine.build_buy_order as buy_utils
 import analysis_engine.build_sell_order as sell_utils
@@ -301,6 +386,14 @@ class BaseAlgo:
             serialize_datasets=ae_consts.DEFAULT_SERIALIZED_DATASETS,
             timeseries=None,
             trade_strategy=None,
+            indicator_mode=None,
+            ticker_workers=None,
+            cross_ticker=None,
+            history_mode=None,
+            flat_reports=None,
+            stream_window=None,
+            perf_counters=None,
+            trace_memory=None,
             verbose=False,
             verbose_processor=False,
             verbose_indicators=False,
@@ -513,6 +606,71 @@ class BaseAlgo:
             for backtesting or live trading
             (default is ``count``)
 
+        **Indicator Mode**
+
+        :param indicator_mode: optional - string to
+            set how indicators run on each minute bar:
+            ``process`` re-runs each indicator's ``process``
+            over its trailing window, ``incremental``
+            lets supported indicators advance rolling state
+            in ``O(1)`` per bar and ``precompute`` lets
+            supported indicators compute every bar's signal
+            in one vectorized call before the bar loop. These
+            modes produce identical results. ``full_series``
+            lets every indicator with a streaming kernel
+            follow the whole series instead of re-seeding over
+            its trailing window, so recursive indicators report
+            different values than ``process``
+            (default is ``process``)
+
+        **Multi-Ticker Workers**
+
+        :param ticker_workers: optional - integer number of
+            forked processes for running each ticker's datasets
+            in parallel. Each ticker trades with its own copy
+            of the balance and the results are merged back
+            in ticker order (default is ``0`` which runs
+            tickers one after another sharing the balance)
+
+        **Cross-Ticker Indicators**
+
+        :param cross_ticker: optional - boolean for computing
+            the batched indicators for all tickers at once from
+            aligned ``(tickers, dates)`` matrices before running
+            a ``daily`` timeseries backtest one ticker at a time
+            (default is ``False``)
+
+        **Trading History Mode**
+
+        :param history_mode: optional - string to set how the
+            trading history is stored: ``dict`` appends one
+            dictionary per bar to ``self.order_history`` and
+            ``columnar`` appends each bar into typed columns
+            that are only converted to dictionaries when
+            building results and publishing
+            (default is ``dict``)
+        :param flat_reports: optional - boolean for writing the
+            indicator report values straight into the ``columnar``
+            history columns (default is ``False``)
+
+        **Streaming Datasets**
+
+        :param stream_window: optional - integer number of the
+            most recent dataset nodes to keep per ticker in
+            ``self.last_handle_data`` after they are processed
+            (default is ``0`` which keeps every node). Streamed
+            datasets do not use ``ticker_workers`` or
+            ``cross_ticker``
+
+        **Performance Counters**
+
+        :param perf_counters: optional - boolean for timing
+            each backtest phase and indicator
+            (default is ``True``)
+        :param trace_memory: optional - boolean for recording
+            ``tracemalloc`` snapshots after each dataset
+            (default is ``False``)
+
         **Debugging arguments**
 
         :param verbose: optional - boolean for
@@ -573,7 +731,37 @@ class BaseAlgo:
         self.trade_strategy = trade_strategy
         if not self.trade_strategy:
             self.trade_strategy = 'count'
+        self.indicator_mode = indicator_mode
+        if not self.indicator_mode:
+            self.indicator_mode = 'process'
+        self.ticker_workers = ticker_workers
+        if not self.ticker_workers:
+            self.ticker_workers = 0
+        self.ticker_balances = {}
+        self.cross_ticker = cross_ticker
+        if not self.cross_ticker:
+            self.cross_ticker = False
+        # each ticker's full daily dataset from prepare_cross_ticker
+        self.cross_ticker_datasets = {}
+        self.history_mode = history_mode
+        if not self.history_mode:
+            self.history_mode = 'dict'
+        self.flat_reports = flat_reports
+        if not self.flat_reports:
+            self.flat_reports = False
+        self.stream_window = stream_window
+        if not self.stream_window:
+            self.stream_window = 0
+        self.perf_counters = perf_counters
+        if self.perf_counters is None:
+            self.perf_counters = True
+        self.trace_memory = trace_memory
+        if not self.trace_memory:
+            self.trace_memory = False
+        self.perf = None
         self.timeseries_value = ae_consts.ALGO_TIMESERIES_MINUTE
+        self.indicator_mode_value = ae_consts.ALGO_INDICATOR_MODE_PROCESS
+        self.history_mode_value = ae_consts.ALGO_HISTORY_MODE_DICT
         self.trade_horizon = 5
         self.commission = commission
         self.result = None
@@ -611,7 +799,8 @@ class BaseAlgo:
         self.order_history = []
         self.config_file = config_file
         self.config_dict = config_dict
-        self.positions = {}
+        self.ledger = position_ledger.PositionLedger()
+        self.positions = self.ledger.positions
         self.created_on_date = datetime.datetime.utcnow()
         self.created_date = self.created_on_date.strftime(
             ae_consts.COMMON_TICK_DATE_FORMAT)
@@ -635,6 +824,7 @@ class BaseAlgo:
         self.ds_data = None
         self.df_daily = pd.DataFrame([{}])
         self.df_minute = pd.DataFrame([{}])
+        self.minute_cursor = None
         self.df_stats = pd.DataFrame([{}])
         self.df_peers = pd.DataFrame([{}])
         self.df_financials = pd.DataFrame([])
@@ -1056,6 +1246,29 @@ class BaseAlgo:
         else:
             self.trade_off_num_indicators = True
 
+        self.ticker_workers = int(self.ticker_workers)
+        self.cross_ticker = bool(self.cross_ticker)
+        self.flat_reports = bool(self.flat_reports)
+        self.stream_window = int(self.stream_window)
+        self.perf = perf_utils.PerfCounters(
+            enabled=bool(self.perf_counters),
+            trace_memory=bool(self.trace_memory))
+
+        self.indicator_mode = str(self.indicator_mode).lower()
+        self.indicator_mode_value = ae_consts.ALGO_INDICATOR_MODES.get(
+            self.indicator_mode,
+            ae_consts.ALGO_INDICATOR_MODE_PROCESS)
+
+        self.history_mode = str(self.history_mode).lower()
+        self.history_mode_value = ae_consts.ALGO_HISTORY_MODES.get(
+            self.history_mode,
+            ae_consts.ALGO_HISTORY_MODE_DICT)
+        self.order_history = self.build_order_history()
+
+        # the ledger and algorithm share one positions dictionary
+        self.ledger.set_positions(
+            positions=self.positions)
+
         self.indicator_datasets = []
         self.determine_indicator_datasets()
 
@@ -1072,6 +1285,18 @@ class BaseAlgo:
                 raise Exception(err)
             self.iproc_label = self.iproc.get_label()
             self.num_indicators = self.iproc.get_num_indicators()
+            if hasattr(self.iproc, 'set_perf_counters'):
+                self.iproc.set_perf_counters(
+                    perf=self.perf)
+            if hasattr(self.iproc, 'set_lazy_report'):
+                # the history columns are written from the flat
+                # report so only build the report dictionary
+                # when it is read
+                self.iproc.set_lazy_report(
+                    lazy_report=(
+                        self.flat_reports and
+                        self.history_mode_value ==
+                        ae_consts.ALGO_HISTORY_MODE_COLUMNAR))
             self.min_buy_indicators = self.buy_rules.get(
                 'min_indicators',
                 self.num_indicators)
@@ -1293,6 +1518,11 @@ class BaseAlgo:
                         'news': pd.DataFrame
                     }
                 }
+
+            In a ``minute`` timeseries ``minute`` only holds the
+            trailing rows the indicators read (see
+            ``IndicatorProcessor.get_dataset_window``) and
+            ``self.df_minute`` holds every minute of the day
         """
 
         use_date = self.trade_date
@@ -1727,6 +1957,8 @@ class BaseAlgo:
             # end for all self.last_handle_data[ticker]
         # end of converting dataset
 
+        output_record['perf'] = self.perf.get_summary()
+
         return output_record
     # end of create_report_dataset
 
@@ -2226,24 +2458,12 @@ class BaseAlgo:
 
         :param ticker: ticker to lookup
         """
-        buys = None
-        sells = None
-        num_owned = None
-        self.num_buys = 0
-        self.num_sells = 0
-        if ticker in self.positions:
-            num_owned = self.positions[ticker].get(
-                'shares',
-                None)
-            buys = self.positions[ticker].get(
-                'buys',
-                [])
-            sells = self.positions[ticker].get(
-                'sells',
-                [])
-            self.num_buys = len(buys)
-            self.num_sells = len(sells)
-        # if own the ticker
+        (num_owned,
+         buys,
+         sells,
+         self.num_buys,
+         self.num_sells) = self.ledger.get_position(
+            ticker=ticker)
 
         self.net_value = ae_consts.to_f(self.balance)
         if self.latest_close and num_owned:
@@ -2324,6 +2544,66 @@ class BaseAlgo:
         return history_dict
     # end of get_trade_history_node
 
+    def build_order_history(
+            self):
+        """build_order_history
+
+        Build an empty trading history for the ``history_mode``:
+        a ``list`` for ``dict`` or a
+        ``TradeHistoryRecorder`` for ``columnar``
+        """
+        if self.history_mode_value == ae_consts.ALGO_HISTORY_MODE_COLUMNAR:
+            return history_recorder.TradeHistoryRecorder()
+        return []
+    # end of build_order_history
+
+    def get_history(
+            self):
+        """get_history
+
+        Get the trading history as a ``list`` of dictionaries
+        (exports the columns when ``history_mode`` is ``columnar``)
+        """
+        if isinstance(
+                self.order_history,
+                history_recorder.TradeHistoryRecorder):
+            return self.order_history.to_records()
+        return self.order_history
+    # end of get_history
+
+    def get_history_df(
+            self):
+        """get_history_df
+
+        Get the trading history as a ``pandas.DataFrame``
+        """
+        if isinstance(
+                self.order_history,
+                history_recorder.TradeHistoryRecorder):
+            return self.order_history.to_df()
+        return pd.DataFrame(self.order_history)
+    # end of get_history_df
+
+    def get_history_column(
+            self,
+            key):
+        """get_history_column
+
+        Get a ``list`` of one key's values from every trading
+        history record (``None`` for records missing the key)
+
+        :param key: trading history key like ``net_value``
+        """
+        if isinstance(
+                self.order_history,
+                history_recorder.TradeHistoryRecorder):
+            return self.order_history.get_column(key)
+        return [
+            node.get(key, None)
+            for node in self.order_history
+        ]
+    # end of get_history_column
+
     def load_from_config(
             self,
             config_dict):
@@ -2366,13 +2646,15 @@ class BaseAlgo:
             'name': self.name,
             'created': self.created_date,
             'updated': finished_date,
-            'open_positions': self.positions,
+            'open_positions': position_ledger.positions_to_dicts(
+                self.positions),
             'buys': self.get_buys(),
             'sells': self.get_sells(),
             'num_processed': len(self.order_history),
-            'history': self.order_history,
+            'history': self.get_history(),
             'balance': self.balance,
-            'commission': self.commission
+            'commission': self.commission,
+            'perf': self.perf.get_summary()
         }
 
         return self.result
@@ -2409,14 +2691,20 @@ class BaseAlgo:
 
     def get_buys(
             self):
-        """get_buys"""
-        return self.buys
+        """get_buys
+
+        Get all buy orders as a ``list`` of dictionaries
+        """
+        return position_ledger.to_dicts(self.buys)
     # end of get_buys
 
     def get_sells(
             self):
-        """get_sells"""
-        return self.sells
+        """get_sells
+
+        Get all sell orders as a ``list`` of dictionaries
+        """
+        return position_ledger.to_dicts(self.sells)
     # end of get_sells
 
     def get_history_dataset(
@@ -2442,12 +2730,8 @@ class BaseAlgo:
 
         :param ticker: ticker to lookup
         """
-        num_owned = 0
-        if ticker in self.positions:
-            num_owned = self.positions[ticker].get(
-                'shares',
-                None)
-        return num_owned
+        return self.ledger.get_owned_shares(
+            ticker=ticker)
     # end of get_owned_shares
 
     def create_buy_order(
@@ -2540,25 +2824,13 @@ class BaseAlgo:
             if not prev_shares:
                 prev_shares = 0
             prev_bal = ae_consts.to_f(self.balance)
+            new_buy, created_position = self.ledger.record_order(
+                ticker=ticker,
+                order=new_buy,
+                is_buy=True)
             if new_buy['status'] == ae_consts.TRADE_FILLED:
-                if ticker in self.positions:
-                    self.positions[ticker]['shares'] = int(
-                        new_buy['shares'])
-                    self.positions[ticker]['buys'].append(
-                        new_buy)
-                    (self.num_owned,
-                     self.ticker_buys,
-                     self.ticker_sells) = self.get_ticker_positions(
-                        ticker=ticker)
+                if not created_position:
                     self.created_buy = True
-                else:
-                    self.positions[ticker] = {
-                        'shares': new_buy['shares'],
-                        'buys': [
-                            new_buy
-                        ],
-                        'sells': []
-                    }
                 self.balance = new_buy['balance']
                 if self.verbose_trading:
                     log.info(
@@ -2587,11 +2859,12 @@ class BaseAlgo:
             # record the ticker's event if it's a minute timeseries
             if minute:
                 self.last_history_dict = self.get_trade_history_node()
-                if self.latest_ind_report:
-                    for k in self.latest_ind_report:
+                latest_ind_report = self.get_latest_ind_report()
+                if latest_ind_report:
+                    for k in latest_ind_report:
                         if k not in self.ind_conf_ignore_keys:
                             self.last_history_dict[k] = (
-                                self.latest_ind_report[k])
+                                latest_ind_report[k])
         except Exception as e:
             self.debug_msg = (
                 f'{self.name} - buy {ticker}@{close} - FAILED with ex={e}')
@@ -2688,25 +2961,13 @@ class BaseAlgo:
             if not prev_shares:
                 prev_shares = 0
             prev_bal = ae_consts.to_f(self.balance)
+            new_sell, created_position = self.ledger.record_order(
+                ticker=ticker,
+                order=new_sell,
+                is_buy=False)
             if new_sell['status'] == ae_consts.TRADE_FILLED:
-                if ticker in self.positions:
-                    self.positions[ticker]['shares'] = int(
-                        new_sell['shares'])
-                    self.positions[ticker]['sells'].append(
-                        new_sell)
-                    (self.num_owned,
-                     self.ticker_buys,
-                     self.ticker_sells) = self.get_ticker_positions(
-                        ticker=ticker)
+                if not created_position:
                     self.created_sell = True
-                else:
-                    self.positions[ticker] = {
-                        'shares': new_sell['shares'],
-                        'buys': [],
-                        'sells': [
-                            new_sell
-                        ]
-                    }
                 self.balance = new_sell['balance']
                 if self.verbose_trading:
                     log.info(
@@ -2735,11 +2996,12 @@ class BaseAlgo:
             # record the ticker's event if it's a minute timeseries
             if minute:
                 self.last_history_dict = self.get_trade_history_node()
-                if self.latest_ind_report:
-                    for k in self.latest_ind_report:
+                latest_ind_report = self.get_latest_ind_report()
+                if latest_ind_report:
+                    for k in latest_ind_report:
                         if k not in self.ind_conf_ignore_keys:
                             self.last_history_dict[k] = (
-                                self.latest_ind_report[k])
+                                latest_ind_report[k])
         except Exception as e:
             self.debug_msg = (
                 f'{self.name} - sell {ticker}@{close} - FAILED with ex={e}')
@@ -2759,8 +3021,11 @@ class BaseAlgo:
         create a progress label string for the logs
 
         :param progress: progress counter
-        :param total: total number of counts
+        :param total: total number of counts (``None`` if
+            the total is not known like when streaming datasets)
         """
+        if not total:
+            return f'{progress}/?'
         percent_done = ae_consts.get_percent_done(
             progress=progress,
             total=total)
@@ -2956,52 +3221,56 @@ class BaseAlgo:
         # by default assume close of trading for the day
         self.use_minute = f'{self.trade_date} 16:00:00'
 
+        # the minute cursor is only built if the minute
+        # loop steps through the bars
+        self.minute_cursor = None
+
         try:
             if hasattr(self.df_daily, 'index'):
                 columns = list(self.df_daily.columns.values)
                 if 'high' in columns:
                     self.today_high = float(
-                        self.df_daily.iloc[-1]['high'])
+                        self.df_daily['high'].iat[-1])
                     self.latest_high = self.today_high
                 if 'low' in columns:
                     self.today_low = float(
-                        self.df_daily.iloc[-1]['low'])
+                        self.df_daily['low'].iat[-1])
                     self.latest_low = self.today_low
                 if 'open' in columns:
                     self.today_open = float(
-                        self.df_daily.iloc[-1]['open'])
+                        self.df_daily['open'].iat[-1])
                     self.latest_open = self.today_open
                 if 'close' in columns:
                     self.today_close = float(
-                        self.df_daily.iloc[-1]['close'])
+                        self.df_daily['close'].iat[-1])
                     self.trade_price = self.today_close
                     self.latest_close = self.trade_price
                     if not self.starting_close:
                         self.starting_close = self.today_close
                 if 'volume' in columns:
                     self.today_volume = int(
-                        self.df_daily.iloc[-1]['volume'])
+                        self.df_daily['volume'].iat[-1])
                     self.latest_volume = self.today_volume
             if hasattr(self.df_minute, 'index'):
                 columns = list(self.df_minute.columns.values)
                 if 'high' in columns:
                     self.latest_high = float(
-                        self.df_minute.iloc[-1]['high'])
+                        self.df_minute['high'].iat[-1])
                 if 'low' in columns:
                     self.latest_low = float(
-                        self.df_minute.iloc[-1]['low'])
+                        self.df_minute['low'].iat[-1])
                 if 'open' in columns:
                     self.latest_open = float(
-                        self.df_minute.iloc[-1]['open'])
+                        self.df_minute['open'].iat[-1])
                 if 'close' in columns:
                     self.latest_close = float(
-                        self.df_minute.iloc[-1]['close'])
+                        self.df_minute['close'].iat[-1])
                     self.trade_price = self.latest_close
                     if not self.starting_close:
                         self.starting_close = self.latest_close
                 if 'volume' in columns:
                     self.latest_volume = int(
-                        self.df_minute.iloc[-1]['volume'])
+                        self.df_minute['volume'].iat[-1])
         except Exception as e:
             self.debug_msg = (
                 f'{self.name} handle - FAILED getting latest prices '
@@ -3027,7 +3296,7 @@ class BaseAlgo:
         self.loaded_dataset = None
         self.last_history_dict = None
         self.last_handle_data = None
-        self.order_history = []
+        self.order_history = self.build_order_history()
         self.use_minute = None
         self.intraday_start_min = None
         self.intraday_end_min = None
@@ -3085,6 +3354,66 @@ class BaseAlgo:
         # end of while minutes to add to the self.intraday_events dict
     # end of populate_intraday_events_dict
 
+    def append_history_with_report(
+            self,
+            history_dict):
+        """append_history_with_report
+
+        Add the latest indicator report's keys (except
+        ``self.ind_conf_ignore_keys``) to a trading history
+        record and append it to ``self.order_history``. With
+        ``flat_reports`` and ``columnar`` history the values are
+        written straight into the history columns from
+        ``IndicatorProcessor.get_flat_report()``
+
+        :param history_dict: trading history record
+        """
+        if not self.latest_ind_report:
+            self.order_history.append(history_dict)
+            return
+        flat_report = None
+        use_flat_report = (
+            self.flat_reports and
+            self.iproc and
+            self.latest_ind_report is self.iproc.latest_report and
+            isinstance(
+                self.order_history,
+                history_recorder.TradeHistoryRecorder))
+        if use_flat_report:
+            flat_report = self.iproc.get_flat_report()
+        if flat_report:
+            self.order_history.append(
+                history_dict,
+                keys=flat_report[0],
+                values=flat_report[1])
+            return
+        latest_ind_report = self.get_latest_ind_report()
+        for k in latest_ind_report:
+            if k not in self.ind_conf_ignore_keys:
+                history_dict[k] = latest_ind_report[k]
+        self.order_history.append(history_dict)
+    # end of append_history_with_report
+
+    def get_latest_ind_report(
+            self):
+        """get_latest_ind_report
+
+        Get ``self.latest_ind_report`` with the indicator values.
+        With ``flat_reports`` and ``columnar`` history the
+        ``IndicatorProcessor`` only builds the values into the
+        report dictionary when this is called
+        """
+        if (self.iproc and
+                self.latest_ind_report is not None and
+                self.latest_ind_report is getattr(
+                    self.iproc,
+                    'latest_report',
+                    None) and
+                hasattr(self.iproc, 'build_latest_report')):
+            return self.iproc.build_latest_report()
+        return self.latest_ind_report
+    # end of get_latest_ind_report
+
     def record_trade_history_for_dataset(
             self,
             node):
@@ -3114,23 +3443,15 @@ class BaseAlgo:
             self.use_minute = f'{self.trade_date} 16:00:00'
             self.last_history_dict = self.get_trade_history_node()
             if self.last_history_dict:
-                if self.latest_ind_report:
-                    for k in self.latest_ind_report:
-                        if k not in self.ind_conf_ignore_keys:
-                            self.last_history_dict[k] = (
-                                self.latest_ind_report[k])
-                self.order_history.append(self.last_history_dict)
+                self.append_history_with_report(
+                    history_dict=self.last_history_dict)
         # end of if day timeseries
         elif (use_minute_timeseries and self.found_minute_data):
             # add the end of day point to the history
             self.last_history_dict = self.get_trade_history_node()
             if self.last_history_dict:
-                if self.latest_ind_report:
-                    for k in self.latest_ind_report:
-                        if k not in self.ind_conf_ignore_keys:
-                            self.last_history_dict[k] = (
-                                self.latest_ind_report[k])
-                self.order_history.append(self.last_history_dict)
+                self.append_history_with_report(
+                    history_dict=self.last_history_dict)
         else:
             raise Exception(
                 f'Unsupported self.timeseries={self.timeseries} and '
@@ -3182,10 +3503,32 @@ class BaseAlgo:
                     ]
                 }
 
+            ``data`` can also be a lazy iterator of
+            ``(ticker, dataset)`` tuples or a dictionary of
+            ticker to a generator of datasets (see
+            ``handle_data_stream``)
         """
 
         self.debug_msg = (
             f'{self.name} handle - start')
+        self.perf.start_run()
+
+        is_stream = (
+            not self.loaded_dataset and (
+                not isinstance(data, dict) or
+                any(not isinstance(data[k], list) for k in data)))
+        if is_stream or self.stream_window > 0:
+            if self.ticker_workers > 1 or self.cross_ticker:
+                log.warning(
+                    f'{self.name} handle - streamed datasets '
+                    f'(stream_window={self.stream_window}) run each '
+                    'ticker in this process without '
+                    f'ticker_workers={self.ticker_workers} or '
+                    f'cross_ticker={self.cross_ticker}')
+            self.handle_data_stream(
+                data=data)
+            self.perf.finish_run()
+            return
 
         if self.loaded_dataset:
             if self.verbose:
@@ -3205,95 +3548,465 @@ class BaseAlgo:
                 f'{self.name} handle - '
                 f'tickers={json.dumps(data_for_tickers)}')
 
-        for ticker in data_for_tickers:
-            num_ticker_datasets = len(data[ticker])
-            cur_idx = 1
-            for idx, node in enumerate(data[ticker]):
-                node_date = node.get('date', 'missing-date')
-                track_label = self.build_progress_label(
-                    progress=cur_idx,
-                    total=num_ticker_datasets)
-                algo_id = (
-                    f'{ticker} {track_label}')
-                self.debug_msg = (
-                    f'{self.name} handle - {algo_id} - '
-                    f'id={node["id"]} ds={node_date}')
-
-                valid_run = False
-                if self.run_this_date:
-                    if node_date == self.run_this_date:
-                        log.critical(
-                            f'{self.name} handle - starting at '
-                            f'date={node_date} with just this dataset: ')
-                        log.info(
-                            f'{node["data"]}')
-                        valid_run = True
-                        self.verbose = True
-                        self.verbose_trading = True
-
-                        if self.inspect_dataset:
-                            self.view_date_dataset_records(
-                                algo_id=algo_id,
-                                ticker=ticker,
-                                node=node)
-                else:
-                    valid_run = True
+        use_ticker_workers = (
+            self.ticker_workers > 1 and
+            num_tickers > 1 and
+            not self.run_this_date)
+        if use_ticker_workers:
+            self.handle_tickers_in_workers(
+                data=data,
+                tickers=data_for_tickers)
+        else:
+            use_cross_ticker = (
+                self.cross_ticker and
+                self.iproc and
+                self.timeseries_value == ae_consts.ALGO_TIMESERIES_DAY and
+                not self.run_this_date)
+            if use_cross_ticker:
+                self.prepare_cross_ticker(
+                    data=data,
+                    tickers=data_for_tickers)
+            for ticker in data_for_tickers:
+                if use_cross_ticker:
+                    self.iproc.load_ticker_batches(
+                        algo_id=f'{ticker} cross-ticker',
+                        ticker=ticker,
+                        dataset=self.cross_ticker_datasets[ticker],
+                        uses_data='daily')
+                self.handle_ticker_datasets(
+                    ticker=ticker,
+                    datasets=data[ticker])
+            # end of for all supported tickers
+            self.cross_ticker_datasets = {}
+        # for all supported tickers
+
+        # store the last handle dataset
+        self.last_handle_data = data
 
-                if valid_run:
-                    self.ticker = ticker
-                    self.prev_bal = self.balance
-                    self.prev_num_owned = self.num_owned
+        self.perf.finish_run()
+        self.debug_msg = (
+            f'{self.name} handle - end tickers={num_tickers}')
 
-                    (self.num_owned,
-                     self.ticker_buys,
-                     self.ticker_sells) = self.get_ticker_positions(
-                        ticker=ticker)
+    # end of handle_data
 
-                    use_daily_timeseries = (
-                        self.timeseries_value == ae_consts.ALGO_TIMESERIES_DAY)
+    def prepare_cross_ticker(
+            self,
+            data,
+            tickers):
+        """prepare_cross_ticker
+
+        Pick each ticker's longest ``daily`` dataset (usually
+        the last node's) as the full history and compute the
+        batched indicators for all the tickers with
+        ``self.iproc.precompute_tickers``
+
+        :param data: dictionary of ticker to a list of
+            dataset nodes (see ``handle_data``)
+        :param tickers: list of tickers to prepare
+        """
+        self.perf.mark()
+        self.cross_ticker_datasets = {}
+        for ticker in tickers:
+            use_df = None
+            for node in data[ticker]:
+                df = node.get('data', {}).get('daily', None)
+                if not hasattr(df, 'index'):
+                    continue
+                if use_df is None or len(df.index) > len(use_df.index):
+                    use_df = df
+            # end of for all nodes
+            self.cross_ticker_datasets[ticker] = {
+                'data': {
+                    'daily': use_df
+                }
+            }
+        # end of for all tickers
 
-                    node['data']['custom'] = self.include_custom
+        matrix = self.iproc.precompute_tickers(
+            datasets=self.cross_ticker_datasets,
+            uses_data='daily')
+        self.perf.lap('seed')
+        if self.verbose:
+            log.info(
+                f'{self.name} handle - cross_ticker '
+                f'tickers={len(matrix)} dates={matrix.num_dates}')
+    # end of prepare_cross_ticker
 
-                    if use_daily_timeseries:
-                        self.handle_daily_dataset(
-                            algo_id=algo_id,
-                            ticker=ticker,
-                            node=node)
-                    else:
-                        self.handle_minute_dataset(
-                            algo_id=algo_id,
-                            ticker=ticker,
-                            node=node,
-                            start_row=node.get('start_row', 0))
-                    # end of processing datasets for day vs minute
-                # if not debugging a specific dataset in the cache
-
-                if (self.show_balance and
-                        (self.num_buys > 0 or self.num_sells > 0)):
-                    self.debug_msg = (
-                        f'{self.name} handle - plot start balance')
-                    self.plot_trading_history_with_balance(
+    def get_cross_ticker_bar_idx(
+            self,
+            ticker,
+            node):
+        """get_cross_ticker_bar_idx
+
+        Get the position of the node's last ``daily`` row in
+        the ticker's full history from ``prepare_cross_ticker``
+        or ``None`` if the node's ``daily`` dataset is not the
+        first rows of the full history
+
+        :param ticker: string - ticker
+        :param node: dataset node
+        """
+        full_df = self.cross_ticker_datasets.get(
+            ticker,
+            {}).get('data', {}).get('daily', None)
+        df = node.get('data', {}).get('daily', None)
+        if not hasattr(full_df, 'index') or not hasattr(df, 'index'):
+            return None
+        num_rows = len(df.index)
+        if num_rows == 0 or num_rows > len(full_df.index):
+            return None
+        if df is not full_df:
+            if 'date' not in df or 'date' not in full_df:
+                return None
+            if (df['date'].iloc[-1] !=
+                    full_df['date'].iloc[num_rows - 1]):
+                return None
+        return num_rows - 1
+    # end of get_cross_ticker_bar_idx
+
+    def handle_ticker_datasets(
+            self,
+            ticker,
+            datasets):
+        """handle_ticker_datasets
+
+        Run the algorithm across all of a ticker's datasets
+        in order
+
+        :param ticker: string - ticker
+        :param datasets: list of dataset nodes for the ticker
+            (``data[ticker]`` in ``handle_data``)
+        """
+        num_ticker_datasets = len(datasets)
+        cur_idx = 1
+        for idx, node in enumerate(datasets):
+            self.handle_ticker_dataset(
+                ticker=ticker,
+                node=node,
+                progress=cur_idx,
+                total=num_ticker_datasets)
+            cur_idx += 1
+    # end of handle_ticker_datasets
+
+    def handle_ticker_dataset(
+            self,
+            ticker,
+            node,
+            progress,
+            total=None):
+        """handle_ticker_dataset
+
+        Run the algorithm on one of a ticker's dataset nodes
+
+        :param ticker: string - ticker
+        :param node: dataset node with ``id``, ``date``
+            and ``data`` keys
+        :param progress: position of the node in the
+            ticker's datasets (starting at ``1``)
+        :param total: optional - number of datasets for the
+            ticker (``None`` if it is not known yet)
+        """
+        node_date = node.get('date', 'missing-date')
+        track_label = self.build_progress_label(
+            progress=progress,
+            total=total)
+        algo_id = (
+            f'{ticker} {track_label}')
+        self.debug_msg = (
+            f'{self.name} handle - {algo_id} - '
+            f'id={node["id"]} ds={node_date}')
+
+        valid_run = False
+        if self.run_this_date:
+            if node_date == self.run_this_date:
+                log.critical(
+                    f'{self.name} handle - starting at '
+                    f'date={node_date} with just this dataset: ')
+                log.info(
+                    f'{node["data"]}')
+                valid_run = True
+                self.verbose = True
+                self.verbose_trading = True
+
+                if self.inspect_dataset:
+                    self.view_date_dataset_records(
                         algo_id=algo_id,
                         ticker=ticker,
                         node=node)
-                    self.debug_msg = (
-                        f'{self.name} handle - plot done balance')
-                # if showing plots while the algo runs
+        else:
+            valid_run = True
 
-                if self.verbose:
-                    log.info(
-                        f'{self.name} done {node_date}')
+        if valid_run:
+            self.ticker = ticker
+            self.prev_bal = self.balance
+            self.prev_num_owned = self.num_owned
 
-                cur_idx += 1
-        # for all supported tickers
+            (self.num_owned,
+             self.ticker_buys,
+             self.ticker_sells) = self.get_ticker_positions(
+                ticker=ticker)
 
-        # store the last handle dataset
-        self.last_handle_data = data
+            use_daily_timeseries = (
+                self.timeseries_value == ae_consts.ALGO_TIMESERIES_DAY)
+
+            node['data']['custom'] = self.include_custom
+
+            if use_daily_timeseries:
+                self.handle_daily_dataset(
+                    algo_id=algo_id,
+                    ticker=ticker,
+                    node=node)
+            else:
+                self.handle_minute_dataset(
+                    algo_id=algo_id,
+                    ticker=ticker,
+                    node=node,
+                    start_row=node.get('start_row', 0))
+            # end of processing datasets for day vs minute
+        # if not debugging a specific dataset in the cache
+
+        if (self.show_balance and
+                (self.num_buys > 0 or self.num_sells > 0)):
+            self.debug_msg = (
+                f'{self.name} handle - plot start balance')
+            self.plot_trading_history_with_balance(
+                algo_id=algo_id,
+                ticker=ticker,
+                node=node)
+            self.debug_msg = (
+                f'{self.name} handle - plot done balance')
+        # if showing plots while the algo runs
+
+        self.perf.snapshot_memory(
+            label=node.get('id', node_date))
+
+        if self.verbose:
+            log.info(
+                f'{self.name} done {node_date}')
+    # end of handle_ticker_dataset
+
+    def handle_data_stream(
+            self,
+            data):
+        """handle_data_stream
+
+        Process dataset nodes one at a time as they are pulled
+        from ``data`` and only keep the ``self.stream_window``
+        most recent nodes per ticker in ``self.last_handle_data``
+        (``0`` keeps every node). Ticker workers are not used
+        for streams because the nodes are not loaded up front
+
+        :param data: a lazy iterator of ``(ticker, node)`` tuples
+            (like ``analysis_engine.stream_datasets.prefetch_nodes``)
+            or a dictionary of ticker to a ``list`` or generator
+            of dataset nodes (see ``handle_data``)
+        """
+        nodes = data
+        if isinstance(data, dict):
+            nodes = stream_datasets.iter_ticker_nodes(
+                data=data,
+                tickers=self.get_supported_tickers_in_data(
+                    data=data))
+
+        window = None
+        if self.stream_window > 0:
+            window = self.stream_window
+        self.last_handle_data = {}
+        num_handled = {}
+        for ticker, node in nodes:
+            if ticker not in self.tickers:
+                continue
+            if ticker not in self.last_handle_data:
+                self.last_handle_data[ticker] = collections.deque(
+                    maxlen=window)
+                num_handled[ticker] = 0
+            num_handled[ticker] += 1
+            self.handle_ticker_dataset(
+                ticker=ticker,
+                node=node,
+                progress=num_handled[ticker])
+            self.last_handle_data[ticker].append(node)
+        # end of for all streamed nodes
 
         self.debug_msg = (
-            f'{self.name} handle - end tickers={num_tickers}')
+            f'{self.name} handle - end stream '
+            f'tickers={len(num_handled)} '
+            f'datasets={sum(num_handled.values())}')
+    # end of handle_data_stream
 
-    # end of handle_data
+    def handle_tickers_in_workers(
+            self,
+            data,
+            tickers):
+        """handle_tickers_in_workers
+
+        Fan the ``tickers`` out over a ``multiprocessing.Pool``
+        with up to ``self.ticker_workers`` forked processes. Each
+        ticker runs in a new process forked from this algorithm
+        (so no state from another ticker leaks into it), trades
+        with its own copy of the current balance and returns its
+        trading history, buys, sells, position, balance and perf
+        counters. The results are merged back in ``tickers`` order
+        so runs match running the tickers one after another:
+
+        - ``self.order_history``, ``self.buys`` and ``self.sells``
+          are extended in ``tickers`` order with the balance keys
+          moved by the net gain or loss of the tickers before it
+        - every ticker uses the ``algo_start_price`` from the
+          first ticker's first dataset
+        - ``self.positions[ticker]`` is set from each worker
+        - ``self.balance`` changes by each ticker's net gain or
+          loss (also stored in ``self.ticker_balances``)
+        - ``self.perf`` adds each ticker's counters
+
+        Falls back to running the tickers one after another if the
+        platform does not support forking processes
+
+        :param data: dictionary of extracted data
+            (see ``handle_data``)
+        :param tickers: list of tickers to run
+        """
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            log.error(
+                f'{self.name} handle - ticker_workers={self.ticker_workers} '
+                'requires forking processes - running tickers in '
+                'a single process')
+            for ticker in tickers:
+                self.handle_ticker_datasets(
+                    ticker=ticker,
+                    datasets=data[ticker])
+            return
+
+        num_workers = min(
+            self.ticker_workers,
+            len(tickers))
+        if self.verbose:
+            log.info(
+                f'{self.name} handle - starting workers={num_workers} '
+                f'tickers={len(tickers)}')
+
+        if not self.starting_close:
+            # load the first dataset a serial run would use so
+            # every worker starts with the same algo_start_price
+            for ticker in tickers:
+                nodes = [
+                    node
+                    for node in data[ticker]
+                    if (not self.run_this_date or
+                        node.get('date', None) == self.run_this_date)
+                ]
+                if nodes:
+                    self.load_from_dataset(
+                        ds_data=nodes[0])
+                    break
+            # end of for all tickers
+        # end of setting the start price
+
+        start_balance = self.balance
+        # each ticker gets a new fork of this algorithm
+        with multiprocessing.get_context('fork').Pool(
+                processes=num_workers,
+                initializer=init_ticker_worker,
+                initargs=(self, data),
+                maxtasksperchild=1) as pool:
+            results = pool.map(
+                run_ticker_worker,
+                tickers,
+                chunksize=1)
+        # end of running tickers in workers
+
+        for res in results:
+            ticker = res['ticker']
+            history = self.rebase_ticker_worker_result(
+                res=res,
+                balance_offset=self.balance - start_balance)
+            self.order_history.extend(history)
+            self.buys.extend(res['buys'])
+            self.sells.extend(res['sells'])
+            if res['position'] is not None:
+                self.ledger.set_position(
+                    ticker=ticker,
+                    position=res['position'])
+            self.ticker_balances[ticker] = res['balance']
+            self.balance += (res['balance'] - start_balance)
+            self.perf.merge(res['perf'])
+            self.ticker = ticker
+        # end of merging worker results
+
+        if self.verbose:
+            log.info(
+                f'{self.name} handle - done workers={num_workers} '
+                f'tickers={len(tickers)} balance={self.balance}')
+    # end of handle_tickers_in_workers
+
+    def rebase_ticker_worker_result(
+            self,
+            res,
+            balance_offset):
+        """rebase_ticker_worker_result
+
+        Move a ticker worker's trading history, buys and sells
+        onto the balance they would have had if the tickers ran
+        one after another. Returns the trading history to merge
+        (``res['buys']``, ``res['sells']`` and ``res['position']``
+        are updated)
+
+        :param res: result from ``get_ticker_worker_result``
+        :param balance_offset: net gain or loss of the tickers
+            merged before this one
+        """
+        history = res['history']
+        if not balance_offset:
+            return history
+
+        history = [
+            history_utils.rebase_trade_history_entry(
+                history_dict=node,
+                balance_offset=balance_offset)
+            for node in history
+        ]
+        rebased_orders = {}
+        for order_key in ['buys', 'sells']:
+            orders = []
+            for order in res[order_key]:
+                new_order = dict(order)
+                for key in ['balance', 'prev_balance']:
+                    new_order[key] = ae_consts.to_f(
+                        order[key] + balance_offset)
+                if isinstance(order, position_ledger.OrderRecord):
+                    new_order = position_ledger.OrderRecord(new_order)
+                rebased_orders[id(order)] = new_order
+                orders.append(new_order)
+            res[order_key] = orders
+            if res['position'] is not None:
+                res['position'][order_key] = [
+                    rebased_orders.get(id(order), order)
+                    for order in res['position'].get(order_key, [])
+                ]
+        # end of for all buys and sells
+        return history
+    # end of rebase_ticker_worker_result
+
+    def get_ticker_worker_result(
+            self,
+            ticker):
+        """get_ticker_worker_result
+
+        Build the picklable result a ticker worker
+        sends back to the parent algorithm
+
+        :param ticker: string - ticker
+        """
+        return {
+            'ticker': ticker,
+            'history': self.order_history,
+            'buys': self.buys,
+            'sells': self.sells,
+            'position': self.positions.get(ticker, None),
+            'balance': self.balance,
+            'perf': self.perf
+        }
+    # end of get_ticker_worker_result
 
     def handle_daily_dataset(
             self,
@@ -3316,8 +4029,10 @@ class BaseAlgo:
         # parse the dataset node and set member variables
         self.debug_msg = (
             f'{ticker} START - load dataset id={node.get("id", "missing-id")}')
+        self.perf.mark()
         self.load_from_dataset(
             ds_data=node)
+        self.perf.lap('load')
         self.debug_msg = (
             f'{ticker} END - load dataset id={node.get("id", "missing-id")}')
 
@@ -3330,10 +4045,16 @@ class BaseAlgo:
         self.latest_sells = []
         if self.iproc:
             self.debug_msg = f'{ticker} BASEALGO-START - indicator processing'
+            bar_idx = None
+            if self.cross_ticker_datasets:
+                bar_idx = self.get_cross_ticker_bar_idx(
+                    ticker=ticker,
+                    node=node)
             self.latest_ind_report = self.iproc.process(
                 algo_id=algo_id,
                 ticker=self.ticker,
-                dataset=node)
+                dataset=node,
+                bar_idx=bar_idx)
             self.latest_buys = self.latest_ind_report.get(
                 'buys',
                 [])
@@ -3342,6 +4063,7 @@ class BaseAlgo:
                 [])
             self.debug_msg = f'{ticker} BASEALGO-END - indicator processing'
         # end of indicator processing
+        self.perf.lap('indicator')
 
         self.num_latest_buys = len(self.latest_buys)
         self.num_latest_sells = len(self.latest_sells)
@@ -3355,6 +4077,7 @@ class BaseAlgo:
             algo_id=algo_id,
             ticker=self.ticker,
             dataset=node)
+        self.perf.lap('process')
         self.debug_msg = (
             f'{ticker} END - process id={node.get("id", "missing-id")}')
 
@@ -3368,6 +4091,7 @@ class BaseAlgo:
             algo_id=algo_id,
             reason_for_buy=self.buy_reason,
             reason_for_sell=self.sell_reason)
+        self.perf.lap('trade')
         self.debug_msg = (
             f'{ticker} END - trade id={node.get("id", "missing-id")}')
 
@@ -3380,6 +4104,7 @@ class BaseAlgo:
             f'{ticker} START - history id={node.get("id", "missing-id")}')
         self.record_trade_history_for_dataset(
             node=node)
+        self.perf.lap('history')
         self.debug_msg = (
             f'{ticker} END - history id={node.get("id", "missing-id")}')
     # end of handle_daily_dataset
@@ -3423,8 +4148,10 @@ class BaseAlgo:
         node_date = node.get('date', 'missing-date')
         self.debug_msg = (
             f'{ticker} START - load dataset id={node_id}')
+        self.perf.mark()
         self.load_from_dataset(
             ds_data=node)
+        self.perf.lap('load')
         self.debug_msg = (
             f'{ticker} END - load dataset id={node_id}')
 
@@ -3457,22 +4184,75 @@ class BaseAlgo:
             return
         # if no minute data found
 
-        for minute_idx, row in self.df_minute[start_row:].iterrows():
+        use_bar_idx = (
+            self.iproc and
+            self.indicator_mode_value in [
+                ae_consts.ALGO_INDICATOR_MODE_INCREMENTAL,
+                ae_consts.ALGO_INDICATOR_MODE_PRECOMPUTE,
+                ae_consts.ALGO_INDICATOR_MODE_FULL_SERIES
+            ])
+        if use_bar_idx:
+            node['data']['minute'] = self.df_minute
+            if (self.indicator_mode_value ==
+                    ae_consts.ALGO_INDICATOR_MODE_PRECOMPUTE):
+                # compute every minute's signals up front so
+                # each bar below is a lookup
+                self.iproc.precompute_signals(
+                    algo_id=algo_id,
+                    ticker=self.ticker,
+                    dataset=node,
+                    uses_data='minute')
+            else:
+                # seed rolling indicator state with all the minutes
+                # so each bar below is an O(1) update
+                self.iproc.seed_incremental(
+                    algo_id=algo_id,
+                    ticker=self.ticker,
+                    dataset=node,
+                    uses_data='minute',
+                    full_series=(
+                        self.indicator_mode_value ==
+                        ae_consts.ALGO_INDICATOR_MODE_FULL_SERIES))
+            self.perf.lap('seed')
+
+        # step through the extracted columns instead of
+        # building a pd.Series per minute with iterrows
+        if self.minute_cursor is None:
+            self.minute_cursor = bar_cursor.BarCursor(
+                df=self.df_minute)
+        cursor = self.minute_cursor
+        minute_window = None
+        if self.iproc:
+            self.iproc.set_bar_cursor(
+                cursor=cursor,
+                uses_data='minute')
+            # convert the pricing columns once for the whole day
+            # so each minute's shared arrays are just views
+            self.iproc.set_ohlcv_source(
+                df=self.df_minute,
+                uses_data='minute')
+            # only slice the trailing minutes the indicators
+            # read instead of every minute so far
+            if hasattr(self.iproc, 'get_dataset_window'):
+                minute_window = self.iproc.get_dataset_window(
+                    uses_data='minute')
+        for minute_idx in cursor.bars(start_row=start_row):
+            self.perf.mark()
 
             # map the latest values for the algo to use
             # as if the minute was the latest trading time
             # as it iterates minute-by-minute
-            self.latest_min = row.get('date', None)
+            self.latest_min = cursor.date
             if not self.latest_min:
                 log.warn(
                     f'no cached minute data found in cache for {ticker} '
                     f'on: {node_id} rows={num_rows}')
                 return
-            self.latest_high = row.get('high', None)
-            self.latest_low = row.get('low', None)
-            self.latest_open = row.get('open', None)
-            self.latest_close = row.get('close', None)
-            self.latest_volume = row.get('volume', None)
+            self.latest_high = cursor.high
+            self.latest_low = cursor.low
+            self.latest_open = cursor.open
+            self.latest_close = cursor.close
+            self.latest_volume = cursor.volume
             self.trade_price = self.latest_close
             self.use_minute = self.latest_min.strftime(
                 ae_consts.COMMON_TICK_DATE_FORMAT)
@@ -3512,6 +4292,8 @@ class BaseAlgo:
              self.ticker_sells) = self.get_ticker_positions(
                 ticker=ticker)
 
+            self.perf.lap('bar')
+
             """
             Indicator Processor
 
@@ -3525,11 +4307,16 @@ class BaseAlgo:
                     f'daily [0-{minute_idx + 1}]')
 
                 # prune off the minutes that are not the latest
-                node['data']['minute'] = self.df_minute.iloc[0:(minute_idx+1)]
+                start_idx = 0
+                if minute_window:
+                    start_idx = max(0, minute_idx + 1 - minute_window)
+                node['data']['minute'] = self.df_minute.iloc[
+                    start_idx:(minute_idx + 1)]
                 self.latest_ind_report = self.iproc.process(
                     algo_id=minute_algo_id,
                     ticker=self.ticker,
-                    dataset=node)
+                    dataset=node,
+                    bar_idx=(minute_idx if use_bar_idx else None))
                 self.latest_buys = self.latest_ind_report.get(
                     'buys',
                     [])
@@ -3539,6 +4326,7 @@ class BaseAlgo:
                 self.debug_msg = (
                     f'{ticker} END - indicator processing')
             # end of indicator processing
+            self.perf.lap('indicator')
 
             self.num_latest_buys = len(self.latest_buys)
             self.num_latest_sells = len(self.latest_sells)
@@ -3558,6 +4346,7 @@ class BaseAlgo:
                 algo_id=algo_id,
                 ticker=self.ticker,
                 dataset=node)
+            self.perf.lap('process')
             self.debug_msg = (
                 f'{ticker} END - process id={node_id}')
 
@@ -3571,6 +4360,7 @@ class BaseAlgo:
                 algo_id=algo_id,
                 reason_for_buy=self.buy_reason,
                 reason_for_sell=self.sell_reason)
+            self.perf.lap('trade')
             self.debug_msg = (
                 f'{ticker} END - trade id={node_id}')
 
@@ -3583,9 +4373,12 @@ class BaseAlgo:
                 f'{ticker} START - history id={node_id}')
             self.record_trade_history_for_dataset(
                 node=node)
+            self.perf.lap('history')
             self.debug_msg = (
                 f'{ticker} END - history id={node_id}')
         # end for all rows in the minute dataset
+        if minute_window:
+            node['data']['minute'] = self.df_minute
     # end of handle_minute_dataset
 
     def plot_trading_history_with_balance(
@@ -3764,3 +4557,52 @@ class BaseAlgo:
     # end of load_custom_datasets
 
 # end of BaseAlgo
+
+
+# algorithm and datasets inherited by forked ticker workers
+WORKER_ALGO = None
+WORKER_DATA = None
+
+
+def init_ticker_worker(
+        algo,
+        data):
+    """init_ticker_worker
+
+    ``multiprocessing.Pool`` initializer for
+    ``BaseAlgo.handle_tickers_in_workers`` - the forked
+    process keeps its own copy of the algorithm
+
+    :param algo: ``BaseAlgo`` running the tickers
+    :param data: dictionary of extracted data
+    """
+    global WORKER_ALGO
+    global WORKER_DATA
+    WORKER_ALGO = algo
+    WORKER_DATA = data
+# end of init_ticker_worker
+
+
+def run_ticker_worker(
+        ticker):
+    """run_ticker_worker
+
+    Run one ticker's datasets inside a forked worker and
+    return the picklable results. Each worker process runs
+    one ticker, and starts with an empty trading history and
+    empty perf counters so the results only hold this ticker's
+    changes
+
+    :param ticker: string - ticker
+    """
+    algo = WORKER_ALGO
+    algo.order_history = algo.build_order_history()
+    algo.buys = []
+    algo.sells = []
+    algo.perf.reset()
+    algo.handle_ticker_datasets(
+        ticker=ticker,
+        datasets=WORKER_DATA[ticker])
+    return algo.get_ticker_worker_result(
+        ticker=ticker)
+# end of run_ticker_worker
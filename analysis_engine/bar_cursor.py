@@ -0,0 +1,227 @@
+"""
+Columnar cursor for stepping through pricing bars
+
+Pulls the ``date``, ``open``, ``high``, ``low``, ``close`` and
+``volume`` columns out of a ``pandas.DataFrame`` once (on first use)
+so an algorithm can walk the bars without building a ``pandas.Series``
+per row (like ``DataFrame.iterrows()`` does).
+
+- ``cursor.get_values(<column>)`` - typed ``numpy.ndarray`` for
+  each column for vectorized work (``None`` if the column is missing)
+- ``cursor.date``, ``cursor.open``, ``cursor.high``, ``cursor.low``,
+  ``cursor.close``, ``cursor.volume`` - native python values for
+  the current bar (``None`` if the column is missing)
+
+.. code-block:: python
+
+    import analysis_engine.bar_cursor as bar_cursor
+    cursor = bar_cursor.BarCursor(df=df_minute)
+    for bar_idx in cursor.bars(start_row=0):
+        print(
+            f'{cursor.date} high={cursor.high} low={cursor.low} '
+            f'close={cursor.close}')
+"""
+
+import numpy as np
+
+
+BAR_COLUMNS = [
+    'date',
+    'open',
+    'high',
+    'low',
+    'close',
+    'volume'
+]
+
+
+class BarCursor:
+    """BarCursor
+
+    Cursor over the pricing columns in a ``pandas.DataFrame``
+    """
+
+    def __init__(
+            self,
+            df,
+            columns=None):
+        """__init__
+
+        :param df: ``pandas.DataFrame`` with pricing bars
+        :param columns: optional - list of columns to extract
+            (default is ``BAR_COLUMNS``)
+        """
+        self.columns = columns
+        if not self.columns:
+            self.columns = BAR_COLUMNS
+        self.df = df
+        self.num_bars = 0
+        if hasattr(df, 'index'):
+            self.num_bars = len(df.index)
+        else:
+            self.df = None
+
+        # typed arrays for vectorized access and python lists
+        # so reading a single bar does not allocate new objects
+        # (each one is only built for a column when it is used)
+        self.values = {}
+        self.lists = {}
+
+        # (member name, list) pairs set on each seek
+        self.bar_lists = None
+
+        self.idx = None
+        self.date = None
+        self.open = None
+        self.high = None
+        self.low = None
+        self.close = None
+        self.volume = None
+    # end of __init__
+
+    def __len__(
+            self):
+        """__len__"""
+        return self.num_bars
+    # end of __len__
+
+    def has_column(
+            self,
+            col):
+        """has_column
+
+        :param col: column name
+        """
+        return (
+            self.df is not None and
+            col in self.columns and
+            col in self.df)
+    # end of has_column
+
+    def get_list(
+            self,
+            col):
+        """get_list
+
+        Get the column as a python ``list`` (built on
+        the first call)
+
+        :param col: column name
+        """
+        if col not in self.lists:
+            self.lists[col] = None
+            if self.has_column(col):
+                self.lists[col] = self.df[col].tolist()
+        return self.lists[col]
+    # end of get_list
+
+    def get_values(
+            self,
+            col):
+        """get_values
+
+        Get the column as a typed ``numpy.ndarray`` (built
+        on the first call)
+
+        :param col: column name
+        """
+        if col not in self.values:
+            self.values[col] = None
+            if self.has_column(col):
+                self.values[col] = self.df[col].to_numpy()
+        return self.values[col]
+    # end of get_values
+
+    def get(
+            self,
+            col,
+            idx=None):
+        """get
+
+        Get a single value without moving the cursor
+
+        :param col: column name
+        :param idx: optional - bar position (supports negative
+            positions) - default is the current bar
+        """
+        use_list = self.get_list(col)
+        if use_list is None:
+            return None
+        if idx is None:
+            idx = self.idx
+        return use_list[idx]
+    # end of get
+
+    def seek(
+            self,
+            idx):
+        """seek
+
+        Move the cursor to the bar at position ``idx`` and set
+        the current bar's values
+
+        :param idx: bar position (supports negative positions)
+        """
+        if idx < 0:
+            idx += self.num_bars
+        self.idx = idx
+        if self.bar_lists is None:
+            self.bar_lists = [
+                (col, self.get_list(col))
+                for col in BAR_COLUMNS
+                if self.get_list(col) is not None
+            ]
+        for col, values in self.bar_lists:
+            setattr(self, col, values[idx])
+        return self
+    # end of seek
+
+    def last(
+            self):
+        """last
+
+        Move the cursor to the last bar
+        """
+        return self.seek(-1)
+    # end of last
+
+    def bars(
+            self,
+            start_row=0):
+        """bars
+
+        Generator that moves the cursor across each bar
+        starting at ``start_row`` and yields the bar position
+
+        :param start_row: first bar position (default is ``0``)
+        """
+        for idx in range(start_row, self.num_bars):
+            self.seek(idx)
+            yield idx
+    # end of bars
+
+    def window(
+            self,
+            col,
+            num_points,
+            idx=None):
+        """window
+
+        Get a ``numpy.ndarray`` view of the trailing ``num_points``
+        values for a column ending at the bar ``idx``
+
+        :param col: column name
+        :param num_points: number of trailing bars
+        :param idx: optional - last bar position - default
+            is the current bar
+        """
+        values = self.get_values(col)
+        if values is None:
+            return np.array([])
+        if idx is None:
+            idx = self.idx
+        start_idx = max(0, idx + 1 - num_points)
+        return values[start_idx:idx + 1]
+    # end of window
+
+# end of BarCursor
@@ -8,18 +8,55 @@ method like:
 .. code-block:: python
 
     algo.handle_data(build_dataset_node())
+
+Use ``build_dataset_nodes`` to extract a date range (for one or
+more tickers) in chunks with one ``MGET`` per chunk and optionally
+decode the nodes on a pool of forked processes:
+
+.. code-block:: python
+
+    for ticker, node in build_dataset_nodes(
+            extract_requests=[
+                {
+                    'id': f'SPY_{date}',
+                    'ticker': 'SPY',
+                    'date': date
+                }
+                for date in dates
+            ],
+            datasets=['daily', 'minute'],
+            num_workers=4):
+        algo.handle_data({ticker: [node]})
 """
 
+import multiprocessing
+import concurrent.futures
 import pandas as pd
 import analysis_engine.consts as ae_consts
 import analysis_engine.utils as ae_utils
 import analysis_engine.api_requests as api_requests
+import analysis_engine.redis_pool as redis_pool
+import analysis_engine.get_data_from_redis_key as redis_get
 import analysis_engine.iex.extract_df_from_redis as iex_extract_utils
 import analysis_engine.td.extract_df_from_redis as td_extract_utils
 import spylunking.log.setup_logging as log_utils
 
 log = log_utils.build_colorized_logger(name=__name__)
 
+# dataset name in ``datasets`` to the IEX redis key suffix
+IEX_DATASETS = {
+    'daily': 'daily',
+    'minute': 'minute',
+    'quote': 'quote',
+    'stats': 'stats',
+    'peers': 'peers',
+    'news': 'news1',
+    'financials': 'financials',
+    'earnings': 'earnings',
+    'dividends': 'dividends',
+    'company': 'company'
+}
+
 
 def build_dataset_node(
         ticker,
@@ -41,6 +78,8 @@ def build_dataset_node(
         s3_region_name=None,
         s3_secure=False,
         s3_key=None,
+        batch_extract=True,
+        redis_recs=None,
         verbose=False):
     """build_dataset_node
 
@@ -99,6 +138,15 @@ def build_dataset_node(
         (default is ``False``)
     :param s3_key: optional s3 key not used
         (default is ``None``)
+    :param batch_extract: optional - get every dataset's
+        redis key with one ``MGET`` round trip per redis
+        server instead of one ``GET`` per dataset
+        (default is ``True``)
+    :param redis_recs: optional - dictionary of redis key to
+        the ``get_data_from_redis_key`` results already fetched
+        with ``get_batch_redis_recs`` (like for a chunk of
+        ``build_dataset_nodes`` dates). Keys that are not in
+        it are extracted on their own
 
     **Debugging**
 
@@ -160,132 +208,37 @@ def build_dataset_node(
             f'bt {date_key} {ae_consts.ppj(base_req)}')
         """
 
-    iex_daily_status = ae_consts.FAILED
-    iex_minute_status = ae_consts.FAILED
-    iex_quote_status = ae_consts.FAILED
-    iex_stats_status = ae_consts.FAILED
-    iex_peers_status = ae_consts.FAILED
-    iex_news_status = ae_consts.FAILED
-    iex_financials_status = ae_consts.FAILED
-    iex_earnings_status = ae_consts.FAILED
-    iex_dividends_status = ae_consts.FAILED
-    iex_company_status = ae_consts.FAILED
-    td_calls_status = ae_consts.FAILED
-    td_puts_status = ae_consts.FAILED
-
-    iex_daily_df = None
-    iex_minute_df = None
-    iex_quote_df = None
-    iex_stats_df = None
-    iex_peers_df = None
-    iex_news_df = None
-    iex_financials_df = None
-    iex_earnings_df = None
-    iex_dividends_df = None
-    iex_company_df = None
-    td_calls_df = None
-    td_puts_df = None
-
-    if 'daily' in datasets:
-        iex_daily_status, iex_daily_df = \
-            iex_extract_utils.extract_daily_dataset(
-                ticker=ticker,
-                date=date,
-                work_dict=base_req,
-                verbose=verbose)
-        if iex_daily_status != ae_consts.SUCCESS:
-            if verbose:
-                log.warn(f'unable to extract iex_daily={ticker}')
-    if 'minute' in datasets:
-        iex_minute_status, iex_minute_df = \
-            iex_extract_utils.extract_minute_dataset(
-                ticker=ticker,
-                date=date,
-                work_dict=base_req,
-                verbose=verbose)
-        if iex_minute_status != ae_consts.SUCCESS:
-            if verbose:
-                log.warn(f'unable to extract iex_minute={ticker}')
-    if 'quote' in datasets:
-        iex_quote_status, iex_quote_df = \
-            iex_extract_utils.extract_quote_dataset(
-                ticker=ticker,
-                date=date,
-                work_dict=base_req,
-                verbose=verbose)
-        if iex_quote_status != ae_consts.SUCCESS:
-            if verbose:
-                log.warn(f'unable to extract iex_quote={ticker}')
-    if 'stats' in datasets:
-        iex_stats_df, iex_stats_df = \
-            iex_extract_utils.extract_stats_dataset(
-                ticker=ticker,
-                date=date,
-                work_dict=base_req,
-                verbose=verbose)
-        if iex_stats_status != ae_consts.SUCCESS:
-            if verbose:
-                log.warn(f'unable to extract iex_stats={ticker}')
-    if 'peers' in datasets:
-        iex_peers_df, iex_peers_df = \
-            iex_extract_utils.extract_peers_dataset(
-                ticker=ticker,
-                date=date,
-                work_dict=base_req,
-                verbose=verbose)
-        if iex_peers_status != ae_consts.SUCCESS:
-            if verbose:
-                log.warn(f'unable to extract iex_peers={ticker}')
-    if 'news' in datasets:
-        iex_news_status, iex_news_df = \
-            iex_extract_utils.extract_news_dataset(
-                ticker=ticker,
-                date=date,
-                work_dict=base_req,
-                verbose=verbose)
-        if iex_news_status != ae_consts.SUCCESS:
-            if verbose:
-                log.warn(f'unable to extract iex_news={ticker}')
-    if 'financials' in datasets:
-        iex_financials_status, iex_financials_df = \
-            iex_extract_utils.extract_financials_dataset(
-                ticker=ticker,
-                date=date,
-                work_dict=base_req,
-                verbose=verbose)
-        if iex_financials_status != ae_consts.SUCCESS:
-            if verbose:
-                log.warn(f'unable to extract iex_financials={ticker}')
-    if 'earnings' in datasets:
-        iex_earnings_status, iex_earnings_df = \
-            iex_extract_utils.extract_earnings_dataset(
-                ticker=ticker,
-                date=date,
-                work_dict=base_req,
-                verbose=verbose)
-        if iex_earnings_status != ae_consts.SUCCESS:
-            if verbose:
-                log.warn(f'unable to extract iex_earnings={ticker}')
-    if 'dividends' in datasets:
-        iex_dividends_status, iex_dividends_df = \
-            iex_extract_utils.extract_dividends_dataset(
+    if redis_recs is None:
+        redis_recs = {}
+        if batch_extract:
+            redis_recs = get_batch_redis_recs(
+                label=label,
+                date_keys=[
+                    date_key
+                ],
+                datasets=datasets,
+                work_dict=base_req)
+    # end of getting all the dataset keys in one round trip
+
+    iex_dfs = {}
+    for name, iex_key in IEX_DATASETS.items():
+        iex_dfs[iex_key] = None
+        if name not in datasets:
+            continue
+        iex_status, iex_dfs[iex_key] = \
+            iex_extract_utils.extract_dataset(
+                key=iex_key,
                 ticker=ticker,
                 date=date,
                 work_dict=base_req,
+                scrub_mode='sort-by-date',
+                redis_res=redis_recs.get(
+                    f'{date_key}_{iex_key}',
+                    None),
                 verbose=verbose)
-        if iex_dividends_status != ae_consts.SUCCESS:
+        if iex_status != ae_consts.SUCCESS:
             if verbose:
-                log.warn(f'unable to extract iex_dividends={ticker}')
-    if 'company' in datasets:
-        iex_company_status, iex_company_df = \
-            iex_extract_utils.extract_company_dataset(
-                ticker=ticker,
-                date=date,
-                work_dict=base_req,
-                verbose=verbose)
-        if iex_company_status != ae_consts.SUCCESS:
-            if verbose:
-                log.warn(f'unable to extract iex_company={ticker}')
+                log.warn(f'unable to extract iex_{name}={ticker}')
     # end of iex extracts
 
     """
@@ -332,6 +285,11 @@ def build_dataset_node(
 
     base_req['verbose_td'] = True
     """
+    td_calls_status = ae_consts.FAILED
+    td_puts_status = ae_consts.FAILED
+    td_calls_df = None
+    td_puts_df = None
+
     if (
             'calls' in datasets or
             'tdcalls' in datasets):
@@ -340,6 +298,9 @@ def build_dataset_node(
                 ticker=ticker,
                 date=date,
                 work_dict=base_req,
+                redis_rec=redis_recs.get(
+                    f'{date_key}_tdcalls',
+                    None),
                 verbose=verbose)
         if td_calls_status != ae_consts.SUCCESS:
             if verbose:
@@ -367,6 +328,9 @@ def build_dataset_node(
                 ticker=ticker,
                 date=date,
                 work_dict=base_req,
+                redis_rec=redis_recs.get(
+                    f'{date_key}_tdputs',
+                    None),
                 verbose=verbose)
         if td_puts_status != ae_consts.SUCCESS:
             if verbose:
@@ -387,16 +351,16 @@ def build_dataset_node(
     # end of Tradier puts extraction
 
     ticker_data = {
-        'daily': iex_daily_df,
-        'minute': iex_minute_df,
-        'quote': iex_quote_df,
-        'stats': iex_stats_df,
-        'peers': iex_peers_df,
-        'news1': iex_news_df,
-        'financials': iex_financials_df,
-        'earnings': iex_earnings_df,
-        'dividends': iex_dividends_df,
-        'company': iex_company_df,
+        'daily': iex_dfs['daily'],
+        'minute': iex_dfs['minute'],
+        'quote': iex_dfs['quote'],
+        'stats': iex_dfs['stats'],
+        'peers': iex_dfs['peers'],
+        'news1': iex_dfs['news1'],
+        'financials': iex_dfs['financials'],
+        'earnings': iex_dfs['earnings'],
+        'dividends': iex_dfs['dividends'],
+        'company': iex_dfs['company'],
         'tdcalls': td_calls_df,
         'tdputs': td_puts_df,
         'calls': None,  # yahoo - here for legacy
@@ -407,3 +371,264 @@ def build_dataset_node(
 
     return ticker_data
 # end of build_dataset_node
+
+
+def get_batch_redis_keys(
+        date_keys,
+        datasets,
+        work_dict):
+    """get_batch_redis_keys
+
+    Get the redis keys for all the ``datasets`` of every
+    ``<ticker>_<date>`` in ``date_keys`` grouped by the
+    ``(host, port)`` of the redis server they are read from
+    (the IEX extracts use ``redis_address`` and the TD extracts
+    use ``redis_host`` and ``redis_port`` if they are set)
+
+    :param date_keys: list of ``<ticker>_<date>`` redis
+        key prefixes
+    :param datasets: list of string dataset names
+    :param work_dict: dictionary of args for the extracts
+    """
+    iex_host, iex_port = redis_pool.split_address(
+        address=(
+            work_dict.get('redis_address', None) or
+            ae_consts.REDIS_ADDRESS))
+    td_host, td_port = ae_consts.get_redis_host_and_port(
+        req=work_dict)
+    servers = {}
+    for date_key in date_keys:
+        for name, iex_key in IEX_DATASETS.items():
+            if name in datasets:
+                servers.setdefault(
+                    (iex_host, iex_port),
+                    []).append(f'{date_key}_{iex_key}')
+        if 'calls' in datasets or 'tdcalls' in datasets:
+            servers.setdefault(
+                (td_host, td_port),
+                []).append(f'{date_key}_tdcalls')
+        if 'puts' in datasets or 'tdputs' in datasets:
+            servers.setdefault(
+                (td_host, td_port),
+                []).append(f'{date_key}_tdputs')
+    # end of for all date keys
+    return servers
+# end of get_batch_redis_keys
+
+
+def get_batch_redis_recs(
+        label,
+        date_keys,
+        datasets,
+        work_dict):
+    """get_batch_redis_recs
+
+    Get the redis keys for all the ``datasets`` of every
+    ``<ticker>_<date>`` in ``date_keys`` with one ``MGET`` for
+    each redis server (see ``get_batch_redis_keys``). Returns a
+    dictionary of redis key to the ``get_data_from_redis_key``
+    result (keys that failed are left out so the extracts get
+    them again on their own)
+
+    :param label: log tracking label
+    :param date_keys: list of ``<ticker>_<date>`` redis
+        key prefixes
+    :param datasets: list of string dataset names
+    :param work_dict: dictionary of args for the extracts
+    """
+    servers = get_batch_redis_keys(
+        date_keys=date_keys,
+        datasets=datasets,
+        work_dict=work_dict)
+    redis_recs = {}
+    for (host, port), keys in servers.items():
+        server_recs = redis_get.get_data_from_redis_keys(
+            label=label,
+            host=host,
+            port=port,
+            password=work_dict.get(
+                'redis_password',
+                ae_consts.REDIS_PASSWORD),
+            db=work_dict.get(
+                'redis_db',
+                ae_consts.REDIS_DB),
+            keys=keys,
+            decompress_df=True)
+        for key, rec in server_recs.items():
+            if rec['status'] == ae_consts.SUCCESS:
+                redis_recs[key] = rec
+    # end of for all redis servers
+    return redis_recs
+# end of get_batch_redis_recs
+
+
+def build_dataset_nodes(
+        extract_requests,
+        datasets,
+        service_dict=None,
+        chunk_size=20,
+        num_workers=0,
+        log_label=None,
+        verbose=False):
+    """build_dataset_nodes
+
+    Generator that extracts the dataset nodes for a list of
+    ticker-dates and yields ``(ticker, node)`` tuples in the
+    same order as ``extract_requests`` (the format
+    ``BaseAlgo.handle_data`` streams). The redis keys for each
+    chunk of ``chunk_size`` requests are fetched with one
+    ``MGET``.
+
+    ``pd.read_json`` holds the GIL and is most of the time spent
+    extracting, so set ``num_workers`` to decode and scrub the
+    nodes on a pool of forked processes. The next chunk is fetched
+    while the workers decode the current one. Falls back to
+    decoding in this process if the platform does not support
+    forking processes
+
+    :param extract_requests: list of extract request
+        dictionaries with ``id``, ``ticker`` and ``date`` keys
+        (the tickers can be mixed)
+    :param datasets: list of string dataset names
+        to extract from redis
+    :param service_dict: optional - dictionary for all
+        service connectivity to Redis and Minio
+    :param chunk_size: optional - number of requests to
+        fetch in each ``MGET`` (default is ``20``)
+    :param num_workers: optional - number of processes
+        decoding the nodes (``0`` or ``1`` decodes in this
+        process, default is ``0``)
+    :param log_label: optional - log label string
+    :param verbose: optional - flag for debugging
+        (default to ``False``)
+    """
+    label = log_label
+    if not label:
+        label = 'build_bt'
+    use_requests = list(extract_requests)
+    if len(use_requests) == 0:
+        return
+    chunk_size = max(1, int(chunk_size))
+    chunks = [
+        use_requests[idx:idx + chunk_size]
+        for idx in range(0, len(use_requests), chunk_size)
+    ]
+    work_dict = api_requests.get_ds_dict(
+        ticker=use_requests[0]['ticker'],
+        ds_id=label,
+        service_dict=service_dict)
+    node_args = {
+        'datasets': datasets,
+        'service_dict': service_dict,
+        'log_label': label,
+        'verbose': verbose
+    }
+
+    # get the redis results for each request in the chunk
+    def fetch_chunk(chunk):
+        redis_recs = get_batch_redis_recs(
+            label=label,
+            date_keys=[
+                f'{req["ticker"]}_{req["date"]}'
+                for req in chunk
+            ],
+            datasets=datasets,
+            work_dict=work_dict)
+        return split_redis_recs(
+            chunk=chunk,
+            redis_recs=redis_recs)
+    # end of fetch_chunk
+
+    use_workers = (
+        num_workers is not None and
+        num_workers > 1 and
+        'fork' in multiprocessing.get_all_start_methods())
+    if num_workers and num_workers > 1 and not use_workers:
+        log.error(
+            f'{label} - extract num_workers={num_workers} requires '
+            'forking processes - decoding in a single process')
+
+    if not use_workers:
+        for chunk in chunks:
+            for req, redis_recs in zip(chunk, fetch_chunk(chunk)):
+                yield build_node(
+                    req=req,
+                    redis_recs=redis_recs,
+                    node_args=node_args)
+        # end of for all chunks
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context('fork')) as executor:
+        chunk_recs = fetch_chunk(chunks[0])
+        for chunk_idx, chunk in enumerate(chunks):
+            futures = [
+                executor.submit(
+                    build_node,
+                    req,
+                    redis_recs,
+                    node_args)
+                for req, redis_recs in zip(chunk, chunk_recs)
+            ]
+            if chunk_idx + 1 < len(chunks):
+                chunk_recs = fetch_chunk(chunks[chunk_idx + 1])
+            for future in futures:
+                yield future.result()
+        # end of for all chunks
+    # end of process pool
+# end of build_dataset_nodes
+
+
+def split_redis_recs(
+        chunk,
+        redis_recs):
+    """split_redis_recs
+
+    Split the redis results fetched for a chunk of extract
+    requests into a list with each request's results
+
+    :param chunk: list of extract requests with ``ticker``
+        and ``date`` keys
+    :param redis_recs: dictionary of redis key to the
+        ``get_data_from_redis_key`` result
+    """
+    chunk_recs = []
+    for req in chunk:
+        prefix = f'{req["ticker"]}_{req["date"]}_'
+        chunk_recs.append({
+            key: rec
+            for key, rec in redis_recs.items()
+            if key.startswith(prefix)
+        })
+    return chunk_recs
+# end of split_redis_recs
+
+
+def build_node(
+        req,
+        redis_recs,
+        node_args):
+    """build_node
+
+    Build the ``(ticker, node)`` tuple for one
+    ``build_dataset_nodes`` request (this runs in the
+    worker processes)
+
+    :param req: extract request with ``id``, ``ticker``
+        and ``date`` keys
+    :param redis_recs: dictionary of the request's
+        prefetched redis results
+    :param node_args: dictionary of the other
+        ``build_dataset_node`` arguments
+    """
+    return req['ticker'], {
+        'id': req['id'],
+        'date': req['date'],
+        'data': build_dataset_node(
+            ticker=req['ticker'],
+            date=req['date'],
+            redis_recs=redis_recs,
+            **node_args)
+    }
+# end of build_node
@@ -16,9 +16,10 @@ Debug redis calls with:
 
 """
 
-import redis
+import io
 import pandas as pd
 import analysis_engine.consts as ae_consts
+import analysis_engine.redis_pool as redis_pool
 import analysis_engine.build_result as build_result
 import analysis_engine.get_data_from_redis_key as redis_get
 import spylunking.log.setup_logging as log_utils
@@ -40,6 +41,7 @@ def build_df_from_redis(
         serializer='json',
         encoding='utf-8',
         orient='records',
+        redis_res=None,
         verbose=False):
     """build_df_from_redis
 
@@ -61,6 +63,10 @@ def build_df_from_redis(
     :param orient: use the same orient value as
         the ``to_json(orient='records')`` used
         to deserialize the DataFrame correctly.
+    :param redis_res: optional - ``get_data_from_redis_key``
+        result already fetched for ``key`` (like from a
+        ``get_data_from_redis_keys`` batch) to load
+        without another round trip to redis
     :param verbose: optional - boolean for turning on logging
     """
 
@@ -90,36 +96,44 @@ def build_df_from_redis(
                 use_host = address.split(':')[0]
                 use_port = int(address.split(':')[1])
 
-        use_client = client
-        if not use_client:
-            if verbose:
-                log.debug(
-                    f'{log_id} connecting to redis={use_host}:{use_port}@{db}')
-            use_client = redis.Redis(
+        if not redis_res:
+            use_client = client
+            if not use_client:
+                if verbose:
+                    log.debug(
+                        f'{log_id} connecting to '
+                        f'redis={use_host}:{use_port}@{db}')
+                use_client = redis_pool.get_client(
+                    host=use_host,
+                    port=use_port,
+                    password=password,
+                    db=db)
+
+            redis_res = redis_get.get_data_from_redis_key(
+                label=log_id,
+                client=use_client,
                 host=use_host,
                 port=use_port,
                 password=password,
-                db=db)
-
-        redis_res = redis_get.get_data_from_redis_key(
-            label=log_id,
-            client=use_client,
-            host=use_host,
-            port=use_port,
-            password=password,
-            db=db,
-            key=key,
-            expire=expire,
-            decompress_df=is_compressed,
-            serializer='json',
-            encoding=encoding)
+                db=db,
+                key=key,
+                expire=expire,
+                decompress_df=is_compressed,
+                serializer='json',
+                encoding=encoding)
 
         valid_df = False
         if redis_res['status'] == ae_consts.SUCCESS:
             data = redis_res['rec'].get(
                 'data',
                 None)
-            if data:
+            if ae_consts.is_df(df=data):
+                if verbose:
+                    log.info(
+                        f'{log_id} - loaded serialized df from key={key}')
+                df = data
+                valid_df = True
+            elif data:
                 if ae_consts.ev('DEBUG_REDIS', '0') == '1':
                     log.debug(
                         f'{log_id} - found key={key} '
@@ -128,6 +142,10 @@ def build_df_from_redis(
                     if verbose:
                         log.info(
                             f'{log_id} - loading df from key={key}')
+                    # newer pandas only reads literal json
+                    # strings from a buffer
+                    if isinstance(data, str):
+                        data = io.StringIO(data)
                     df = pd.read_json(
                         data,
                         orient='records')
@@ -499,3 +499,32 @@ def build_trade_history_entry(
 
     return history_dict
 # end of build_trade_history_entry
+
+
+def rebase_trade_history_entry(
+        history_dict,
+        balance_offset):
+    """rebase_trade_history_entry
+
+    Update a trading history dictionary in place so it looks
+    like it was built with a balance that was ``balance_offset``
+    larger (like the history from a ticker worker that started
+    from its own copy of the balance)
+
+    :param history_dict: trading history dictionary from
+        ``build_trade_history_entry``
+    :param balance_offset: float amount to add to the balance
+        and net value keys
+    """
+    for key in ['balance', 'prev_balance', 'net_value', 'net_gain']:
+        if history_dict.get(key, None) is not None:
+            history_dict[key] = ae_consts.to_f(
+                history_dict[key] + balance_offset)
+    history_dict['balance_net_gain'] += balance_offset
+    if history_dict['balance'] and history_dict['original_balance']:
+        if history_dict['balance_net_gain'] > 0.0:
+            history_dict['algo_status'] = ae_consts.ALGO_PROFITABLE
+        else:
+            history_dict['algo_status'] = ae_consts.ALGO_NOT_PROFITABLE
+    return history_dict
+# end of rebase_trade_history_entry
@@ -5,12 +5,14 @@ Helper for compressing a ``dict`` or ``pandas.DataFrame``
 import json
 import zlib
 import analysis_engine.consts as ae_consts
+import analysis_engine.serialize_df as serialize_df
 
 
 def compress_data(
         data,
         encoding='utf-8',
-        date_format=None):
+        date_format=None,
+        serializer=None):
     """compress_data
 
     Helper for compressing ``data`` which can be
@@ -21,10 +23,24 @@ def compress_data(
         to compress
     :param encoding: optional encoding - default is ``utf-8``
     :param date_format: optional date format - default is ``None``
+    :param serializer: optional - ``json`` or ``columnar`` for
+        serializing a ``pandas.DataFrame`` with
+        ``analysis_engine.serialize_df``
+        (default is ``ae_consts.DF_SERIALIZER``)
     """
 
+    use_serializer = serializer
+    if not use_serializer:
+        use_serializer = ae_consts.DF_SERIALIZER
+
     converted_json = None
     if ae_consts.is_df(df=data):
+        if (
+                use_serializer == 'columnar' and
+                hasattr(data, 'columns')):
+            return serialize_df.serialize_df(
+                df=data,
+                date_format=date_format)
         if date_format:
             converted_json = data.to_json(
                 orient='records',
@@ -314,6 +314,12 @@ ALGO_TIMESERIES_DAY = 43  # evaluate trade performance on daily-units
 ALGO_TIMESERIES_MINUTE = 44  # evaluate trade performance on minute-units
 ALGO_TRADE_INDICATOR_COUNTS = 45  # trade off num indicators said buy/sell
 MISSING_TOKEN = 46
+ALGO_INDICATOR_MODE_PROCESS = 47  # indicators re-process every bar
+ALGO_INDICATOR_MODE_INCREMENTAL = 48  # indicators advance rolling state
+ALGO_INDICATOR_MODE_PRECOMPUTE = 49  # indicators precompute all signals
+ALGO_HISTORY_MODE_DICT = 50  # trading history is a list of dictionaries
+ALGO_HISTORY_MODE_COLUMNAR = 51  # trading history is stored in columns
+ALGO_INDICATOR_MODE_FULL_SERIES = 52  # indicators follow the whole series
 
 # Assuming the engine is running in UTC timezones
 EST_OFFSET_HOURS = int(
@@ -858,6 +864,12 @@ REDIS_DB = int(ev(
 REDIS_EXPIRE = ev(
     'REDIS_EXPIRE',
     None)
+# cache ``pandas.DataFrame`` datasets as ``json``
+# or as ``columnar`` binary column bundles
+# (see ``analysis_engine.serialize_df``)
+DF_SERIALIZER = ev(
+    'DF_SERIALIZER',
+    'json')
 
 # copy these values over
 # when calling child tasks from a
@@ -1005,6 +1017,18 @@ def get_status(
         return 'ALGO_TIMESERIES_MINUTE'
     elif status == ALGO_TRADE_INDICATOR_COUNTS:
         return 'ALGO_TRADE_INDICATOR_COUNTS'
+    elif status == ALGO_INDICATOR_MODE_PROCESS:
+        return 'ALGO_INDICATOR_MODE_PROCESS'
+    elif status == ALGO_INDICATOR_MODE_INCREMENTAL:
+        return 'ALGO_INDICATOR_MODE_INCREMENTAL'
+    elif status == ALGO_INDICATOR_MODE_PRECOMPUTE:
+        return 'ALGO_INDICATOR_MODE_PRECOMPUTE'
+    elif status == ALGO_HISTORY_MODE_DICT:
+        return 'ALGO_HISTORY_MODE_DICT'
+    elif status == ALGO_HISTORY_MODE_COLUMNAR:
+        return 'ALGO_HISTORY_MODE_COLUMNAR'
+    elif status == ALGO_INDICATOR_MODE_FULL_SERIES:
+        return 'ALGO_INDICATOR_MODE_FULL_SERIES'
     elif status == SA_DATASET_TYPE_ALGO_READY:
         return 'ALGO_READY'
     elif status == SA_DATASET_TYPE_TRADING_HISTORY:
@@ -1192,6 +1216,20 @@ ALGO_TIMESERIES = {
 }
 
 
+ALGO_INDICATOR_MODES = {
+    'process': ALGO_INDICATOR_MODE_PROCESS,
+    'incremental': ALGO_INDICATOR_MODE_INCREMENTAL,
+    'precompute': ALGO_INDICATOR_MODE_PRECOMPUTE,
+    'full_series': ALGO_INDICATOR_MODE_FULL_SERIES
+}
+
+
+ALGO_HISTORY_MODES = {
+    'dict': ALGO_HISTORY_MODE_DICT,
+    'columnar': ALGO_HISTORY_MODE_COLUMNAR
+}
+
+
 def get_indicator_type_as_int(
         val=None):
     """get_indicator_type_as_int
@@ -1242,13 +1280,17 @@ def get_indicator_uses_data_as_int(
     integer value
 
     :param val: integer to lookup in the ``INDICATOR_USES_DATA_MAPPING``
-        dictionary
+        dictionary (timeframe specs like ``minute:5m`` use the
+        source dataset's value)
     """
     if not val:
         return INDICATOR_USES_DATA_ANY
     else:
         if val in INDICATOR_USES_DATA_MAPPING:
             return INDICATOR_USES_DATA_MAPPING[val]
+        elif (isinstance(val, str) and
+                val.split(':')[0] in INDICATOR_USES_DATA_MAPPING):
+            return INDICATOR_USES_DATA_MAPPING[val.split(':')[0]]
         else:
             return INDICATOR_USES_DATA_UNSUPPORTED
     # if supported or not
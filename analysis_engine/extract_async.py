@@ -0,0 +1,807 @@
+"""
+asyncio extraction for Redis and S3 datasets
+
+The extract helpers block on every Redis and S3 read, so a process
+only has one ticker-date in flight at a time. These coroutines read
+with ``redis.asyncio`` clients and await the S3 reads in the event
+loop's executor so many ticker-dates can be read at once. Decoding
+and scrubbing reuse the synchronous helpers (like
+``get_data_from_redis_key.decode_data`` and ``build_dataset_node``
+with prefetched ``redis_recs``) so both APIs return the same
+datasets. The helpers run on the event loop's default executor so
+decoding a dataset does not stop the loop from reading the next
+ones.
+
+.. code-block:: python
+
+    import asyncio
+    import analysis_engine.extract_async as extract_async
+
+    async def run():
+        async for ticker, node in extract_async.build_dataset_nodes_async(
+                extract_requests=[
+                    {
+                        'id': f'SPY_{date}',
+                        'ticker': 'SPY',
+                        'date': date
+                    }
+                    for date in dates
+                ],
+                datasets=['daily', 'minute'],
+                chunk_size=5,
+                max_in_flight=8):
+            print(ticker, node['date'])
+
+    asyncio.run(run())
+
+``load_dataset_nodes`` runs the range loader from synchronous code
+and returns the list of ``(ticker, node)`` tuples. If it is called
+while an event loop is running in the same thread, the range loader
+runs on a new event loop in another thread and the caller is blocked
+until it finishes (use ``build_dataset_nodes_async`` from async code).
+
+.. note:: S3 reads use the existing ``boto3`` helpers on the event
+    loop's default executor instead of an async S3 client dependency
+"""
+
+import asyncio
+import functools
+import concurrent.futures
+import collections
+import redis.asyncio as redis_asyncio
+import analysis_engine.consts as ae_consts
+import analysis_engine.utils as ae_utils
+import analysis_engine.api_requests as api_requests
+import analysis_engine.redis_pool as redis_pool
+import analysis_engine.build_result as build_result
+import analysis_engine.build_df_from_redis as build_df
+import analysis_engine.build_dataset_node as build_ds_node
+import analysis_engine.get_data_from_redis_key as redis_get
+import analysis_engine.prepare_dict_for_algo as prepare_utils
+import analysis_engine.s3_read_contents_from_key as s3_utils
+import analysis_engine.load_algo_dataset_from_s3 as load_from_s3
+import spylunking.log.setup_logging as log_utils
+
+log = log_utils.build_colorized_logger(name=__name__)
+
+
+def get_async_client(
+        host=None,
+        port=None,
+        db=None,
+        password=None,
+        address=None):
+    """get_async_client
+
+    Get a new ``redis.asyncio.Redis`` client (close it with
+    ``close_client`` when done)
+
+    :param host: Redis host
+    :param port: Redis port
+    :param db: Redis db
+    :param password: optional - Redis password
+    :param address: optional - Redis address like
+        ``localhost:6379`` if ``host`` and ``port`` are not set
+    """
+    if not host and not port and address:
+        host, port = redis_pool.split_address(
+            address=address)
+    return redis_asyncio.Redis(
+        host=host if host else 'localhost',
+        port=int(port) if port else 6379,
+        password=password,
+        db=int(db) if db else 0)
+# end of get_async_client
+
+
+async def close_client(
+        client):
+    """close_client
+
+    Close a ``redis.asyncio.Redis`` client
+
+    :param client: ``redis.asyncio.Redis`` client
+    """
+    if hasattr(client, 'aclose'):
+        await client.aclose()
+    else:
+        await client.close()
+# end of close_client
+
+
+async def run_in_executor(
+        func,
+        **kwargs):
+    """run_in_executor
+
+    Await a blocking function on the event loop's
+    default executor
+
+    :param func: function to call
+    :param kwargs: keyword arguments for ``func``
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None,
+        functools.partial(
+            func,
+            **kwargs))
+# end of run_in_executor
+
+
+async def get_data_from_redis_key_async(
+        label=None,
+        client=None,
+        host=None,
+        port=None,
+        password=None,
+        db=None,
+        key=None,
+        decompress_df=False,
+        serializer='json',
+        encoding='utf-8'):
+    """get_data_from_redis_key_async
+
+    Awaitable ``get_data_from_redis_key``
+
+    :param label: log tracking label
+    :param client: optional - ``redis.asyncio.Redis`` client
+        (a new client is used and closed if not set)
+    :param host: redis host
+    :param port: redis port
+    :param password: redis password
+    :param db: redis db
+    :param key: redis key
+    :param decompress_df: used for decompressing
+        ``pandas.DataFrame`` automatically
+    :param serializer: not used yet - support for future
+                       pickle objects in redis
+    :param encoding: format of the encoded key in redis
+    """
+    log_id = label if label else 'get-data'
+    use_client = client
+    try:
+        if not use_client:
+            use_client = get_async_client(
+                host=host,
+                port=port,
+                password=password,
+                db=db)
+        raw_data = await use_client.get(key)
+    except Exception as e:
+        err = (
+            f'{log_id} failed - redis get key={key} ex={e}')
+        log.error(err)
+        return build_result.build_result(
+            status=ae_consts.ERR,
+            err=err,
+            rec={
+                'data': None
+            })
+    finally:
+        if use_client is not None and not client:
+            await close_client(use_client)
+    # end of try/ex for getting redis data
+
+    return await run_in_executor(
+        redis_get.decode_data,
+        label=log_id,
+        key=key,
+        raw_data=raw_data,
+        decompress_df=decompress_df,
+        serializer=serializer,
+        encoding=encoding)
+# end of get_data_from_redis_key_async
+
+
+def decode_values(
+        label,
+        keys,
+        raw_values,
+        decompress_df=False,
+        serializer='json',
+        encoding='utf-8'):
+    """decode_values
+
+    Decode the bytes from an ``MGET`` into a dictionary of
+    redis key to the ``get_data_from_redis_key`` result
+
+    :param label: log tracking label
+    :param keys: list of redis keys
+    :param raw_values: list of bytes (or ``None``) for ``keys``
+    :param decompress_df: used for decompressing
+        ``pandas.DataFrame`` automatically
+    :param serializer: not used yet - support for future
+                       pickle objects in redis
+    :param encoding: format of the encoded key in redis
+    """
+    return {
+        key: redis_get.decode_data(
+            label=label,
+            key=key,
+            raw_data=raw_data,
+            decompress_df=decompress_df,
+            serializer=serializer,
+            encoding=encoding)
+        for key, raw_data in zip(keys, raw_values)
+    }
+# end of decode_values
+
+
+async def get_data_from_redis_keys_async(
+        label=None,
+        client=None,
+        host=None,
+        port=None,
+        password=None,
+        db=None,
+        keys=None,
+        decompress_df=False,
+        serializer='json',
+        encoding='utf-8'):
+    """get_data_from_redis_keys_async
+
+    Awaitable ``get_data_from_redis_keys`` with one ``MGET``
+
+    :param label: log tracking label
+    :param client: optional - ``redis.asyncio.Redis`` client
+        (a new client is used and closed if not set)
+    :param host: redis host
+    :param port: redis port
+    :param password: redis password
+    :param db: redis db
+    :param keys: list of redis keys
+    :param decompress_df: used for decompressing
+        ``pandas.DataFrame`` automatically
+    :param serializer: not used yet - support for future
+                       pickle objects in redis
+    :param encoding: format of the encoded key in redis
+    """
+    log_id = label if label else 'get-data'
+    use_keys = list(dict.fromkeys(keys if keys else []))
+    if not use_keys:
+        return {}
+
+    use_client = client
+    try:
+        if not use_client:
+            use_client = get_async_client(
+                host=host,
+                port=port,
+                password=password,
+                db=db)
+        raw_values = await use_client.mget(use_keys)
+    except Exception as e:
+        err = (
+            f'{log_id} failed - redis mget keys={use_keys} ex={e}')
+        log.error(err)
+        return {
+            key: build_result.build_result(
+                status=ae_consts.ERR,
+                err=err,
+                rec={
+                    'data': None
+                })
+            for key in use_keys
+        }
+    finally:
+        if use_client is not None and not client:
+            await close_client(use_client)
+    # end of try/ex for getting redis data
+
+    return await run_in_executor(
+        decode_values,
+        label=log_id,
+        keys=use_keys,
+        raw_values=raw_values,
+        decompress_df=decompress_df,
+        serializer=serializer,
+        encoding=encoding)
+# end of get_data_from_redis_keys_async
+
+
+async def build_df_from_redis_async(
+        label=None,
+        client=None,
+        address=None,
+        host=None,
+        port=None,
+        password=None,
+        db=None,
+        key=None,
+        is_compressed=True,
+        encoding='utf-8',
+        orient='records',
+        verbose=False):
+    """build_df_from_redis_async
+
+    Awaitable ``build_df_from_redis``
+
+    :param label: log tracking label
+    :param client: optional - ``redis.asyncio.Redis`` client
+        (a new client is used and closed if not set)
+    :param address: redis address: <host:port>
+    :param host: redis host
+    :param port: redis port
+    :param password: redis password
+    :param db: redis db
+    :param key: redis key
+    :param is_compressed: optional boolean - the
+        object is a compressed string and the
+        default is ``True``
+    :param encoding: format of the encoded key in redis
+    :param orient: use the same orient value as
+        the ``to_json(orient='records')`` used
+        to deserialize the DataFrame correctly.
+    :param verbose: optional - boolean for turning on logging
+    """
+    if not host and not port and address:
+        host, port = redis_pool.split_address(
+            address=address)
+    redis_res = await get_data_from_redis_key_async(
+        label=label,
+        client=client,
+        host=host,
+        port=port,
+        password=password,
+        db=db,
+        key=key,
+        decompress_df=is_compressed,
+        encoding=encoding)
+    return await run_in_executor(
+        build_df.build_df_from_redis,
+        label=label,
+        key=key,
+        is_compressed=is_compressed,
+        encoding=encoding,
+        orient=orient,
+        redis_res=redis_res,
+        verbose=verbose)
+# end of build_df_from_redis_async
+
+
+async def s3_read_contents_from_key_async(
+        s3,
+        s3_bucket_name,
+        s3_key,
+        encoding='utf-8',
+        convert_as_json=True,
+        compress=False):
+    """s3_read_contents_from_key_async
+
+    Awaitable ``s3_read_contents_from_key`` (this will
+    raise exceptions)
+
+    :param s3: existing S3 object
+    :param s3_bucket_name: bucket name
+    :param s3_key: S3 key
+    :param encoding: utf-8 by default
+    :param convert_to_json: auto-convert to a dict
+    :param compress: decompress using ``zlib``
+    """
+    return await run_in_executor(
+        s3_utils.s3_read_contents_from_key,
+        s3=s3,
+        s3_bucket_name=s3_bucket_name,
+        s3_key=s3_key,
+        encoding=encoding,
+        convert_as_json=convert_as_json,
+        compress=compress)
+# end of s3_read_contents_from_key_async
+
+
+async def load_algo_dataset_from_s3_async(
+        **kwargs):
+    """load_algo_dataset_from_s3_async
+
+    Awaitable ``load_algo_dataset_from_s3``
+
+    :param kwargs: keyword arguments for
+        ``load_algo_dataset_from_s3``
+    """
+    return await run_in_executor(
+        load_from_s3.load_algo_dataset_from_s3,
+        **kwargs)
+# end of load_algo_dataset_from_s3_async
+
+
+async def load_algo_dataset_from_redis_async(
+        redis_key,
+        redis_address,
+        redis_db,
+        redis_password,
+        redis_expire=None,
+        redis_serializer='json',
+        serialize_datasets=ae_consts.DEFAULT_SERIALIZED_DATASETS,
+        compress=False,
+        encoding='utf-8',
+        client=None):
+    """load_algo_dataset_from_redis_async
+
+    Awaitable ``load_algo_dataset_from_redis``
+
+    :param redis_key: redis key
+    :param redis_address: redis address: <host:port>
+    :param redis_db: redis db
+    :param redis_password: redis password
+    :param redis_expire: not used yet - redis expire
+    :param redis_serializer: not used yet - support for
+        future pickle objects in redis
+    :param serialize_datasets: optional - list of dataset names to
+        deserialize in the dataset
+    :param compress: optional - boolean flag for decompressing
+        the contents of the key if necessary
+        (default is ``False`` and algorithms
+        use ``zlib`` for compression)
+    :param encoding: optional - string for data encoding
+    :param client: optional - ``redis.asyncio.Redis`` client
+    """
+    redis_host, redis_port = redis_pool.split_address(
+        address=redis_address)
+    redis_res = await get_data_from_redis_key_async(
+        client=client,
+        key=redis_key,
+        host=redis_host,
+        port=redis_port,
+        db=redis_db,
+        password=redis_password,
+        serializer=redis_serializer,
+        encoding=encoding)
+
+    if redis_res['status'] != ae_consts.SUCCESS:
+        log.error(
+            'failed getting data from '
+            f'redis={redis_address}:{redis_db}/{redis_key}')
+        return None
+
+    data_from_file = redis_res['rec']['data']
+    if not data_from_file:
+        log.error(
+            f'missing data from redis={redis_address}:{redis_db}/{redis_key}')
+        return None
+
+    return await run_in_executor(
+        prepare_utils.prepare_dict_for_algo,
+        data=data_from_file,
+        compress=compress,
+        convert_to_dict=True,
+        encoding=encoding)
+# end of load_algo_dataset_from_redis_async
+
+
+def get_redis_work_dict(
+        ticker,
+        label,
+        service_dict=None,
+        redis_address=None,
+        redis_db=None,
+        redis_password=None):
+    """get_redis_work_dict
+
+    Get the redis connectivity arguments ``build_dataset_node``
+    uses for the same arguments
+
+    :param ticker: string ticker
+    :param label: log tracking label
+    :param service_dict: optional - dictionary for all
+        service connectivity to Redis and Minio
+    :param redis_address: optional - Redis address
+    :param redis_db: optional - Redis db
+    :param redis_password: optional - Redis password
+    """
+    if service_dict:
+        return api_requests.get_ds_dict(
+            ticker=ticker,
+            ds_id=label,
+            service_dict=service_dict)
+    return {
+        'redis_address': (
+            redis_address if redis_address else ae_consts.REDIS_ADDRESS),
+        'redis_db': (
+            redis_db if redis_db else ae_consts.REDIS_DB),
+        'redis_password': (
+            redis_password if redis_password else ae_consts.REDIS_PASSWORD)
+    }
+# end of get_redis_work_dict
+
+
+async def get_batch_redis_recs_async(
+        label,
+        date_keys,
+        datasets,
+        work_dict,
+        clients):
+    """get_batch_redis_recs_async
+
+    Awaitable ``build_dataset_node.get_batch_redis_recs``
+    with the ``MGET`` for each redis server in flight
+    at the same time. Keys that failed are read again with
+    ``get_data_from_redis_key_async`` and every result is
+    returned (even errors) so decoding the nodes never reads
+    a key with a blocking ``GET``
+
+    :param label: log tracking label
+    :param date_keys: list of ``<ticker>_<date>`` redis
+        key prefixes
+    :param datasets: list of string dataset names
+    :param work_dict: dictionary of args for the extracts
+    :param clients: dictionary of ``(host, port)`` to
+        ``redis.asyncio.Redis`` clients (new clients are
+        added to it and the caller closes them)
+    """
+    servers = build_ds_node.get_batch_redis_keys(
+        date_keys=date_keys,
+        datasets=datasets,
+        work_dict=work_dict)
+    fetches = []
+    server_clients = []
+    for (host, port), keys in servers.items():
+        if (host, port) not in clients:
+            clients[(host, port)] = get_async_client(
+                host=host,
+                port=port,
+                password=work_dict.get(
+                    'redis_password',
+                    ae_consts.REDIS_PASSWORD),
+                db=work_dict.get(
+                    'redis_db',
+                    ae_consts.REDIS_DB))
+        server_clients.append(clients[(host, port)])
+        fetches.append(get_data_from_redis_keys_async(
+            label=label,
+            client=clients[(host, port)],
+            keys=keys,
+            decompress_df=True))
+    # end of for all redis servers
+
+    redis_recs = {}
+    retry_keys = []
+    retries = []
+    for client, server_recs in zip(
+            server_clients,
+            await asyncio.gather(*fetches)):
+        for key, rec in server_recs.items():
+            redis_recs[key] = rec
+            if rec['status'] != ae_consts.SUCCESS:
+                retry_keys.append(key)
+                retries.append(get_data_from_redis_key_async(
+                    label=label,
+                    client=client,
+                    key=key,
+                    decompress_df=True))
+    # end of for all redis servers
+
+    for key, rec in zip(retry_keys, await asyncio.gather(*retries)):
+        redis_recs[key] = rec
+    return redis_recs
+# end of get_batch_redis_recs_async
+
+
+async def build_dataset_node_async(
+        ticker,
+        datasets,
+        date=None,
+        service_dict=None,
+        log_label=None,
+        redis_address=None,
+        redis_db=None,
+        redis_password=None,
+        clients=None,
+        verbose=False):
+    """build_dataset_node_async
+
+    Awaitable ``build_dataset_node`` that reads all the
+    dataset keys with ``redis.asyncio`` and returns the same
+    dictionary of datasets
+
+    :param ticker: string ticker
+    :param datasets: list of string dataset names
+        to extract from redis
+    :param date: optional - string datetime formatted
+        ``YYYY-MM-DD``
+        (default is last trading close date)
+    :param service_dict: optional - dictionary for all
+        service connectivity to Redis and Minio
+    :param log_label: optional - log label string
+    :param redis_address: optional - Redis address
+    :param redis_db: optional - Redis db
+    :param redis_password: optional - Redis password
+    :param clients: optional - dictionary of ``(host, port)``
+        to ``redis.asyncio.Redis`` clients to reuse (new clients
+        are closed before returning if not set)
+    :param verbose: optional - flag for debugging
+        (default to ``False``)
+    """
+    label = log_label
+    if not label:
+        label = 'build_bt'
+    if not date:
+        date = ae_utils.get_last_close_str()
+    use_clients = clients if clients is not None else {}
+    try:
+        redis_recs = await get_batch_redis_recs_async(
+            label=label,
+            date_keys=[
+                f'{ticker}_{date}'
+            ],
+            datasets=datasets,
+            work_dict=get_redis_work_dict(
+                ticker=ticker,
+                label=label,
+                service_dict=service_dict,
+                redis_address=redis_address,
+                redis_db=redis_db,
+                redis_password=redis_password),
+            clients=use_clients)
+    finally:
+        if clients is None:
+            for client in use_clients.values():
+                await close_client(client)
+    return await run_in_executor(
+        build_ds_node.build_dataset_node,
+        ticker=ticker,
+        datasets=datasets,
+        date=date,
+        service_dict=service_dict,
+        log_label=label,
+        redis_address=redis_address,
+        redis_db=redis_db,
+        redis_password=redis_password,
+        redis_recs=redis_recs,
+        verbose=verbose)
+# end of build_dataset_node_async
+
+
+async def build_dataset_nodes_async(
+        extract_requests,
+        datasets,
+        service_dict=None,
+        chunk_size=20,
+        max_in_flight=4,
+        log_label=None,
+        verbose=False):
+    """build_dataset_nodes_async
+
+    Async generator version of
+    ``build_dataset_node.build_dataset_nodes`` that yields
+    ``(ticker, node)`` tuples in the same order as
+    ``extract_requests``. Up to ``max_in_flight`` chunks of
+    ``chunk_size`` requests are read at the same time ahead
+    of the node being decoded on the event loop's default
+    executor
+
+    :param extract_requests: list of extract request
+        dictionaries with ``id``, ``ticker`` and ``date`` keys
+        (the tickers can be mixed)
+    :param datasets: list of string dataset names
+        to extract from redis
+    :param service_dict: optional - dictionary for all
+        service connectivity to Redis and Minio
+    :param chunk_size: optional - number of requests to
+        fetch in each ``MGET`` (default is ``20``)
+    :param max_in_flight: optional - number of chunks read
+        at the same time (default is ``4``)
+    :param log_label: optional - log label string
+    :param verbose: optional - flag for debugging
+        (default to ``False``)
+    """
+    label = log_label
+    if not label:
+        label = 'build_bt'
+    use_requests = list(extract_requests)
+    if len(use_requests) == 0:
+        return
+    chunk_size = max(1, int(chunk_size))
+    max_in_flight = max(1, int(max_in_flight))
+    chunks = collections.deque(
+        use_requests[idx:idx + chunk_size]
+        for idx in range(0, len(use_requests), chunk_size))
+    work_dict = get_redis_work_dict(
+        ticker=use_requests[0]['ticker'],
+        label=label,
+        service_dict=service_dict)
+    node_args = {
+        'datasets': datasets,
+        'service_dict': service_dict,
+        'log_label': label,
+        'verbose': verbose
+    }
+    clients = {}
+    pending = collections.deque()
+
+    # start reading the next chunk
+    def start_chunk():
+        chunk = chunks.popleft()
+        pending.append((chunk, asyncio.ensure_future(
+            get_batch_redis_recs_async(
+                label=label,
+                date_keys=[
+                    f'{req["ticker"]}_{req["date"]}'
+                    for req in chunk
+                ],
+                datasets=datasets,
+                work_dict=work_dict,
+                clients=clients))))
+    # end of start_chunk
+
+    try:
+        while chunks and len(pending) < max_in_flight:
+            start_chunk()
+        while pending:
+            chunk, fetch = pending.popleft()
+            redis_recs = await fetch
+            if chunks:
+                start_chunk()
+            chunk_recs = build_ds_node.split_redis_recs(
+                chunk=chunk,
+                redis_recs=redis_recs)
+            for req, req_recs in zip(chunk, chunk_recs):
+                yield await run_in_executor(
+                    build_ds_node.build_node,
+                    req=req,
+                    redis_recs=req_recs,
+                    node_args=node_args)
+        # end of while chunks are in flight
+    finally:
+        for chunk, fetch in pending:
+            fetch.cancel()
+        for client in clients.values():
+            await close_client(client)
+    # end of try/finally closing the clients
+# end of build_dataset_nodes_async
+
+
+def load_dataset_nodes(
+        extract_requests,
+        datasets,
+        service_dict=None,
+        chunk_size=20,
+        max_in_flight=4,
+        log_label=None,
+        verbose=False):
+    """load_dataset_nodes
+
+    Run ``build_dataset_nodes_async`` from synchronous code
+    and return the list of ``(ticker, node)`` tuples (if an
+    event loop is already running in this thread, the range
+    loader runs on its own event loop in another thread and
+    this blocks the running loop until it finishes)
+
+    :param extract_requests: list of extract request
+        dictionaries with ``id``, ``ticker`` and ``date`` keys
+    :param datasets: list of string dataset names
+        to extract from redis
+    :param service_dict: optional - dictionary for all
+        service connectivity to Redis and Minio
+    :param chunk_size: optional - number of requests to
+        fetch in each ``MGET`` (default is ``20``)
+    :param max_in_flight: optional - number of chunks read
+        at the same time (default is ``4``)
+    :param log_label: optional - log label string
+    :param verbose: optional - flag for debugging
+        (default to ``False``)
+    """
+    async def collect_nodes():
+        return [
+            item
+            async for item in build_dataset_nodes_async(
+                extract_requests=extract_requests,
+                datasets=datasets,
+                service_dict=service_dict,
+                chunk_size=chunk_size,
+                max_in_flight=max_in_flight,
+                log_label=log_label,
+                verbose=verbose)
+        ]
+    # end of collect_nodes
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(collect_nodes())
+    # asyncio.run can not start a loop from a running loop
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=1) as executor:
+        return executor.submit(
+            lambda: asyncio.run(collect_nodes())).result()
+# end of load_dataset_nodes
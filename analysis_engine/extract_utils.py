@@ -43,6 +43,7 @@ def perform_extract(
         work_dict,
         dataset_id_key='ticker',
         scrub_mode='sort-by-date',
+        redis_res=None,
         verbose=False):
     """perform_extract
 
@@ -56,6 +57,9 @@ def perform_extract(
                            debugging errors
     :param scrub_mode: scrubbing mode on extraction for
                        one-off cleanup before analysis
+    :param redis_res: optional - ``get_data_from_redis_key``
+                      result already fetched for the
+                      ``redis_key`` in a batch
     :param verbose: optional - boolean for turning on logging
     """
     status = ae_consts.FAILED
@@ -131,6 +135,7 @@ def perform_extract(
             address=redis_address,
             db=redis_db,
             key=redis_key,
+            redis_res=redis_res,
             verbose=verbose)
     except Exception as e:
         extract_res = None
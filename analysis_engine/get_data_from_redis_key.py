@@ -17,9 +17,10 @@ Debug redis calls with:
 
 import json
 import zlib
-import redis
 import analysis_engine.consts as ae_consts
+import analysis_engine.redis_pool as redis_pool
 import analysis_engine.build_result as build_result
+import analysis_engine.serialize_df as serialize_df
 import spylunking.log.setup_logging as log_utils
 
 log = log_utils.build_colorized_logger(name=__name__)
@@ -74,7 +75,7 @@ def get_data_from_redis_key(
             log.debug(
                 f'{log_id} - get key={key} new '
                 f'client={host}:{port}@{db}')
-            use_client = redis.Redis(
+            use_client = redis_pool.get_client(
                 host=host,
                 port=port,
                 password=password,
@@ -86,9 +87,151 @@ def get_data_from_redis_key(
         # https://redis-py.readthedocs.io/en/latest/index.html#redis.StrictRedis.get  # noqa
         raw_data = use_client.get(
             name=key)
+    except Exception as e:
+        err = (
+            f'{log_id} failed - redis get from decoded={decoded_data} '
+            f'data={data} key={key} ex={e}')
+        log.error(err)
+        res = build_result.build_result(
+            status=ae_consts.ERR,
+            err=err,
+            rec=rec)
+        return res
+    # end of try/ex for getting redis data
+
+    return decode_data(
+        label=log_id,
+        key=key,
+        raw_data=raw_data,
+        decompress_df=decompress_df,
+        serializer=serializer,
+        encoding=encoding)
+# end of get_data_from_redis_key
+
+
+def get_data_from_redis_keys(
+        label=None,
+        client=None,
+        host=None,
+        port=None,
+        password=None,
+        db=None,
+        keys=None,
+        decompress_df=False,
+        serializer='json',
+        encoding='utf-8'):
+    """get_data_from_redis_keys
+
+    Get many keys with one ``MGET`` round trip instead of
+    one ``GET`` per key. Returns a dictionary with the
+    ``get_data_from_redis_key`` result for each key
+
+    :param label: log tracking label
+    :param client: initialized redis client
+    :param host: redis host
+    :param port: redis port
+    :param password: redis password
+    :param db: redis db
+    :param keys: list of redis keys
+    :param decompress_df: used for decompressing
+        ``pandas.DataFrame`` automatically
+    :param serializer: not used yet - support for future
+                       pickle objects in redis
+    :param encoding: format of the encoded key in redis
+    """
+    log_id = label if label else 'get-data'
+    use_keys = list(dict.fromkeys(keys if keys else []))
+    if not use_keys:
+        return {}
+
+    try:
+        use_client = client
+        if not use_client:
+            use_client = redis_pool.get_client(
+                host=host,
+                port=port,
+                password=password,
+                db=db)
+        log.debug(f'{log_id} - mget keys={use_keys}')
+        raw_values = use_client.mget(use_keys)
+    except Exception as e:
+        err = (
+            f'{log_id} failed - redis mget keys={use_keys} ex={e}')
+        log.error(err)
+        return {
+            key: build_result.build_result(
+                status=ae_consts.ERR,
+                err=err,
+                rec={
+                    'data': None
+                })
+            for key in use_keys
+        }
+    # end of try/ex for getting redis data
+
+    return {
+        key: decode_data(
+            label=log_id,
+            key=key,
+            raw_data=raw_data,
+            decompress_df=decompress_df,
+            serializer=serializer,
+            encoding=encoding)
+        for key, raw_data in zip(use_keys, raw_values)
+    }
+# end of get_data_from_redis_keys
+
+
+def decode_data(
+        label=None,
+        key=None,
+        raw_data=None,
+        decompress_df=False,
+        serializer='json',
+        encoding='utf-8'):
+    """decode_data
+
+    Decode the bytes stored in a redis key into a
+    ``get_data_from_redis_key`` result (bytes from
+    ``analysis_engine.serialize_df`` are detected by their
+    header and decoded into a ``pandas.DataFrame``)
+
+    :param label: log tracking label
+    :param key: redis key the bytes came from
+    :param raw_data: bytes from redis or ``None``
+        if the key was not found
+    :param decompress_df: used for decompressing
+        ``pandas.DataFrame`` automatically
+    :param serializer: not used yet - support for future
+                       pickle objects in redis
+    :param encoding: format of the encoded key in redis
+    """
+    decoded_data = None
+    data = None
+
+    rec = {
+        'data': data
+    }
+    res = build_result.build_result(
+        status=ae_consts.NOT_RUN,
+        err=None,
+        rec=rec)
+
+    log_id = label if label else 'get-data'
 
+    try:
         if raw_data:
 
+            if serialize_df.is_serialized_df(raw_data):
+                log.debug(f'{log_id} - deserializing df key={key}')
+                rec['data'] = serialize_df.deserialize_df(
+                    data=raw_data)
+                return build_result.build_result(
+                    status=ae_consts.SUCCESS,
+                    err=None,
+                    rec=rec)
+            # binary column bundles do not need the json decode
+
             if decompress_df:
                 try:
                     data = zlib.decompress(
@@ -159,7 +302,7 @@ def get_data_from_redis_key(
             status=ae_consts.ERR,
             err=err,
             rec=rec)
-    # end of try/ex for getting redis data
+    # end of try/ex for decoding redis data
 
     return res
-# end of get_data_from_redis_key
+# end of decode_data
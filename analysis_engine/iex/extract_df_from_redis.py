@@ -417,6 +417,7 @@ def extract_dataset(
         date=None,
         work_dict=None,
         scrub_mode='NO_SORT',
+        redis_res=None,
         verbose=False):
     """extract_dataset
 
@@ -429,6 +430,9 @@ def extract_dataset(
         formatted ``YYYY-MM-DD``
     :param work_dict: dictionary of args
     :param scrub_mode: type of scrubbing handler to run
+    :param redis_res: optional - ``get_data_from_redis_key``
+        result already fetched for the
+        ``<ticker>_<date>_<key>`` redis key
     :param verbose: optional - boolean for turning on logging
     """
     if not key or key not in keys:
@@ -470,5 +474,6 @@ def extract_dataset(
         df_str=df_str,
         work_dict=req,
         scrub_mode=scrub_mode,
+        redis_res=redis_res,
         verbose=verbose)
 # end of extract_dataset
@@ -196,6 +196,10 @@ def get_data_from_iex(
         upload_and_cache_req['data'] = rec['data']
         if not upload_and_cache_req['data']:
             upload_and_cache_req['data'] = '{}'
+        if (
+                ae_consts.DF_SERIALIZER == 'columnar' and
+                ae_consts.is_df(df=df)):
+            upload_and_cache_req['df'] = df
         use_field = field
         if use_field == 'news':
             use_field = 'news1'
@@ -24,6 +24,9 @@ import analysis_engine.indicators.base_indicator as base_indicator
 class IndicatorATR(base_indicator.BaseIndicator):
     """IndicatorATR"""
 
+    uses_ohlcv_arrays = True
+    uses_lookback_window = True
+
     def __init__(
             self,
             **kwargs):
@@ -306,6 +309,59 @@ class IndicatorATR(base_indicator.BaseIndicator):
             self.lg('process end')
     # end of process
 
+    def compute_ohlcv_value(
+            self,
+            ohlcv):
+        """compute_ohlcv_value
+
+        Compute the latest ``ATR`` value from the trailing
+        ``num_points`` rows of the shared ``OHLCVBundle``
+        with ``ae_talib.cached``
+
+        :param ohlcv: ``analysis_engine.ohlcv_bundle.OHLCVBundle``
+        """
+        num_points = self.num_points
+        return ae_talib.cached(
+            ohlcv=ohlcv,
+            func='ATR',
+            inputs={
+                'high': 'high',
+                'low': 'low',
+                'close': 'close'
+            },
+            num_points=num_points,
+            timeperiod=num_points)[-1]
+    # end of compute_ohlcv_value
+
+    def build_stream_kernel(
+            self):
+        """build_stream_kernel
+
+        Build the streaming ``ATR`` kernel for
+        ``indicator_mode=incremental``
+        """
+        return ae_talib.stream.ATR(
+            timeperiod=self.num_points)
+    # end of build_stream_kernel
+
+    def handle_stream_value(
+            self,
+            value,
+            cur_value):
+        """handle_stream_value
+
+        Set ``self.atr_value`` and the buy and sell labels
+        from the streaming kernel's latest value
+
+        :param value: latest ``ATR`` value
+        :param cur_value: close for the current bar
+        """
+        self.atr_value = ae_consts.to_f(value)
+        self.set_percent_signals(
+            value=self.atr_value,
+            cur_value=cur_value)
+    # end of handle_stream_value
+
     def reset_internals(
             self):
         """reset_internals"""
@@ -14,6 +14,16 @@ import spylunking.log.setup_logging as log_utils
 class BaseIndicator:
     """BaseIndicator"""
 
+    # set to True in derived classes that implement
+    # compute_ohlcv_value (or process_arrays) so the
+    # IndicatorProcessor hands them the bar's OHLCVBundle
+    uses_ohlcv_arrays = False
+    # set to True in derived classes whose process only reads
+    # the trailing num_points rows (once there are more than
+    # num_points rows) so the IndicatorProcessor can hand them
+    # a window of the dataset instead of every row seen so far
+    uses_lookback_window = False
+
     def __init__(
             self,
             config_dict,
@@ -111,6 +121,37 @@ class BaseIndicator:
             ae_consts.EMPTY_DF_LIST)
         self.configurables = self.config
         self.ind_confs = []
+        # set by the IndicatorProcessor when the algorithm runs
+        # with indicator_mode=incremental or indicator_mode=precompute
+        # and this indicator supports the mode
+        self.is_incremental = False
+        self.is_precomputed = False
+        # analysis_engine.bar_cursor.BarCursor positioned on the
+        # current bar (set by the IndicatorProcessor when the
+        # algorithm steps through minutes)
+        self.bar_cursor = None
+        # analysis_engine.stream_talib kernel from build_stream_kernel
+        # (set by seed_incremental)
+        self.stream_kernel = None
+        self.stream_columns = []
+        self.stream_closes = []
+        self.stream_is_missing = []
+        self.stream_num_missing = []
+        self.stream_last_idx = None
+        # set by the IndicatorProcessor when the algorithm runs
+        # with indicator_mode=full_series to follow every bar
+        # with the kernel even if it does not match process
+        self.use_full_series = False
+        # this indicator's row of the ae_talib.multi matrix
+        # (set by precompute_batch)
+        self.batch_values = None
+        self.batch_closes = None
+        self.batch_num_missing = None
+        # report keys compiled on the first get_report call and
+        # the reusable list of values for each bar's report
+        self.report_layout = None
+        self.report_keys = None
+        self.report_values = None
         self.convert_config_keys_to_members()
     # end of __init__
 
@@ -336,91 +377,124 @@ class BaseIndicator:
         return report_key
     # end of build_report_key
 
-    def get_report(
-            self,
-            verbose=False):
-        """get_report
-
-        Get the indicator's current output node
-        that is used for the trading performance report
-        generated at the end of the algorithm
+    def build_report_layout(
+            self):
+        """build_report_layout
 
-        .. note:: the report dict should mostly be numeric
-            types to enable AI predictions after removing
-            non-numeric columns
+        Compile the report's keys once (including the
+        ``build_report_key`` suffix for keys that would stomp an
+        earlier key) so every ``get_report`` call uses the same
+        keys. Call this again after changing ``self.report_dict``,
+        ``self.configurables`` or the report prefix
 
-        :param verbose: optional - boolean for toggling
-            to show the report
+        Returns the list of report keys
         """
+        layout = []
         cur_report_dict = {}
 
         # allow derived indicators to build their own report prefix
         report_prefix_key_name = self.get_report_prefix()
 
         for key in self.report_dict:
-
-            is_valid = True
             if key in self.report_ignore_keys:
-                is_valid = False
-
-            if is_valid:
-                report_key = self.build_report_key(
-                    key,
-                    prefix_key=report_prefix_key_name,
-                    key_type='report',
-                    cur_report_dict=cur_report_dict)
-                cur_report_dict[report_key] = self.report_dict[key]
+                continue
+            report_key = self.build_report_key(
+                key,
+                prefix_key=report_prefix_key_name,
+                key_type='report',
+                cur_report_dict=cur_report_dict)
+            cur_report_dict[report_key] = None
+            layout.append((report_key, key, True))
         # for all keys to output into the report
 
-        buy_value = None
-        sell_value = None
-
         for key in self.configurables:
-
-            is_valid = True
             if key in self.report_ignore_keys:
-                is_valid = False
+                continue
             elif key not in self.__dict__:
-                is_valid = False
-
-            if is_valid:
-                report_key = self.build_report_key(
-                    key,
-                    prefix_key=report_prefix_key_name,
-                    key_type='conf',
-                    cur_report_dict=cur_report_dict)
-
-                use_value = None
-                if key == 'is_buy':
-                    buy_value = self.__dict__[key]
-                    if buy_value:
-                        use_value = \
-                            ae_consts.INDICATOR_ACTIONS[buy_value]
-                    else:
-                        use_value = \
-                            ae_consts.INT_INDICATOR_NOT_PROCESSED
-                elif key == 'is_sell':
-                    sell_value = self.__dict__[key]
-                    if sell_value:
-                        use_value = \
-                            ae_consts.INDICATOR_ACTIONS[sell_value]
-                    else:
-                        use_value = \
-                            ae_consts.INT_INDICATOR_NOT_PROCESSED
+                continue
+            report_key = self.build_report_key(
+                key,
+                prefix_key=report_prefix_key_name,
+                key_type='conf',
+                cur_report_dict=cur_report_dict)
+            cur_report_dict[report_key] = None
+            layout.append((report_key, key, False))
+        # end of all configurables for this indicator
+
+        self.report_layout = layout
+        self.report_keys = [
+            node[0]
+            for node in layout
+        ]
+        self.report_values = [None] * len(layout)
+        return self.report_keys
+    # end of build_report_layout
+
+    def get_report_keys(
+            self):
+        """get_report_keys
+
+        Get the list of report keys from ``build_report_layout``
+        """
+        if self.report_layout is None:
+            self.build_report_layout()
+        return self.report_keys
+    # end of get_report_keys
+
+    def get_report_values(
+            self):
+        """get_report_values
+
+        Fill and return the reusable list of the current
+        report values in the same order as ``get_report_keys``.
+        The list is overwritten by the next call
+        """
+        if self.report_layout is None:
+            self.build_report_layout()
+        values = self.report_values
+        member_dict = self.__dict__
+        for idx, (report_key, key, is_report) in enumerate(
+                self.report_layout):
+            if is_report:
+                values[idx] = self.report_dict.get(key, None)
+            elif key == 'is_buy' or key == 'is_sell':
+                action_value = member_dict.get(key, None)
+                if action_value:
+                    values[idx] = ae_consts.INDICATOR_ACTIONS[action_value]
                 else:
-                    use_value = self.__dict__[key]
-                # end of deciding value
+                    values[idx] = ae_consts.INT_INDICATOR_NOT_PROCESSED
+            else:
+                values[idx] = member_dict.get(key, None)
+        # end of for all report keys
+        return values
+    # end of get_report_values
 
-                cur_report_dict[report_key] = use_value
-            # if valid
+    def get_report(
+            self,
+            verbose=False):
+        """get_report
 
-        # end of all configurables for this indicator
+        Get the indicator's current output node
+        that is used for the trading performance report
+        generated at the end of the algorithm
+
+        .. note:: the report dict should mostly be numeric
+            types to enable AI predictions after removing
+            non-numeric columns
+
+        :param verbose: optional - boolean for toggling
+            to show the report
+        """
+        cur_report_dict = dict(zip(
+            self.get_report_keys(),
+            self.get_report_values()))
 
         if verbose or self.verbose:
             self.lg(
                 f'indicator={self.name} '
                 f'report={ae_consts.ppj(cur_report_dict)} '
-                f'buy={buy_value} sell={sell_value}')
+                f'buy={self.__dict__.get("is_buy", None)} '
+                f'sell={self.__dict__.get("is_sell", None)}')
 
         return cur_report_dict
     # end of get_report
@@ -507,11 +581,433 @@ class BaseIndicator:
         return ae_consts.SUCCESS
     # end of reset_internals
 
-    def handle_subscribed_dataset(
+    def build_stream_kernel(
+            self):
+        """build_stream_kernel
+
+        Derive this method to return a streaming kernel from
+        ``analysis_engine.ae_talib.stream`` (like
+        ``ae_talib.stream.RSI(timeperiod=self.num_points)``) and
+        implement ``handle_stream_value`` to support
+        ``indicator_mode=incremental`` without writing your own
+        ``seed_incremental`` and ``process_incremental``. Return
+        ``None`` to keep using ``process``
+        """
+        return None
+    # end of build_stream_kernel
+
+    def stream_kernel_matches_process(
+            self):
+        """stream_kernel_matches_process
+
+        Derive this method to return ``True`` if the kernel from
+        ``build_stream_kernel`` reports the same value as
+        ``process`` for every bar. Only windowed kernels can
+        match because ``process`` re-runs the talib function over
+        the trailing ``num_points`` rows on every bar, so
+        ``indicator_mode=incremental`` keeps calling ``process``
+        for the others and only ``indicator_mode=full_series``
+        uses their kernels
+        """
+        return False
+    # end of stream_kernel_matches_process
+
+    def handle_stream_value(
+            self,
+            value,
+            cur_value):
+        """handle_stream_value
+
+        Derive this method to set the indicator's values and
+        buy and sell labels from the streaming kernel's latest
+        ``value`` (a ``tuple`` for kernels with more than one output).
+        ``process_arrays`` also calls it with the value from
+        ``compute_ohlcv_value``
+
+        :param value: latest value from the kernel
+        :param cur_value: close for the current bar
+        """
+        return
+    # end of handle_stream_value
+
+    def set_percent_signals(
+            self,
+            value,
+            cur_value):
+        """set_percent_signals
+
+        Label the bar using the percent difference between
+        the close and ``value`` with the ``buy_above_percent``,
+        ``buy_below_percent``, ``sell_above_percent`` and
+        ``sell_below_percent`` thresholds like the built-in
+        indicators do in ``process``
+
+        :param value: indicator value
+        :param cur_value: close for the current bar
+        """
+        if cur_value <= 0:
+            self.lg(f'invalid current_value={cur_value}')
+            return
+
+        self.close = cur_value
+        self.amount_to_close = ae_consts.to_f(
+            cur_value - value)
+        self.percent_value = ae_consts.to_f(
+            self.amount_to_close / cur_value * 100.0)
+
+        self.is_buy = ae_consts.INDICATOR_IGNORE
+        self.is_sell = ae_consts.INDICATOR_IGNORE
+
+        if (self.buy_above_percent != -1 and
+                self.percent_value > self.buy_above_percent):
+            self.is_buy = ae_consts.INDICATOR_BUY
+        elif (self.buy_below_percent != -1 and
+                self.percent_value > self.buy_below_percent):
+            self.is_buy = ae_consts.INDICATOR_BUY
+
+        if (self.sell_above_percent != -1 and
+                self.percent_value > self.sell_above_percent):
+            self.is_sell = ae_consts.INDICATOR_SELL
+        elif (self.sell_below_percent != -1 and
+                self.percent_value > self.sell_below_percent):
+            self.is_sell = ae_consts.INDICATOR_SELL
+    # end of set_percent_signals
+
+    def seed_incremental(
+            self,
+            algo_id,
+            ticker,
+            dataset):
+        """seed_incremental
+
+        Derive this method to support ``indicator_mode=incremental``.
+        It is called once with the full (unpruned) ``dataset``
+        before the algorithm starts stepping through bars. Return
+        ``True`` if the indicator will track its own rolling state
+        and handle each bar in ``process_incremental``, otherwise
+        return ``False`` and the indicator keeps using ``process``
+
+        By default this caches the subscribed dataset's columns
+        for the kernel from ``build_stream_kernel`` (if any) when
+        ``stream_kernel_matches_process`` returns ``True`` or the
+        algorithm runs with ``indicator_mode=full_series``
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pd.DataFrame(s)`` holding
+            every bar the algorithm will step through
+        """
+        self.stream_kernel = None
+        kernel = self.build_stream_kernel()
+        if kernel is None:
+            return False
+        if not (
+                self.use_full_series or
+                self.stream_kernel_matches_process()):
+            return False
+        df_status, use_df = self.get_subscribed_dataset(
+            dataset=dataset)
+        if df_status == ae_consts.EMPTY or len(use_df.index) == 0:
+            return False
+        use_cols = list(kernel.inputs)
+        if 'close' not in use_cols:
+            use_cols.append('close')
+        for col in use_cols:
+            if col not in use_df:
+                return False
+
+        self.stream_columns = [
+            use_df[col].tolist()
+            for col in kernel.inputs
+        ]
+        self.stream_closes = use_df['close'].tolist()
+        is_missing = use_df[use_cols].isna().any(
+            axis=1)
+        self.stream_is_missing = is_missing.tolist()
+        self.stream_num_missing = is_missing.cumsum().tolist()
+        self.stream_last_idx = None
+        self.stream_kernel = kernel
+        return True
+    # end of seed_incremental
+
+    def process_incremental(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            bar_idx):
+        """process_incremental
+
+        Advance the indicator's rolling state to ``bar_idx``
+        and set the buy and sell values. Custom implementations
+        should match what ``process`` would have reported for the
+        same bar. By default this just calls ``process``
+
+        Indicators using a ``build_stream_kernel`` kernel feed every
+        bar since the start of the dataset to the kernel (rows with
+        missing values are skipped) and report the kernel's value
+        once more than ``num_points`` bars are available. If any of
+        the trailing ``num_points`` rows are missing this calls
+        ``process`` like ``process_precomputed`` does. With
+        ``indicator_mode=full_series`` recursive kernels
+        (like ``EMA``, ``RSI``, ``MACD`` or ``ATR``) report the TA-Lib
+        value for the whole series instead of re-seeding over the
+        trailing ``num_points`` bars on every bar
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pd.DataFrame(s)`` to process
+            (pruned to the current bar)
+        :param bar_idx: integer position of the current bar
+            in the dataset passed to ``seed_incremental``
+        """
+        kernel = self.stream_kernel
+        if kernel is None:
+            self.process(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset)
+            return
+
+        if self.stream_last_idx is None or bar_idx <= self.stream_last_idx:
+            kernel.reset()
+            start_idx = 0
+        else:
+            start_idx = self.stream_last_idx + 1
+
+        columns = self.stream_columns
+        is_missing = self.stream_is_missing
+        update = kernel.update
+        for idx in range(start_idx, bar_idx + 1):
+            if not is_missing[idx]:
+                update(*[values[idx] for values in columns])
+        self.stream_last_idx = bar_idx
+
+        if is_missing[bar_idx]:
+            self.process(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset)
+            return
+
+        # process reports nothing until there are more
+        # than num_points rows
+        num_points = int(getattr(self, 'num_points', 0))
+        if bar_idx + 1 <= num_points:
+            return
+
+        if not self.use_full_series and num_points > 0:
+            num_missing = (
+                self.stream_num_missing[bar_idx] -
+                self.stream_num_missing[bar_idx - num_points])
+            if num_missing > 0:
+                self.process(
+                    algo_id=algo_id,
+                    ticker=ticker,
+                    dataset=dataset)
+                return
+
+        self.handle_stream_value(
+            value=kernel.value,
+            cur_value=self.stream_closes[bar_idx])
+    # end of process_incremental
+
+    def get_lookback(
+            self):
+        """get_lookback
+
+        Get the number of trailing rows of the subscribed
+        dataset this indicator reads on each bar or ``None`` if
+        it needs every row. With ``uses_lookback_window`` this
+        is ``num_points + 1``. Derive this method if the
+        indicator needs a different window
+        """
+        if not self.uses_lookback_window:
+            return None
+        return int(getattr(self, 'num_points', 0)) + 1
+    # end of get_lookback
+
+    def precompute_signals(
             self,
             algo_id,
             ticker,
             dataset):
+        """precompute_signals
+
+        Derive this method to support ``indicator_mode=precompute``.
+        It is called once with the full (unpruned) ``dataset``
+        before the algorithm starts stepping through bars so the
+        indicator can compute its whole output column (and the
+        buy and sell labels) in one vectorized call. Return
+        ``True`` if ``process_precomputed`` should handle each
+        bar, otherwise return ``False`` and the indicator keeps
+        using ``process``
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pd.DataFrame(s)`` holding
+            every bar the algorithm will step through
+        """
+        return False
+    # end of precompute_signals
+
+    def get_batch_call(
+            self):
+        """get_batch_call
+
+        Derive this method to return a tuple of an
+        ``analysis_engine.ae_talib`` function name and the list
+        of dataset columns it takes (like
+        ``('WILLR', ['high', 'low', 'close'])``) when the indicator's
+        value is that function with ``timeperiod=self.num_points``.
+        With ``indicator_mode=precompute`` the ``IndicatorProcessor``
+        computes all the ``num_points`` values for indicators with
+        the same call in one ``ae_talib.multi`` call and passes each
+        indicator its row with ``precompute_batch``. Return ``None``
+        to use ``precompute_signals`` instead
+        """
+        return None
+    # end of get_batch_call
+
+    def precompute_batch(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            ohlcv,
+            values):
+        """precompute_batch
+
+        Prepare ``process_precomputed`` from this indicator's row
+        of the ``ae_talib.multi`` matrix. By default this keeps the
+        row, closes and missing-row counts so ``process_precomputed``
+        can pass each bar's value to ``handle_stream_value``. Return
+        ``False`` to keep using ``process``
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pd.DataFrame(s)`` holding
+            every bar the algorithm will step through
+        :param ohlcv: ``analysis_engine.ohlcv_bundle.OHLCVBundle``
+            for the full subscribed dataset
+        :param values: ``numpy.float64`` array with the
+            indicator's value for every bar
+        """
+        self.batch_values = values
+        self.batch_closes = ohlcv.get('close')
+        self.batch_num_missing = ohlcv.get_num_missing()
+        return True
+    # end of precompute_batch
+
+    def process_precomputed(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            bar_idx):
+        """process_precomputed
+
+        Set the indicator's values and buy and sell labels for
+        ``bar_idx`` from the values built in ``precompute_signals``.
+        The results must match what ``process`` would have reported
+        for the same bar. By default this passes the
+        ``precompute_batch`` value to ``handle_stream_value`` (or
+        just calls ``process``)
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pd.DataFrame(s)`` to process
+            (pruned to the current bar)
+        :param bar_idx: integer position of the current bar
+            in the dataset passed to ``precompute_signals``
+        """
+        if self.batch_values is None:
+            self.process(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset)
+            return
+
+        # process reports nothing until there are more
+        # than num_points rows
+        num_points = getattr(self, 'num_points', 0)
+        if bar_idx + 1 <= num_points:
+            return
+
+        num_missing = self.batch_num_missing
+        start_idx = max(0, bar_idx + 1 - num_points)
+        if num_missing[bar_idx + 1] != num_missing[start_idx]:
+            self.process(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset)
+            return
+
+        self.handle_stream_value(
+            value=self.batch_values[bar_idx],
+            cur_value=self.batch_closes[bar_idx])
+    # end of process_precomputed
+
+    def compute_ohlcv_value(
+            self,
+            ohlcv):
+        """compute_ohlcv_value
+
+        Derive this method (and set ``uses_ohlcv_arrays = True``)
+        to compute the indicator's latest value from the
+        trailing ``num_points`` rows of the bar's shared
+        ``analysis_engine.ohlcv_bundle.OHLCVBundle`` (like
+        ``ohlcv.window('close', self.num_points)``) instead of
+        slicing the ``pd.DataFrame`` in ``process``. The value
+        is passed to ``handle_stream_value``
+
+        :param ohlcv: ``OHLCVBundle`` for the subscribed dataset
+        """
+        return None
+    # end of compute_ohlcv_value
+
+    def process_arrays(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            ohlcv):
+        """process_arrays
+
+        Set the buy and sell values from the bar's shared
+        ``OHLCVBundle``. The results must match what ``process``
+        would have reported for the same bar. By default this
+        reports nothing until there are more than ``num_points``
+        rows (like the built-in indicators' ``process``) and then
+        calls ``handle_stream_value`` with ``compute_ohlcv_value``
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pd.DataFrame(s)`` to process
+        :param ohlcv: ``analysis_engine.ohlcv_bundle.OHLCVBundle``
+            for the subscribed dataset
+        """
+        if ohlcv.num_rows <= getattr(self, 'num_points', 0):
+            return
+        self.handle_stream_value(
+            value=self.compute_ohlcv_value(
+                ohlcv=ohlcv),
+            cur_value=ohlcv.last('close'))
+    # end of process_arrays
+
+    def handle_subscribed_dataset(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            bar_idx=None,
+            ohlcv=None):
         """handle_subscribed_dataset
 
         Filter the algorithm's ``dataset`` to just the
@@ -524,12 +1020,42 @@ class BaseIndicator:
             during specific dates
         :param ticker: string - ticker
         :param dataset: dictionary of ``pd.DataFrame(s)`` to process
+        :param bar_idx: optional - integer position of the current
+            bar for indicators running in incremental
+            or precompute mode
+        :param ohlcv: optional - shared
+            ``analysis_engine.ohlcv_bundle.OHLCVBundle`` for
+            indicators with ``uses_ohlcv_arrays``
         """
 
         # certain datasets like minutes or options may
         # want to refer to the previous dataset
         self.previous_df = dataset
 
+        if bar_idx is not None:
+            if self.is_precomputed:
+                self.process_precomputed(
+                    algo_id=algo_id,
+                    ticker=ticker,
+                    dataset=dataset,
+                    bar_idx=bar_idx)
+                return
+            elif self.is_incremental:
+                self.process_incremental(
+                    algo_id=algo_id,
+                    ticker=ticker,
+                    dataset=dataset,
+                    bar_idx=bar_idx)
+                return
+
+        if ohlcv is not None:
+            self.process_arrays(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset,
+                ohlcv=ohlcv)
+            return
+
         # call derived class's process()
         self.process(
             algo_id=algo_id,
@@ -24,6 +24,9 @@ import analysis_engine.indicators.base_indicator as base_indicator
 class IndicatorBollingerBands(base_indicator.BaseIndicator):
     """IndicatorBollingerBands"""
 
+    uses_ohlcv_arrays = True
+    uses_lookback_window = True
+
     def __init__(
             self,
             **kwargs):
@@ -302,35 +305,10 @@ class IndicatorBollingerBands(base_indicator.BaseIndicator):
             self.middleband = ae_consts.to_f(middlebands[-1])
             self.lowerband = ae_consts.to_f(lowerbands[-1])
 
-            if cur_value <= 0:
-                self.lg(f'invalid current_value={cur_value}')
+            if not self.set_band_signals(
+                    cur_value=cur_value):
                 return
 
-            self.amount_to_low = ae_consts.to_f(cur_value - self.lowerband)
-            self.amount_to_high = ae_consts.to_f(self.upperband - cur_value)
-
-            if self.amount_to_low < 0:
-                self.percent_to_low = -1 * ae_consts.to_f(
-                    self.amount_to_low / cur_value * 100.0)
-            else:
-                self.percent_to_low = ae_consts.to_f(
-                    self.amount_to_low / cur_value * 100.0)
-
-            if self.amount_to_high < 0:
-                self.percent_to_high = -1 * ae_consts.to_f(
-                    self.amount_to_high / cur_value * 100.0)
-            else:
-                self.percent_to_high = ae_consts.to_f(
-                    self.amount_to_high / cur_value * 100.0)
-
-            self.is_buy = ae_consts.INDICATOR_IGNORE
-            self.is_sell = ae_consts.INDICATOR_IGNORE
-
-            if self.percent_to_low > self.buy_below_percent:
-                self.is_buy = ae_consts.INDICATOR_BUY
-            elif self.percent_to_high > self.sell_above_percent:
-                self.is_sell = ae_consts.INDICATOR_SELL
-
             self.lg(
                 f'process end - {first_date} to {end_date} '
                 f'buy_below={self.buy_below_percent} is_buy={self.is_buy} '
@@ -339,6 +317,121 @@ class IndicatorBollingerBands(base_indicator.BaseIndicator):
             self.lg('process end')
     # end of process
 
+    def set_band_signals(
+            self,
+            cur_value):
+        """set_band_signals
+
+        Label the bar using the percent distance from the close
+        to the lower and upper bands. Returns ``False`` if the
+        close is not valid
+
+        :param cur_value: close for the current bar
+        """
+        if cur_value <= 0:
+            self.lg(f'invalid current_value={cur_value}')
+            return False
+
+        self.amount_to_low = ae_consts.to_f(cur_value - self.lowerband)
+        self.amount_to_high = ae_consts.to_f(self.upperband - cur_value)
+
+        if self.amount_to_low < 0:
+            self.percent_to_low = -1 * ae_consts.to_f(
+                self.amount_to_low / cur_value * 100.0)
+        else:
+            self.percent_to_low = ae_consts.to_f(
+                self.amount_to_low / cur_value * 100.0)
+
+        if self.amount_to_high < 0:
+            self.percent_to_high = -1 * ae_consts.to_f(
+                self.amount_to_high / cur_value * 100.0)
+        else:
+            self.percent_to_high = ae_consts.to_f(
+                self.amount_to_high / cur_value * 100.0)
+
+        self.is_buy = ae_consts.INDICATOR_IGNORE
+        self.is_sell = ae_consts.INDICATOR_IGNORE
+
+        if self.percent_to_low > self.buy_below_percent:
+            self.is_buy = ae_consts.INDICATOR_BUY
+        elif self.percent_to_high > self.sell_above_percent:
+            self.is_sell = ae_consts.INDICATOR_SELL
+        return True
+    # end of set_band_signals
+
+    def compute_ohlcv_value(
+            self,
+            ohlcv):
+        """compute_ohlcv_value
+
+        Compute the latest ``BBANDS`` values from the trailing
+        ``num_points`` rows of the shared ``OHLCVBundle``
+        with ``ae_talib.cached``
+
+        :param ohlcv: ``analysis_engine.ohlcv_bundle.OHLCVBundle``
+        """
+        bands = ae_talib.cached(
+            ohlcv=ohlcv,
+            func='BBANDS',
+            inputs={
+                'close': 'close'
+            },
+            num_points=self.num_points,
+            timeperiod=self.num_points,
+            nbdevup=self.upper_stdev,
+            nbdevdn=self.lower_stdev,
+            matype=self.matype)
+        return tuple(
+            values[-1]
+            for values in bands)
+    # end of compute_ohlcv_value
+
+    def build_stream_kernel(
+            self):
+        """build_stream_kernel
+
+        Build the streaming ``BBANDS`` kernel for
+        ``indicator_mode=incremental``
+        """
+        return ae_talib.stream.BBANDS(
+            timeperiod=self.num_points,
+            nbdevup=self.upper_stdev,
+            nbdevdn=self.lower_stdev,
+            matype=self.matype)
+    # end of build_stream_kernel
+
+    def stream_kernel_matches_process(
+            self):
+        """stream_kernel_matches_process
+
+        The bands only read the trailing ``num_points`` rows
+        unless the middle band is an ``EMA`` (``matype=1``)
+        """
+        return int(self.matype) != 1
+    # end of stream_kernel_matches_process
+
+    def handle_stream_value(
+            self,
+            value,
+            cur_value):
+        """handle_stream_value
+
+        Set the indicator values and the buy and sell labels
+        from the streaming kernel's latest value
+
+        :param value: latest ``(upperband, middleband, lowerband)`` values
+        :param cur_value: close for the current bar
+        """
+        (self.upperband,
+         self.middleband,
+         self.lowerband) = [
+            ae_consts.to_f(val)
+            for val in value
+        ]
+        self.set_band_signals(
+            cur_value=cur_value)
+    # end of handle_stream_value
+
     def reset_internals(
             self):
         """reset_internals"""
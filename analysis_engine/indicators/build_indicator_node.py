@@ -4,6 +4,7 @@ Build a single indicator for an algorithm
 
 import uuid
 import copy
+import itertools
 import analysis_engine.consts as ae_consts
 import analysis_engine.utils as ae_utils
 import spylunking.log.setup_logging as log_utils
@@ -143,3 +144,58 @@ def build_indicator_node(
 
     return labeled_node
 # end of build_indicator_node
+
+
+def build_indicator_variants(
+        node):
+    """build_indicator_variants
+
+    Expand an ``indicators`` node with a ``variants`` dictionary of
+    value lists into one node per combination (like a parameter sweep
+    over ``num_points`` and thresholds). Each variant is named
+    ``<name>_<value>_<value>`` in the ``variants`` key order. Nodes
+    without ``variants`` are returned as a single item list
+
+    .. code-block:: python
+
+        {
+            "name": "willr",
+            "module_path": "analysis_engine/indicators/williamsr.py",
+            "uses_data": "daily",
+            "variants": {
+                "num_points": [10, 14, 20],
+                "buy_below": [-80, -90]
+            },
+            "sell_above": -20
+        }
+
+    :param node: single dictionary from the config's ``indicators`` list
+    :return: list of dictionaries
+    """
+    variants = node.get(
+        'variants',
+        None)
+    if not variants:
+        return [node]
+
+    name = node.get(
+        'name',
+        None)
+    keys = list(variants)
+    values = []
+    for key in keys:
+        key_values = variants[key]
+        if not isinstance(key_values, (list, tuple)):
+            key_values = [key_values]
+        values.append(key_values)
+    nodes = []
+    for combo in itertools.product(*values):
+        new_node = copy.deepcopy(node)
+        new_node.pop('variants')
+        for key, value in zip(keys, combo):
+            new_node[key] = value
+        suffix = '_'.join(str(value) for value in combo)
+        new_node['name'] = f'{name}_{suffix}'
+        nodes.append(new_node)
+    return nodes
+# end of build_indicator_variants
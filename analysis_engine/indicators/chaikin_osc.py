@@ -27,6 +27,9 @@ import analysis_engine.indicators.base_indicator as base_indicator
 class IndicatorChaikinOSC(base_indicator.BaseIndicator):
     """IndicatorChaikinOSC"""
 
+    uses_ohlcv_arrays = True
+    uses_lookback_window = True
+
     def __init__(
             self,
             **kwargs):
@@ -334,6 +337,62 @@ class IndicatorChaikinOSC(base_indicator.BaseIndicator):
             self.lg('process end')
     # end of process
 
+    def compute_ohlcv_value(
+            self,
+            ohlcv):
+        """compute_ohlcv_value
+
+        Compute the latest ``ADOSC`` value from the trailing
+        ``num_points`` rows of the shared ``OHLCVBundle``
+        with ``ae_talib.cached``
+
+        :param ohlcv: ``analysis_engine.ohlcv_bundle.OHLCVBundle``
+        """
+        num_points = self.num_points
+        return ae_talib.cached(
+            ohlcv=ohlcv,
+            func='ChaikinADOSC',
+            inputs={
+                'high': 'high',
+                'low': 'low',
+                'close': 'close',
+                'volume': 'volume'
+            },
+            num_points=num_points,
+            fast_period=self.fast_period,
+            slow_period=self.slow_period)[-1]
+    # end of compute_ohlcv_value
+
+    def build_stream_kernel(
+            self):
+        """build_stream_kernel
+
+        Build the streaming ``ADOSC`` kernel for
+        ``indicator_mode=incremental``
+        """
+        return ae_talib.stream.ADOSC(
+            fastperiod=self.fast_period,
+            slowperiod=self.slow_period)
+    # end of build_stream_kernel
+
+    def handle_stream_value(
+            self,
+            value,
+            cur_value):
+        """handle_stream_value
+
+        Set ``self.chaikinosc_value`` and the buy and sell labels
+        from the streaming kernel's latest value
+
+        :param value: latest ``ADOSC`` value
+        :param cur_value: close for the current bar
+        """
+        self.chaikinosc_value = ae_consts.to_f(value)
+        self.set_percent_signals(
+            value=self.chaikinosc_value,
+            cur_value=cur_value)
+    # end of handle_stream_value
+
     def reset_internals(
             self):
         """reset_internals"""
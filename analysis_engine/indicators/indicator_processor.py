@@ -9,11 +9,57 @@ Indicator Processor
     Support for buy or sell value range
     This is like an alert threshold between a ``lower``
     and ``upper`` bound
+
+Set ``"indicator_workers": <N>`` in the algorithm config to evaluate
+the indicators on a pool of ``N`` threads for each bar. TA-Lib and
+NumPy release the GIL on large arrays, so configs with many
+indicators on long daily histories run faster. The ``buys``,
+``sells`` and report keys are still assembled in the config's
+indicator order.
+
+``precompute_tickers`` computes the batched indicators (see
+``BaseIndicator.get_batch_call``) for a whole universe of tickers
+with one ``analysis_engine.ticker_matrix.TickerMatrix`` call per
+period, and ``load_ticker_batches`` hands each ticker its rows
+before the algorithm steps through the ticker's datasets.
+
+Each indicator's report keys are compiled once
+(``BaseIndicator.build_report_layout``) and every bar's values are
+written into one reusable flat buffer. ``get_flat_report()`` returns
+the ``(keys, values)`` lists for the latest bar so the algorithm can
+write them straight into a columnar trading history without building
+a dictionary per indicator. With ``set_lazy_report(True)`` the values
+are only written into the flat buffer and ``build_latest_report()``
+copies them into the latest report when something reads it.
+
+Indicators with a bounded lookback (``BaseIndicator.get_lookback``)
+only see the trailing rows they read instead of every row the
+algorithm has stepped through. For each ``uses_data`` dataset the
+processor keeps the largest lookback of the indicators subscribed to
+it and hands them a ``pd.DataFrame`` window of that many rows. Any
+indicator without a lookback keeps the whole dataset for everyone on
+it. Set ``"lookback_window": false`` in the algorithm config to turn
+the window off.
+
+Indicators can subscribe to a higher timeframe of a dataset with a
+``uses_data`` spec like ``minute:5m`` or ``minute:1h``. The processor
+keeps one ``analysis_engine.resampled_bars.ResampledBars`` for each
+spec, folds the source dataset's new rows into it on every bar and
+adds the bars (the last one is still forming) to the dataset the
+indicators see under the spec's name.
 """
 
 import os
 import json
+import time
+import concurrent.futures
+import analysis_engine.ae_talib as ae_talib
 import analysis_engine.consts as ae_consts
+import analysis_engine.ohlcv_bundle as ohlcv_bundle
+import analysis_engine.resampled_bars as resampled_bars
+import analysis_engine.ta_cache as ta_cache
+import analysis_engine.ticker_matrix as ticker_matrix
+import analysis_engine.indicators.base_indicator as base_indicator
 import analysis_engine.indicators.build_indicator_node as build_indicator
 import analysis_engine.indicators.load_indicator_from_module as load_indicator
 import spylunking.log.setup_logging as log_utils
@@ -87,6 +133,48 @@ class IndicatorProcessor:
                 'create the IndicatorProcessor')
 
         self.last_ind_obj = None
+        self.perf = None
+        # full-dataset OHLCVBundles from set_ohlcv_source and
+        # the bundles built for the current bar
+        self.ohlcv_sources = {}
+        self.ohlcv_bundles = {}
+        # memoized ae_talib.cached results for the current bar
+        # ("ta_cache": false in the config turns it off)
+        self.ta_cache = ta_cache.TACache(
+            enabled=bool(self.config_dict.get(
+                'ta_cache',
+                True)))
+        # thread pool for evaluating indicators in parallel
+        # ("indicator_workers": <N> in the config with N > 1)
+        self.indicator_workers = int(self.config_dict.get(
+            'indicator_workers',
+            0) or 0)
+        self.executor = None
+        self.executor_pid = None
+        # rows from precompute_tickers by ticker and batch call
+        self.ticker_batches = {}
+        # flat report keys, the reusable values buffer and each
+        # indicator's (start, end, keys) in the buffer
+        # (built on the first process call)
+        self.report_layout_ready = False
+        self.report_keys = None
+        self.report_values = None
+        self.report_slices = []
+        # only write the flat buffer on each bar and copy it into
+        # the latest report in build_latest_report
+        # (set by the algorithm with flat_reports and columnar history)
+        self.lazy_report = False
+        self.latest_report_ready = True
+        # largest lookback by uses_data dataset or None for
+        # datasets with an indicator that needs every row
+        # ("lookback_window": false in the config turns it off)
+        self.lookback_window = bool(self.config_dict.get(
+            'lookback_window',
+            True))
+        self.lookbacks = None
+        # ResampledBars for each timeframe uses_data spec
+        # like minute:5m (built with the indicators)
+        self.resampled = {}
         self.ticker = ticker
         self.ind_dict = {}
         self.num_indicators = len(self.config_dict.get(
@@ -161,6 +249,51 @@ class IndicatorProcessor:
         return self.ind_dict
     # end of get_indicators
 
+    def get_executor(
+            self):
+        """get_executor
+
+        Get the ``concurrent.futures.ThreadPoolExecutor`` for
+        ``indicator_workers``. A forked process (like a ticker
+        worker) starts its own pool because the parent's threads
+        are not copied
+        """
+        pid = os.getpid()
+        if self.executor is None or self.executor_pid != pid:
+            self.executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(
+                    self.indicator_workers,
+                    max(1, len(self.ind_dict))),
+                thread_name_prefix=f'{self.label}-ind')
+            self.executor_pid = pid
+        return self.executor
+    # end of get_executor
+
+    def shutdown(
+            self):
+        """shutdown
+
+        Stop the ``indicator_workers`` thread pool
+        """
+        if (self.executor is not None and
+                self.executor_pid == os.getpid()):
+            self.executor.shutdown(wait=True)
+        self.executor = None
+        self.executor_pid = None
+    # end of shutdown
+
+    def __getstate__(
+            self):
+        """__getstate__
+
+        Drop the thread pool when pickling
+        """
+        state = self.__dict__.copy()
+        state['executor'] = None
+        state['executor_pid'] = None
+        return state
+    # end of __getstate__
+
     def build_indicators_for_config(
             self,
             config_dict):
@@ -177,12 +310,19 @@ class IndicatorProcessor:
             log.error('missing "indicators" list in the config_dict')
             return
 
+        # nodes with "variants" become one indicator per combination
+        nodes = []
+        for node in config_dict['indicators']:
+            nodes.extend(build_indicator.build_indicator_variants(
+                node=node))
+        self.num_indicators = len(nodes)
+
         if self.verbose:
             log.info(
                 f'{self.label} start - '
                 f'building indicators={self.num_indicators}')
 
-        for idx, node in enumerate(config_dict['indicators']):
+        for idx, node in enumerate(nodes):
             percent_done = ae_consts.get_percent_done(
                 progress=(idx + 1),
                 total=self.num_indicators)
@@ -223,6 +363,15 @@ class IndicatorProcessor:
                         base_class_module_name=base_class_indicator,
                         verbose=self.verbose_indicators)
 
+                uses_data = self.ind_dict[indicator_key_name][
+                    'obj'].uses_data
+                if (uses_data not in self.resampled and
+                        resampled_bars.parse_timeframe(
+                            uses_data=uses_data)):
+                    self.resampled[uses_data] = \
+                        resampled_bars.ResampledBars(
+                            uses_data=uses_data)
+
                 log.debug(
                     f'{self.label} - '
                     f'created indicator={indicator_key_name} '
@@ -240,11 +389,760 @@ class IndicatorProcessor:
                 f'from indicators={self.num_indicators}')
     # end of build_indicators_for_config
 
+    def build_report_layout(
+            self):
+        """build_report_layout
+
+        Compile the flat report keys for all indicators and the
+        reusable values buffer. The flat report is turned off
+        (``self.report_keys`` is ``None``) if an indicator
+        overrides ``get_report``
+
+        Returns the list of flat report keys or ``None``
+        """
+        self.report_layout_ready = True
+        self.report_keys = None
+        self.report_values = None
+        self.report_slices = []
+        keys = [
+            'num_indicators'
+        ]
+        slices = []
+        for ind_id in self.ind_dict:
+            ind_obj = self.ind_dict[ind_id]['obj']
+            if (type(ind_obj).get_report is not
+                    base_indicator.BaseIndicator.get_report):
+                return None
+            ind_keys = ind_obj.build_report_layout()
+            slices.append((
+                len(keys),
+                len(keys) + len(ind_keys),
+                ind_keys))
+            keys.extend(ind_keys)
+        # end of for all indicators
+        self.report_keys = keys
+        self.report_values = [None] * len(keys)
+        self.report_slices = slices
+        return self.report_keys
+    # end of build_report_layout
+
+    def get_flat_report(
+            self):
+        """get_flat_report
+
+        Get a tuple of the flat report keys and the reusable
+        list of values for the latest ``process`` call (the same
+        keys and values as the latest report without ``id``,
+        ``ticker``, ``date``, ``buys`` and ``sells``) or ``None`` if
+        the flat report is turned off. The values are overwritten
+        by the next ``process`` call
+        """
+        if self.report_keys is None:
+            return None
+        return (
+            self.report_keys,
+            self.report_values)
+    # end of get_flat_report
+
+    def set_lazy_report(
+            self,
+            lazy_report):
+        """set_lazy_report
+
+        Only write each bar's indicator values into the flat
+        buffer (see ``get_flat_report``) instead of also copying
+        them into the latest report. The report from ``process``
+        keeps the ``buys``, ``sells`` and identifier keys and
+        ``build_latest_report`` adds the indicator values when
+        they are needed. Earlier reports in ``self.reports`` do
+        not have the indicator values
+
+        :param lazy_report: boolean
+        """
+        self.lazy_report = bool(lazy_report)
+    # end of set_lazy_report
+
+    def build_latest_report(
+            self):
+        """build_latest_report
+
+        Copy the flat buffer's values into the latest report
+        (once per bar with ``set_lazy_report(True)``) and
+        return the latest report
+        """
+        if not self.latest_report_ready:
+            self.latest_report_ready = True
+            if self.report_keys is not None:
+                self.latest_report.update(zip(
+                    self.report_keys,
+                    self.report_values))
+        return self.latest_report
+    # end of build_latest_report
+
+    def build_lookbacks(
+            self):
+        """build_lookbacks
+
+        Find the largest ``get_lookback()`` of the indicators
+        subscribed to each ``uses_data`` dataset. A dataset
+        with an indicator that needs every row (or all datasets
+        with ``lookback_window`` turned off) maps to ``None``
+
+        Returns the dictionary of ``uses_data`` to the lookback
+        """
+        lookbacks = {}
+        for ind_id in self.ind_dict:
+            ind_obj = self.ind_dict[ind_id]['obj']
+            uses_data = ind_obj.uses_data
+            lookback = None
+            if self.lookback_window:
+                lookback = ind_obj.get_lookback()
+            if uses_data not in lookbacks:
+                lookbacks[uses_data] = lookback
+            elif lookback is None or lookbacks[uses_data] is None:
+                lookbacks[uses_data] = None
+            else:
+                lookbacks[uses_data] = max(
+                    lookbacks[uses_data],
+                    lookback)
+        # end of for all indicators
+        self.lookbacks = lookbacks
+        return self.lookbacks
+    # end of build_lookbacks
+
+    def get_lookback(
+            self,
+            uses_data):
+        """get_lookback
+
+        Get the number of trailing rows the indicators
+        subscribed to the ``uses_data`` dataset see on each
+        bar or ``None`` if they see every row
+
+        :param uses_data: name of the dataset like
+            ``minute`` or ``daily``
+        """
+        if self.lookbacks is None:
+            self.build_lookbacks()
+        return self.lookbacks.get(
+            uses_data,
+            None)
+    # end of get_lookback
+
+    def get_dataset_window(
+            self,
+            uses_data):
+        """get_dataset_window
+
+        Get the number of trailing rows of the ``uses_data``
+        dataset the algorithm needs to pass to ``process`` on
+        each bar or ``None`` if it needs to pass every row so
+        far. This is the ``get_lookback`` unless a timeframe
+        spec (like ``minute:5m``) is built from the dataset
+
+        :param uses_data: name of the dataset like
+            ``minute`` or ``daily``
+        """
+        for bars in self.resampled.values():
+            if bars.source == uses_data:
+                return None
+        return self.get_lookback(
+            uses_data=uses_data)
+    # end of get_dataset_window
+
+    def get_timeframe_dataset(
+            self,
+            dataset):
+        """get_timeframe_dataset
+
+        Fold the bar's new source rows into each
+        ``ResampledBars`` and get a shallow copy of the
+        ``dataset`` with the bars under each timeframe spec
+        (like ``dataset['data']['minute:5m']``). Only the
+        trailing bars within the spec's lookback (see
+        ``get_lookback``) are converted to a ``pd.DataFrame``.
+        The ``dataset`` is returned unchanged if no indicator
+        uses a timeframe
+
+        :param dataset: dictionary of ``pd.DataFrame(s)``
+            for the current bar
+        """
+        if not self.resampled:
+            return dataset
+        data = dataset.get('data', None)
+        if data is None:
+            return dataset
+        timeframe_data = dict(data)
+        for uses_data, bars in self.resampled.items():
+            df = data.get(bars.source, None)
+            source_df = None
+            source = self.ohlcv_sources.get(bars.source, None)
+            if (source is not None and hasattr(df, 'index') and
+                    source.is_prefix(df)):
+                source_df = source.df
+            bars.update(
+                df=df,
+                source_df=source_df)
+            timeframe_data[uses_data] = bars.get_df(
+                num_bars=self.get_lookback(
+                    uses_data=uses_data))
+        # end of for all timeframes
+        timeframe_dataset = dict(dataset)
+        timeframe_dataset['data'] = timeframe_data
+        return timeframe_dataset
+    # end of get_timeframe_dataset
+
+    def get_window_dataset(
+            self,
+            dataset):
+        """get_window_dataset
+
+        Get a shallow copy of the bar's ``dataset`` where each
+        ``pd.DataFrame`` with a lookback (see ``get_lookback``)
+        is cut down to a window of its trailing rows. The
+        ``dataset`` is returned unchanged if no dataset is
+        longer than its lookback
+
+        :param dataset: dictionary of ``pd.DataFrame(s)``
+            for the current bar
+        """
+        if self.lookbacks is None:
+            self.build_lookbacks()
+        data = dataset.get('data', None)
+        if not data:
+            return dataset
+        window_data = None
+        for uses_data, lookback in self.lookbacks.items():
+            if lookback is None:
+                continue
+            df = data.get(uses_data, None)
+            if not hasattr(df, 'index'):
+                continue
+            num_rows = len(df.index)
+            if num_rows <= lookback:
+                continue
+            if window_data is None:
+                window_data = dict(data)
+            window_data[uses_data] = df.iloc[num_rows - lookback:]
+        # end of for all datasets with a lookback
+        if window_data is None:
+            return dataset
+        window_dataset = dict(dataset)
+        window_dataset['data'] = window_data
+        return window_dataset
+    # end of get_window_dataset
+
+    def set_bar_cursor(
+            self,
+            cursor,
+            uses_data='minute'):
+        """set_bar_cursor
+
+        Share the algorithm's ``BarCursor`` with all indicators
+        subscribed to the ``uses_data`` dataset so they can read
+        the current bar with ``self.bar_cursor.close`` (and the
+        other pricing columns) without touching the
+        ``pd.DataFrame``
+
+        :param cursor: ``analysis_engine.bar_cursor.BarCursor``
+            the algorithm is stepping through
+        :param uses_data: name of the dataset the cursor is
+            stepping through (default is ``minute``)
+        """
+        for ind_id in self.ind_dict:
+            ind_obj = self.ind_dict[ind_id]['obj']
+            if ind_obj.uses_data == uses_data:
+                ind_obj.bar_cursor = cursor
+            else:
+                ind_obj.bar_cursor = None
+        # end of for all indicators
+    # end of set_bar_cursor
+
+    def set_ohlcv_source(
+            self,
+            df,
+            uses_data='minute'):
+        """set_ohlcv_source
+
+        Convert the pricing columns for every bar the algorithm
+        will step through once, so each bar's
+        ``analysis_engine.ohlcv_bundle.OHLCVBundle`` is just a
+        set of views when the bar's dataset holds consecutive rows
+        of ``df`` (like ``df_minute.iloc[0:(minute_idx + 1)]`` or
+        the trailing window from ``get_dataset_window``)
+
+        :param df: ``pd.DataFrame`` with all the bars or ``None``
+            to stop reusing the arrays
+        :param uses_data: name of the dataset
+            (default is ``minute``)
+        """
+        if hasattr(df, 'index'):
+            self.ohlcv_sources[uses_data] = ohlcv_bundle.OHLCVBundle(
+                df=df,
+                uses_data=uses_data)
+        else:
+            self.ohlcv_sources.pop(uses_data, None)
+    # end of set_ohlcv_source
+
+    def get_ohlcv_bundle(
+            self,
+            dataset,
+            uses_data):
+        """get_ohlcv_bundle
+
+        Get the current bar's ``OHLCVBundle`` for a
+        ``uses_data`` dataset. It is built on the first request
+        in each ``process`` call and shared by all indicators
+        subscribed to the dataset. Returns ``None`` if the
+        dataset is not a ``pd.DataFrame``
+
+        :param dataset: dictionary of ``pd.DataFrame(s)``
+            for the current bar
+        :param uses_data: name of the dataset like
+            ``minute`` or ``daily``
+        """
+        if uses_data in self.ohlcv_bundles:
+            return self.ohlcv_bundles[uses_data]
+        bundle = None
+        df = dataset.get('data', {}).get(uses_data, None)
+        if hasattr(df, 'index'):
+            source = self.ohlcv_sources.get(uses_data, None)
+            start_row = None
+            if source is not None:
+                start_row = source.get_start_row(
+                    df=df)
+            if start_row is not None:
+                bundle = source.rows(
+                    start_row=start_row,
+                    end_row=start_row + len(df.index))
+            else:
+                bundle = ohlcv_bundle.OHLCVBundle(
+                    df=df,
+                    uses_data=uses_data)
+            bundle.ta_cache = self.ta_cache
+        self.ohlcv_bundles[uses_data] = bundle
+        return bundle
+    # end of get_ohlcv_bundle
+
+    def get_ta_cache_summary(
+            self):
+        """get_ta_cache_summary
+
+        Get the total ``ae_talib.cached`` hits and misses
+        for all bars processed so far
+        """
+        return self.ta_cache.get_summary()
+    # end of get_ta_cache_summary
+
+    def set_perf_counters(
+            self,
+            perf):
+        """set_perf_counters
+
+        Add each indicator's wall time in ``process`` to an
+        ``analysis_engine.perf_counters.PerfCounters`` and
+        include the ``ae_talib.cached`` hits and misses in
+        its summary
+
+        :param perf: ``PerfCounters`` or ``None`` to
+            stop timing indicators
+        """
+        if perf is not None:
+            perf.ta_cache = self.ta_cache
+        self.perf = perf
+        if self.perf is not None and not self.perf.enabled:
+            self.perf = None
+    # end of set_perf_counters
+
+    def seed_incremental(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            uses_data='minute',
+            full_series=False):
+        """seed_incremental
+
+        Prepare all indicators subscribed to the ``uses_data``
+        dataset for ``indicator_mode=incremental`` by letting
+        each indicator seed its rolling state from the full
+        ``dataset``. Indicators that do not support incremental
+        updates (or that use a different dataset) keep calling
+        their ``process`` method on every bar.
+
+        Returns the number of indicators running incrementally
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pd.DataFrame(s)`` holding
+            every bar the algorithm will step through
+        :param uses_data: name of the dataset the algorithm
+            is stepping through (default is ``minute``)
+        :param full_series: optional - let every indicator with
+            a ``build_stream_kernel`` kernel follow the whole
+            series even if the kernel does not match ``process``
+            for ``indicator_mode=full_series``
+            (default is ``False``)
+        """
+        num_incremental = 0
+        for ind_id in self.ind_dict:
+            ind_obj = self.ind_dict[ind_id]['obj']
+            ind_obj.is_incremental = False
+            ind_obj.use_full_series = full_series
+            if ind_obj.uses_data != uses_data:
+                continue
+            ind_obj.is_incremental = bool(ind_obj.seed_incremental(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset))
+            if ind_obj.is_incremental:
+                num_incremental += 1
+        # end of for all indicators
+
+        if self.verbose:
+            log.info(
+                f'{self.label} - seeded incremental '
+                f'indicators={num_incremental}/{self.num_indicators} '
+                f'uses_data={uses_data}')
+        return num_incremental
+    # end of seed_incremental
+
+    def precompute_signals(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            uses_data='minute'):
+        """precompute_signals
+
+        Prepare all indicators subscribed to the ``uses_data``
+        dataset for ``indicator_mode=precompute`` by letting
+        each indicator compute its signals for every bar in
+        the full ``dataset`` before the algorithm starts
+        stepping through bars. Indicators that do not support
+        precomputing (or that use a different dataset) keep
+        calling their ``process`` method on every bar.
+
+        Returns the number of precomputed indicators
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pd.DataFrame(s)`` holding
+            every bar the algorithm will step through
+        :param uses_data: name of the dataset the algorithm
+            is stepping through (default is ``minute``)
+        """
+        num_precomputed = 0
+        batches = {}
+        for ind_id in self.ind_dict:
+            ind_obj = self.ind_dict[ind_id]['obj']
+            ind_obj.is_precomputed = False
+            ind_obj.batch_values = None
+            if ind_obj.uses_data != uses_data:
+                continue
+            batch_call = ind_obj.get_batch_call()
+            if batch_call is not None:
+                func, cols = batch_call
+                batches.setdefault(
+                    (func, tuple(cols)),
+                    []).append(ind_obj)
+                continue
+            ind_obj.is_precomputed = bool(ind_obj.precompute_signals(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset))
+            if ind_obj.is_precomputed:
+                num_precomputed += 1
+        # end of for all indicators
+
+        for batch_call, ind_objs in batches.items():
+            num_precomputed += self.precompute_batch(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset,
+                uses_data=uses_data,
+                batch_call=batch_call,
+                ind_objs=ind_objs)
+        # end of for all batched calls
+
+        if self.verbose:
+            log.info(
+                f'{self.label} - precomputed '
+                f'indicators={num_precomputed}/{self.num_indicators} '
+                f'uses_data={uses_data}')
+        return num_precomputed
+    # end of precompute_signals
+
+    def precompute_batch(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            uses_data,
+            batch_call,
+            ind_objs,
+            rows=None):
+        """precompute_batch
+
+        Compute the values for every ``num_points`` of the
+        indicators sharing a ``get_batch_call`` with one
+        ``analysis_engine.ae_talib.multi`` call (a
+        ``(periods, bars)`` matrix) and pass each indicator its
+        row with ``precompute_batch``. Indicators fall back to
+        their own ``precompute_signals`` if the dataset is
+        missing one of the call's columns
+
+        Returns the number of precomputed indicators
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pd.DataFrame(s)`` holding
+            every bar the algorithm will step through
+        :param uses_data: name of the dataset
+        :param batch_call: tuple of the ``ae_talib`` function
+            name and tuple of column names
+        :param ind_objs: list of indicator objects
+        :param rows: optional - dictionary with the values for
+            every indicator's ``num_points`` already computed for
+            the dataset (like the rows from ``precompute_tickers``)
+        """
+        func, cols = batch_call
+        df = dataset.get('data', {}).get(uses_data, None)
+        ohlcv = None
+        if hasattr(df, 'index') and len(df.index) > 0:
+            ohlcv = ohlcv_bundle.OHLCVBundle(
+                df=df,
+                uses_data=uses_data)
+            for col in cols:
+                if col not in ohlcv:
+                    ohlcv = None
+                    break
+        if ohlcv is None:
+            num_precomputed = 0
+            for ind_obj in ind_objs:
+                ind_obj.is_precomputed = bool(ind_obj.precompute_signals(
+                    algo_id=algo_id,
+                    ticker=ticker,
+                    dataset=dataset))
+                num_precomputed += int(ind_obj.is_precomputed)
+            return num_precomputed
+
+        if rows is None:
+            periods = sorted(set(
+                int(ind_obj.num_points)
+                for ind_obj in ind_objs))
+            matrix = ae_talib.multi(
+                func,
+                periods,
+                *[ohlcv.get(col) for col in cols])
+            rows = {
+                period: matrix[row]
+                for row, period in enumerate(periods)
+            }
+        if self.verbose:
+            log.info(
+                f'{self.label} - batched {func}{list(cols)} '
+                f'indicators={len(ind_objs)} periods={len(rows)} '
+                f'bars={ohlcv.num_rows}')
+
+        num_precomputed = 0
+        for ind_obj in ind_objs:
+            ind_obj.is_precomputed = bool(ind_obj.precompute_batch(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset,
+                ohlcv=ohlcv,
+                values=rows[int(ind_obj.num_points)]))
+            if not ind_obj.is_precomputed:
+                ind_obj.batch_values = None
+            num_precomputed += int(ind_obj.is_precomputed)
+        return num_precomputed
+    # end of precompute_batch
+
+    def get_batch_calls(
+            self,
+            uses_data):
+        """get_batch_calls
+
+        Group the indicators subscribed to the ``uses_data``
+        dataset by their ``get_batch_call`` and return a dictionary
+        of ``(func, tuple(cols))`` to the list of indicator objects
+
+        :param uses_data: name of the dataset
+        """
+        batches = {}
+        for ind_id in self.ind_dict:
+            ind_obj = self.ind_dict[ind_id]['obj']
+            if ind_obj.uses_data != uses_data:
+                continue
+            batch_call = ind_obj.get_batch_call()
+            if batch_call is not None:
+                func, cols = batch_call
+                batches.setdefault(
+                    (func, tuple(cols)),
+                    []).append(ind_obj)
+        # end of for all indicators
+        return batches
+    # end of get_batch_calls
+
+    def precompute_tickers(
+            self,
+            datasets,
+            uses_data='daily'):
+        """precompute_tickers
+
+        Align every ticker's ``uses_data`` dataset into an
+        ``analysis_engine.ticker_matrix.TickerMatrix`` and compute
+        each batched indicator's values for all the tickers with
+        one ``ae_talib.rows`` call per period. The rows are kept
+        until ``load_ticker_batches`` is called for the ticker.
+
+        Returns the ``TickerMatrix``
+
+        :param datasets: dictionary of ticker to a dictionary of
+            ``pd.DataFrame(s)`` holding every bar the algorithm
+            will step through (like ``{'data': {'daily': df}}``)
+        :param uses_data: name of the dataset
+            (default is ``daily``)
+        """
+        self.ticker_batches = {}
+        matrix = ticker_matrix.TickerMatrix(
+            frames={
+                ticker: datasets[ticker].get('data', {}).get(
+                    uses_data,
+                    None)
+                for ticker in datasets
+            },
+            uses_data=uses_data)
+        batches = self.get_batch_calls(
+            uses_data=uses_data)
+        for batch_call, ind_objs in batches.items():
+            func, cols = batch_call
+            periods = sorted(set(
+                int(ind_obj.num_points)
+                for ind_obj in ind_objs))
+            for period in periods:
+                values = matrix.compute(
+                    func=func,
+                    cols=list(cols),
+                    timeperiod=period)
+                for ticker in values:
+                    self.ticker_batches.setdefault(
+                        ticker,
+                        {}).setdefault(
+                            batch_call,
+                            {})[period] = values[ticker]
+            # end of for all periods
+        # end of for all batched calls
+
+        if self.verbose:
+            log.info(
+                f'{self.label} - precomputed tickers={len(matrix)} '
+                f'dates={matrix.num_dates} '
+                f'groups={len(matrix.get_groups())} '
+                f'batches={len(batches)} uses_data={uses_data}')
+        return matrix
+    # end of precompute_tickers
+
+    def load_ticker_batches(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            uses_data='daily'):
+        """load_ticker_batches
+
+        Prepare the batched indicators for
+        ``process(bar_idx=...)`` on the ticker's datasets with the
+        ticker's rows from ``precompute_tickers`` (the same as
+        ``precompute_signals`` for just the batched indicators).
+        The other indicators keep calling their ``process`` method.
+
+        Returns the number of precomputed indicators
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: the ticker's dataset passed to
+            ``precompute_tickers``
+        :param uses_data: name of the dataset
+            (default is ``daily``)
+        """
+        for ind_id in self.ind_dict:
+            ind_obj = self.ind_dict[ind_id]['obj']
+            ind_obj.is_precomputed = False
+            ind_obj.batch_values = None
+        # end of for all indicators
+
+        ticker_rows = self.ticker_batches.pop(ticker, {})
+        num_precomputed = 0
+        batches = self.get_batch_calls(
+            uses_data=uses_data)
+        for batch_call, ind_objs in batches.items():
+            num_precomputed += self.precompute_batch(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset,
+                uses_data=uses_data,
+                batch_call=batch_call,
+                ind_objs=ind_objs,
+                rows=ticker_rows.get(batch_call, None))
+        # end of for all batched calls
+        return num_precomputed
+    # end of load_ticker_batches
+
+    def run_indicator(
+            self,
+            ind_obj,
+            algo_id,
+            ticker,
+            dataset,
+            bar_idx=None):
+        """run_indicator
+
+        Reset and run one indicator on the current bar and
+        return a tuple of its report and wall time in seconds.
+        The report is the indicator's reusable list of
+        ``get_report_values`` when the flat report is on.
+        With ``indicator_workers`` this runs on the thread pool
+
+        :param ind_obj: indicator object
+        :param algo_id: string - algo identifier label
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pd.DataFrame(s)``
+            for the current bar
+        :param bar_idx: optional - integer position of
+            the current bar
+        """
+        ind_start = time.perf_counter()
+        ind_obj.reset_internals()
+        ohlcv = None
+        if ind_obj.uses_ohlcv_arrays:
+            ohlcv = self.get_ohlcv_bundle(
+                dataset=dataset,
+                uses_data=ind_obj.uses_data)
+        ind_obj.handle_subscribed_dataset(
+            algo_id=algo_id,
+            ticker=ticker,
+            dataset=dataset,
+            bar_idx=bar_idx,
+            ohlcv=ohlcv)
+        if self.report_keys is not None:
+            new_report = ind_obj.get_report_values()
+        else:
+            new_report = ind_obj.get_report()
+        return new_report, time.perf_counter() - ind_start
+    # end of run_indicator
+
     def process(
             self,
             algo_id,
             ticker,
-            dataset):
+            dataset,
+            bar_idx=None):
         """process
 
         :param algo_id: string - algo identifier label for debugging datasets
@@ -255,6 +1153,9 @@ class IndicatorProcessor:
             represent a label from one of the data sources (``IEX``,
             ``Yahoo``, ``FinViz`` or other). Here is the supported
             dataset structure for the process method:
+        :param bar_idx: optional - integer position of the current
+            bar for indicators seeded with ``seed_incremental``
+            or ``precompute_signals``
         """
         self.latest_report = {
             'id': algo_id,
@@ -264,6 +1165,49 @@ class IndicatorProcessor:
             'num_indicators': self.num_indicators,
             'date': dataset.get('date', None)
         }
+        self.ohlcv_bundles = {}
+        self.ta_cache.start_bar()
+        if not self.report_layout_ready:
+            self.build_report_layout()
+        report_values = self.report_values
+        lazy_report = (
+            self.lazy_report and
+            report_values is not None)
+        self.latest_report_ready = not lazy_report
+        use_workers = (
+            self.indicator_workers > 1 and
+            self.num_indicators > 1)
+        # add the higher timeframe bars and only show the
+        # indicators the trailing rows they read
+        ind_dataset = self.get_timeframe_dataset(
+            dataset=dataset)
+        window_dataset = self.get_window_dataset(
+            dataset=ind_dataset)
+        if use_workers or window_dataset is not ind_dataset:
+            # build the shared bundles from the full datasets
+            # (views of the set_ohlcv_source arrays) before the
+            # indicators (or the threads) read them
+            for ind_id in self.ind_dict:
+                ind_obj = self.ind_dict[ind_id]['obj']
+                if ind_obj.uses_ohlcv_arrays:
+                    self.get_ohlcv_bundle(
+                        dataset=ind_dataset,
+                        uses_data=ind_obj.uses_data)
+        futures = None
+        if use_workers:
+            executor = self.get_executor()
+            futures = [
+                executor.submit(
+                    self.run_indicator,
+                    ind_obj=self.ind_dict[ind_id]['obj'],
+                    algo_id=algo_id,
+                    ticker=ticker,
+                    dataset=window_dataset,
+                    bar_idx=bar_idx)
+                for ind_id in self.ind_dict
+            ]
+        # end of starting the indicators on the thread pool
+
         for idx, ind_id in enumerate(self.ind_dict):
             ind_node = self.ind_dict[ind_id]
             ind_obj = ind_node['obj']
@@ -273,24 +1217,49 @@ class IndicatorProcessor:
             percent_label = (
                 f'ticker={self.ticker} {percent_done} '
                 f'{idx+1}/{self.num_indicators}')
-            ind_obj.reset_internals()
             if self.verbose:
                 log.info(
                     f'{self.label} - {ind_obj.get_name()} '
                     f'start {percent_label}')
             # this will throw on errors to help with debugging
             self.last_ind_obj = ind_obj
-            ind_obj.handle_subscribed_dataset(
-                algo_id=algo_id,
-                ticker=ticker,
-                dataset=dataset)
-            new_report = ind_obj.get_report()
+            if futures:
+                new_report, ind_seconds = futures[idx].result()
+            else:
+                new_report, ind_seconds = self.run_indicator(
+                    ind_obj=ind_obj,
+                    algo_id=algo_id,
+                    ticker=ticker,
+                    dataset=window_dataset,
+                    bar_idx=bar_idx)
+            if self.perf:
+                self.perf.add_indicator(
+                    name=ind_obj.get_name(),
+                    seconds=ind_seconds)
+            if report_values is not None:
+                # copy the values into the flat buffer and only
+                # build a dictionary for buy and sell nodes
+                start_idx, end_idx, ind_keys = self.report_slices[idx]
+                report_values[start_idx:end_idx] = new_report
+                if not lazy_report:
+                    self.latest_report.update(zip(
+                        ind_keys,
+                        new_report))
+                if (getattr(ind_obj, 'is_buy', None) ==
+                        ae_consts.INDICATOR_BUY or
+                        getattr(ind_obj, 'is_sell', None) ==
+                        ae_consts.INDICATOR_SELL or
+                        self.verbose):
+                    new_report = dict(zip(
+                        ind_keys,
+                        new_report))
+            else:
+                self.latest_report.update(new_report)
             if self.verbose:
                 log.info(
                     f'{self.label} - {ind_obj.get_name()} '
                     f'end {percent_label} '
                     f'report: {ae_consts.ppj(new_report)}')
-            self.latest_report.update(new_report)
 
             is_buy_value = ind_obj.is_buy
             is_sell_value = ind_obj.is_sell
@@ -323,6 +1292,8 @@ class IndicatorProcessor:
                     'report': new_report})
         # end of for all indicators
 
+        if report_values is not None:
+            report_values[0] = self.num_indicators
         self.reports.append(self.latest_report)
 
         # allow derived indicator processors to build custom reports
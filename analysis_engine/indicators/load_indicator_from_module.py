@@ -1,10 +1,20 @@
 """
 Helper for loading derived Indicators from a local module file
+
+Each module file is only executed once per process. The module and
+its indicator class are stored in ``INDICATOR_MODULE_CACHE`` under
+the file's absolute path, modification time and ``sha256`` content
+hash. Later loads (every ``IndicatorProcessor`` built for a backtest,
+``task_run_algo`` or ``AlgoRunner.latest()``) reuse the class, and a
+changed file is executed again. Pass ``use_cache=False`` to always
+execute the file, or call ``clear_indicator_module_cache()``.
 """
 
 import os
 import inspect
 import types
+import hashlib
+import threading
 import importlib.machinery
 import uuid
 import analysis_engine.consts as ae_consts
@@ -13,6 +23,41 @@ import spylunking.log.setup_logging as log_utils
 
 log = log_utils.build_colorized_logger(name=__name__)
 
+# (absolute path, module name) to the cached module file entry
+INDICATOR_MODULE_CACHE = {}
+INDICATOR_MODULE_CACHE_LOCK = threading.Lock()
+
+
+def clear_indicator_module_cache():
+    """clear_indicator_module_cache
+
+    Drop all cached indicator modules so the next
+    load executes each module file again
+    """
+    with INDICATOR_MODULE_CACHE_LOCK:
+        INDICATOR_MODULE_CACHE.clear()
+# end of clear_indicator_module_cache
+
+
+def get_module_file_key(
+        path_to_module):
+    """get_module_file_key
+
+    Get a tuple of the file's absolute path, modification
+    time (in nanoseconds) and ``sha256`` content hash
+
+    :param path_to_module: path to the module file
+    """
+    abs_path = os.path.abspath(path_to_module)
+    with open(abs_path, 'rb') as module_file:
+        mtime_ns = os.fstat(module_file.fileno()).st_mtime_ns
+        digest = hashlib.sha256(module_file.read()).hexdigest()
+    return (
+        abs_path,
+        mtime_ns,
+        digest)
+# end of get_module_file_key
+
 
 def load_indicator_from_module(
         module_name,
@@ -20,10 +65,12 @@ def load_indicator_from_module(
         path_to_module=None,
         log_label=None,
         base_class_module_name='BaseIndicator',
-        verbose=False):
+        verbose=False,
+        use_cache=True):
     """load_indicator_from_module
 
-    Load a custom indicator from a file
+    Load a custom indicator from a file (reusing the module
+    from ``INDICATOR_MODULE_CACHE`` if the file has not changed)
 
     :param module_name: string name of the indicator module
         use in to load the module
@@ -42,6 +89,9 @@ def load_indicator_from_module(
         for using a non-standard indicator base class
     :param verbose: optional - bool for more logging
         (default is ``False``)
+    :param use_cache: optional - bool for reusing the
+        module and class from ``INDICATOR_MODULE_CACHE``
+        (default is ``True``)
     """
 
     default_base_module_path = ae_consts.INDICATOR_BASE_MODULE_PATH
@@ -79,22 +129,54 @@ def load_indicator_from_module(
             'and if you are using a container, confirm it is '
             'accessible within the container')
 
-    loader = importlib.machinery.SourceFileLoader(
-        use_module_name,
-        path_to_module)
-    custom_indicator_module = types.ModuleType(
-        loader.name)
-    loader.exec_module(
-        custom_indicator_module)
-
-    found_base_object = False
+    file_key = None
+    cache_key = None
     class_member_in_module = None
-    for member in inspect.getmembers(custom_indicator_module):
-        if module_name in str(member):
-            found_base_object = True
-            class_member_in_module = member
-            break
-    # for all members in this custom module file
+    if use_cache:
+        file_key = get_module_file_key(
+            path_to_module=path_to_module)
+        cache_key = (
+            file_key[0],
+            module_name)
+        with INDICATOR_MODULE_CACHE_LOCK:
+            cached_node = INDICATOR_MODULE_CACHE.get(
+                cache_key,
+                None)
+        if cached_node and cached_node['file_key'] == file_key:
+            use_module_name = cached_node['module_name']
+            class_member_in_module = cached_node['member']
+            if verbose:
+                log.info(
+                    f'load - cached indicator module={use_module_name} '
+                    f'from file={path_to_module}')
+    # end of checking the module cache
+
+    found_base_object = class_member_in_module is not None
+    if not found_base_object:
+        loader = importlib.machinery.SourceFileLoader(
+            use_module_name,
+            path_to_module)
+        custom_indicator_module = types.ModuleType(
+            loader.name)
+        loader.exec_module(
+            custom_indicator_module)
+
+        for member in inspect.getmembers(custom_indicator_module):
+            if module_name in str(member):
+                found_base_object = True
+                class_member_in_module = member
+                break
+        # for all members in this custom module file
+
+        if found_base_object and cache_key:
+            with INDICATOR_MODULE_CACHE_LOCK:
+                INDICATOR_MODULE_CACHE[cache_key] = {
+                    'file_key': file_key,
+                    'module_name': use_module_name,
+                    'module': custom_indicator_module,
+                    'member': class_member_in_module
+                }
+    # end of executing the module file
 
     if not found_base_object:
         raise Exception(
@@ -24,6 +24,8 @@ import analysis_engine.indicators.base_indicator as base_indicator
 class IndicatorMACD(base_indicator.BaseIndicator):
     """IndicatorMACD"""
 
+    uses_lookback_window = True
+
     def __init__(
             self,
             **kwargs):
@@ -328,6 +330,42 @@ class IndicatorMACD(base_indicator.BaseIndicator):
             self.lg('process end')
     # end of process
 
+    def build_stream_kernel(
+            self):
+        """build_stream_kernel
+
+        Build the streaming ``MACD`` kernel for
+        ``indicator_mode=incremental``
+        """
+        return ae_talib.stream.MACD(
+            fastperiod=self.fast_period,
+            slowperiod=self.slow_period,
+            signalperiod=self.signal_period)
+    # end of build_stream_kernel
+
+    def handle_stream_value(
+            self,
+            value,
+            cur_value):
+        """handle_stream_value
+
+        Set the indicator values and the buy and sell labels
+        from the streaming kernel's latest value
+
+        :param value: latest ``(macd, macdsignal, macdhist)`` values
+        :param cur_value: close for the current bar
+        """
+        (self.macd_value,
+         self.macd_signal,
+         self.macd_hist) = [
+            ae_consts.to_f(val)
+            for val in value
+        ]
+        self.set_percent_signals(
+            value=self.macd_value,
+            cur_value=cur_value)
+    # end of handle_stream_value
+
     def reset_internals(
             self):
         """reset_internals"""
@@ -25,6 +25,9 @@ import analysis_engine.indicators.base_indicator as base_indicator
 class IndicatorMFI(base_indicator.BaseIndicator):
     """IndicatorMFI"""
 
+    uses_ohlcv_arrays = True
+    uses_lookback_window = True
+
     def __init__(
             self,
             **kwargs):
@@ -309,6 +312,60 @@ class IndicatorMFI(base_indicator.BaseIndicator):
             self.lg('process end')
     # end of process
 
+    def compute_ohlcv_value(
+            self,
+            ohlcv):
+        """compute_ohlcv_value
+
+        Compute the latest ``MFI`` value from the trailing
+        ``num_points`` rows of the shared ``OHLCVBundle``
+        with ``ae_talib.cached``
+
+        :param ohlcv: ``analysis_engine.ohlcv_bundle.OHLCVBundle``
+        """
+        num_points = self.num_points
+        return ae_talib.cached(
+            ohlcv=ohlcv,
+            func='MFI',
+            inputs={
+                'high': 'high',
+                'low': 'low',
+                'close': 'close',
+                'volume': 'volume'
+            },
+            num_points=num_points,
+            timeperiod=num_points)[-1]
+    # end of compute_ohlcv_value
+
+    def build_stream_kernel(
+            self):
+        """build_stream_kernel
+
+        Build the streaming ``MFI`` kernel for
+        ``indicator_mode=incremental``
+        """
+        return ae_talib.stream.MFI(
+            timeperiod=self.num_points)
+    # end of build_stream_kernel
+
+    def handle_stream_value(
+            self,
+            value,
+            cur_value):
+        """handle_stream_value
+
+        Set ``self.mfi_value`` and the buy and sell labels
+        from the streaming kernel's latest value
+
+        :param value: latest ``MFI`` value
+        :param cur_value: close for the current bar
+        """
+        self.mfi_value = ae_consts.to_f(value)
+        self.set_percent_signals(
+            value=self.mfi_value,
+            cur_value=cur_value)
+    # end of handle_stream_value
+
     def reset_internals(
             self):
         """reset_internals"""
@@ -24,6 +24,8 @@ import analysis_engine.indicators.base_indicator as base_indicator
 class IndicatorSTOCH(base_indicator.BaseIndicator):
     """IndicatorSTOCH"""
 
+    uses_lookback_window = True
+
     def __init__(
             self,
             **kwargs):
@@ -322,6 +324,43 @@ class IndicatorSTOCH(base_indicator.BaseIndicator):
             self.lg('process end')
     # end of process
 
+    def build_stream_kernel(
+            self):
+        """build_stream_kernel
+
+        Build the streaming ``STOCH`` kernel for
+        ``indicator_mode=incremental``
+        """
+        return ae_talib.stream.STOCH(
+            fastk_period=self.fastk_period,
+            slowk_period=self.slowk_period,
+            slowk_matype=self.slowk_matype,
+            slowd_period=self.slowd_period,
+            slowd_matype=self.slowd_matype)
+    # end of build_stream_kernel
+
+    def handle_stream_value(
+            self,
+            value,
+            cur_value):
+        """handle_stream_value
+
+        Set the indicator values and the buy and sell labels
+        from the streaming kernel's latest value
+
+        :param value: latest ``(slowk, slowd)`` values
+        :param cur_value: close for the current bar
+        """
+        (self.slowk_value,
+         self.slowd_value) = [
+            ae_consts.to_f(val)
+            for val in value
+        ]
+        self.set_percent_signals(
+            value=self.slowk_value,
+            cur_value=cur_value)
+    # end of handle_stream_value
+
     def reset_internals(
             self):
         """reset_internals"""
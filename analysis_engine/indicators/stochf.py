@@ -24,6 +24,8 @@ import analysis_engine.indicators.base_indicator as base_indicator
 class IndicatorSTOCHF(base_indicator.BaseIndicator):
     """IndicatorSTOCHF"""
 
+    uses_lookback_window = True
+
     def __init__(
             self,
             **kwargs):
@@ -339,6 +341,41 @@ class IndicatorSTOCHF(base_indicator.BaseIndicator):
             self.lg('process end')
     # end of process
 
+    def build_stream_kernel(
+            self):
+        """build_stream_kernel
+
+        Build the streaming ``STOCHF`` kernel for
+        ``indicator_mode=incremental``
+        """
+        return ae_talib.stream.STOCHF(
+            fastk_period=self.fastk_period,
+            fastd_period=self.fastd_period,
+            fastd_matype=self.fastd_matype)
+    # end of build_stream_kernel
+
+    def handle_stream_value(
+            self,
+            value,
+            cur_value):
+        """handle_stream_value
+
+        Set the indicator values and the buy and sell labels
+        from the streaming kernel's latest value
+
+        :param value: latest ``(fastk, fastd)`` values
+        :param cur_value: close for the current bar
+        """
+        (self.fastk_value,
+         self.fastd_value) = [
+            ae_consts.to_f(val)
+            for val in value
+        ]
+        self.set_percent_signals(
+            value=self.fastk_value,
+            cur_value=cur_value)
+    # end of handle_stream_value
+
     def reset_internals(
             self):
         """reset_internals"""
@@ -16,6 +16,7 @@ Momentum
     export SHARED_LOG_CFG=/opt/sa/analysis_engine/log/debug-logging.json
 """
 
+import numpy as np
 import analysis_engine.ae_talib as ae_talib
 import analysis_engine.consts as ae_consts
 import analysis_engine.indicators.base_indicator as base_indicator
@@ -24,6 +25,9 @@ import analysis_engine.indicators.base_indicator as base_indicator
 class IndicatorWilliamsR(base_indicator.BaseIndicator):
     """IndicatorWilliamsR"""
 
+    uses_ohlcv_arrays = True
+    uses_lookback_window = True
+
     def __init__(
             self,
             **kwargs):
@@ -269,6 +273,358 @@ class IndicatorWilliamsR(base_indicator.BaseIndicator):
             self.lg(f'process end - willr={self.willr_value}')
     # end of process
 
+    def cache_subscribed_columns(
+            self,
+            dataset):
+        """cache_subscribed_columns
+
+        Cache the subscribed dataset's ``high``, ``low`` and
+        ``close`` columns as lists along with a running count
+        of rows with missing values so windows with gaps can
+        fall back to ``process``. Returns ``True`` if the
+        columns were cached
+
+        :param dataset: dictionary of ``pandas.DataFrame(s)`` holding
+            every bar the algorithm will step through
+        """
+        df_status, use_df = self.get_subscribed_dataset(
+            dataset=dataset)
+        if df_status == ae_consts.EMPTY or len(use_df.index) == 0:
+            return False
+        for col in ['high', 'low', 'close']:
+            if col not in use_df:
+                return False
+
+        self.bar_highs = use_df['high'].tolist()
+        self.bar_lows = use_df['low'].tolist()
+        self.bar_closes = use_df['close'].tolist()
+        has_nans = use_df.isna().any(axis=1)
+        self.bar_num_nans = np.concatenate((
+            [0],
+            np.cumsum(has_nans.values)))
+        return True
+    # end of cache_subscribed_columns
+
+    def has_missing_values(
+            self,
+            bar_idx):
+        """has_missing_values
+
+        Check if the trailing ``num_points`` window ending at
+        ``bar_idx`` has rows with missing values
+
+        :param bar_idx: integer position of the current bar
+        """
+        start_row = bar_idx + 1 - self.num_points
+        return (
+            self.bar_num_nans[bar_idx + 1] !=
+            self.bar_num_nans[start_row])
+    # end of has_missing_values
+
+    def seed_incremental(
+            self,
+            algo_id,
+            ticker,
+            dataset):
+        """seed_incremental
+
+        Cache the subscribed dataset's columns and build a
+        streaming ``WILLR`` kernel so ``process_incremental``
+        can update the indicator in ``O(1)`` per bar
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pandas.DataFrame(s)`` holding
+            every bar the algorithm will step through
+        """
+        if not self.cache_subscribed_columns(
+                dataset=dataset):
+            return False
+        self.inc_willr = ae_talib.stream.WILLR(
+            timeperiod=self.num_points)
+        self.inc_last_idx = None
+        return True
+    # end of seed_incremental
+
+    def precompute_signals(
+            self,
+            algo_id,
+            ticker,
+            dataset):
+        """precompute_signals
+
+        Compute the ``WILLR`` values for every bar in the
+        subscribed dataset with a single ``ae_talib.WILLR`` call
+        and label each bar's buy and sell signal up front so
+        ``process_precomputed`` is just a lookup
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pandas.DataFrame(s)`` holding
+            every bar the algorithm will step through
+        """
+        if not self.cache_subscribed_columns(
+                dataset=dataset):
+            return False
+        self.set_precomputed_values(
+            willr_values=ae_talib.WILLR(
+                np.array(self.bar_highs, dtype=float),
+                np.array(self.bar_lows, dtype=float),
+                np.array(self.bar_closes, dtype=float),
+                self.num_points))
+        return True
+    # end of precompute_signals
+
+    def set_precomputed_values(
+            self,
+            willr_values):
+        """set_precomputed_values
+
+        Label every bar's buy and sell signal from the
+        ``WILLR`` values for ``process_precomputed``
+
+        :param willr_values: ``WILLR`` value for every bar
+        """
+        self.pre_values = [
+            ae_consts.to_f(value)
+            for value in willr_values
+        ]
+        self.pre_is_buy = [
+            ae_consts.INDICATOR_BUY
+            if value < self.buy_below
+            else ae_consts.INDICATOR_IGNORE
+            for value in self.pre_values
+        ]
+        self.pre_is_sell = [
+            ae_consts.INDICATOR_SELL
+            if value > self.sell_above
+            else ae_consts.INDICATOR_IGNORE
+            for value in self.pre_values
+        ]
+    # end of set_precomputed_values
+
+    def get_batch_call(
+            self):
+        """get_batch_call
+
+        Share one ``ae_talib.multi`` call with the other
+        ``WILLR`` indicators on the same columns
+        """
+        return ('WILLR', ['high', 'low', 'close'])
+    # end of get_batch_call
+
+    def precompute_batch(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            ohlcv,
+            values):
+        """precompute_batch
+
+        Label each bar's buy and sell signal from this
+        indicator's row of the ``ae_talib.multi`` matrix
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pandas.DataFrame(s)`` holding
+            every bar the algorithm will step through
+        :param ohlcv: ``analysis_engine.ohlcv_bundle.OHLCVBundle``
+            for the full subscribed dataset
+        :param values: ``WILLR`` value for every bar
+        """
+        if not self.cache_subscribed_columns(
+                dataset=dataset):
+            return False
+        self.set_precomputed_values(
+            willr_values=values)
+        return True
+    # end of precompute_batch
+
+    def process_precomputed(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            bar_idx):
+        """process_precomputed
+
+        Look up the precomputed ``WILLR`` value and buy and
+        sell labels for ``bar_idx``
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pandas.DataFrame(s)`` to process
+        :param bar_idx: integer position of the current bar
+        """
+        self.willr_value = None
+        if bar_idx + 1 <= self.num_points:
+            return
+
+        if self.has_missing_values(bar_idx):
+            self.process(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset)
+            return
+
+        self.willr_value = self.pre_values[bar_idx]
+        self.is_buy = self.pre_is_buy[bar_idx]
+        self.is_sell = self.pre_is_sell[bar_idx]
+    # end of process_precomputed
+
+    def process_incremental(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            bar_idx):
+        """process_incremental
+
+        Advance the streaming ``WILLR`` kernel to ``bar_idx`` and
+        set the same buy and sell values ``process`` would report
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pandas.DataFrame(s)`` to process
+        :param bar_idx: integer position of the current bar
+        """
+        self.willr_value = None
+        num_points = self.num_points
+        if (self.inc_last_idx is None or
+                bar_idx <= self.inc_last_idx or
+                bar_idx - self.inc_last_idx > num_points):
+            self.inc_willr.reset()
+            start_idx = max(0, bar_idx - num_points + 1)
+        else:
+            start_idx = self.inc_last_idx + 1
+
+        highs = self.bar_highs
+        lows = self.bar_lows
+        closes = self.bar_closes
+        update = self.inc_willr.update
+        for idx in range(start_idx, bar_idx + 1):
+            update(highs[idx], lows[idx], closes[idx])
+        self.inc_last_idx = bar_idx
+
+        if bar_idx + 1 <= num_points:
+            return
+
+        if self.has_missing_values(bar_idx):
+            self.process(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset)
+            return
+
+        self.willr_value = ae_consts.to_f(
+            self.inc_willr.value)
+
+        self.is_buy = ae_consts.INDICATOR_IGNORE
+        self.is_sell = ae_consts.INDICATOR_IGNORE
+
+        if self.willr_value < self.buy_below:
+            self.is_buy = ae_consts.INDICATOR_BUY
+
+        if self.willr_value > self.sell_above:
+            self.is_sell = ae_consts.INDICATOR_SELL
+
+        if self.verbose:
+            self.lg(
+                f'process_incremental end - bar={bar_idx} '
+                f'willr_value={self.willr_value} '
+                f'buy_below={self.buy_below} is_buy={self.is_buy} '
+                f'sell_above={self.sell_above} is_sell={self.is_sell}')
+    # end of process_incremental
+
+    def compute_ohlcv_value(
+            self,
+            ohlcv):
+        """compute_ohlcv_value
+
+        Compute the latest ``WILLR`` value from the trailing
+        ``num_points`` rows of the shared ``OHLCVBundle``
+        with ``ae_talib.cached``
+
+        :param ohlcv: ``analysis_engine.ohlcv_bundle.OHLCVBundle``
+        """
+        num_points = self.num_points
+        return ae_talib.cached(
+            ohlcv=ohlcv,
+            func='WILLR',
+            inputs={
+                'high': 'high',
+                'low': 'low',
+                'close': 'close'
+            },
+            num_points=num_points,
+            timeperiod=num_points)[-1]
+    # end of compute_ohlcv_value
+
+    def process_arrays(
+            self,
+            algo_id,
+            ticker,
+            dataset,
+            ohlcv):
+        """process_arrays
+
+        Set the same ``WILLR`` value and buy and sell labels
+        ``process`` would report from the shared ``OHLCVBundle``
+
+        :param algo_id: string - algo identifier label for debugging datasets
+            during specific dates
+        :param ticker: string - ticker
+        :param dataset: dictionary of ``pandas.DataFrame(s)`` to process
+        :param ohlcv: ``analysis_engine.ohlcv_bundle.OHLCVBundle``
+        """
+        self.willr_value = None
+        if ohlcv.num_rows <= self.num_points:
+            return
+
+        # process drops rows with missing values from the window
+        if ohlcv.has_missing(self.num_points):
+            self.process(
+                algo_id=algo_id,
+                ticker=ticker,
+                dataset=dataset)
+            return
+
+        self.handle_stream_value(
+            value=self.compute_ohlcv_value(
+                ohlcv=ohlcv),
+            cur_value=None)
+    # end of process_arrays
+
+    def handle_stream_value(
+            self,
+            value,
+            cur_value):
+        """handle_stream_value
+
+        Set ``self.willr_value`` and the buy and sell labels
+        using the ``buy_below`` and ``sell_above`` thresholds
+
+        :param value: latest ``WILLR`` value
+        :param cur_value: close for the current bar (not used)
+        """
+        self.willr_value = ae_consts.to_f(value)
+
+        self.is_buy = ae_consts.INDICATOR_IGNORE
+        self.is_sell = ae_consts.INDICATOR_IGNORE
+
+        if self.willr_value < self.buy_below:
+            self.is_buy = ae_consts.INDICATOR_BUY
+
+        if self.willr_value > self.sell_above:
+            self.is_sell = ae_consts.INDICATOR_SELL
+    # end of handle_stream_value
+
     def reset_internals(
             self):
         """reset_internals"""
@@ -47,7 +47,7 @@ def load_algo_dataset_from_redis(
     data_from_file = None
 
     redis_host = redis_address.split(':')[0]
-    redis_port = int(redis_address.split(':')[0])
+    redis_port = int(redis_address.split(':')[1])
 
     redis_res = redis_utils.get_data_from_redis_key(
         key=redis_key,
@@ -77,6 +77,7 @@ datasets from the redis pipeline:
 
 import analysis_engine.algo as base_algo
 import analysis_engine.utils as ae_utils
+import analysis_engine.position_ledger as position_ledger
 import spylunking.log.setup_logging as log_utils
 
 log = log_utils.build_colorized_logger(name=__name__)
@@ -220,13 +221,15 @@ class ExampleMinuteAlgo(base_algo.BaseAlgo):
             'name': self.name,
             'created': self.created_date,
             'updated': finished_date,
-            'open_positions': self.positions,
+            'open_positions': position_ledger.positions_to_dicts(
+                self.positions),
             'buys': self.get_buys(),
             'sells': self.get_sells(),
             'num_processed': len(self.order_history),
-            'history': self.order_history,
+            'history': self.get_history(),
             'balance': self.balance,
-            'commission': self.commission
+            'commission': self.commission,
+            'perf': self.perf.get_summary()
         }
 
         return self.result
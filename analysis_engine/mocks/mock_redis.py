@@ -130,4 +130,125 @@ class MockRedis:
         # end of get data from dict vs in the env
     # end of get
 
+    def mget(
+            self,
+            keys,
+            *args):
+        """mget
+
+        mock redis mget
+
+        :param keys: list of key names to get
+        :param args: additional key names
+        """
+        names = list(keys) if isinstance(keys, (list, tuple)) else [keys]
+        names += list(args)
+        log.info(
+            f'mock - MockRedis.mget(keys={names})')
+        return [
+            self.get(
+                name=name)
+            for name in names
+        ]
+    # end of mget
+
 # end of MockRedis
+
+
+class MockAsyncRedis:
+    """MockAsyncRedis"""
+
+    def __init__(
+            self,
+            host=None,
+            port=None,
+            password=None,
+            db=None):
+        """__init__
+
+        build a mock ``redis.asyncio`` client that shares the
+        cached data of the ``analysis_engine.redis_pool`` client
+        for the same server (patch ``redis.Redis`` with
+        ``MockRedis`` too)
+
+        :param host: hostname
+        :param port: port
+        :param password: password
+        :param db: database number
+        """
+        import analysis_engine.redis_pool as redis_pool
+        self.client = redis_pool.get_client(
+            host=host,
+            port=port,
+            password=password,
+            db=db)
+        self.closed = False
+    # end of __init__
+
+    async def set(
+            self,
+            name=None,
+            value=None,
+            ex=None,
+            px=None,
+            nx=False,
+            xx=False):
+        """set
+
+        mock redis set
+
+        :param name: cache key name
+        :param value: value to cache
+        :param ex: expire time
+        :param px: redis values
+        :param nx: redis values
+        :param xx: redis values
+        """
+        return self.client.set(
+            name=name,
+            value=value,
+            ex=ex,
+            px=px,
+            nx=nx,
+            xx=xx)
+    # end of set
+
+    async def get(
+            self,
+            name=None):
+        """get
+
+        mock redis get
+
+        :param name: name of the key to check
+        """
+        return self.client.get(
+            name=name)
+    # end of get
+
+    async def mget(
+            self,
+            keys,
+            *args):
+        """mget
+
+        mock redis mget
+
+        :param keys: list of key names to get
+        :param args: additional key names
+        """
+        return self.client.mget(
+            keys,
+            *args)
+    # end of mget
+
+    async def aclose(
+            self):
+        """aclose
+
+        mock closing the client
+        """
+        self.closed = True
+    # end of aclose
+
+# end of MockAsyncRedis
@@ -0,0 +1,1369 @@
+"""
+Pure NumPy TA-Lib functions
+
+Vectorized versions of the TA-Lib functions used by
+``analysis_engine.ae_talib`` for environments that cannot build
+TA-Lib. ``ae_talib`` uses these automatically when ``import talib``
+fails. Each function takes the same arguments as the TA-Lib function
+with the same name, returns ``numpy.float64`` arrays with ``nan``
+for the lookback period and follows TA-Lib's default (non-Metastock)
+seeding so the values match TA-Lib to floating point precision.
+Like TA-Lib's pandas wrapper, passing any ``pandas.Series`` input
+returns ``pandas.Series`` outputs with the first series' index.
+
+Recursive smoothing (EMA and Wilder's averages) is evaluated in
+blocks with a matrix of decay powers instead of a per-bar python
+loop.
+
+.. code-block:: python
+
+    import analysis_engine.np_talib as np_talib
+    willr = np_talib.WILLR(high, low, close, timeperiod=14)
+
+Supported moving average types for ``matype`` arguments:
+
+- ``0`` - simple moving average
+- ``1`` - exponential moving average
+- ``2`` - weighted moving average
+"""
+
+import functools
+import itertools
+import numpy as np
+import pandas as pd
+
+
+NAN = float('nan')
+# number of bars evaluated with one matrix product in run_recurrence
+BLOCK_SIZE = 64
+# TA-Lib's TA_IS_ZERO tolerance
+ZERO_TOLERANCE = 0.00000001
+SUPPORTED_MATYPES = {
+    0: 'SMA',
+    1: 'EMA',
+    2: 'WMA'
+}
+RECURRENCE_KERNELS = {}
+
+
+def pandas_output(
+        func):
+    """pandas_output
+
+    Decorator for returning ``pandas.Series`` outputs (with the
+    index of the first ``pandas.Series`` argument) when any
+    input is a ``pandas.Series`` like TA-Lib's functions. The
+    ``pandas.Series`` inputs are passed to ``func`` as arrays
+
+    :param func: TA-Lib function returning an array or
+        a ``tuple`` of arrays
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        index = None
+        for arg in itertools.chain(args, kwargs.values()):
+            if isinstance(arg, pd.Series):
+                index = arg.index
+                break
+        if index is None:
+            return func(*args, **kwargs)
+        res = func(
+            *[
+                to_array(arg) if isinstance(arg, pd.Series) else arg
+                for arg in args
+            ],
+            **{
+                key: (
+                    to_array(arg) if isinstance(arg, pd.Series) else arg)
+                for key, arg in kwargs.items()
+            })
+        if isinstance(res, tuple):
+            return tuple(
+                pd.Series(values, index=index)
+                for values in res)
+        return pd.Series(res, index=index)
+    return wrapper
+# end of pandas_output
+
+
+def to_array(
+        values):
+    """to_array
+
+    Convert a ``list``, ``pandas.Series`` or array to a
+    contiguous ``numpy.float64`` array
+
+    :param values: input values
+    """
+    return np.ascontiguousarray(
+        values,
+        dtype=np.float64)
+# end of to_array
+
+
+def build_output(
+        num_values):
+    """build_output
+
+    :param num_values: length of the output array
+    """
+    return np.full(
+        num_values,
+        NAN,
+        dtype=np.float64)
+# end of build_output
+
+
+def is_zero(
+        values):
+    """is_zero
+
+    Vectorized TA-Lib ``TA_IS_ZERO`` check
+
+    :param values: array of values
+    """
+    return (values > -ZERO_TOLERANCE) & (values < ZERO_TOLERANCE)
+# end of is_zero
+
+
+def rolling_windows(
+        values,
+        timeperiod):
+    """rolling_windows
+
+    Read-only ``(len(values) - timeperiod + 1, timeperiod)`` view
+    of every trailing window without copying ``values``
+
+    :param values: ``numpy.float64`` array
+    :param timeperiod: window size
+    """
+    num_windows = len(values) - timeperiod + 1
+    return np.lib.stride_tricks.as_strided(
+        values,
+        shape=(num_windows, timeperiod),
+        strides=(values.strides[0], values.strides[0]),
+        writeable=False)
+# end of rolling_windows
+
+
+def rolling_max(
+        values,
+        timeperiod):
+    """rolling_max
+
+    Maximum of every trailing window in ``O(n)`` using the
+    prefix and suffix maximums of ``timeperiod`` sized blocks
+    (van Herk/Gil-Werman)
+
+    :param values: ``numpy.float64`` array
+    :param timeperiod: window size
+    """
+    num_values = len(values)
+    num_blocks = -(-num_values // timeperiod)
+    padded = np.full(
+        num_blocks * timeperiod,
+        -np.inf,
+        dtype=np.float64)
+    padded[:num_values] = values
+    blocks = padded.reshape(num_blocks, timeperiod)
+    prefix = np.maximum.accumulate(blocks, axis=1).ravel()
+    suffix = np.maximum.accumulate(
+        blocks[:, ::-1],
+        axis=1)[:, ::-1].ravel()
+    return np.maximum(
+        suffix[:num_values - timeperiod + 1],
+        prefix[timeperiod - 1:num_values])
+# end of rolling_max
+
+
+def rolling_min(
+        values,
+        timeperiod):
+    """rolling_min
+
+    Minimum of every trailing window in ``O(n)``
+
+    :param values: ``numpy.float64`` array
+    :param timeperiod: window size
+    """
+    return -rolling_max(
+        -values,
+        timeperiod)
+# end of rolling_min
+
+
+def rolling_max_rows(
+        values,
+        timeperiod):
+    """rolling_max_rows
+
+    ``rolling_max`` for each row of a ``(rows, n)`` matrix
+    with one set of block prefix and suffix maximums
+
+    :param values: ``(rows, n)`` ``numpy.float64`` matrix
+    :param timeperiod: window size
+    """
+    num_rows, num_values = values.shape
+    num_blocks = -(-num_values // timeperiod)
+    padded = np.full(
+        (num_rows, num_blocks * timeperiod),
+        -np.inf,
+        dtype=np.float64)
+    padded[:, :num_values] = values
+    blocks = padded.reshape(num_rows, num_blocks, timeperiod)
+    prefix = np.maximum.accumulate(blocks, axis=2).reshape(
+        num_rows, -1)
+    suffix = np.maximum.accumulate(
+        blocks[:, :, ::-1],
+        axis=2)[:, :, ::-1].reshape(num_rows, -1)
+    return np.maximum(
+        suffix[:, :num_values - timeperiod + 1],
+        prefix[:, timeperiod - 1:num_values])
+# end of rolling_max_rows
+
+
+def multi_rolling_max(
+        values,
+        timeperiods):
+    """multi_rolling_max
+
+    Maximum of every trailing window for each period in
+    ``timeperiods`` as a ``(len(timeperiods), len(values))``
+    matrix with ``nan`` before each window is full. One sparse
+    table of power of two block maximums is built for all the
+    periods and each window is the maximum of two overlapping
+    blocks
+
+    :param values: ``numpy.float64`` array
+    :param timeperiods: list of window sizes
+    """
+    num_values = len(values)
+    out = np.full(
+        (len(timeperiods), num_values),
+        NAN,
+        dtype=np.float64)
+    if num_values == 0 or len(timeperiods) == 0:
+        return out
+    max_period = max(timeperiods)
+    # levels[k][idx] is the maximum of values[idx:idx + 2 ** k]
+    levels = [values]
+    width = 1
+    while width * 2 <= max_period and width < len(levels[-1]):
+        prev = levels[-1]
+        levels.append(np.maximum(
+            prev[:-width],
+            prev[width:]))
+        width *= 2
+    for row, timeperiod in enumerate(timeperiods):
+        timeperiod = int(timeperiod)
+        if timeperiod < 1 or timeperiod > num_values:
+            continue
+        level = timeperiod.bit_length() - 1
+        table = levels[level]
+        block = 1 << level
+        out[row, timeperiod - 1:] = np.maximum(
+            table[0:num_values - timeperiod + 1],
+            table[timeperiod - block:num_values - block + 1])
+    return out
+# end of multi_rolling_max
+
+
+def get_recurrence_kernel(
+        decay):
+    """get_recurrence_kernel
+
+    Build (and cache) the lower triangular matrix of
+    ``decay ** (row - col)`` and the ``decay ** (row + 1)`` carry
+    powers used by ``run_recurrence``
+
+    :param decay: float decay factor
+    """
+    kernel = RECURRENCE_KERNELS.get(decay, None)
+    if kernel is None:
+        lags = (
+            np.arange(BLOCK_SIZE)[:, None]
+            - np.arange(BLOCK_SIZE)[None, :])
+        matrix = np.where(
+            lags >= 0,
+            np.power(decay, np.maximum(lags, 0)),
+            0.0)
+        carry = np.power(
+            decay,
+            np.arange(1, BLOCK_SIZE + 1, dtype=np.float64))
+        kernel = (matrix.T.copy(), carry)
+        RECURRENCE_KERNELS[decay] = kernel
+    return kernel
+# end of get_recurrence_kernel
+
+
+def run_recurrence(
+        inputs,
+        decay,
+        initial):
+    """run_recurrence
+
+    Evaluate ``y[t] = decay * y[t - 1] + inputs[t]`` with
+    ``y[-1] = initial`` for every value in ``inputs``. Each block
+    of ``BLOCK_SIZE`` values is solved with one matrix product and
+    only the carry between blocks is a python loop
+
+    :param inputs: ``numpy.float64`` array
+    :param decay: float decay factor
+    :param initial: value before the first input
+    """
+    num_values = len(inputs)
+    if num_values == 0:
+        return np.zeros(0, dtype=np.float64)
+    num_blocks = -(-num_values // BLOCK_SIZE)
+    blocks = np.zeros(
+        num_blocks * BLOCK_SIZE,
+        dtype=np.float64)
+    blocks[:num_values] = inputs
+    blocks = blocks.reshape(num_blocks, BLOCK_SIZE)
+    matrix, carry = get_recurrence_kernel(
+        decay=decay)
+    local = blocks.dot(matrix)
+    block_decay = carry[-1]
+    starts = np.empty(num_blocks, dtype=np.float64)
+    prev = initial
+    for block_idx, block_end in enumerate(local[:, -1].tolist()):
+        starts[block_idx] = prev
+        prev = block_decay * prev + block_end
+    local += starts[:, None] * carry[None, :]
+    return local.ravel()[:num_values]
+# end of run_recurrence
+
+
+def run_recurrence_rows(
+        inputs,
+        decay,
+        initial):
+    """run_recurrence_rows
+
+    ``run_recurrence`` for each row of a ``(rows, n)`` matrix.
+    The carry between blocks is one python loop step per block
+    for all the rows
+
+    :param inputs: ``(rows, n)`` ``numpy.float64`` matrix
+    :param decay: float decay factor
+    :param initial: ``numpy.float64`` array with each
+        row's value before its first input
+    """
+    num_rows, num_values = inputs.shape
+    if num_values == 0:
+        return np.zeros((num_rows, 0), dtype=np.float64)
+    num_blocks = -(-num_values // BLOCK_SIZE)
+    blocks = np.zeros(
+        (num_rows, num_blocks * BLOCK_SIZE),
+        dtype=np.float64)
+    blocks[:, :num_values] = inputs
+    blocks = blocks.reshape(num_rows * num_blocks, BLOCK_SIZE)
+    matrix, carry = get_recurrence_kernel(
+        decay=decay)
+    local = blocks.dot(matrix).reshape(
+        num_rows, num_blocks, BLOCK_SIZE)
+    block_decay = carry[-1]
+    starts = np.empty((num_rows, num_blocks), dtype=np.float64)
+    prev = np.array(initial, dtype=np.float64)
+    for block_idx in range(num_blocks):
+        starts[:, block_idx] = prev
+        prev = block_decay * prev + local[:, block_idx, -1]
+    local += starts[:, :, None] * carry[None, None, :]
+    return local.reshape(num_rows, -1)[:, :num_values]
+# end of run_recurrence_rows
+
+
+def wilder_smooth(
+        inputs,
+        timeperiod,
+        initial):
+    """wilder_smooth
+
+    Wilder's average ``y[t] = (y[t - 1] * (n - 1) + x[t]) / n``
+
+    :param inputs: ``numpy.float64`` array
+    :param timeperiod: smoothing period ``n``
+    :param initial: average before the first input
+    """
+    return run_recurrence(
+        inputs=inputs / timeperiod,
+        decay=(timeperiod - 1.0) / timeperiod,
+        initial=initial)
+# end of wilder_smooth
+
+
+def hold_where_invalid(
+        inputs,
+        valid,
+        timeperiod,
+        initial):
+    """hold_where_invalid
+
+    Wilder's average that keeps the previous value for
+    inputs that are not ``valid``
+
+    :param inputs: ``numpy.float64`` array
+    :param valid: boolean array - update the average
+    :param timeperiod: smoothing period
+    :param initial: average before the first input
+    """
+    out = np.full(
+        len(inputs),
+        initial,
+        dtype=np.float64)
+    valid_idx = np.flatnonzero(valid)
+    if len(valid_idx) == 0:
+        return out
+    smoothed = wilder_smooth(
+        inputs=inputs[valid_idx],
+        timeperiod=timeperiod,
+        initial=initial)
+    # forward fill the last updated value over invalid inputs
+    last_valid = np.full(len(inputs), -1, dtype=np.int64)
+    last_valid[valid_idx] = np.arange(len(valid_idx))
+    last_valid = np.maximum.accumulate(last_valid)
+    has_update = last_valid >= 0
+    out[has_update] = smoothed[last_valid[has_update]]
+    return out
+# end of hold_where_invalid
+
+
+def true_range(
+        high,
+        low,
+        close):
+    """true_range
+
+    True range for every bar after the first
+
+    :param high: ``numpy.float64`` highs
+    :param low: ``numpy.float64`` lows
+    :param close: ``numpy.float64`` closes
+    """
+    prev_close = close[:-1]
+    return np.maximum(
+        high[1:],
+        prev_close) - np.minimum(
+            low[1:],
+            prev_close)
+# end of true_range
+
+
+"""
+Overlap
+
+https://mrjbq7.github.io/ta-lib/func_groups/overlap_studies.html
+"""
+
+
+@pandas_output
+def SMA(
+        real,
+        timeperiod=30):
+    """SMA
+
+    :param real: values
+    :param timeperiod: number of values
+    """
+    real = to_array(real)
+    out = build_output(len(real))
+    if timeperiod < 1 or len(real) < timeperiod:
+        return out
+    out[timeperiod - 1:] = rolling_windows(
+        real,
+        timeperiod).sum(axis=1) / timeperiod
+    return out
+# end of SMA
+
+
+@pandas_output
+def EMA(
+        real,
+        timeperiod=30):
+    """EMA
+
+    Exponential moving average seeded with the simple
+    average of the first ``timeperiod`` values
+
+    :param real: values
+    :param timeperiod: number of values
+    """
+    real = to_array(real)
+    out = build_output(len(real))
+    if timeperiod < 1 or len(real) < timeperiod:
+        return out
+    k = 2.0 / (timeperiod + 1)
+    seed = real[:timeperiod].sum() / timeperiod
+    out[timeperiod - 1] = seed
+    out[timeperiod:] = run_recurrence(
+        inputs=real[timeperiod:] * k,
+        decay=1.0 - k,
+        initial=seed)
+    return out
+# end of EMA
+
+
+@pandas_output
+def WMA(
+        real,
+        timeperiod=30):
+    """WMA
+
+    :param real: values
+    :param timeperiod: number of values
+    """
+    real = to_array(real)
+    out = build_output(len(real))
+    if timeperiod < 1 or len(real) < timeperiod:
+        return out
+    weights = np.arange(1, timeperiod + 1, dtype=np.float64)
+    # convolve flips the weights so the newest value gets timeperiod
+    out[timeperiod - 1:] = np.convolve(
+        real,
+        weights[::-1],
+        'valid') / weights.sum()
+    return out
+# end of WMA
+
+
+@pandas_output
+def MA(
+        real,
+        timeperiod=30,
+        matype=0):
+    """MA
+
+    :param real: values
+    :param timeperiod: number of values
+    :param matype: moving average type
+        (``0`` SMA, ``1`` EMA or ``2`` WMA)
+    """
+    if timeperiod == 1:
+        return to_array(real).copy()
+    ma_name = SUPPORTED_MATYPES.get(matype, None)
+    if not ma_name:
+        raise Exception(
+            f'unsupported matype={matype} the numpy talib backend '
+            f'supports: {SUPPORTED_MATYPES}')
+    return globals()[ma_name](
+        real,
+        timeperiod=timeperiod)
+# end of MA
+
+
+@pandas_output
+def BBANDS(
+        real,
+        timeperiod=5,
+        nbdevup=2.0,
+        nbdevdn=2.0,
+        matype=0):
+    """BBANDS
+
+    :return: upperband, middleband, lowerband
+    :param real: values
+    :param timeperiod: number of values
+    :param nbdevup: standard deviations for the upper band
+    :param nbdevdn: standard deviations for the lower band
+    :param matype: moving average type for the middle band
+    """
+    real = to_array(real)
+    middle = MA(
+        real,
+        timeperiod=timeperiod,
+        matype=matype)
+    upper = build_output(len(real))
+    lower = build_output(len(real))
+    if timeperiod < 2 or len(real) < timeperiod:
+        return upper, middle, lower
+    # TA-Lib uses the population variance of the window
+    mean = rolling_windows(real, timeperiod).sum(axis=1) / timeperiod
+    variance = rolling_windows(
+        real * real,
+        timeperiod).sum(axis=1) / timeperiod - mean * mean
+    stddev = np.where(
+        variance > ZERO_TOLERANCE,
+        np.sqrt(np.maximum(variance, 0.0)),
+        0.0)
+    valid_middle = middle[timeperiod - 1:]
+    upper[timeperiod - 1:] = valid_middle + nbdevup * stddev
+    lower[timeperiod - 1:] = valid_middle - nbdevdn * stddev
+    return upper, middle, lower
+# end of BBANDS
+
+
+"""
+Momentum
+
+https://mrjbq7.github.io/ta-lib/func_groups/momentum_indicators.html
+"""
+
+
+@pandas_output
+def MOM(
+        real,
+        timeperiod=10):
+    """MOM
+
+    :param real: values
+    :param timeperiod: number of values
+    """
+    real = to_array(real)
+    out = build_output(len(real))
+    if len(real) <= timeperiod:
+        return out
+    out[timeperiod:] = real[timeperiod:] - real[:-timeperiod]
+    return out
+# end of MOM
+
+
+@pandas_output
+def ROC(
+        real,
+        timeperiod=10):
+    """ROC
+
+    :param real: values
+    :param timeperiod: number of values
+    """
+    real = to_array(real)
+    out = build_output(len(real))
+    if len(real) <= timeperiod:
+        return out
+    prev = real[:-timeperiod]
+    safe_prev = np.where(prev != 0.0, prev, 1.0)
+    out[timeperiod:] = np.where(
+        prev != 0.0,
+        ((real[timeperiod:] / safe_prev) - 1.0) * 100.0,
+        0.0)
+    return out
+# end of ROC
+
+
+def rsi_from_moves(
+        gains,
+        losses,
+        timeperiod):
+    """rsi_from_moves
+
+    Wilder's relative strength index from the per-bar gains
+    and losses (``len(real) - 1`` values each)
+
+    :param gains: ``numpy.float64`` array of positive moves
+    :param losses: ``numpy.float64`` array of negative moves
+    :param timeperiod: number of values
+    """
+    out = build_output(len(gains) + 1)
+    if timeperiod < 2 or len(gains) < timeperiod:
+        return out
+    avg_gain = gains[:timeperiod].sum() / timeperiod
+    avg_loss = losses[:timeperiod].sum() / timeperiod
+    avg_gains = np.concatenate((
+        [avg_gain],
+        wilder_smooth(
+            inputs=gains[timeperiod:],
+            timeperiod=timeperiod,
+            initial=avg_gain)))
+    avg_losses = np.concatenate((
+        [avg_loss],
+        wilder_smooth(
+            inputs=losses[timeperiod:],
+            timeperiod=timeperiod,
+            initial=avg_loss)))
+    total = avg_gains + avg_losses
+    zero = is_zero(total)
+    out[timeperiod:] = np.where(
+        zero,
+        0.0,
+        100.0 * (avg_gains / np.where(zero, 1.0, total)))
+    return out
+# end of rsi_from_moves
+
+
+@pandas_output
+def RSI(
+        real,
+        timeperiod=14):
+    """RSI
+
+    Wilder's relative strength index
+
+    :param real: values
+    :param timeperiod: number of values
+    """
+    real = to_array(real)
+    if len(real) == 0:
+        return build_output(0)
+    diffs = np.diff(real)
+    return rsi_from_moves(
+        gains=np.maximum(diffs, 0.0),
+        losses=np.maximum(-diffs, 0.0),
+        timeperiod=timeperiod)
+# end of RSI
+
+
+def RSI_MULTI(
+        real,
+        timeperiods):
+    """RSI_MULTI
+
+    ``RSI`` for every period in ``timeperiods`` as a
+    ``(len(timeperiods), len(real))`` matrix. The gains and
+    losses are computed once and shared by every period
+
+    :param real: values
+    :param timeperiods: list of periods
+    """
+    real = to_array(real)
+    out = np.full(
+        (len(timeperiods), len(real)),
+        NAN,
+        dtype=np.float64)
+    if len(real) == 0:
+        return out
+    diffs = np.diff(real)
+    gains = np.maximum(diffs, 0.0)
+    losses = np.maximum(-diffs, 0.0)
+    for row, timeperiod in enumerate(timeperiods):
+        out[row] = rsi_from_moves(
+            gains=gains,
+            losses=losses,
+            timeperiod=int(timeperiod))
+    return out
+# end of RSI_MULTI
+
+
+def RSI_ROWS(
+        real,
+        timeperiod=14):
+    """RSI_ROWS
+
+    ``RSI`` for each row of a ``(rows, n)`` matrix (like the
+    aligned closes of many tickers) with one Wilder smoothing
+    pass for all the rows
+
+    :param real: ``(rows, n)`` values
+    :param timeperiod: number of values
+    """
+    real = to_array(real)
+    num_rows, num_values = real.shape
+    out = np.full(
+        (num_rows, num_values),
+        NAN,
+        dtype=np.float64)
+    if timeperiod < 2 or num_values - 1 < timeperiod:
+        return out
+    diffs = np.diff(real, axis=1)
+    gains = np.maximum(diffs, 0.0)
+    losses = np.maximum(-diffs, 0.0)
+    avgs = []
+    for moves in (gains, losses):
+        avg = moves[:, :timeperiod].sum(axis=1) / timeperiod
+        avgs.append(np.concatenate((
+            avg[:, None],
+            run_recurrence_rows(
+                inputs=moves[:, timeperiod:] / timeperiod,
+                decay=(timeperiod - 1.0) / timeperiod,
+                initial=avg)), axis=1))
+    avg_gains, avg_losses = avgs
+    total = avg_gains + avg_losses
+    zero = is_zero(total)
+    out[:, timeperiod:] = np.where(
+        zero,
+        0.0,
+        100.0 * (avg_gains / np.where(zero, 1.0, total)))
+    return out
+# end of RSI_ROWS
+
+
+@pandas_output
+def MACD(
+        real,
+        fastperiod=12,
+        slowperiod=26,
+        signalperiod=9):
+    """MACD
+
+    The fast EMA is seeded over the ``fastperiod`` values
+    that end where the slow EMA starts like TA-Lib
+
+    :return: macd, macdsignal, macdhist
+    :param real: values
+    :param fastperiod: fast EMA period
+    :param slowperiod: slow EMA period
+    :param signalperiod: signal EMA period
+    """
+    real = to_array(real)
+    macd = build_output(len(real))
+    signal = build_output(len(real))
+    hist = build_output(len(real))
+    if slowperiod < fastperiod:
+        fastperiod, slowperiod = slowperiod, fastperiod
+    slow_start = slowperiod - 1
+    lookback = slow_start + signalperiod - 1
+    if len(real) <= lookback:
+        return macd, signal, hist
+    fast_ema = EMA(
+        real[slow_start - fastperiod + 1:],
+        timeperiod=fastperiod)[fastperiod - 1:]
+    slow_ema = EMA(
+        real,
+        timeperiod=slowperiod)[slow_start:]
+    macd_values = fast_ema - slow_ema
+    signal_values = EMA(
+        macd_values,
+        timeperiod=signalperiod)
+    macd[lookback:] = macd_values[signalperiod - 1:]
+    signal[lookback:] = signal_values[signalperiod - 1:]
+    hist[lookback:] = macd[lookback:] - signal[lookback:]
+    return macd, signal, hist
+# end of MACD
+
+
+@pandas_output
+def MFI(
+        high,
+        low,
+        close,
+        volume,
+        timeperiod=14):
+    """MFI
+
+    :param high: highs
+    :param low: lows
+    :param close: closes
+    :param volume: volumes
+    :param timeperiod: number of values
+    """
+    high = to_array(high)
+    low = to_array(low)
+    close = to_array(close)
+    volume = to_array(volume)
+    out = build_output(len(close))
+    if len(close) <= timeperiod:
+        return out
+    typical = (high + low + close) / 3.0
+    money_flow = (typical * volume)[1:]
+    change = np.diff(typical)
+    positive = np.where(change > 0.0, money_flow, 0.0)
+    negative = np.where(change < 0.0, money_flow, 0.0)
+    positive_sum = rolling_windows(positive, timeperiod).sum(axis=1)
+    negative_sum = rolling_windows(negative, timeperiod).sum(axis=1)
+    total = positive_sum + negative_sum
+    out[timeperiod:] = np.where(
+        total < 1.0,
+        0.0,
+        100.0 * (positive_sum / np.where(total < 1.0, 1.0, total)))
+    return out
+# end of MFI
+
+
+def stoch_fastk(
+        high,
+        low,
+        close,
+        fastk_period):
+    """stoch_fastk
+
+    Fast %K for every bar after the lookback
+
+    :param high: ``numpy.float64`` highs
+    :param low: ``numpy.float64`` lows
+    :param close: ``numpy.float64`` closes
+    :param fastk_period: number of values
+    """
+    highest = rolling_max(high, fastk_period)
+    lowest = rolling_min(low, fastk_period)
+    diff = (highest - lowest) / 100.0
+    return np.where(
+        diff != 0.0,
+        (close[fastk_period - 1:] - lowest) / np.where(
+            diff != 0.0, diff, 1.0),
+        0.0)
+# end of stoch_fastk
+
+
+@pandas_output
+def STOCH(
+        high,
+        low,
+        close,
+        fastk_period=5,
+        slowk_period=3,
+        slowk_matype=0,
+        slowd_period=3,
+        slowd_matype=0):
+    """STOCH
+
+    :return: slowk, slowd
+    :param high: highs
+    :param low: lows
+    :param close: closes
+    :param fastk_period: fast %K period
+    :param slowk_period: slow %K period
+    :param slowk_matype: slow %K moving average type
+    :param slowd_period: slow %D period
+    :param slowd_matype: slow %D moving average type
+    """
+    high = to_array(high)
+    low = to_array(low)
+    close = to_array(close)
+    slowk = build_output(len(close))
+    slowd = build_output(len(close))
+    lookback = (fastk_period - 1) + (slowk_period - 1) + (slowd_period - 1)
+    if len(close) <= lookback:
+        return slowk, slowd
+    fastk = stoch_fastk(
+        high=high,
+        low=low,
+        close=close,
+        fastk_period=fastk_period)
+    slowk_values = MA(
+        fastk,
+        timeperiod=slowk_period,
+        matype=slowk_matype)[slowk_period - 1:]
+    slowd_values = MA(
+        slowk_values,
+        timeperiod=slowd_period,
+        matype=slowd_matype)[slowd_period - 1:]
+    slowk[lookback:] = slowk_values[slowd_period - 1:]
+    slowd[lookback:] = slowd_values
+    return slowk, slowd
+# end of STOCH
+
+
+@pandas_output
+def STOCHF(
+        high,
+        low,
+        close,
+        fastk_period=5,
+        fastd_period=3,
+        fastd_matype=0):
+    """STOCHF
+
+    :return: fastk, fastd
+    :param high: highs
+    :param low: lows
+    :param close: closes
+    :param fastk_period: fast %K period
+    :param fastd_period: fast %D period
+    :param fastd_matype: fast %D moving average type
+    """
+    high = to_array(high)
+    low = to_array(low)
+    close = to_array(close)
+    fastk = build_output(len(close))
+    fastd = build_output(len(close))
+    lookback = (fastk_period - 1) + (fastd_period - 1)
+    if len(close) <= lookback:
+        return fastk, fastd
+    fastk_values = stoch_fastk(
+        high=high,
+        low=low,
+        close=close,
+        fastk_period=fastk_period)
+    fastd_values = MA(
+        fastk_values,
+        timeperiod=fastd_period,
+        matype=fastd_matype)[fastd_period - 1:]
+    fastk[lookback:] = fastk_values[fastd_period - 1:]
+    fastd[lookback:] = fastd_values
+    return fastk, fastd
+# end of STOCHF
+
+
+@pandas_output
+def WILLR(
+        high,
+        low,
+        close,
+        timeperiod=14):
+    """WILLR
+
+    :param high: highs
+    :param low: lows
+    :param close: closes
+    :param timeperiod: number of values
+    """
+    high = to_array(high)
+    low = to_array(low)
+    close = to_array(close)
+    out = build_output(len(close))
+    if timeperiod < 2 or len(close) < timeperiod:
+        return out
+    highest = rolling_max(high, timeperiod)
+    lowest = rolling_min(low, timeperiod)
+    diff = highest - lowest
+    # same operation order as stream_talib.WILLR
+    out[timeperiod - 1:] = np.where(
+        diff != 0.0,
+        (highest - close[timeperiod - 1:]) / np.where(
+            diff != 0.0, diff, 1.0) * -100.0,
+        0.0)
+    return out
+# end of WILLR
+
+
+def WILLR_MULTI(
+        high,
+        low,
+        close,
+        timeperiods):
+    """WILLR_MULTI
+
+    ``WILLR`` for every period in ``timeperiods`` as a
+    ``(len(timeperiods), len(close))`` matrix using one
+    ``multi_rolling_max`` pass for the highs and one for the lows
+
+    :param high: highs
+    :param low: lows
+    :param close: closes
+    :param timeperiods: list of periods
+    """
+    high = to_array(high)
+    low = to_array(low)
+    close = to_array(close)
+    highest = multi_rolling_max(high, timeperiods)
+    lowest = -multi_rolling_max(-low, timeperiods)
+    diff = highest - lowest
+    # same operation order as WILLR
+    out = np.where(
+        diff != 0.0,
+        (highest - close[None, :]) / np.where(
+            diff != 0.0, diff, 1.0) * -100.0,
+        0.0)
+    out[np.isnan(highest)] = NAN
+    for row, timeperiod in enumerate(timeperiods):
+        if timeperiod < 2:
+            out[row] = NAN
+    return out
+# end of WILLR_MULTI
+
+
+def WILLR_ROWS(
+        high,
+        low,
+        close,
+        timeperiod=14):
+    """WILLR_ROWS
+
+    ``WILLR`` for each row of ``(rows, n)`` matrices (like the
+    aligned prices of many tickers)
+
+    :param high: ``(rows, n)`` highs
+    :param low: ``(rows, n)`` lows
+    :param close: ``(rows, n)`` closes
+    :param timeperiod: number of values
+    """
+    high = to_array(high)
+    low = to_array(low)
+    close = to_array(close)
+    out = np.full(
+        close.shape,
+        NAN,
+        dtype=np.float64)
+    if timeperiod < 2 or close.shape[1] < timeperiod:
+        return out
+    highest = rolling_max_rows(high, timeperiod)
+    lowest = -rolling_max_rows(-low, timeperiod)
+    diff = highest - lowest
+    # same operation order as WILLR
+    out[:, timeperiod - 1:] = np.where(
+        diff != 0.0,
+        (highest - close[:, timeperiod - 1:]) / np.where(
+            diff != 0.0, diff, 1.0) * -100.0,
+        0.0)
+    return out
+# end of WILLR_ROWS
+
+
+@pandas_output
+def ADX(
+        high,
+        low,
+        close,
+        timeperiod=14):
+    """ADX
+
+    :param high: highs
+    :param low: lows
+    :param close: closes
+    :param timeperiod: number of values
+    """
+    high = to_array(high)
+    low = to_array(low)
+    close = to_array(close)
+    out = build_output(len(close))
+    lookback = 2 * timeperiod - 1
+    if timeperiod < 2 or len(close) <= lookback:
+        return out
+    diff_plus = np.diff(high)
+    diff_minus = -np.diff(low)
+    is_minus = (diff_minus > 0.0) & (diff_plus < diff_minus)
+    is_plus = ~is_minus & (diff_plus > 0.0) & (diff_plus > diff_minus)
+    minus_dm = np.where(is_minus, diff_minus, 0.0)
+    plus_dm = np.where(is_plus, diff_plus, 0.0)
+    tr = true_range(
+        high=high,
+        low=low,
+        close=close)
+
+    # TA-Lib seeds the running sums with timeperiod - 1 bars
+    num_seed = timeperiod - 1
+    decay = 1.0 - 1.0 / timeperiod
+    sums = []
+    for values in [minus_dm, plus_dm, tr]:
+        sums.append(run_recurrence(
+            inputs=values[num_seed:],
+            decay=decay,
+            initial=values[:num_seed].sum()))
+    minus_sum, plus_sum, tr_sum = sums
+
+    valid_tr = ~is_zero(tr_sum)
+    safe_tr = np.where(valid_tr, tr_sum, 1.0)
+    minus_di = 100.0 * (minus_sum / safe_tr)
+    plus_di = 100.0 * (plus_sum / safe_tr)
+    di_total = minus_di + plus_di
+    valid = valid_tr & ~is_zero(di_total)
+    dx = np.where(
+        valid,
+        100.0 * (np.abs(minus_di - plus_di) / np.where(
+            valid, di_total, 1.0)),
+        0.0)
+
+    first_adx = dx[:timeperiod].sum() / timeperiod
+    out[lookback] = first_adx
+    out[lookback + 1:] = hold_where_invalid(
+        inputs=dx[timeperiod:],
+        valid=valid[timeperiod:],
+        timeperiod=timeperiod,
+        initial=first_adx)
+    return out
+# end of ADX
+
+
+"""
+Volume
+
+https://mrjbq7.github.io/ta-lib/func_groups/volume_indicators.html
+"""
+
+
+@pandas_output
+def AD(
+        high,
+        low,
+        close,
+        volume):
+    """AD
+
+    Chaikin accumulation/distribution line
+
+    :param high: highs
+    :param low: lows
+    :param close: closes
+    :param volume: volumes
+    """
+    high = to_array(high)
+    low = to_array(low)
+    close = to_array(close)
+    volume = to_array(volume)
+    spread = high - low
+    flow = np.where(
+        spread > 0.0,
+        (((close - low) - (high - close)) / np.where(
+            spread > 0.0, spread, 1.0)) * volume,
+        0.0)
+    return np.cumsum(flow)
+# end of AD
+
+
+@pandas_output
+def ADOSC(
+        high,
+        low,
+        close,
+        volume,
+        fastperiod=3,
+        slowperiod=10):
+    """ADOSC
+
+    Chaikin A/D oscillator. Like TA-Lib both EMAs are seeded
+    with the first A/D value instead of a simple average
+
+    :param high: highs
+    :param low: lows
+    :param close: closes
+    :param volume: volumes
+    :param fastperiod: fast EMA period
+    :param slowperiod: slow EMA period
+    """
+    ad = AD(
+        high,
+        low,
+        close,
+        volume)
+    out = build_output(len(ad))
+    lookback = max(fastperiod, slowperiod) - 1
+    if len(ad) <= lookback:
+        return out
+    emas = []
+    for timeperiod in [fastperiod, slowperiod]:
+        k = 2.0 / (timeperiod + 1)
+        emas.append(run_recurrence(
+            inputs=ad[1:] * k,
+            decay=1.0 - k,
+            initial=ad[0]))
+    fast_ema, slow_ema = emas
+    out[max(lookback, 1):] = (fast_ema - slow_ema)[max(lookback, 1) - 1:]
+    if lookback == 0:
+        out[0] = 0.0
+    return out
+# end of ADOSC
+
+
+@pandas_output
+def OBV(
+        real,
+        volume):
+    """OBV
+
+    :param real: values
+    :param volume: volumes
+    """
+    real = to_array(real)
+    volume = to_array(volume)
+    if len(real) == 0:
+        return build_output(0)
+    signed = np.sign(np.diff(real)) * volume[1:]
+    return volume[0] + np.concatenate(([0.0], np.cumsum(signed)))
+# end of OBV
+
+
+"""
+Volatility
+
+https://mrjbq7.github.io/ta-lib/func_groups/volatility_indicators.html
+"""
+
+
+@pandas_output
+def TRANGE(
+        high,
+        low,
+        close):
+    """TRANGE
+
+    :param high: highs
+    :param low: lows
+    :param close: closes
+    """
+    high = to_array(high)
+    low = to_array(low)
+    close = to_array(close)
+    out = build_output(len(close))
+    if len(close) < 2:
+        return out
+    out[1:] = true_range(
+        high=high,
+        low=low,
+        close=close)
+    return out
+# end of TRANGE
+
+
+def average_true_range(
+        high,
+        low,
+        close,
+        timeperiod):
+    """average_true_range
+
+    Wilder's average true range for every bar after
+    the ``timeperiod`` lookback
+
+    :param high: ``numpy.float64`` highs
+    :param low: ``numpy.float64`` lows
+    :param close: ``numpy.float64`` closes
+    :param timeperiod: number of values
+    """
+    tr = true_range(
+        high=high,
+        low=low,
+        close=close)
+    first_atr = tr[:timeperiod].sum() / timeperiod
+    return np.concatenate((
+        [first_atr],
+        wilder_smooth(
+            inputs=tr[timeperiod:],
+            timeperiod=timeperiod,
+            initial=first_atr)))
+# end of average_true_range
+
+
+@pandas_output
+def ATR(
+        high,
+        low,
+        close,
+        timeperiod=14):
+    """ATR
+
+    :param high: highs
+    :param low: lows
+    :param close: closes
+    :param timeperiod: number of values
+    """
+    if timeperiod <= 1:
+        return TRANGE(
+            high,
+            low,
+            close)
+    high = to_array(high)
+    low = to_array(low)
+    close = to_array(close)
+    out = build_output(len(close))
+    if len(close) <= timeperiod:
+        return out
+    out[timeperiod:] = average_true_range(
+        high=high,
+        low=low,
+        close=close,
+        timeperiod=timeperiod)
+    return out
+# end of ATR
+
+
+@pandas_output
+def NATR(
+        high,
+        low,
+        close,
+        timeperiod=14):
+    """NATR
+
+    :param high: highs
+    :param low: lows
+    :param close: closes
+    :param timeperiod: number of values
+    """
+    high = to_array(high)
+    low = to_array(low)
+    close = to_array(close)
+    out = build_output(len(close))
+    if timeperiod < 1 or len(close) <= timeperiod:
+        return out
+    atr = average_true_range(
+        high=high,
+        low=low,
+        close=close,
+        timeperiod=timeperiod)
+    closes = close[timeperiod:]
+    zero = is_zero(closes)
+    out[timeperiod:] = np.where(
+        zero,
+        0.0,
+        (atr / np.where(zero, 1.0, closes)) * 100.0)
+    return out
+# end of NATR
@@ -0,0 +1,310 @@
+"""
+Read-only pricing arrays shared by all indicators on a bar
+
+The ``IndicatorProcessor`` builds one ``OHLCVBundle`` for each
+``uses_data`` dataset (like ``minute`` or ``daily``) on every bar
+and hands it to the indicators that support the array fast path
+(``uses_ohlcv_arrays = True``). Each ``open``, ``high``, ``low``,
+``close`` and ``volume`` column is converted to a contiguous,
+read-only ``float64`` ``numpy.ndarray`` once instead of once per
+indicator.
+
+- ``bundle.num_rows`` - number of rows in the dataset
+- ``bundle.get(<column>)`` - full column (raises ``KeyError``
+  if the dataset does not have the column like ``pd.DataFrame``)
+- ``bundle.window(<column>, num_points)`` - view of the
+  trailing ``num_points`` values
+- ``bundle.has_missing(num_points)`` - ``True`` if any of the
+  trailing ``num_points`` rows has a missing value in any of
+  the dataset's columns
+
+.. code-block:: python
+
+    import analysis_engine.ohlcv_bundle as ohlcv_bundle
+    source = ohlcv_bundle.OHLCVBundle(df=df_minute)
+    # views of the first 100 rows without copying
+    bundle = source.head(100)
+    closes = bundle.window('close', 14)
+    # views of a trailing window like df_minute.iloc[86:100]
+    bundle = source.rows(86, 100)
+"""
+
+import copy
+import numpy as np
+import pandas as pd
+
+
+OHLCV_COLUMNS = [
+    'open',
+    'high',
+    'low',
+    'close',
+    'volume'
+]
+
+
+def to_float_array(
+        values):
+    """to_float_array
+
+    Convert a column to a contiguous, read-only ``float64``
+    ``numpy.ndarray`` (values that are not numbers become ``nan``)
+
+    :param values: ``pd.Series`` or list of values
+    """
+    if not isinstance(values, np.ndarray) or values.dtype == object:
+        values = pd.to_numeric(
+            pd.Series(values),
+            errors='coerce').to_numpy()
+    arr = np.ascontiguousarray(
+        values,
+        dtype=np.float64)
+    if arr is values:
+        # do not change the flags on the caller's array
+        arr = arr.view()
+    arr.setflags(write=False)
+    return arr
+# end of to_float_array
+
+
+class OHLCVBundle:
+    """OHLCVBundle
+
+    Read-only ``float64`` pricing columns for a dataset
+    """
+
+    def __init__(
+            self,
+            df,
+            columns=None,
+            uses_data=None):
+        """__init__
+
+        :param df: ``pd.DataFrame`` with pricing rows
+        :param columns: optional - list of columns to convert
+            (default is ``OHLCV_COLUMNS``)
+        :param uses_data: optional - name of the dataset
+            like ``minute`` or ``daily``
+        """
+        self.df = df
+        self.uses_data = uses_data
+        # analysis_engine.ta_cache.TACache for ae_talib.cached
+        # (set by the IndicatorProcessor)
+        self.ta_cache = None
+        self.columns = columns
+        if not self.columns:
+            self.columns = OHLCV_COLUMNS
+        self.num_rows = len(df.index)
+        self.index = df.index
+        self.arrays = {}
+        for col in self.columns:
+            if col in df:
+                self.arrays[col] = to_float_array(
+                    df[col].to_numpy())
+        # end of for all columns
+
+        # running count of rows with missing values
+        # built on the first has_missing call
+        self.num_missing = None
+        self.parent = None
+        # position of the first row in the parent's rows
+        # and in the dataset the arrays were converted from
+        self.parent_start = 0
+        self.start_row = 0
+    # end of __init__
+
+    def __len__(
+            self):
+        """__len__"""
+        return self.num_rows
+    # end of __len__
+
+    def __contains__(
+            self,
+            col):
+        """__contains__
+
+        :param col: column name
+        """
+        return col in self.arrays
+    # end of __contains__
+
+    def get(
+            self,
+            col):
+        """get
+
+        Get the full read-only array for a column
+
+        :param col: column name
+        """
+        return self.arrays[col]
+    # end of get
+
+    def last(
+            self,
+            col):
+        """last
+
+        Get the value for a column in the last row
+
+        :param col: column name
+        """
+        return self.arrays[col][self.num_rows - 1]
+    # end of last
+
+    def window(
+            self,
+            col,
+            num_points):
+        """window
+
+        Get a view of the trailing ``num_points`` values
+        for a column
+
+        :param col: column name
+        :param num_points: number of trailing rows
+        """
+        start_idx = max(0, self.num_rows - num_points)
+        return self.arrays[col][start_idx:self.num_rows]
+    # end of window
+
+    def get_num_missing(
+            self):
+        """get_num_missing
+
+        Get the running count of rows with a missing value
+        in any of the dataset's columns (``num_rows + 1`` values
+        starting at ``0``)
+        """
+        if self.num_missing is None:
+            if self.parent is not None:
+                self.num_missing = self.parent.get_num_missing()[
+                    self.parent_start:self.parent_start + self.num_rows + 1]
+                if self.parent_start > 0:
+                    self.num_missing = (
+                        self.num_missing - self.num_missing[0])
+            else:
+                self.num_missing = np.concatenate((
+                    [0],
+                    np.cumsum(self.df.isna().any(axis=1).to_numpy())))
+        return self.num_missing
+    # end of get_num_missing
+
+    def has_missing(
+            self,
+            num_points):
+        """has_missing
+
+        Check if any of the trailing ``num_points`` rows has a
+        missing value in any column (like ``df.dropna(how='any')``
+        would drop)
+
+        :param num_points: number of trailing rows
+        """
+        num_missing = self.get_num_missing()
+        start_idx = max(0, self.num_rows - num_points)
+        return num_missing[self.num_rows] != num_missing[start_idx]
+    # end of has_missing
+
+    def is_prefix(
+            self,
+            df):
+        """is_prefix
+
+        Check if ``df`` holds the first rows of this bundle's
+        dataset (like ``df_minute.iloc[0:(minute_idx + 1)]``)
+
+        :param df: ``pd.DataFrame`` to check
+        """
+        num_rows = len(df.index)
+        if num_rows == 0 or num_rows > self.num_rows:
+            return False
+        return (
+            df.index[0] == self.index[0] and
+            df.index[num_rows - 1] == self.index[num_rows - 1])
+    # end of is_prefix
+
+    def get_start_row(
+            self,
+            df):
+        """get_start_row
+
+        Get the position of ``df``'s first row in this bundle's
+        dataset if ``df`` holds consecutive rows of it (like
+        ``df_minute.iloc[86:100]``) or ``None``
+
+        :param df: ``pd.DataFrame`` to check
+        """
+        if self.is_prefix(df):
+            return 0
+        num_rows = len(df.index)
+        if num_rows == 0 or num_rows > self.num_rows:
+            return None
+        try:
+            start_row = self.index.get_loc(df.index[0])
+        except KeyError:
+            return None
+        if not isinstance(start_row, (int, np.integer)):
+            # the index has duplicate labels
+            return None
+        end_row = int(start_row) + num_rows
+        if (end_row > self.num_rows or
+                df.index[num_rows - 1] != self.index[end_row - 1]):
+            return None
+        return int(start_row)
+    # end of get_start_row
+
+    def head(
+            self,
+            num_rows):
+        """head
+
+        Get a bundle of views over the first ``num_rows`` rows
+        without copying the arrays
+
+        :param num_rows: number of rows
+        """
+        bundle = copy.copy(self)
+        bundle.num_rows = num_rows
+        bundle.arrays = {
+            col: values[0:num_rows]
+            for col, values in self.arrays.items()
+        }
+        bundle.num_missing = None
+        bundle.parent = self
+        bundle.parent_start = 0
+        bundle.start_row = self.start_row
+        return bundle
+    # end of head
+
+    def rows(
+            self,
+            start_row,
+            end_row):
+        """rows
+
+        Get a bundle of views over the rows from ``start_row``
+        up to (not including) ``end_row`` without copying
+        the arrays
+
+        :param start_row: position of the first row
+        :param end_row: position after the last row
+        """
+        if start_row == 0:
+            return self.head(end_row)
+        bundle = copy.copy(self)
+        bundle.num_rows = end_row - start_row
+        bundle.index = self.index[start_row:end_row]
+        bundle.arrays = {
+            col: values[start_row:end_row]
+            for col, values in self.arrays.items()
+        }
+        bundle.num_missing = None
+        bundle.parent = self
+        bundle.parent_start = start_row
+        bundle.start_row = self.start_row + start_row
+        return bundle
+    # end of rows
+
+# end of OHLCVBundle
@@ -0,0 +1,129 @@
+"""
+Benchmark the per-bar overhead of stepping through a minute
+``pandas.DataFrame`` with ``DataFrame.iterrows()`` compared to the
+columnar ``analysis_engine.bar_cursor.BarCursor``
+
+Both loops read the ``date``, ``open``, ``high``, ``low``, ``close``
+and ``volume`` values for every bar like
+``BaseAlgo.handle_minute_dataset``
+
+::
+
+    python ./analysis_engine/perf/bench_bar_cursor.py -n 100000
+"""
+
+import time
+import argparse
+import numpy as np
+import pandas as pd
+import analysis_engine.bar_cursor as bar_cursor
+
+
+def build_minute_df(
+        num_bars):
+    """build_minute_df
+
+    Build a random walk minute ``pandas.DataFrame``
+
+    :param num_bars: number of minute rows
+    """
+    rng = np.random.RandomState(42)
+    closes = 280.0 + np.cumsum(rng.normal(0.0, 0.05, num_bars))
+    return pd.DataFrame({
+        'date': pd.date_range(
+            '2019-01-02 09:30:00',
+            periods=num_bars,
+            freq='min'),
+        'open': closes + rng.normal(0.0, 0.02, num_bars),
+        'high': closes + 0.1,
+        'low': closes - 0.1,
+        'close': closes,
+        'volume': rng.randint(100, 10000, num_bars),
+        'label': 'bar'
+    })
+# end of build_minute_df
+
+
+def run_iterrows(
+        df):
+    """run_iterrows
+
+    :param df: minute ``pandas.DataFrame``
+    """
+    total = 0.0
+    for minute_idx, row in df.iterrows():
+        row.get('date', None)
+        row.get('open', None)
+        row.get('high', None)
+        row.get('low', None)
+        total += row.get('close', None)
+        row.get('volume', None)
+    return total
+# end of run_iterrows
+
+
+def run_bar_cursor(
+        df):
+    """run_bar_cursor
+
+    :param df: minute ``pandas.DataFrame``
+    """
+    total = 0.0
+    cursor = bar_cursor.BarCursor(
+        df=df)
+    for minute_idx in cursor.bars():
+        cursor.date
+        cursor.open
+        cursor.high
+        cursor.low
+        total += cursor.close
+        cursor.volume
+    return total
+# end of run_bar_cursor
+
+
+def start(
+        num_bars=50000):
+    """start
+
+    Run both loops and print the per-bar overhead
+
+    :param num_bars: number of minute rows to step through
+    """
+    df = build_minute_df(
+        num_bars=num_bars)
+
+    results = {}
+    for name, bench_func in [
+            ('iterrows', run_iterrows),
+            ('bar_cursor', run_bar_cursor)]:
+        start_time = time.perf_counter()
+        bench_func(df)
+        elapsed = time.perf_counter() - start_time
+        results[name] = elapsed
+        print(
+            f'{name:>12}: bars={num_bars} total={elapsed:.4f}s '
+            f'per_bar={(elapsed / num_bars) * 1e6:.3f}us')
+    # end of for all benchmarks
+
+    print(
+        f'{"speedup":>12}: '
+        f'{results["iterrows"] / results["bar_cursor"]:.1f}x')
+    return results
+# end of start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=(
+            'benchmark iterrows against the columnar BarCursor'))
+    parser.add_argument(
+        '-n',
+        help='number of minute bars',
+        required=False,
+        dest='num_bars',
+        type=int,
+        default=50000)
+    args = parser.parse_args()
+    start(
+        num_bars=args.num_bars)
@@ -0,0 +1,445 @@
+"""
+Benchmark ``build_dataset_node`` getting each dataset's redis key
+with its own ``GET`` compared to one ``MGET`` for all the datasets
+(``batch_extract=True``) and to ``build_dataset_nodes`` extracting
+the whole date range in chunks
+
+The script publishes the ``-n`` datasets (in ``build_dataset_node``
+order: ``daily``, ``minute``, ``quote``, ``stats``, ``peers``,
+``news``, ``financials``, ``earnings``, ``dividends``, ``company``,
+``tdcalls`` and ``tdputs``) with ``-r`` rows for each of ``-d``
+days, then builds every day's dataset node in both modes and with
+``build_dataset_nodes`` (``-c`` days per ``MGET`` and each number
+of decoding processes in ``-w``). Use
+``-l`` to add milliseconds of latency to every request sent to
+redis (through a local proxy) like a remote redis server. It
+prints the time per day, how many ``GET`` and ``MGET`` commands
+the server ran in each mode, and checks that every mode built the
+same datasets. The keys are deleted when it finishes.
+
+::
+
+    python ./analysis_engine/perf/bench_dataset_node.py \
+        -a localhost:6379 -d 20 -n 12 -r 390 -l 1 -c 20 -w 0,4
+"""
+
+import time
+import socket
+import argparse
+import threading
+import pandas as pd
+import analysis_engine.consts as ae_consts
+import analysis_engine.compress_data as compress_data
+import analysis_engine.redis_pool as redis_pool
+import analysis_engine.build_dataset_node as build_ds_node
+import analysis_engine.perf.bench_indicator_workers as bench_workers
+
+
+DATASET_NAMES = list(build_ds_node.IEX_DATASETS) + [
+    'tdcalls',
+    'tdputs'
+]
+
+
+def pump(
+        src,
+        dst,
+        latency):
+    """pump
+
+    Forward bytes from ``src`` to ``dst`` until
+    either socket closes
+
+    :param src: socket to read
+    :param dst: socket to write
+    :param latency: seconds to wait before forwarding
+        each read
+    """
+    try:
+        while True:
+            data = src.recv(65536)
+            if not data:
+                break
+            if latency:
+                time.sleep(latency)
+            dst.sendall(data)
+    except OSError:
+        pass
+    finally:
+        for sock in (src, dst):
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+    # end of forwarding
+# end of pump
+
+
+def start_proxy(
+        address,
+        latency_ms):
+    """start_proxy
+
+    Start a local TCP proxy to the redis ``address`` that
+    delays every request by ``latency_ms`` and return
+    the proxy's address
+
+    :param address: redis address
+    :param latency_ms: milliseconds to delay each request
+    """
+    host, port = redis_pool.split_address(
+        address=address)
+    listener = socket.socket(
+        socket.AF_INET,
+        socket.SOCK_STREAM)
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(64)
+
+    def accept():
+        while True:
+            client_sock, _ = listener.accept()
+            server_sock = socket.create_connection((host, port))
+            for src, dst, latency in (
+                    (client_sock, server_sock, latency_ms / 1000.0),
+                    (server_sock, client_sock, 0.0)):
+                threading.Thread(
+                    target=pump,
+                    args=(src, dst, latency),
+                    daemon=True).start()
+        # end of accepting connections
+
+    threading.Thread(
+        target=accept,
+        daemon=True).start()
+    return f'127.0.0.1:{listener.getsockname()[1]}'
+# end of start_proxy
+
+
+def get_num_commands(
+        client):
+    """get_num_commands
+
+    Get how many ``GET`` and ``MGET`` commands the
+    redis server has run
+
+    :param client: redis client
+    """
+    stats = client.info('commandstats')
+    return (
+        stats.get('cmdstat_get', {}).get('calls', 0),
+        stats.get('cmdstat_mget', {}).get('calls', 0))
+# end of get_num_commands
+
+
+def run_nodes(
+        dates,
+        datasets,
+        address,
+        stats_client,
+        batch_extract):
+    """run_nodes
+
+    Build every day's dataset node and return the total
+    seconds, the number of ``GET`` and ``MGET`` commands
+    and the nodes
+
+    :param dates: list of dates
+    :param datasets: list of dataset names
+    :param address: redis address
+    :param stats_client: redis client to read the
+        server's command stats
+    :param batch_extract: bool for one ``MGET`` per day
+    """
+    start_gets, start_mgets = get_num_commands(
+        client=stats_client)
+    nodes = []
+    start_time = time.perf_counter()
+    for date in dates:
+        nodes.append(build_ds_node.build_dataset_node(
+            ticker='BENCH',
+            datasets=datasets,
+            date=date,
+            redis_address=address,
+            s3_enabled=False,
+            batch_extract=batch_extract))
+    # end of for all dates
+    elapsed = time.perf_counter() - start_time
+    num_gets, num_mgets = get_num_commands(
+        client=stats_client)
+    return (
+        elapsed,
+        num_gets - start_gets,
+        num_mgets - start_mgets,
+        nodes)
+# end of run_nodes
+
+
+def run_range(
+        dates,
+        datasets,
+        address,
+        stats_client,
+        chunk_size,
+        num_workers):
+    """run_range
+
+    Build all the dataset nodes with ``build_dataset_nodes``
+    and return the total seconds, the number of ``GET`` and
+    ``MGET`` commands and the nodes
+
+    :param dates: list of dates
+    :param datasets: list of dataset names
+    :param address: redis address
+    :param stats_client: redis client to read the
+        server's command stats
+    :param chunk_size: number of days per ``MGET``
+    :param num_workers: number of decoding processes
+    """
+    start_gets, start_mgets = get_num_commands(
+        client=stats_client)
+    start_time = time.perf_counter()
+    nodes = [
+        node['data']
+        for ticker, node in build_ds_node.build_dataset_nodes(
+            extract_requests=[
+                {
+                    'id': f'BENCH_{date}',
+                    'ticker': 'BENCH',
+                    'date': date
+                }
+                for date in dates
+            ],
+            datasets=datasets,
+            service_dict={
+                'redis_address': address
+            },
+            chunk_size=chunk_size,
+            num_workers=num_workers)
+    ]
+    elapsed = time.perf_counter() - start_time
+    num_gets, num_mgets = get_num_commands(
+        client=stats_client)
+    return (
+        elapsed,
+        num_gets - start_gets,
+        num_mgets - start_mgets,
+        nodes)
+# end of run_range
+
+
+def nodes_match(
+        nodes,
+        expected_nodes):
+    """nodes_match
+
+    Check the dataset nodes have the same datasets
+
+    :param nodes: list of dataset nodes
+    :param expected_nodes: list of dataset nodes
+    """
+    for node, expected_node in zip(nodes, expected_nodes):
+        for name, expected_df in expected_node.items():
+            df = node[name]
+            if expected_df is None or df is None:
+                if df is not expected_df:
+                    return False
+            elif not df.equals(expected_df):
+                return False
+        # end of for all datasets
+    # end of for all nodes
+    return len(nodes) == len(expected_nodes)
+# end of nodes_match
+
+
+def start(
+        address=ae_consts.REDIS_ADDRESS,
+        db=ae_consts.REDIS_DB,
+        num_days=20,
+        num_datasets=12,
+        num_rows=390,
+        latency_ms=0.0,
+        chunk_size=20,
+        workers=None):
+    """start
+
+    Publish the datasets, time building the dataset
+    nodes in both modes and delete the keys
+
+    :param address: Redis address
+    :param db: Redis db
+    :param num_days: number of trading days
+    :param num_datasets: number of datasets per day
+    :param num_rows: rows in each dataset
+    :param latency_ms: milliseconds added to each request
+    :param chunk_size: days per ``build_dataset_nodes`` ``MGET``
+    :param workers: list of ``build_dataset_nodes``
+        decoding process counts
+    """
+    if workers is None:
+        workers = [
+            0,
+            4
+        ]
+    dates = list(pd.bdate_range(
+        '2019-01-02',
+        periods=num_days).strftime('%Y-%m-%d'))
+    datasets = DATASET_NAMES[0:num_datasets]
+    keys = [
+        f'BENCH_{date}_{build_ds_node.IEX_DATASETS.get(name, name)}'
+        for date in dates
+        for name in datasets
+    ]
+    client = redis_pool.get_client(
+        address=address,
+        db=db)
+    data = compress_data.compress_data(
+        data=bench_workers.build_daily_df(
+            num_bars=num_rows),
+        date_format='iso')
+    for key in keys:
+        client.set(
+            name=key,
+            value=data)
+    use_address = address
+    if latency_ms:
+        use_address = start_proxy(
+            address=address,
+            latency_ms=latency_ms)
+    # the TD extracts use the REDIS_ADDRESS default
+    # instead of the redis_address argument
+    default_address = ae_consts.REDIS_ADDRESS
+    ae_consts.REDIS_ADDRESS = use_address
+    try:
+        key_secs, key_gets, key_mgets, key_nodes = run_nodes(
+            dates=dates,
+            datasets=datasets,
+            address=use_address,
+            stats_client=client,
+            batch_extract=False)
+        batch_secs, batch_gets, batch_mgets, batch_nodes = run_nodes(
+            dates=dates,
+            datasets=datasets,
+            address=use_address,
+            stats_client=client,
+            batch_extract=True)
+        range_runs = []
+        for num_workers in workers:
+            range_runs.append((num_workers,) + run_range(
+                dates=dates,
+                datasets=datasets,
+                address=use_address,
+                stats_client=client,
+                chunk_size=chunk_size,
+                num_workers=num_workers))
+        # end of for all worker counts
+    finally:
+        ae_consts.REDIS_ADDRESS = default_address
+        client.delete(*keys)
+    matches = nodes_match(
+        nodes=batch_nodes,
+        expected_nodes=key_nodes)
+    range_lines = ''
+    for num_workers, secs, gets, mgets, nodes in range_runs:
+        matches = matches and nodes_match(
+            nodes=nodes,
+            expected_nodes=key_nodes)
+        range_lines += (
+            f'range w={num_workers}: {secs / num_days * 1e3:8.2f}ms/day '
+            f'get={gets} mget={mgets} '
+            f'speedup={key_secs / secs:6.2f}x\n')
+    # end of for all range runs
+    print(
+        f'days={num_days} datasets={len(datasets)} rows={num_rows} '
+        f'latency={latency_ms}ms\n'
+        f'per key: {key_secs / num_days * 1e3:8.2f}ms/day '
+        f'get={key_gets} mget={key_mgets}\n'
+        f'batch:   {batch_secs / num_days * 1e3:8.2f}ms/day '
+        f'get={batch_gets} mget={batch_mgets} '
+        f'speedup={key_secs / batch_secs:6.2f}x\n'
+        f'{range_lines}'
+        f'matches={matches}')
+    return {
+        'per_key_seconds': key_secs,
+        'batch_seconds': batch_secs,
+        'speedup': key_secs / batch_secs,
+        'range_seconds': {
+            num_workers: secs
+            for num_workers, secs, _, _, _ in range_runs
+        },
+        'matches': matches
+    }
+# end of start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=(
+            'benchmark build_dataset_node with one redis GET '
+            'per dataset and one MGET for all the datasets'))
+    parser.add_argument(
+        '-a',
+        help='redis address',
+        required=False,
+        dest='address',
+        default=ae_consts.REDIS_ADDRESS)
+    parser.add_argument(
+        '-b',
+        help='redis db',
+        required=False,
+        dest='db',
+        type=int,
+        default=int(ae_consts.REDIS_DB))
+    parser.add_argument(
+        '-d',
+        help='number of trading days',
+        required=False,
+        dest='num_days',
+        type=int,
+        default=20)
+    parser.add_argument(
+        '-n',
+        help='number of datasets per day (up to 12)',
+        required=False,
+        dest='num_datasets',
+        type=int,
+        default=12)
+    parser.add_argument(
+        '-r',
+        help='rows in each dataset',
+        required=False,
+        dest='num_rows',
+        type=int,
+        default=390)
+    parser.add_argument(
+        '-l',
+        help='milliseconds of latency added to each request',
+        required=False,
+        dest='latency_ms',
+        type=float,
+        default=0.0)
+    parser.add_argument(
+        '-c',
+        help='days per build_dataset_nodes MGET',
+        required=False,
+        dest='chunk_size',
+        type=int,
+        default=20)
+    parser.add_argument(
+        '-w',
+        help='comma-separated build_dataset_nodes process counts',
+        required=False,
+        dest='workers',
+        default='0,4')
+    args = parser.parse_args()
+    start(
+        address=args.address,
+        db=args.db,
+        num_days=args.num_days,
+        num_datasets=args.num_datasets,
+        num_rows=args.num_rows,
+        latency_ms=args.latency_ms,
+        chunk_size=args.chunk_size,
+        workers=[
+            int(num_workers)
+            for num_workers in args.workers.split(',')
+        ])
@@ -0,0 +1,265 @@
+"""
+Benchmark the synchronous ``build_dataset_node`` and
+``build_dataset_nodes`` extracts compared to the
+``analysis_engine.extract_async`` range loader with many
+ticker-dates in flight
+
+The script publishes the ``-n`` datasets with ``-r`` rows for each
+of ``-d`` days (like ``bench_dataset_node.py``), then builds every
+day's dataset node with one ``MGET`` per day, with
+``build_dataset_nodes`` (``-c`` days per ``MGET``) and with
+``extract_async.load_dataset_nodes`` (``-c`` days per ``MGET`` and
+each number of chunks in flight in ``-f``). Use ``-l`` to add
+milliseconds of latency to every request sent to redis (through a
+local proxy) like a remote redis server. It prints the time per day
+and checks that every mode built the same datasets. The keys are
+deleted when it finishes.
+
+::
+
+    python ./analysis_engine/perf/bench_extract_async.py \
+        -a localhost:6379 -d 60 -n 12 -r 390 -l 5 -c 1 -f 1,8
+"""
+
+import time
+import argparse
+import pandas as pd
+import analysis_engine.consts as ae_consts
+import analysis_engine.compress_data as compress_data
+import analysis_engine.redis_pool as redis_pool
+import analysis_engine.build_dataset_node as build_ds_node
+import analysis_engine.extract_async as extract_async
+import analysis_engine.perf.bench_dataset_node as bench_node
+import analysis_engine.perf.bench_indicator_workers as bench_workers
+
+
+def run_async(
+        dates,
+        datasets,
+        address,
+        chunk_size,
+        max_in_flight):
+    """run_async
+
+    Build all the dataset nodes with
+    ``extract_async.load_dataset_nodes`` and return the
+    total seconds and the nodes
+
+    :param dates: list of dates
+    :param datasets: list of dataset names
+    :param address: redis address
+    :param chunk_size: number of days per ``MGET``
+    :param max_in_flight: number of chunks read
+        at the same time
+    """
+    start_time = time.perf_counter()
+    nodes = [
+        node['data']
+        for ticker, node in extract_async.load_dataset_nodes(
+            extract_requests=[
+                {
+                    'id': f'BENCH_{date}',
+                    'ticker': 'BENCH',
+                    'date': date
+                }
+                for date in dates
+            ],
+            datasets=datasets,
+            service_dict={
+                'redis_address': address
+            },
+            chunk_size=chunk_size,
+            max_in_flight=max_in_flight)
+    ]
+    return time.perf_counter() - start_time, nodes
+# end of run_async
+
+
+def start(
+        address=ae_consts.REDIS_ADDRESS,
+        db=ae_consts.REDIS_DB,
+        num_days=60,
+        num_datasets=12,
+        num_rows=390,
+        latency_ms=0.0,
+        chunk_size=1,
+        in_flight=None):
+    """start
+
+    Publish the datasets, time building the dataset
+    nodes in each mode and delete the keys
+
+    :param address: Redis address
+    :param db: Redis db
+    :param num_days: number of trading days
+    :param num_datasets: number of datasets per day
+    :param num_rows: rows in each dataset
+    :param latency_ms: milliseconds added to each request
+    :param chunk_size: days per ``MGET`` for the range extracts
+    :param in_flight: list of ``max_in_flight`` values
+        for the async range loader
+    """
+    if in_flight is None:
+        in_flight = [
+            1,
+            8
+        ]
+    dates = list(pd.bdate_range(
+        '2019-01-02',
+        periods=num_days).strftime('%Y-%m-%d'))
+    datasets = bench_node.DATASET_NAMES[0:num_datasets]
+    keys = [
+        f'BENCH_{date}_{build_ds_node.IEX_DATASETS.get(name, name)}'
+        for date in dates
+        for name in datasets
+    ]
+    client = redis_pool.get_client(
+        address=address,
+        db=db)
+    data = compress_data.compress_data(
+        data=bench_workers.build_daily_df(
+            num_bars=num_rows),
+        date_format='iso')
+    for key in keys:
+        client.set(
+            name=key,
+            value=data)
+    use_address = address
+    if latency_ms:
+        use_address = bench_node.start_proxy(
+            address=address,
+            latency_ms=latency_ms)
+    # the TD extracts use the REDIS_ADDRESS default
+    # instead of the redis_address argument
+    default_address = ae_consts.REDIS_ADDRESS
+    ae_consts.REDIS_ADDRESS = use_address
+    try:
+        batch_secs, _, _, batch_nodes = bench_node.run_nodes(
+            dates=dates,
+            datasets=datasets,
+            address=use_address,
+            stats_client=client,
+            batch_extract=True)
+        range_secs, _, _, range_nodes = bench_node.run_range(
+            dates=dates,
+            datasets=datasets,
+            address=use_address,
+            stats_client=client,
+            chunk_size=chunk_size,
+            num_workers=0)
+        async_runs = []
+        for max_in_flight in in_flight:
+            async_runs.append((max_in_flight,) + run_async(
+                dates=dates,
+                datasets=datasets,
+                address=use_address,
+                chunk_size=chunk_size,
+                max_in_flight=max_in_flight))
+        # end of for all in flight counts
+    finally:
+        ae_consts.REDIS_ADDRESS = default_address
+        client.delete(*keys)
+    matches = bench_node.nodes_match(
+        nodes=range_nodes,
+        expected_nodes=batch_nodes)
+    async_lines = ''
+    for max_in_flight, secs, nodes in async_runs:
+        matches = matches and bench_node.nodes_match(
+            nodes=nodes,
+            expected_nodes=batch_nodes)
+        async_lines += (
+            f'async f={max_in_flight}: {secs / num_days * 1e3:8.2f}ms/day '
+            f'speedup={batch_secs / secs:6.2f}x\n')
+    # end of for all async runs
+    print(
+        f'days={num_days} datasets={len(datasets)} rows={num_rows} '
+        f'latency={latency_ms}ms chunk={chunk_size}\n'
+        f'per day:   {batch_secs / num_days * 1e3:8.2f}ms/day\n'
+        f'range:     {range_secs / num_days * 1e3:8.2f}ms/day '
+        f'speedup={batch_secs / range_secs:6.2f}x\n'
+        f'{async_lines}'
+        f'matches={matches}')
+    return {
+        'per_day_seconds': batch_secs,
+        'range_seconds': range_secs,
+        'async_seconds': {
+            max_in_flight: secs
+            for max_in_flight, secs, _ in async_runs
+        },
+        'matches': matches
+    }
+# end of start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=(
+            'benchmark the synchronous dataset extracts and '
+            'the asyncio range loader'))
+    parser.add_argument(
+        '-a',
+        help='redis address',
+        required=False,
+        dest='address',
+        default=ae_consts.REDIS_ADDRESS)
+    parser.add_argument(
+        '-b',
+        help='redis db',
+        required=False,
+        dest='db',
+        type=int,
+        default=int(ae_consts.REDIS_DB))
+    parser.add_argument(
+        '-d',
+        help='number of trading days',
+        required=False,
+        dest='num_days',
+        type=int,
+        default=60)
+    parser.add_argument(
+        '-n',
+        help='number of datasets per day (up to 12)',
+        required=False,
+        dest='num_datasets',
+        type=int,
+        default=12)
+    parser.add_argument(
+        '-r',
+        help='rows in each dataset',
+        required=False,
+        dest='num_rows',
+        type=int,
+        default=390)
+    parser.add_argument(
+        '-l',
+        help='milliseconds of latency added to each request',
+        required=False,
+        dest='latency_ms',
+        type=float,
+        default=0.0)
+    parser.add_argument(
+        '-c',
+        help='days per range MGET',
+        required=False,
+        dest='chunk_size',
+        type=int,
+        default=1)
+    parser.add_argument(
+        '-f',
+        help='comma-separated async chunks in flight',
+        required=False,
+        dest='in_flight',
+        default='1,8')
+    args = parser.parse_args()
+    start(
+        address=args.address,
+        db=args.db,
+        num_days=args.num_days,
+        num_datasets=args.num_datasets,
+        num_rows=args.num_rows,
+        latency_ms=args.latency_ms,
+        chunk_size=args.chunk_size,
+        in_flight=[
+            int(max_in_flight)
+            for max_in_flight in args.in_flight.split(',')
+        ])
@@ -0,0 +1,135 @@
+"""
+Benchmark building an ``IndicatorProcessor`` with the indicator
+module cache cleared before every build (each module file is
+executed like it was before the cache) compared to reusing the
+cached modules
+
+The config has ``-i`` indicators from
+``bench_indicator_workers.build_config`` and each mode builds
+the processor ``-r`` times. The script checks that both modes
+build the same indicator names and classes.
+
+::
+
+    python ./analysis_engine/perf/bench_indicator_loading.py \
+        -i 20 -r 20
+"""
+
+import time
+import argparse
+import analysis_engine.indicators.indicator_processor as ind_proc
+import analysis_engine.indicators.load_indicator_from_module as load_ind
+import analysis_engine.perf.bench_indicator_workers as bench_workers
+
+
+def build_processor(
+        config):
+    """build_processor
+
+    Build an ``IndicatorProcessor`` and return a summary
+    of its indicator names and class names
+
+    :param config: algorithm config
+    """
+    proc = ind_proc.IndicatorProcessor(
+        config_dict=config)
+    return [
+        (ind_id, proc.ind_dict[ind_id]['obj'].__class__.__name__)
+        for ind_id in proc.ind_dict
+    ]
+# end of build_processor
+
+
+def run_builds(
+        config,
+        num_runs,
+        use_cache):
+    """run_builds
+
+    Return the average seconds per build and
+    the last build's summary
+
+    :param config: algorithm config
+    :param num_runs: number of builds
+    :param use_cache: bool for keeping the module cache
+        between builds
+    """
+    load_ind.clear_indicator_module_cache()
+    if use_cache:
+        # the first build in a process always executes the modules
+        build_processor(config)
+    summary = None
+    elapsed = 0.0
+    for _ in range(num_runs):
+        if not use_cache:
+            load_ind.clear_indicator_module_cache()
+        start_time = time.perf_counter()
+        summary = build_processor(config)
+        elapsed += time.perf_counter() - start_time
+    # end of for all runs
+    return elapsed / num_runs, summary
+# end of run_builds
+
+
+def start(
+        num_indicators=20,
+        num_runs=20):
+    """start
+
+    Time building the processor without and with the
+    module cache and print the speedup
+
+    :param num_indicators: number of indicators
+    :param num_runs: number of builds for each mode
+    """
+    config = bench_workers.build_config(
+        num_indicators=num_indicators,
+        num_points=14,
+        indicator_workers=0)
+    cold_secs, cold_summary = run_builds(
+        config=config,
+        num_runs=num_runs,
+        use_cache=False)
+    cached_secs, cached_summary = run_builds(
+        config=config,
+        num_runs=num_runs,
+        use_cache=True)
+    matches = cold_summary == cached_summary
+    print(
+        f'indicators={num_indicators} runs={num_runs} '
+        f'uncached={cold_secs * 1e3:8.2f}ms '
+        f'cached={cached_secs * 1e3:8.2f}ms '
+        f'speedup={cold_secs / cached_secs:6.2f}x '
+        f'matches={matches}')
+    return {
+        'uncached_seconds': cold_secs,
+        'cached_seconds': cached_secs,
+        'speedup': cold_secs / cached_secs,
+        'matches': matches
+    }
+# end of start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=(
+            'benchmark building the indicator processor with and '
+            'without the indicator module cache'))
+    parser.add_argument(
+        '-i',
+        help='number of indicators',
+        required=False,
+        dest='num_indicators',
+        type=int,
+        default=20)
+    parser.add_argument(
+        '-r',
+        help='number of builds for each mode',
+        required=False,
+        dest='num_runs',
+        type=int,
+        default=20)
+    args = parser.parse_args()
+    start(
+        num_indicators=args.num_indicators,
+        num_runs=args.num_runs)
@@ -0,0 +1,233 @@
+"""
+Benchmark ``IndicatorProcessor.process`` one indicator at a time
+compared to evaluating the indicators on a thread pool with
+``indicator_workers``
+
+The processor is built with ``-i`` indicators on a random walk
+daily ``pandas.DataFrame`` with ``-n`` rows. Each indicator uses
+its own ``num_points`` (starting at ``-p``) so no TA-Lib calls are
+shared, and the last ``-b`` bars are processed with each number of
+workers in ``-w``. The script checks that every run produces the
+same ``buys``, ``sells`` and report keys as the serial run.
+
+::
+
+    python ./analysis_engine/perf/bench_indicator_workers.py \
+        -n 5000 -i 40 -p 1000 -b 50 -w 0,2,4,8
+"""
+
+import time
+import argparse
+import numpy as np
+import pandas as pd
+import analysis_engine.indicators.indicator_processor as ind_proc
+
+
+INDICATOR_NAMES = [
+    'williamsr',
+    'williamsr_open',
+    'trange',
+    'bollinger_bands',
+    'chaikin_osc',
+    'obv',
+    'wma'
+]
+
+
+def build_daily_df(
+        num_bars):
+    """build_daily_df
+
+    Build a random walk daily ``pandas.DataFrame``
+
+    :param num_bars: number of daily rows
+    """
+    rng = np.random.RandomState(42)
+    closes = 280.0 + np.cumsum(rng.normal(0.0, 1.0, num_bars))
+    return pd.DataFrame({
+        'date': pd.date_range(
+            '2000-01-03',
+            periods=num_bars,
+            freq='D'),
+        'open': closes + rng.normal(0.0, 0.5, num_bars),
+        'high': closes + rng.uniform(0.0, 2.0, num_bars),
+        'low': closes - rng.uniform(0.0, 2.0, num_bars),
+        'close': closes,
+        'volume': rng.randint(1000, 100000, num_bars)
+    })
+# end of build_daily_df
+
+
+def build_config(
+        num_indicators,
+        num_points,
+        indicator_workers):
+    """build_config
+
+    :param num_indicators: number of indicators
+    :param num_points: ``num_points`` for the first indicator
+    :param indicator_workers: number of threads
+    """
+    indicators = []
+    for idx in range(num_indicators):
+        name = INDICATOR_NAMES[idx % len(INDICATOR_NAMES)]
+        indicators.append({
+            'name': f'{name}_{idx}',
+            'module_path': f'analysis_engine/indicators/{name}.py',
+            'category': 'technical',
+            'type': 'momentum',
+            'uses_data': 'daily',
+            'num_points': num_points + idx,
+            'buy_below': -80,
+            'sell_above': -20,
+            'upper_stdev': 2,
+            'lower_stdev': 2,
+            'matype': 0,
+            'fast_period': 3,
+            'slow_period': 10,
+            'buy_below_percent': 5,
+            'buy_above_percent': 5,
+            'sell_below_percent': 5,
+            'sell_above_percent': 5
+        })
+    return {
+        'name': 'bench_indicator_workers',
+        'indicator_workers': indicator_workers,
+        'indicators': indicators
+    }
+# end of build_config
+
+
+def run_processor(
+        df,
+        config,
+        num_bars):
+    """run_processor
+
+    Process the last ``num_bars`` bars and return the elapsed
+    seconds and a summary of each bar's report
+
+    :param df: daily ``pandas.DataFrame``
+    :param config: algorithm config from ``build_config``
+    :param num_bars: number of bars to process
+    """
+    proc = ind_proc.IndicatorProcessor(
+        config_dict=config)
+    summaries = []
+    start_time = time.perf_counter()
+    for end_idx in range(len(df.index) - num_bars, len(df.index)):
+        report = proc.process(
+            algo_id='bench',
+            ticker='SPY',
+            dataset={
+                'date': str(df['date'].iloc[end_idx - 1]),
+                'data': {
+                    'daily': df.iloc[0:end_idx]
+                }
+            })
+        summaries.append((
+            [node['id'] for node in report['buys']],
+            [node['id'] for node in report['sells']],
+            list(report)))
+    elapsed = time.perf_counter() - start_time
+    proc.shutdown()
+    return elapsed, summaries
+# end of run_processor
+
+
+def start(
+        num_rows=5000,
+        num_indicators=40,
+        num_points=1000,
+        num_bars=50,
+        workers=(0, 2, 4, 8)):
+    """start
+
+    Time ``process`` for each number of workers and
+    print the speedup over the serial run
+
+    :param num_rows: number of daily rows
+    :param num_indicators: number of indicators
+    :param num_points: ``num_points`` for the first indicator
+    :param num_bars: number of bars to process
+    :param workers: list of ``indicator_workers`` values
+    """
+    df = build_daily_df(
+        num_bars=num_rows)
+    results = {}
+    serial_secs = None
+    serial_summaries = None
+    for num_workers in workers:
+        elapsed, summaries = run_processor(
+            df=df,
+            config=build_config(
+                num_indicators=num_indicators,
+                num_points=num_points,
+                indicator_workers=num_workers),
+            num_bars=num_bars)
+        if serial_secs is None:
+            serial_secs = elapsed
+            serial_summaries = summaries
+        matches = summaries == serial_summaries
+        results[num_workers] = {
+            'seconds': elapsed,
+            'speedup': serial_secs / elapsed,
+            'matches': matches
+        }
+        print(
+            f'workers={num_workers:<3} '
+            f'indicators={num_indicators} bars={num_bars} '
+            f'per_bar={elapsed / num_bars * 1e3:9.2f}ms '
+            f'speedup={serial_secs / elapsed:5.2f}x '
+            f'matches={matches}')
+    # end of for all workers
+    return results
+# end of start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=(
+            'benchmark the indicator processor with and '
+            'without indicator_workers'))
+    parser.add_argument(
+        '-n',
+        help='number of daily rows',
+        required=False,
+        dest='num_rows',
+        type=int,
+        default=5000)
+    parser.add_argument(
+        '-i',
+        help='number of indicators',
+        required=False,
+        dest='num_indicators',
+        type=int,
+        default=40)
+    parser.add_argument(
+        '-p',
+        help='num_points for the first indicator',
+        required=False,
+        dest='num_points',
+        type=int,
+        default=1000)
+    parser.add_argument(
+        '-b',
+        help='number of bars to process',
+        required=False,
+        dest='num_bars',
+        type=int,
+        default=50)
+    parser.add_argument(
+        '-w',
+        help='comma-separated indicator_workers values',
+        required=False,
+        dest='workers',
+        default='0,2,4,8')
+    args = parser.parse_args()
+    start(
+        num_rows=args.num_rows,
+        num_indicators=args.num_indicators,
+        num_points=args.num_points,
+        num_bars=args.num_bars,
+        workers=[int(val) for val in args.workers.split(',')])
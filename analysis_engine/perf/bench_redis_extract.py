@@ -0,0 +1,233 @@
+"""
+Benchmark extracting a backtest's datasets from Redis with a new
+client (and TCP connection) for every key compared to the shared
+``analysis_engine.redis_pool`` clients
+
+The script publishes ``-n`` compressed datasets with ``-r`` rows
+for each of ``-d`` days under ``<ticker>_<date>_<dataset>`` keys,
+then reads every key with ``build_df_from_redis`` (the call each
+``extract_utils.perform_extract`` makes) with
+``REDIS_POOL_ENABLED=0`` and with the pool. It prints the time per
+key and per day, how many connections the Redis server accepted in
+each mode, and checks that both modes read the same rows. The keys
+are deleted when it finishes.
+
+::
+
+    python ./analysis_engine/perf/bench_redis_extract.py \
+        -a localhost:6379 -d 60 -n 12 -r 390
+"""
+
+import os
+import time
+import argparse
+import pandas as pd
+import analysis_engine.consts as ae_consts
+import analysis_engine.compress_data as compress_data
+import analysis_engine.build_df_from_redis as build_df
+import analysis_engine.redis_pool as redis_pool
+import analysis_engine.perf.bench_indicator_workers as bench_workers
+
+
+DATASET_NAMES = [
+    'daily',
+    'minute',
+    'quote',
+    'stats',
+    'peers',
+    'news',
+    'financials',
+    'earnings',
+    'dividends',
+    'company',
+    'tdcalls',
+    'tdputs'
+]
+
+
+def build_keys(
+        ticker,
+        num_days,
+        num_datasets):
+    """build_keys
+
+    Get the list of ``<ticker>_<date>_<dataset>`` keys
+
+    :param ticker: ticker
+    :param num_days: number of trading days
+    :param num_datasets: number of datasets per day
+    """
+    dates = pd.bdate_range(
+        '2019-01-02',
+        periods=num_days).strftime('%Y-%m-%d')
+    names = [
+        DATASET_NAMES[idx % len(DATASET_NAMES)] + (
+            '' if idx < len(DATASET_NAMES)
+            else str(idx // len(DATASET_NAMES)))
+        for idx in range(num_datasets)
+    ]
+    return [
+        f'{ticker}_{date}_{name}'
+        for date in dates
+        for name in names
+    ]
+# end of build_keys
+
+
+def run_extract(
+        keys,
+        address,
+        db,
+        use_pool):
+    """run_extract
+
+    Read every key and return the total seconds, the
+    number of connections the server accepted and the
+    number of rows read
+
+    :param keys: list of keys
+    :param address: Redis address
+    :param db: Redis db
+    :param use_pool: bool for the shared clients
+    """
+    os.environ['REDIS_POOL_ENABLED'] = '1' if use_pool else '0'
+    redis_pool.clear_pools()
+    stats_client = redis_pool.get_client(
+        address=address,
+        db=db)
+    start_conns = stats_client.info('stats')['total_connections_received']
+    num_rows = 0
+    start_time = time.perf_counter()
+    for key in keys:
+        res = build_df.build_df_from_redis(
+            label='bench',
+            address=address,
+            db=db,
+            key=key)
+        num_rows += len(res['rec']['data'].index)
+    # end of for all keys
+    elapsed = time.perf_counter() - start_time
+    num_conns = (
+        stats_client.info('stats')['total_connections_received'] -
+        start_conns)
+    os.environ.pop('REDIS_POOL_ENABLED', None)
+    return elapsed, num_conns, num_rows
+# end of run_extract
+
+
+def start(
+        address=ae_consts.REDIS_ADDRESS,
+        db=ae_consts.REDIS_DB,
+        num_days=60,
+        num_datasets=12,
+        num_rows=390):
+    """start
+
+    Publish the datasets, time the extracts in both
+    modes and delete the keys
+
+    :param address: Redis address
+    :param db: Redis db
+    :param num_days: number of trading days
+    :param num_datasets: number of datasets per day
+    :param num_rows: rows in each dataset
+    """
+    keys = build_keys(
+        ticker='BENCH',
+        num_days=num_days,
+        num_datasets=num_datasets)
+    client = redis_pool.get_client(
+        address=address,
+        db=db)
+    data = compress_data.compress_data(
+        data=bench_workers.build_daily_df(
+            num_bars=num_rows),
+        date_format='iso')
+    for key in keys:
+        client.set(
+            name=key,
+            value=data)
+    try:
+        new_secs, new_conns, new_rows = run_extract(
+            keys=keys,
+            address=address,
+            db=db,
+            use_pool=False)
+        pool_secs, pool_conns, pool_rows = run_extract(
+            keys=keys,
+            address=address,
+            db=db,
+            use_pool=True)
+    finally:
+        client = redis_pool.get_client(
+            address=address,
+            db=db)
+        client.delete(*keys)
+    matches = new_rows == pool_rows == len(keys) * num_rows
+    print(
+        f'days={num_days} datasets={num_datasets} keys={len(keys)} '
+        f'rows={num_rows}\n'
+        f'new client: {new_secs / len(keys) * 1e3:7.3f}ms/key '
+        f'{new_secs / num_days * 1e3:8.2f}ms/day '
+        f'connections={new_conns}\n'
+        f'pooled:     {pool_secs / len(keys) * 1e3:7.3f}ms/key '
+        f'{pool_secs / num_days * 1e3:8.2f}ms/day '
+        f'connections={pool_conns}\n'
+        f'speedup={new_secs / pool_secs:6.2f}x matches={matches}')
+    return {
+        'new_client_seconds': new_secs,
+        'pooled_seconds': pool_secs,
+        'new_client_connections': new_conns,
+        'pooled_connections': pool_conns,
+        'speedup': new_secs / pool_secs,
+        'matches': matches
+    }
+# end of start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=(
+            'benchmark extracting datasets from redis with and '
+            'without the shared connection pools'))
+    parser.add_argument(
+        '-a',
+        help='redis address',
+        required=False,
+        dest='address',
+        default=ae_consts.REDIS_ADDRESS)
+    parser.add_argument(
+        '-b',
+        help='redis db',
+        required=False,
+        dest='db',
+        type=int,
+        default=int(ae_consts.REDIS_DB))
+    parser.add_argument(
+        '-d',
+        help='number of trading days',
+        required=False,
+        dest='num_days',
+        type=int,
+        default=60)
+    parser.add_argument(
+        '-n',
+        help='number of datasets per day',
+        required=False,
+        dest='num_datasets',
+        type=int,
+        default=12)
+    parser.add_argument(
+        '-r',
+        help='rows in each dataset',
+        required=False,
+        dest='num_rows',
+        type=int,
+        default=390)
+    args = parser.parse_args()
+    start(
+        address=args.address,
+        db=args.db,
+        num_days=args.num_days,
+        num_datasets=args.num_datasets,
+        num_rows=args.num_rows)
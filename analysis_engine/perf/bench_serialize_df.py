@@ -0,0 +1,197 @@
+"""
+Benchmark caching ``pandas.DataFrame`` datasets as compressed
+``to_json(orient='records')`` compared to the
+``analysis_engine.serialize_df`` binary column bundles
+
+The script builds a daily, a minute and an options
+``pandas.DataFrame`` with ``-r`` rows, then times encoding each one
+with ``compress_data`` (``serializer='json'`` and
+``serializer='columnar'``) and decoding it the way
+``build_df_from_redis`` loads a cached key
+(``get_data_from_redis_key.decode_data`` and
+``pd.read_json`` for json) over ``-n`` runs. It prints the time and
+size for each format and checks both formats decode equal frames.
+
+::
+
+    python ./analysis_engine/perf/bench_serialize_df.py -r 390 -n 200
+"""
+
+import time
+import argparse
+import numpy as np
+import pandas as pd
+import analysis_engine.compress_data as compress_data
+import analysis_engine.build_df_from_redis as build_df
+import analysis_engine.get_data_from_redis_key as redis_get
+import analysis_engine.perf.bench_indicator_workers as bench_workers
+
+
+def build_options_df(
+        num_rows):
+    """build_options_df
+
+    Build a ``pandas.DataFrame`` like a TD option chain
+
+    :param num_rows: number of contracts
+    """
+    rng = np.random.RandomState(42)
+    strikes = 200.0 + np.arange(num_rows) * 0.5
+    return pd.DataFrame({
+        'date': pd.Timestamp('2019-02-15 15:59:00'),
+        'exp_date': '2019-02-22',
+        'symbol': [
+            f'SPY_022219C{strike:g}'
+            for strike in strikes
+        ],
+        'strike': strikes,
+        'bid': rng.uniform(0.0, 10.0, num_rows).round(2),
+        'ask': rng.uniform(0.0, 10.0, num_rows).round(2),
+        'last': rng.uniform(0.0, 10.0, num_rows).round(2),
+        'volume': rng.randint(0, 10000, num_rows),
+        'open_interest': rng.randint(0, 50000, num_rows),
+        'volatility': rng.uniform(0.1, 0.6, num_rows),
+        'delta': rng.uniform(0.0, 1.0, num_rows),
+        'in_the_money': strikes < 272.0
+    })
+# end of build_options_df
+
+
+def decode(
+        data):
+    """decode
+
+    Load a cached value like ``build_df_from_redis``
+    and return the ``pandas.DataFrame``
+
+    :param data: bytes from ``compress_data``
+    """
+    return build_df.build_df_from_redis(
+        key='bench',
+        redis_res=redis_get.decode_data(
+            key='bench',
+            raw_data=data,
+            decompress_df=True))['rec']['data']
+# end of decode
+
+
+def time_calls(
+        func,
+        num_runs):
+    """time_calls
+
+    Return the average milliseconds per call and the
+    last result
+
+    :param func: function to call
+    :param num_runs: number of calls
+    """
+    start_time = time.perf_counter()
+    for _ in range(num_runs):
+        res = func()
+    return (time.perf_counter() - start_time) / num_runs * 1e3, res
+# end of time_calls
+
+
+def start(
+        num_rows=390,
+        num_runs=200):
+    """start
+
+    Time encoding and decoding each dataset
+    in both formats
+
+    :param num_rows: rows in each dataset
+    :param num_runs: number of encodes and decodes
+    """
+    daily_df = bench_workers.build_daily_df(
+        num_bars=num_rows)
+    minute_df = daily_df.copy()
+    minute_df['date'] = pd.date_range(
+        '2019-02-15 09:30:00',
+        periods=num_rows,
+        freq='min')
+    frames = {
+        'daily': daily_df,
+        'minute': minute_df,
+        'options': build_options_df(
+            num_rows=num_rows)
+    }
+    results = {}
+    lines = ''
+    matches = True
+    for name, df in frames.items():
+        formats = {}
+        for serializer in ['json', 'columnar']:
+            encode_ms, data = time_calls(
+                func=lambda: compress_data.compress_data(
+                    data=df,
+                    date_format='iso',
+                    serializer=serializer),
+                num_runs=num_runs)
+            decode_ms, decoded_df = time_calls(
+                func=lambda: decode(
+                    data=data),
+                num_runs=num_runs)
+            formats[serializer] = {
+                'encode_ms': encode_ms,
+                'decode_ms': decode_ms,
+                'bytes': len(data),
+                'df': decoded_df
+            }
+            lines += (
+                f'{name:8s} {serializer:8s} encode={encode_ms:7.3f}ms '
+                f'decode={decode_ms:7.3f}ms bytes={len(data)}\n')
+        # end of for both formats
+        try:
+            pd.testing.assert_frame_equal(
+                formats['columnar']['df'],
+                formats['json']['df'])
+        except AssertionError:
+            matches = False
+        lines += (
+            f'{name:8s} speedup encode='
+            f'{formats["json"]["encode_ms"] / formats["columnar"]["encode_ms"]:6.2f}x '  # noqa
+            f'decode='
+            f'{formats["json"]["decode_ms"] / formats["columnar"]["decode_ms"]:6.2f}x\n')  # noqa
+        results[name] = {
+            serializer: {
+                key: value
+                for key, value in rec.items()
+                if key != 'df'
+            }
+            for serializer, rec in formats.items()
+        }
+    # end of for all frames
+    print(
+        f'rows={num_rows} runs={num_runs}\n'
+        f'{lines}'
+        f'matches={matches}')
+    results['matches'] = matches
+    return results
+# end of start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=(
+            'benchmark caching datasets as json and as '
+            'binary column bundles'))
+    parser.add_argument(
+        '-r',
+        help='rows in each dataset',
+        required=False,
+        dest='num_rows',
+        type=int,
+        default=390)
+    parser.add_argument(
+        '-n',
+        help='number of encodes and decodes',
+        required=False,
+        dest='num_runs',
+        type=int,
+        default=200)
+    args = parser.parse_args()
+    start(
+        num_rows=args.num_rows,
+        num_runs=args.num_runs)
@@ -0,0 +1,185 @@
+"""
+Benchmark the TA-Lib C functions against the pure NumPy
+functions in ``analysis_engine.np_talib`` across input sizes
+
+Each function is called with the same random walk inputs and the
+script reports the average time per call for both backends and
+the largest absolute difference between their outputs. Without
+TA-Lib installed only the NumPy timings are shown.
+
+::
+
+    python ./analysis_engine/perf/bench_talib_backends.py \
+        -s 100,1000,100000 -r 20
+"""
+
+import time
+import argparse
+import numpy as np
+import analysis_engine.np_talib as np_talib
+
+try:
+    import talib
+except Exception:
+    talib = None
+# end of loading talib if available
+
+
+BENCH_CALLS = [
+    ('BBANDS', lambda ta, hi, lo, cl, vol: ta.BBANDS(
+        cl, timeperiod=20, nbdevup=2.0, nbdevdn=2.0, matype=0)),
+    ('EMA', lambda ta, hi, lo, cl, vol: ta.EMA(cl, timeperiod=30)),
+    ('WMA', lambda ta, hi, lo, cl, vol: ta.WMA(cl, timeperiod=30)),
+    ('ADX', lambda ta, hi, lo, cl, vol: ta.ADX(hi, lo, cl, timeperiod=14)),
+    ('MACD', lambda ta, hi, lo, cl, vol: ta.MACD(
+        cl, fastperiod=12, slowperiod=26, signalperiod=9)),
+    ('MFI', lambda ta, hi, lo, cl, vol: ta.MFI(hi, lo, cl, vol, timeperiod=14)),
+    ('MOM', lambda ta, hi, lo, cl, vol: ta.MOM(cl, timeperiod=10)),
+    ('ROC', lambda ta, hi, lo, cl, vol: ta.ROC(cl, timeperiod=10)),
+    ('RSI', lambda ta, hi, lo, cl, vol: ta.RSI(cl, timeperiod=14)),
+    ('STOCH', lambda ta, hi, lo, cl, vol: ta.STOCH(
+        hi, lo, cl, fastk_period=5, slowk_period=3, slowk_matype=0,
+        slowd_period=3, slowd_matype=0)),
+    ('STOCHF', lambda ta, hi, lo, cl, vol: ta.STOCHF(
+        hi, lo, cl, fastk_period=5, fastd_period=3, fastd_matype=0)),
+    ('WILLR', lambda ta, hi, lo, cl, vol: ta.WILLR(hi, lo, cl, timeperiod=14)),
+    ('AD', lambda ta, hi, lo, cl, vol: ta.AD(hi, lo, cl, vol)),
+    ('ADOSC', lambda ta, hi, lo, cl, vol: ta.ADOSC(
+        hi, lo, cl, vol, fastperiod=3, slowperiod=10)),
+    ('OBV', lambda ta, hi, lo, cl, vol: ta.OBV(cl, vol)),
+    ('ATR', lambda ta, hi, lo, cl, vol: ta.ATR(hi, lo, cl, timeperiod=14)),
+    ('NATR', lambda ta, hi, lo, cl, vol: ta.NATR(hi, lo, cl, timeperiod=14)),
+    ('TRANGE', lambda ta, hi, lo, cl, vol: ta.TRANGE(hi, lo, cl))
+]
+
+
+def build_inputs(
+        num_bars):
+    """build_inputs
+
+    Build random walk highs, lows, closes and volumes
+
+    :param num_bars: number of values
+    """
+    rng = np.random.RandomState(42)
+    closes = 280.0 + np.cumsum(rng.normal(0.0, 0.05, num_bars))
+    highs = closes + rng.uniform(0.0, 0.1, num_bars)
+    lows = closes - rng.uniform(0.0, 0.1, num_bars)
+    volumes = rng.randint(100, 10000, num_bars).astype(np.float64)
+    return highs, lows, closes, volumes
+# end of build_inputs
+
+
+def time_call(
+        bench_func,
+        ta,
+        inputs,
+        num_repeats):
+    """time_call
+
+    :param bench_func: function from ``BENCH_CALLS``
+    :param ta: ``talib`` or ``np_talib`` module
+    :param inputs: tuple from ``build_inputs``
+    :param num_repeats: number of calls to average
+    """
+    start_time = time.perf_counter()
+    for idx in range(num_repeats):
+        res = bench_func(ta, *inputs)
+    elapsed = (time.perf_counter() - start_time) / num_repeats
+    return elapsed, res
+# end of time_call
+
+
+def get_max_diff(
+        expected,
+        found):
+    """get_max_diff
+
+    :param expected: output from ``talib``
+    :param found: output from ``np_talib``
+    """
+    if not isinstance(expected, tuple):
+        expected = (expected,)
+        found = (found,)
+    max_diff = 0.0
+    for expected_values, found_values in zip(expected, found):
+        valid = ~np.isnan(expected_values)
+        if valid.any():
+            max_diff = max(
+                max_diff,
+                float(np.nanmax(np.abs(
+                    expected_values[valid] - found_values[valid]))))
+    return max_diff
+# end of get_max_diff
+
+
+def start(
+        sizes=(100, 1000, 100000),
+        num_repeats=20):
+    """start
+
+    Time every function with both backends and print
+    the per-call times
+
+    :param sizes: list of input sizes
+    :param num_repeats: number of calls to average
+    """
+    results = {}
+    for num_bars in sizes:
+        inputs = build_inputs(
+            num_bars=num_bars)
+        for name, bench_func in BENCH_CALLS:
+            np_secs, np_res = time_call(
+                bench_func=bench_func,
+                ta=np_talib,
+                inputs=inputs,
+                num_repeats=num_repeats)
+            line = (
+                f'{name:>8}: bars={num_bars:<8} '
+                f'numpy={np_secs * 1e6:10.1f}us')
+            node = {
+                'numpy': np_secs
+            }
+            if talib:
+                ta_secs, ta_res = time_call(
+                    bench_func=bench_func,
+                    ta=talib,
+                    inputs=inputs,
+                    num_repeats=num_repeats)
+                node['talib'] = ta_secs
+                node['max_diff'] = get_max_diff(
+                    expected=ta_res,
+                    found=np_res)
+                line += (
+                    f' talib={ta_secs * 1e6:10.1f}us '
+                    f'ratio={np_secs / ta_secs:7.1f}x '
+                    f'max_diff={node["max_diff"]:.2e}')
+            results[(name, num_bars)] = node
+            print(line)
+        # end of for all functions
+    # end of for all sizes
+    return results
+# end of start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=(
+            'benchmark the talib and numpy indicator backends'))
+    parser.add_argument(
+        '-s',
+        help='comma-separated input sizes',
+        required=False,
+        dest='sizes',
+        default='100,1000,100000')
+    parser.add_argument(
+        '-r',
+        help='number of calls to average',
+        required=False,
+        dest='num_repeats',
+        type=int,
+        default=20)
+    args = parser.parse_args()
+    start(
+        sizes=[int(size) for size in args.sizes.split(',')],
+        num_repeats=args.num_repeats)
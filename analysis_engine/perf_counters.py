@@ -0,0 +1,316 @@
+"""
+Low-overhead timing and memory counters for algorithm runs
+
+``BaseAlgo`` times each backtest phase (``load``, ``seed``, ``bar``,
+``indicator``, ``process``, ``trade`` and ``history``) with one
+``time.perf_counter()`` call per phase using ``mark`` and ``lap``,
+and the ``IndicatorProcessor`` adds the wall time for each
+indicator. Set ``"trace_memory": true`` in the algorithm config to
+also record ``tracemalloc`` snapshots after each dataset and the
+top allocation sites when the run finishes.
+
+The summary is attached to ``BaseAlgo.get_result()['perf']`` and
+published with the ``Trading Performance Report`` dataset:
+
+.. code-block:: python
+
+    {
+        'total_seconds': 12.3,
+        'phases': {
+            'indicator': {
+                'seconds': 8.1,
+                'calls': 390,
+                'avg_us': 20769.2,
+                'percent': 65.85
+            }
+        },
+        'indicators': {
+            'willr_10': {
+                'seconds': 8.0,
+                'calls': 390,
+                'avg_us': 20512.8,
+                'percent': 65.04
+            }
+        },
+        'ta_cache': {
+            'enabled': True,
+            'hits': 390,
+            'misses': 390,
+            'hit_rate': 50.0
+        },
+        'memory': {
+            'current_bytes': 1024,
+            'peak_bytes': 4096,
+            'snapshots': [
+                {
+                    'label': 'SPY_2018-11-07',
+                    'current_bytes': 1024,
+                    'peak_bytes': 4096
+                }
+            ],
+            'top': [
+                {
+                    'location': 'analysis_engine/algo.py:123',
+                    'size_bytes': 512,
+                    'count': 3
+                }
+            ]
+        }
+    }
+"""
+
+import time
+import tracemalloc
+
+
+class PerfCounters:
+    """PerfCounters
+
+    Accumulate per-phase and per-indicator wall time
+    """
+
+    def __init__(
+            self,
+            enabled=True,
+            trace_memory=False,
+            num_top_allocations=10):
+        """__init__
+
+        :param enabled: optional - boolean for timing phases
+            (default is ``True``)
+        :param trace_memory: optional - boolean for recording
+            ``tracemalloc`` snapshots (default is ``False``)
+        :param num_top_allocations: optional - number of top
+            allocation sites in the memory summary
+            (default is ``10``)
+        """
+        self.enabled = enabled
+        self.trace_memory = trace_memory
+        self.num_top_allocations = num_top_allocations
+        # name to [seconds, calls]
+        self.phases = {}
+        self.indicators = {}
+        self.total_seconds = 0.0
+        self.last_mark = time.perf_counter()
+        self.run_start = None
+        self.started_tracing = False
+        self.memory_snapshots = []
+        self.top_allocations = []
+        self.current_bytes = None
+        self.peak_bytes = None
+        # analysis_engine.ta_cache.TACache from the
+        # IndicatorProcessor's set_perf_counters
+        self.ta_cache = None
+    # end of __init__
+
+    def mark(
+            self):
+        """mark
+
+        Start timing the next phase
+        """
+        if self.enabled:
+            self.last_mark = time.perf_counter()
+    # end of mark
+
+    def lap(
+            self,
+            phase):
+        """lap
+
+        Add the time since the last ``mark`` or ``lap`` to
+        ``phase`` and start timing the next phase
+
+        :param phase: phase name
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        counter = self.phases.get(phase, None)
+        if counter is None:
+            counter = [0.0, 0]
+            self.phases[phase] = counter
+        counter[0] += now - self.last_mark
+        counter[1] += 1
+        self.last_mark = now
+    # end of lap
+
+    def add_indicator(
+            self,
+            name,
+            seconds):
+        """add_indicator
+
+        Add one indicator run's wall time
+
+        :param name: indicator name
+        :param seconds: elapsed seconds
+        """
+        counter = self.indicators.get(name, None)
+        if counter is None:
+            counter = [0.0, 0]
+            self.indicators[name] = counter
+        counter[0] += seconds
+        counter[1] += 1
+    # end of add_indicator
+
+    def start_run(
+            self):
+        """start_run
+
+        Start timing a ``handle_data`` call and start
+        ``tracemalloc`` if ``trace_memory`` is set
+        """
+        if not self.enabled:
+            return
+        self.run_start = time.perf_counter()
+        self.last_mark = self.run_start
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+    # end of start_run
+
+    def snapshot_memory(
+            self,
+            label):
+        """snapshot_memory
+
+        Record the current and peak traced memory
+
+        :param label: snapshot label like a dataset id
+        """
+        if not self.enabled or not tracemalloc.is_tracing():
+            return
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        self.memory_snapshots.append({
+            'label': label,
+            'current_bytes': current_bytes,
+            'peak_bytes': peak_bytes
+        })
+    # end of snapshot_memory
+
+    def finish_run(
+            self):
+        """finish_run
+
+        Stop timing a ``handle_data`` call and record the top
+        allocation sites if ``tracemalloc`` is running
+        """
+        if not self.enabled or self.run_start is None:
+            return
+        self.total_seconds += time.perf_counter() - self.run_start
+        self.run_start = None
+        if self.trace_memory and tracemalloc.is_tracing():
+            (self.current_bytes,
+             self.peak_bytes) = tracemalloc.get_traced_memory()
+            stats = tracemalloc.take_snapshot().statistics('lineno')
+            self.top_allocations = [
+                {
+                    'location': (
+                        f'{stat.traceback[0].filename}:'
+                        f'{stat.traceback[0].lineno}'),
+                    'size_bytes': stat.size,
+                    'count': stat.count
+                }
+                for stat in stats[:self.num_top_allocations]
+            ]
+            if self.started_tracing:
+                tracemalloc.stop()
+                self.started_tracing = False
+    # end of finish_run
+
+    def reset(
+            self):
+        """reset
+
+        Clear the counters and memory snapshots in place
+        (like in a forked ticker worker before it runs
+        its ticker)
+        """
+        self.phases = {}
+        self.indicators = {}
+        self.total_seconds = 0.0
+        self.memory_snapshots = []
+        self.top_allocations = []
+        self.current_bytes = None
+        self.peak_bytes = None
+        if self.ta_cache is not None:
+            self.ta_cache.reset_counts()
+    # end of reset
+
+    def merge(
+            self,
+            other):
+        """merge
+
+        Add the counters from another ``PerfCounters``
+        (like one returned from a ticker worker)
+
+        :param other: ``PerfCounters``
+        """
+        for name, (seconds, calls) in other.phases.items():
+            counter = self.phases.setdefault(name, [0.0, 0])
+            counter[0] += seconds
+            counter[1] += calls
+        for name, (seconds, calls) in other.indicators.items():
+            counter = self.indicators.setdefault(name, [0.0, 0])
+            counter[0] += seconds
+            counter[1] += calls
+        self.memory_snapshots.extend(other.memory_snapshots)
+        if (self.ta_cache is not None and
+                other.ta_cache is not None and
+                other.ta_cache is not self.ta_cache):
+            self.ta_cache.num_hits += other.ta_cache.num_hits
+            self.ta_cache.num_misses += other.ta_cache.num_misses
+    # end of merge
+
+    def build_counter_summary(
+            self,
+            counters):
+        """build_counter_summary
+
+        :param counters: dictionary of name to ``[seconds, calls]``
+        """
+        summary = {}
+        for name, (seconds, calls) in counters.items():
+            percent = 0.0
+            if self.total_seconds > 0:
+                percent = round(
+                    100.0 * seconds / self.total_seconds,
+                    2)
+            summary[name] = {
+                'seconds': round(seconds, 6),
+                'calls': calls,
+                'avg_us': round(
+                    (seconds / calls) * 1e6 if calls else 0.0,
+                    3),
+                'percent': percent
+            }
+        return summary
+    # end of build_counter_summary
+
+    def get_summary(
+            self):
+        """get_summary
+
+        Build a json-serializable summary of the counters
+        """
+        summary = {
+            'enabled': self.enabled,
+            'total_seconds': round(self.total_seconds, 6),
+            'phases': self.build_counter_summary(self.phases),
+            'indicators': self.build_counter_summary(self.indicators)
+        }
+        if self.ta_cache is not None:
+            summary['ta_cache'] = self.ta_cache.get_summary()
+        if self.trace_memory:
+            summary['memory'] = {
+                'current_bytes': self.current_bytes,
+                'peak_bytes': self.peak_bytes,
+                'snapshots': self.memory_snapshots,
+                'top': self.top_allocations
+            }
+        return summary
+    # end of get_summary
+
+# end of PerfCounters
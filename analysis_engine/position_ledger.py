@@ -0,0 +1,372 @@
+"""
+Position ledger for tracking orders and owned shares per ticker
+
+Orders from ``build_buy_order`` and ``build_sell_order`` are
+stored as compact ``OrderRecord`` objects. A record keeps its
+values in a ``tuple`` and shares one key layout with every other
+order built by the same function, so an algorithm that trades all
+day does not keep a full dictionary for each order. Records are
+read-only ``Mapping`` objects (``order['close']``,
+``order.get('reason')``) and are only converted to dictionaries
+for reports with ``to_dict`` or ``to_dicts``.
+
+The ``PositionLedger.positions`` dictionary keeps the same
+structure ``BaseAlgo.positions`` has always used:
+
+.. code-block:: python
+
+    {
+        'SPY': {
+            'shares': 10,
+            'buys': [<OrderRecord>],
+            'sells': []
+        }
+    }
+"""
+
+import collections.abc
+import analysis_engine.consts as ae_consts
+
+
+# key layouts shared by all order records: tuple of keys to
+# a dictionary of key to position in the record values
+ORDER_LAYOUTS = {}
+
+
+def get_order_layout(
+        keys):
+    """get_order_layout
+
+    Get the shared key layout for a ``tuple`` of order keys
+
+    :param keys: ``tuple`` of order keys
+    """
+    layout = ORDER_LAYOUTS.get(keys, None)
+    if layout is None:
+        layout = {
+            key: idx
+            for idx, key in enumerate(keys)
+        }
+        ORDER_LAYOUTS[keys] = layout
+    return layout
+# end of get_order_layout
+
+
+class OrderRecord(collections.abc.Mapping):
+    """OrderRecord
+
+    Read-only, tuple-backed buy or sell order
+    """
+
+    __slots__ = (
+        'layout',
+        'values'
+    )
+
+    def __init__(
+            self,
+            order):
+        """__init__
+
+        :param order: order dictionary from ``build_buy_order``
+            or ``build_sell_order``
+        """
+        self.layout = get_order_layout(
+            tuple(order.keys()))
+        self.values = tuple(order.values())
+    # end of __init__
+
+    def __getitem__(
+            self,
+            key):
+        """__getitem__
+
+        :param key: order key
+        """
+        return self.values[self.layout[key]]
+    # end of __getitem__
+
+    def __iter__(
+            self):
+        """__iter__"""
+        return iter(self.layout)
+    # end of __iter__
+
+    def __len__(
+            self):
+        """__len__"""
+        return len(self.values)
+    # end of __len__
+
+    def __repr__(
+            self):
+        """__repr__"""
+        return f'OrderRecord({self.to_dict()})'
+    # end of __repr__
+
+    def to_dict(
+            self):
+        """to_dict
+
+        Build the order dictionary
+        """
+        return dict(zip(self.layout, self.values))
+    # end of to_dict
+
+# end of OrderRecord
+
+
+def to_dict(
+        order):
+    """to_dict
+
+    Convert an ``OrderRecord`` to a dictionary (dictionaries
+    are returned as-is)
+
+    :param order: ``OrderRecord`` or order dictionary
+    """
+    if isinstance(order, OrderRecord):
+        return order.to_dict()
+    return order
+# end of to_dict
+
+
+def to_dicts(
+        orders):
+    """to_dicts
+
+    Convert a ``list`` of orders to a ``list`` of dictionaries
+
+    :param orders: ``list`` of ``OrderRecord`` objects
+        or order dictionaries
+    """
+    return [
+        to_dict(order)
+        for order in orders
+    ]
+# end of to_dicts
+
+
+def positions_to_dicts(
+        positions):
+    """positions_to_dicts
+
+    Convert the orders in a positions dictionary for reports
+
+    :param positions: dictionary of ticker to
+        ``{'shares': int, 'buys': list, 'sells': list}``
+    """
+    converted = {}
+    for ticker, position in positions.items():
+        converted_position = dict(position)
+        for key in ['buys', 'sells']:
+            if key in converted_position:
+                converted_position[key] = to_dicts(
+                    converted_position[key])
+        converted[ticker] = converted_position
+    return converted
+# end of positions_to_dicts
+
+
+class PositionLedger:
+    """PositionLedger
+
+    Per-ticker owned shares and filled orders with
+    constant-time lookups and updates. Each ticker also keeps
+    running counters for the number of filled buys and sells
+    and the net value of its filled orders (sell proceeds
+    minus buy costs) that are updated as orders are recorded
+    """
+
+    def __init__(
+            self):
+        """__init__"""
+        self.positions = {}
+        # ticker to {'num_buys': int, 'num_sells': int,
+        # 'net_value': float}
+        self.counters = {}
+    # end of __init__
+
+    def build_counters(
+            self,
+            position):
+        """build_counters
+
+        Count the filled orders in a position dictionary
+
+        :param position: dictionary with ``buys`` and ``sells``
+            lists of orders
+        """
+        buys = position.get('buys', [])
+        sells = position.get('sells', [])
+        return {
+            'num_buys': len(buys),
+            'num_sells': len(sells),
+            'net_value': (
+                sum(order['sell_price'] for order in sells) -
+                sum(order['buy_price'] for order in buys))
+        }
+    # end of build_counters
+
+    def get_counters(
+            self,
+            ticker,
+            position):
+        """get_counters
+
+        Get the ticker's counters (they are rebuilt from the
+        ``position`` if it was added without the ledger)
+
+        :param ticker: string ticker
+        :param position: the ticker's position dictionary
+        """
+        counters = self.counters.get(ticker, None)
+        if counters is None:
+            counters = self.build_counters(
+                position=position)
+            self.counters[ticker] = counters
+        return counters
+    # end of get_counters
+
+    def set_positions(
+            self,
+            positions):
+        """set_positions
+
+        Use a positions dictionary (like the one shared with
+        ``BaseAlgo.positions``) and rebuild the counters
+
+        :param positions: dictionary of ticker to
+            ``{'shares': int, 'buys': list, 'sells': list}``
+        """
+        self.positions = positions
+        self.counters = {
+            ticker: self.build_counters(
+                position=position)
+            for ticker, position in self.positions.items()
+        }
+    # end of set_positions
+
+    def set_position(
+            self,
+            ticker,
+            position):
+        """set_position
+
+        Replace a ticker's position (like one returned from a
+        ticker worker) and rebuild its counters
+
+        :param ticker: string ticker
+        :param position: dictionary with ``shares``, ``buys``
+            and ``sells``
+        """
+        self.positions[ticker] = position
+        self.counters[ticker] = self.build_counters(
+            position=position)
+    # end of set_position
+
+    def record_order(
+            self,
+            ticker,
+            order,
+            is_buy):
+        """record_order
+
+        Compact an order and, if it was filled, update the
+        ticker's owned shares and counters and add it to the
+        ticker's buys or sells. Returns a tuple:
+        ``(order_record, created_position)`` where
+        ``created_position`` is ``True`` if this order opened
+        the ticker's first position
+
+        :param ticker: string ticker
+        :param order: order dictionary from ``build_buy_order``
+            or ``build_sell_order``
+        :param is_buy: ``True`` for buys and ``False`` for sells
+        """
+        record = OrderRecord(order)
+        created_position = False
+        if record['status'] == ae_consts.TRADE_FILLED:
+            position = self.positions.get(ticker, None)
+            if position is None:
+                position = {
+                    'shares': record['shares'],
+                    'buys': [],
+                    'sells': []
+                }
+                self.positions[ticker] = position
+                self.counters.pop(ticker, None)
+                created_position = True
+            else:
+                position['shares'] = int(record['shares'])
+            counters = self.get_counters(
+                ticker=ticker,
+                position=position)
+            if is_buy:
+                position['buys'].append(record)
+                counters['num_buys'] += 1
+                counters['net_value'] -= record['buy_price']
+            else:
+                position['sells'].append(record)
+                counters['num_sells'] += 1
+                counters['net_value'] += record['sell_price']
+        # end of if filled
+        return record, created_position
+    # end of record_order
+
+    def get_position(
+            self,
+            ticker):
+        """get_position
+
+        Get a tuple of
+        ``(num_owned, buys, sells, num_buys, num_sells)``
+        for a ticker (``(None, None, None, 0, 0)`` if the ticker
+        has no position)
+
+        :param ticker: string ticker
+        """
+        position = self.positions.get(ticker, None)
+        if position is None:
+            return None, None, None, 0, 0
+        counters = self.get_counters(
+            ticker=ticker,
+            position=position)
+        return (
+            position.get('shares', None),
+            position.get('buys', []),
+            position.get('sells', []),
+            counters['num_buys'],
+            counters['num_sells'])
+    # end of get_position
+
+    def get_owned_shares(
+            self,
+            ticker):
+        """get_owned_shares
+
+        :param ticker: string ticker
+        """
+        position = self.positions.get(ticker, None)
+        if position is None:
+            return 0
+        return position.get('shares', None)
+    # end of get_owned_shares
+
+    def get_net_value(
+            self,
+            ticker):
+        """get_net_value
+
+        Get the net value of a ticker's filled orders
+        (sell proceeds minus buy costs)
+
+        :param ticker: string ticker
+        """
+        counters = self.counters.get(ticker, None)
+        if counters is None:
+            return 0.0
+        return counters['net_value']
+    # end of get_net_value
+
+# end of PositionLedger
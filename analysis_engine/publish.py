@@ -4,9 +4,9 @@ Dataset Publishing API
 
 import json
 import boto3
-import redis
 import zlib
 import analysis_engine.consts as ae_consts
+import analysis_engine.redis_pool as redis_pool
 import analysis_engine.compress_data as compress_data
 import analysis_engine.set_data_in_redis_key as redis_utils
 import analysis_engine.send_to_slack as slack_utils
@@ -224,7 +224,7 @@ def publish(
             f'redis={redis_host}:{redis_port}@{redis_db} connect '
             f'key={redis_key} expire={redis_expire}')
 
-        rc = redis.Redis(
+        rc = redis_pool.get_client(
             host=redis_host,
             port=redis_port,
             password=redis_password,
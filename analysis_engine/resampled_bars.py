@@ -0,0 +1,328 @@
+"""
+Resampled pricing bars shared by indicators on a higher timeframe
+
+Indicators can subscribe to a timeframe of another dataset with a
+``uses_data`` spec like ``minute:5m``, ``minute:15m`` or
+``minute:1h`` (units are ``s``, ``m``, ``h`` and ``d``). The
+``IndicatorProcessor`` keeps one ``ResampledBars`` for each spec and
+feeds it the new rows of the source dataset on every bar, so only
+the latest source row is folded into the bars instead of resampling
+the whole ``pd.DataFrame`` on every tick. The still-forming bar is
+updated in place until a row lands in the next bucket.
+
+Bars are labeled with the start of their bucket and match
+``df.set_index('date').resample('5min')`` (without the empty
+buckets for gaps in the source):
+
+- ``open`` - first value in the bucket
+- ``high`` - highest value
+- ``low`` - lowest value
+- ``close`` - latest value
+- ``volume`` - sum of the values
+
+.. code-block:: python
+
+    import analysis_engine.resampled_bars as resampled_bars
+    bars = resampled_bars.ResampledBars(
+        uses_data='minute:5m')
+    for minute_idx in range(len(df_minute.index)):
+        bars.update(
+            df=df_minute.iloc[0:(minute_idx + 1)])
+        df_5m = bars.get_df()
+"""
+
+import re
+import numpy as np
+import pandas as pd
+import analysis_engine.ohlcv_bundle as ohlcv_bundle
+
+
+TIMEFRAME_UNITS = {
+    's': 1,
+    'm': 60,
+    'min': 60,
+    'h': 3600,
+    'd': 86400
+}
+
+
+def parse_timeframe(
+        uses_data):
+    """parse_timeframe
+
+    Split a timeframe spec like ``minute:5m`` into the source
+    dataset name and the bar size in seconds. Returns ``None``
+    for dataset names without a timeframe (like ``minute``)
+
+    :param uses_data: ``uses_data`` value from an
+        indicator's config
+    """
+    if not isinstance(uses_data, str) or ':' not in uses_data:
+        return None
+    source, timeframe = uses_data.split(':', 1)
+    match = re.fullmatch(
+        r'\s*(\d+)\s*([a-z]+)\s*',
+        timeframe.lower())
+    if (not source or not match or
+            match.group(2) not in TIMEFRAME_UNITS or
+            int(match.group(1)) <= 0):
+        raise Exception(
+            f'unsupported timeframe uses_data={uses_data} - please '
+            'use a dataset name and a bar size like minute:5m, '
+            'minute:15m or minute:1h')
+    return (
+        source,
+        int(match.group(1)) * TIMEFRAME_UNITS[match.group(2)])
+# end of parse_timeframe
+
+
+class ResampledBars:
+    """ResampledBars
+
+    Incrementally resample a pricing dataset into
+    higher timeframe bars
+    """
+
+    def __init__(
+            self,
+            uses_data,
+            date_column='date'):
+        """__init__
+
+        :param uses_data: timeframe spec like ``minute:5m``
+        :param date_column: optional - name of the source
+            dataset's date column (default is ``date``)
+        """
+        self.uses_data = uses_data
+        self.source, self.seconds = parse_timeframe(
+            uses_data=uses_data)
+        self.step = np.int64(self.seconds) * np.int64(1000000000)
+        self.date_column = date_column
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset
+
+        Drop all the bars (the next ``update`` starts over
+        from the first row of the dataset)
+        """
+        self.num_bars = 0
+        self.num_rows = 0
+        self.source_df = None
+        self.source_rows = None
+        self.last_index = None
+        self.last_date = None
+        self.last_bucket = None
+        self.columns = []
+        self.dates = np.zeros(0, dtype=np.int64)
+        self.arrays = {}
+    # end of reset
+
+    def __len__(
+            self):
+        """__len__"""
+        return self.num_bars
+    # end of __len__
+
+    def is_continued(
+            self,
+            df):
+        """is_continued
+
+        Check if ``df`` starts with the rows already folded into
+        the bars (like the next ``df_minute.iloc[0:(minute_idx + 1)]``)
+
+        :param df: source ``pd.DataFrame``
+        """
+        if self.num_rows == 0 or len(df.index) < self.num_rows:
+            return False
+        last_idx = self.num_rows - 1
+        return (
+            df.index[last_idx] == self.last_index and
+            df[self.date_column].iat[last_idx] == self.last_date)
+    # end of is_continued
+
+    def convert_rows(
+            self,
+            df):
+        """convert_rows
+
+        Convert the date column to integer nanoseconds
+        (``NaT`` is the smallest ``int64``) and the pricing
+        columns to ``float64`` arrays
+
+        :param df: ``pd.DataFrame`` rows to convert
+        """
+        dates = pd.to_datetime(
+            df[self.date_column],
+            errors='coerce')
+        if getattr(dates.dt, 'tz', None) is not None:
+            dates = dates.dt.tz_localize(None)
+        dates = dates.to_numpy().astype(
+            'datetime64[ns]').view(np.int64)
+        values = [
+            ohlcv_bundle.to_float_array(df[col].to_numpy())
+            for col in self.columns
+        ]
+        return dates, values
+    # end of convert_rows
+
+    def update(
+            self,
+            df,
+            source_df=None):
+        """update
+
+        Fold the rows of ``df`` that are not in the bars yet
+        into the bars. If ``df`` does not continue the rows seen
+        so far (like a new day's minutes) the bars start over.
+        Returns the number of bars
+
+        :param df: source ``pd.DataFrame`` with a date column
+            and the ``open``, ``high``, ``low``, ``close`` and
+            ``volume`` columns it has
+        :param source_df: optional - ``pd.DataFrame`` holding
+            every bar the algorithm will step through when ``df``
+            is its first rows (like ``df_minute`` for
+            ``df_minute.iloc[0:(minute_idx + 1)]``). It is
+            converted once instead of converting the new
+            rows on every update
+        """
+        if (not hasattr(df, 'index') or
+                self.date_column not in df):
+            self.reset()
+            return self.num_bars
+        if not self.is_continued(df):
+            self.reset()
+            self.columns = [
+                col
+                for col in ohlcv_bundle.OHLCV_COLUMNS
+                if col in df
+            ]
+        num_rows = len(df.index)
+        if num_rows == self.num_rows:
+            return self.num_bars
+        if source_df is not None:
+            if source_df is not self.source_df:
+                self.source_df = source_df
+                self.source_rows = self.convert_rows(
+                    df=source_df)
+            dates = self.source_rows[0][self.num_rows:num_rows]
+            values = [
+                col_values[self.num_rows:num_rows]
+                for col_values in self.source_rows[1]
+            ]
+        else:
+            new_df = df
+            if self.num_rows > 0:
+                new_df = df.iloc[self.num_rows:num_rows]
+            dates, values = self.convert_rows(
+                df=new_df)
+        is_nat = np.isnat(dates.view('datetime64[ns]'))
+        for row in range(len(dates)):
+            if is_nat[row]:
+                continue
+            self.add_row(
+                date=int(dates[row]),
+                row=[col_values[row] for col_values in values])
+        # end of for all new rows
+        self.num_rows = num_rows
+        self.last_index = df.index[num_rows - 1]
+        self.last_date = df[self.date_column].iat[num_rows - 1]
+        return self.num_bars
+    # end of update
+
+    def add_row(
+            self,
+            date,
+            row):
+        """add_row
+
+        Fold one source row into the forming bar or start
+        a new bar if the row is in the next bucket
+
+        :param date: row's date as integer nanoseconds
+        :param row: list of the row's values in
+            ``self.columns`` order
+        """
+        bucket = date - (date % self.step)
+        if self.num_bars == 0 or bucket != self.last_bucket:
+            if self.num_bars == len(self.dates):
+                self.grow()
+            idx = self.num_bars
+            self.dates[idx] = bucket
+            for col, value in zip(self.columns, row):
+                if col == 'volume' and value != value:
+                    value = 0.0
+                self.arrays[col][idx] = value
+            self.num_bars += 1
+            self.last_bucket = bucket
+            return
+        idx = self.num_bars - 1
+        for col, value in zip(self.columns, row):
+            # nan values are skipped like pandas
+            if value != value:
+                continue
+            cur_value = self.arrays[col][idx]
+            if col == 'open':
+                if cur_value != cur_value:
+                    self.arrays[col][idx] = value
+            elif col == 'high':
+                if cur_value != cur_value or value > cur_value:
+                    self.arrays[col][idx] = value
+            elif col == 'low':
+                if cur_value != cur_value or value < cur_value:
+                    self.arrays[col][idx] = value
+            elif col == 'volume':
+                self.arrays[col][idx] = cur_value + value
+            else:
+                self.arrays[col][idx] = value
+        # end of for all columns
+    # end of add_row
+
+    def grow(
+            self):
+        """grow
+
+        Double the capacity of the bar arrays
+        """
+        capacity = max(16, 2 * len(self.dates))
+        dates = np.zeros(capacity, dtype=np.int64)
+        dates[0:self.num_bars] = self.dates[0:self.num_bars]
+        self.dates = dates
+        for col in self.columns:
+            values = np.full(capacity, np.nan, dtype=np.float64)
+            if col in self.arrays:
+                values[0:self.num_bars] = self.arrays[col][0:self.num_bars]
+            self.arrays[col] = values
+        # end of for all columns
+    # end of grow
+
+    def get_df(
+            self,
+            num_bars=None):
+        """get_df
+
+        Get a ``pd.DataFrame`` of the bars (the last row is the
+        still-forming bar)
+
+        :param num_bars: optional - only include the
+            trailing ``num_bars`` bars
+        """
+        start_idx = 0
+        if num_bars is not None:
+            start_idx = max(0, self.num_bars - num_bars)
+        data = {
+            self.date_column: self.dates[
+                start_idx:self.num_bars].view('datetime64[ns]')
+        }
+        for col in self.columns:
+            data[col] = self.arrays[col][start_idx:self.num_bars]
+        return pd.DataFrame(
+            data,
+            index=pd.RangeIndex(start_idx, self.num_bars))
+    # end of get_df
+
+# end of ResampledBars
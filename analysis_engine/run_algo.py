@@ -33,6 +33,7 @@ import analysis_engine.build_algo_request as algo_utils
 import analysis_engine.build_dataset_node as build_ds_node
 import analysis_engine.build_result as build_result
 import analysis_engine.api_requests as api_requests
+import analysis_engine.stream_datasets as stream_datasets
 import spylunking.log.setup_logging as log_utils
 
 log = log_utils.build_colorized_logger(name=__name__)
@@ -87,6 +88,10 @@ def run_algo(
         config_dict=None,
         version=1,
         raise_on_err=True,
+        stream=False,
+        num_prefetch=1,
+        extract_chunk_size=20,
+        extract_workers=0,
         **kwargs):
     """run_algo
 
@@ -236,6 +241,24 @@ def run_algo(
     :param publish_to_redis: optional - boolean for
         publishing to redis (coming soon)
 
+    **(Optional) Streaming**
+
+    :param stream: optional - boolean for extracting each
+        dataset node while the algorithm processes the previous
+        one instead of extracting every node before calling
+        ``handle_data`` (default is ``False``). Set
+        ``stream_window`` in the algorithm config to limit how
+        many processed nodes the algorithm keeps
+    :param num_prefetch: optional - number of dataset nodes
+        to extract ahead of the algorithm when ``stream``
+        is ``True`` (default is ``1``)
+    :param extract_chunk_size: optional - number of ticker-dates
+        whose redis keys are fetched with one ``MGET``
+        (default is ``20``)
+    :param extract_workers: optional - number of forked
+        processes decoding the extracted dataset nodes
+        (default is ``0`` for decoding in this process)
+
     **(Optional) Debugging**
 
     :param verbose: bool - show extract warnings
@@ -501,69 +524,89 @@ def run_algo(
                 'req': date_req})
     # end of for all ticker in use_tickers
 
-    first_extract_date = None
-    last_extract_date = None
-    total_extract_requests = len(extract_requests)
-    cur_idx = 1
-    for idx, extract_node in enumerate(extract_requests):
-
-        extract_ticker = extract_node['ticker']
-        extract_date = extract_node['date']
-        ds_node_id = extract_node['id']
-
-        if not first_extract_date:
-            first_extract_date = extract_date
-        last_extract_date = extract_date
-        perc_progress = ae_consts.get_percent_done(
-            progress=cur_idx,
-            total=total_extract_requests)
+    # this could be a separate celery task
+    status = ae_consts.NOT_RUN
+    if stream:
+        if len(extract_requests) == 0:
+            msg = (
+                f'{label} - nothing to test - no datasets to extract for '
+                f'tickers={use_tickers}')
+            log.info(msg)
+            return build_result.build_result(
+                status=ae_consts.EMPTY,
+                err=msg,
+                rec=rec)
+        first_extract_date = extract_requests[0]['date']
+        last_extract_date = extract_requests[-1]['date']
         percent_label = (
             f'{label} '
-            f'ticker={extract_ticker} '
-            f'date={extract_date} '
-            f'{perc_progress} '
-            f'{idx}/{total_extract_requests} '
+            f'stream={len(extract_requests)} '
             f'{indicator_datasets}')
-        if verbose:
-            log.info(
-                f'extracting - {percent_label}')
-
-        ticker_bt_data = build_ds_node.build_dataset_node(
-            ticker=extract_ticker,
-            date=extract_date,
-            service_dict=common_vals,
+        algo_data_req = stream_datasets.prefetch_nodes(
+            nodes=extract_algo_nodes(
+                extract_requests=extract_requests,
+                common_vals=common_vals,
+                datasets=indicator_datasets,
+                label=label,
+                chunk_size=extract_chunk_size,
+                num_workers=extract_workers,
+                verbose=verbose_extract),
+            num_prefetch=num_prefetch)
+    else:
+        first_extract_date = None
+        last_extract_date = None
+        total_extract_requests = len(extract_requests)
+        cur_idx = 1
+        extracted_nodes = extract_algo_nodes(
+            extract_requests=extract_requests,
+            common_vals=common_vals,
             datasets=indicator_datasets,
-            log_label=label,
+            label=label,
+            chunk_size=extract_chunk_size,
+            num_workers=extract_workers,
             verbose=verbose_extract)
-
-        if ticker not in algo_data_req:
-            algo_data_req[ticker] = []
-
-        algo_data_req[ticker].append({
-            'id': ds_node_id,  # id is currently the cache key in redis
-            'date': extract_date,  # used to confirm dates in asc order
-            'data': ticker_bt_data
-        })
-
-        if verbose:
-            log.info(
-                f'extract - {percent_label} '
-                f'dataset={len(algo_data_req[ticker])}')
-        cur_idx += 1
-    # end of for service_dict in extract_requests
-
-    # this could be a separate celery task
-    status = ae_consts.NOT_RUN
-    if len(algo_data_req) == 0:
-        msg = (
-            f'{label} - nothing to test - no data found for '
-            f'tickers={use_tickers} '
-            f'between {first_extract_date} and {last_extract_date}')
-        log.info(msg)
-        return build_result.build_result(
-            status=ae_consts.EMPTY,
-            err=msg,
-            rec=rec)
+        for idx, (extract_ticker, extract_node) in enumerate(
+                extracted_nodes):
+
+            extract_date = extract_node['date']
+
+            if not first_extract_date:
+                first_extract_date = extract_date
+            last_extract_date = extract_date
+            perc_progress = ae_consts.get_percent_done(
+                progress=cur_idx,
+                total=total_extract_requests)
+            percent_label = (
+                f'{label} '
+                f'ticker={extract_ticker} '
+                f'date={extract_date} '
+                f'{perc_progress} '
+                f'{idx}/{total_extract_requests} '
+                f'{indicator_datasets}')
+            if extract_ticker not in algo_data_req:
+                algo_data_req[extract_ticker] = []
+
+            # id is currently the cache key in redis and
+            # date is used to confirm dates in asc order
+            algo_data_req[extract_ticker].append(extract_node)
+
+            if verbose:
+                log.info(
+                    f'extract - {percent_label} '
+                    f'dataset={len(algo_data_req[extract_ticker])}')
+            cur_idx += 1
+        # end of for service_dict in extract_requests
+
+        if len(algo_data_req) == 0:
+            msg = (
+                f'{label} - nothing to test - no data found for '
+                f'tickers={use_tickers} '
+                f'between {first_extract_date} and {last_extract_date}')
+            log.info(msg)
+            return build_result.build_result(
+                status=ae_consts.EMPTY,
+                err=msg,
+                rec=rec)
 
     # this could be a separate celery task
     try:
@@ -692,3 +735,41 @@ def run_algo(
         err=msg,
         rec=rec)
 # end of run_algo
+
+
+def extract_algo_nodes(
+        extract_requests,
+        common_vals,
+        datasets,
+        label,
+        chunk_size=20,
+        num_workers=0,
+        verbose=False):
+    """extract_algo_nodes
+
+    Generator that extracts the dataset nodes for ``run_algo``
+    in chunks with ``build_dataset_node.build_dataset_nodes``
+    and yields ``(ticker, node)`` tuples for
+    ``BaseAlgo.handle_data`` in the same order as
+    ``extract_requests``
+
+    :param extract_requests: list of extract request dictionaries
+        with ``id``, ``ticker`` and ``date`` keys
+    :param common_vals: dictionary of redis and s3 service values
+    :param datasets: list of dataset names to extract
+    :param label: tracking log label
+    :param chunk_size: optional - number of requests fetched
+        with one redis ``MGET`` (default is ``20``)
+    :param num_workers: optional - number of processes decoding
+        the nodes (default is ``0``)
+    :param verbose: optional - boolean for extract logging
+    """
+    return build_ds_node.build_dataset_nodes(
+        extract_requests=extract_requests,
+        datasets=datasets,
+        service_dict=common_vals,
+        chunk_size=chunk_size,
+        num_workers=num_workers,
+        log_label=label,
+        verbose=verbose)
+# end of extract_algo_nodes
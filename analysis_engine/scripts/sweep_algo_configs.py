@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+
+"""
+A tool for sweeping algorithm config parameters against one
+algorithm-ready dataset that is loaded once and shared with all
+worker processes
+
+Sweep the default algorithm's ``wr_80_20`` indicator across
+3 x 3 x 2 = 18 configs:
+
+::
+
+    sweep -c ./cfg/default_algo.json \\
+        -l /tmp/SPY-latest.json \\
+        -p wr_80_20.num_points=10,20,40 \\
+        -p wr_80_20.buy_below=-90,-80,-70 \\
+        -p wr_80_20.sell_above=-20,-10 \\
+        -w 4 \\
+        -o /tmp/sweep-results.csv
+
+Sweep parameter names are either a top-level algo config key
+(like ``buy_shares``) or ``<indicator name>.<indicator key>``.
+Values are parsed as json when possible (``10`` is an ``int``,
+``-80.5`` is a ``float``) and otherwise used as strings.
+"""
+
+import os
+import json
+import inspect
+import argparse
+import importlib.machinery
+import types
+import analysis_engine.consts as ae_consts
+import analysis_engine.algo as base_algo
+import analysis_engine.sweep_algo as sweep_algo
+import spylunking.log.setup_logging as log_utils
+
+
+log = log_utils.build_colorized_logger(
+    name='sweep',
+    log_config_path=ae_consts.LOG_CONFIG_PATH)
+
+
+def parse_sweep_param(
+        param_str):
+    """parse_sweep_param
+
+    Parse a ``name=value1,value2,...`` sweep parameter
+
+    :param param_str: sweep parameter string
+    """
+    if '=' not in param_str:
+        raise Exception(
+            f'invalid sweep parameter={param_str} please use: '
+            'name=value1,value2')
+    name, values_str = param_str.split('=', 1)
+    values = []
+    for value_str in values_str.split(','):
+        try:
+            values.append(json.loads(value_str))
+        except Exception:
+            values.append(value_str)
+    return name.strip(), values
+# end of parse_sweep_param
+
+
+def load_algo_class(
+        mod_path):
+    """load_algo_class
+
+    Find the derived ``BaseAlgo`` class in a custom
+    algorithm module file
+
+    :param mod_path: path to the custom algorithm module
+    """
+    module_name = mod_path.split('/')[-1]
+    loader = importlib.machinery.SourceFileLoader(
+        module_name,
+        mod_path)
+    custom_algo_module = types.ModuleType(
+        loader.name)
+    loader.exec_module(
+        custom_algo_module)
+    for member_name, member in inspect.getmembers(custom_algo_module):
+        if (inspect.isclass(member) and
+                issubclass(member, base_algo.BaseAlgo) and
+                member is not base_algo.BaseAlgo):
+            return member
+    raise Exception(
+        f'did not find a derived analysis_engine.algo.BaseAlgo '
+        f'class in the module file={mod_path}')
+# end of load_algo_class
+
+
+def run_sweep_tool():
+    """run_sweep_tool
+
+    Run a parameter sweep from the command line
+    """
+
+    parser = argparse.ArgumentParser(
+        description=(
+            'sweep algorithm config parameters against one '
+            'shared algorithm-ready dataset'))
+    parser.add_argument(
+        '-c',
+        help=(
+            'path to the base algorithm config json file'),
+        required=True,
+        dest='config_file')
+    parser.add_argument(
+        '-p',
+        help=(
+            'sweep parameter like: wr_80_20.num_points=10,20,40 '
+            '(repeat for more parameters)'),
+        required=True,
+        action='append',
+        dest='sweep_params')
+    parser.add_argument(
+        '-l',
+        help=(
+            'load an algorithm-ready dataset from this file'),
+        required=False,
+        dest='load_from_file')
+    parser.add_argument(
+        '-b',
+        help=(
+            'load an algorithm-ready dataset from this s3 bucket '
+            '(use with -k)'),
+        required=False,
+        dest='load_from_s3_bucket')
+    parser.add_argument(
+        '-k',
+        help=(
+            'load an algorithm-ready dataset from this s3 key '
+            '(use with -b)'),
+        required=False,
+        dest='load_from_s3_key')
+    parser.add_argument(
+        '-r',
+        help=(
+            'load an algorithm-ready dataset from this redis key'),
+        required=False,
+        dest='load_from_redis_key')
+    parser.add_argument(
+        '-z',
+        help=(
+            'decompress the loaded dataset'),
+        required=False,
+        dest='load_compress',
+        action='store_true')
+    parser.add_argument(
+        '-g',
+        help=(
+            'path to a custom algorithm module file'),
+        required=False,
+        dest='algo_mod_path')
+    parser.add_argument(
+        '-w',
+        help=(
+            'number of worker processes (default is the number '
+            'of cpus)'),
+        required=False,
+        type=int,
+        dest='num_workers')
+    parser.add_argument(
+        '-s',
+        help=(
+            'rank by this column: net_value, balance, num_trades '
+            'or max_drawdown (default is net_value)'),
+        required=False,
+        default='net_value',
+        dest='sort_by')
+    parser.add_argument(
+        '-o',
+        help=(
+            'save the ranked results to this csv file'),
+        required=False,
+        dest='output_file')
+    parser.add_argument(
+        '-d',
+        help=(
+            'debug'),
+        required=False,
+        dest='debug',
+        action='store_true')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.config_file):
+        log.error(f'missing config file: {args.config_file}')
+        return
+
+    config_dict = json.loads(open(args.config_file, 'r').read())
+
+    sweep_params = {}
+    for param_str in args.sweep_params:
+        name, values = parse_sweep_param(param_str)
+        sweep_params[name] = values
+
+    algo_class = None
+    if args.algo_mod_path:
+        algo_class = load_algo_class(
+            mod_path=args.algo_mod_path)
+
+    ranked_df = sweep_algo.run_sweep(
+        config_dict=config_dict,
+        sweep_params=sweep_params,
+        load_from_file=args.load_from_file,
+        load_from_s3_bucket=args.load_from_s3_bucket,
+        load_from_s3_key=args.load_from_s3_key,
+        load_from_redis_key=args.load_from_redis_key,
+        load_compress=args.load_compress,
+        algo_class=algo_class,
+        num_workers=args.num_workers,
+        sort_by=args.sort_by,
+        verbose=args.debug)
+
+    print(ranked_df.to_string(index=False))
+
+    if args.output_file:
+        ranked_df.to_csv(
+            args.output_file,
+            index=False)
+        log.info(f'saved ranked results to file={args.output_file}')
+# end of run_sweep_tool
+
+
+if __name__ == '__main__':
+    run_sweep_tool()
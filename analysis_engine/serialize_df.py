@@ -0,0 +1,292 @@
+"""
+Helper for serializing a ``pandas.DataFrame`` into a versioned
+binary column bundle for caching in Redis instead of
+``to_json(orient='records')``
+
+Each numeric and boolean column is stored as its raw ``numpy``
+buffer with the dtype ``pd.read_json`` would give it (integers as
+``int64``, floats with only whole numbers as ``int64`` and ``inf``
+as ``NaN``). Every other column, and any column ``pd.read_json``
+converts to dates by name (like ``date`` or ``created_at``), is
+stored in one ``to_json(orient='split')`` document that is read back
+with ``pd.read_json``. A decoded bundle matches the
+``to_json(orient='records')`` cache of the same frame (including
+``date`` columns of ISO strings becoming ``datetime64`` and a frame
+without rows having no columns) without parsing JSON for the numeric
+columns.
+``get_data_from_redis_key.decode_data`` detects the bundle from its
+header and returns the ``pandas.DataFrame``, so keys that still hold
+compressed JSON keep working.
+
+Set the environment variable ``DF_SERIALIZER=columnar`` to publish
+cached datasets with this format (the default is ``json``).
+
+**Format (version 2)**
+
+::
+
+    5 bytes   header b'\\x00AEDF' (JSON and zlib data can not
+              start with a null byte)
+    1 byte    version
+    1 byte    flags (1 = the rest is compressed with zlib)
+    4 bytes   little-endian length of the JSON column metadata
+    N bytes   JSON column metadata
+    ...       numeric column buffers in column order
+    M bytes   to_json(orient='split') document for the
+              ``json`` columns (``json_nbytes`` in the metadata)
+
+Version 1 bundles stored each ``json`` column as its own JSON list
+after its buffer and are still read.
+
+Reading a bundle never unpickles objects from Redis.
+"""
+
+import io
+import json
+import struct
+import zlib
+import numpy as np
+import pandas as pd
+
+
+HEADER = b'\x00AEDF'
+VERSION = 2
+FLAG_ZLIB = 1
+NUMPY_KINDS = 'biuf'
+DATE_COLUMNS = [
+    'modified',
+    'date',
+    'datetime'
+]
+META_LEN = struct.Struct('<I')
+
+
+def is_serialized_df(
+        data):
+    """is_serialized_df
+
+    Check if ``data`` starts with the serialized
+    ``pandas.DataFrame`` header
+
+    :param data: bytes from redis
+    """
+    return (
+        isinstance(data, (bytes, bytearray, memoryview)) and
+        bytes(data[0:len(HEADER)]) == HEADER)
+# end of is_serialized_df
+
+
+def is_date_column(
+        name):
+    """is_date_column
+
+    Check if ``pd.read_json`` converts a column to dates by
+    its name (``keep_default_dates=True``)
+
+    :param name: column name
+    """
+    name = str(name).lower()
+    return (
+        name.endswith('_at') or
+        name.endswith('_time') or
+        name.startswith('timestamp') or
+        name in DATE_COLUMNS)
+# end of is_date_column
+
+
+def get_numpy_values(
+        series):
+    """get_numpy_values
+
+    Get the ``numpy`` values to store for a numeric or
+    boolean column with the dtype and values ``pd.read_json``
+    gives it (``inf`` and ``-inf`` become ``NaN``), or ``None``
+    if the column is stored as JSON
+
+    :param series: ``pandas.Series`` column
+    """
+    if (
+            not isinstance(series.dtype, np.dtype) or
+            series.dtype.kind not in NUMPY_KINDS or
+            is_date_column(series.name)):
+        return None
+    values = series.to_numpy()
+    if values.dtype.kind in 'iu':
+        values = values.astype('int64')
+    elif values.dtype.kind == 'f':
+        # to_json writes inf and -inf as null
+        values = np.where(
+            np.isinf(values),
+            np.nan,
+            values.astype('float64'))
+        if (
+                len(values) and
+                np.isfinite(values).all() and
+                (np.abs(values) < 2**63).all() and
+                (values == np.trunc(values)).all()):
+            values = values.astype('int64')
+    return values
+# end of get_numpy_values
+
+
+def serialize_df(
+        df,
+        compress=True,
+        level=1,
+        date_format=None):
+    """serialize_df
+
+    Serialize a ``pandas.DataFrame`` into a binary column
+    bundle (the index is not stored just like
+    ``to_json(orient='records')``)
+
+    :param df: ``pandas.DataFrame`` to serialize
+    :param compress: optional - compress the bundle with
+        ``zlib`` (default is ``True``)
+    :param level: optional - ``zlib`` compression level
+        (default is ``1``)
+    :param date_format: optional - ``to_json`` date format
+        for the ``json`` columns (use the same value as the
+        ``compress_data`` json cache)
+    """
+    columns = []
+    buffers = []
+    json_idx = []
+    for idx in range(len(df.columns)):
+        series = df.iloc[:, idx]
+        column = {
+            'name': str(df.columns[idx])
+        }
+        values = get_numpy_values(
+            series=series.rename(column['name']))
+        if values is not None:
+            column['dtype'] = values.dtype.str
+            buf = np.ascontiguousarray(values).tobytes()
+            column['nbytes'] = len(buf)
+            buffers.append(buf)
+        else:
+            column['dtype'] = 'json'
+            json_idx.append(idx)
+        columns.append(column)
+    # end of for all columns
+
+    json_nbytes = 0
+    if json_idx:
+        json_df = df.iloc[:, json_idx]
+        json_df.columns = [
+            columns[idx]['name']
+            for idx in json_idx
+        ]
+        if date_format:
+            buf = json_df.to_json(
+                orient='split',
+                index=False,
+                date_format=date_format).encode('utf-8')
+        else:
+            buf = json_df.to_json(
+                orient='split',
+                index=False).encode('utf-8')
+        json_nbytes = len(buf)
+        buffers.append(buf)
+    # end of storing the json columns
+
+    meta = json.dumps({
+        'num_rows': len(df.index),
+        'columns': columns,
+        'json_nbytes': json_nbytes
+    }).encode('utf-8')
+    payload = b''.join(
+        [META_LEN.pack(len(meta)), meta] + buffers)
+    flags = 0
+    if compress:
+        payload = zlib.compress(
+            payload,
+            level)
+        flags |= FLAG_ZLIB
+    return HEADER + bytes([VERSION, flags]) + payload
+# end of serialize_df
+
+
+def deserialize_df(
+        data):
+    """deserialize_df
+
+    Build the ``pandas.DataFrame`` from a binary column
+    bundle created with ``serialize_df``
+
+    :param data: bytes from ``serialize_df``
+    """
+    if not is_serialized_df(data):
+        raise ValueError(
+            'data is not a serialized df - missing the header')
+    data = bytes(data)
+    version = data[len(HEADER)]
+    flags = data[len(HEADER) + 1]
+    if version > VERSION:
+        raise ValueError(
+            f'unsupported serialized df version={version} '
+            f'(max supported={VERSION})')
+
+    payload = data[len(HEADER) + 2:]
+    if flags & FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+
+    meta_len = META_LEN.unpack_from(payload, 0)[0]
+    offset = META_LEN.size
+    meta = json.loads(
+        payload[offset:offset + meta_len].decode('utf-8'))
+    offset += meta_len
+    num_rows = meta['num_rows']
+    # read_json returns no columns for an empty records list
+    if num_rows == 0:
+        return pd.DataFrame()
+
+    names = []
+    values = {}
+    json_idx = []
+    for idx, column in enumerate(meta['columns']):
+        names.append(column['name'])
+        if column['dtype'] == 'json' and version > 1:
+            json_idx.append(idx)
+            continue
+        nbytes = column['nbytes']
+        if column['dtype'] == 'json':
+            values[idx] = json.loads(
+                payload[offset:offset + nbytes].decode('utf-8'))
+        else:
+            col_values = np.frombuffer(
+                payload,
+                dtype=np.dtype(column['dtype']),
+                count=num_rows,
+                offset=offset)
+            if 'tz' in column:
+                col_values = pd.DatetimeIndex(
+                    col_values).tz_localize(
+                        'UTC').tz_convert(
+                            column['tz'])
+            values[idx] = col_values
+        offset += nbytes
+    # end of for all columns
+
+    # the names come from the metadata so only the values
+    # need the read_json conversions
+    if json_idx:
+        json_nbytes = meta['json_nbytes']
+        json_df = pd.read_json(
+            io.StringIO(
+                payload[offset:offset + json_nbytes].decode('utf-8')),
+            orient='split',
+            convert_axes=False)
+        for json_pos, idx in enumerate(json_idx):
+            values[idx] = json_df.iloc[:, json_pos].array
+    # end of reading the json columns
+
+    df = pd.DataFrame(
+        {
+            idx: values[idx]
+            for idx in range(len(names))
+        },
+        index=pd.RangeIndex(num_rows))
+    df.columns = names
+    return df
+# end of deserialize_df
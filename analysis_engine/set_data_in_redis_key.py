@@ -9,8 +9,8 @@ Debug redis calls with:
 """
 
 import json
-import redis
 import analysis_engine.consts as ae_consts
+import analysis_engine.redis_pool as redis_pool
 import analysis_engine.build_result as build_result
 import spylunking.log.setup_logging as log_utils
 
@@ -96,7 +96,7 @@ def set_data_in_redis_key(
             if not use_client:
                 log.debug(
                     f'{log_id} set key={key} new client={host}:{port}@{db}')
-                use_client = redis.Redis(
+                use_client = redis_pool.get_client(
                     host=host,
                     port=port,
                     password=password,
@@ -0,0 +1,107 @@
+"""
+Helpers for streaming dataset nodes into ``BaseAlgo.handle_data``
+
+``BaseAlgo.handle_data`` accepts a lazy iterator of
+``(ticker, node)`` tuples (or a ``dict`` of ticker to a generator
+of nodes) and only keeps the ``stream_window`` most recent nodes
+per ticker. Wrap the iterator with ``prefetch_nodes`` to build the
+next node in a background thread while the algorithm processes the
+current one:
+
+.. code-block:: python
+
+    import analysis_engine.stream_datasets as stream_datasets
+
+    def extract_nodes():
+        for date in dates:
+            yield ticker, {
+                'id': f'{ticker}_{date}',
+                'date': date,
+                'data': build_dataset_node(ticker=ticker, date=date)
+            }
+
+    algo.handle_data(
+        data=stream_datasets.prefetch_nodes(
+            nodes=extract_nodes(),
+            num_prefetch=1))
+"""
+
+import queue
+import threading
+
+
+# sentinel placed on the queue when the iterator is done
+END_OF_NODES = object()
+
+
+def iter_ticker_nodes(
+        data,
+        tickers):
+    """iter_ticker_nodes
+
+    Yield ``(ticker, node)`` tuples from a ``dict`` of
+    ticker to a ``list`` or iterator of dataset nodes
+
+    :param data: ``dict`` of ticker to dataset nodes
+    :param tickers: ``list`` of tickers to yield in order
+    """
+    for ticker in tickers:
+        for node in data[ticker]:
+            yield ticker, node
+# end of iter_ticker_nodes
+
+
+def prefetch_nodes(
+        nodes,
+        num_prefetch=1):
+    """prefetch_nodes
+
+    Generator that pulls up to ``num_prefetch`` items ahead of
+    the caller from ``nodes`` in a background thread. Exceptions
+    raised by ``nodes`` are raised in the caller
+
+    :param nodes: iterator of ``(ticker, node)`` tuples
+    :param num_prefetch: number of items to build ahead
+        (default is ``1``)
+    """
+    items = queue.Queue(maxsize=max(1, int(num_prefetch)))
+    stop_event = threading.Event()
+
+    def put_item(item):
+        while not stop_event.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    # end of put_item
+
+    def fill_queue():
+        try:
+            for item in nodes:
+                if not put_item((item, None)):
+                    return
+            put_item((END_OF_NODES, None))
+        except Exception as e:
+            put_item((END_OF_NODES, e))
+    # end of fill_queue
+
+    worker = threading.Thread(
+        target=fill_queue,
+        name='prefetch-nodes',
+        daemon=True)
+    worker.start()
+    try:
+        while True:
+            item, err = items.get()
+            if item is END_OF_NODES:
+                if err is not None:
+                    raise err
+                return
+            yield item
+        # end of while nodes are available
+    finally:
+        stop_event.set()
+        worker.join()
+# end of prefetch_nodes
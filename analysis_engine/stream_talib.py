@@ -0,0 +1,1388 @@
+"""
+Streaming TA-Lib kernels
+
+Stateful versions of the ``analysis_engine.ae_talib`` wrappers that
+keep rolling state between bars so an indicator can be advanced one
+bar at a time instead of recomputing over its whole window. Each kernel
+supports:
+
+- ``seed(...)`` - reset and replay a history of values
+- ``update(...)`` - advance by a single bar and return the latest value
+- ``reset()`` - clear all internal state
+
+``inputs`` lists the columns ``update`` takes in order and ``value``
+holds the latest output (a ``tuple`` for kernels with more than one
+output like ``MACD`` and ``BBANDS``). The values returned by ``update``
+match what the TA-Lib function returns for the newest bar in the same
+series, including TA-Lib's seeding of exponential and Wilder averages,
+so recursive kernels like ``EMA`` and ``RSI`` follow every bar since
+the last ``reset`` and not just the trailing ``timeperiod`` bars.
+
+.. code-block:: python
+
+    import analysis_engine.ae_talib as ae_talib
+    willr = ae_talib.stream.WILLR(timeperiod=14)
+    willr.seed(highs, lows, closes)
+    latest = willr.update(high, low, close)
+
+    rsi = ae_talib.stream.RSI(timeperiod=14)
+    for close in closes:
+        value = rsi.update(close)
+"""
+
+import collections
+
+
+NAN = float('nan')
+# TA-Lib's TA_IS_ZERO tolerance
+ZERO_TOLERANCE = 0.00000001
+
+
+class StreamKernel:
+    """StreamKernel
+
+    Base class for the streaming kernels
+    """
+
+    inputs = ('close',)
+
+    def reset(
+            self):
+        """reset"""
+        self.value = NAN
+    # end of reset
+
+    def update(
+            self,
+            *values):
+        """update
+
+        Advance the kernel by one bar and return the latest value
+
+        :param values: one value for each column in ``inputs``
+        """
+        raise NotImplementedError(
+            f'{self.__class__.__name__} must implement update')
+    # end of update
+
+    def seed(
+            self,
+            *columns):
+        """seed
+
+        Reset the kernel and replay a history of bars
+
+        :param columns: one list of values for each column
+            in ``inputs``
+        """
+        self.reset()
+        update = self.update
+        for values in zip(*columns):
+            update(*values)
+        return self.value
+    # end of seed
+
+# end of StreamKernel
+
+
+class WILLR(StreamKernel):
+    """WILLR
+
+    Streaming Williams %R using monotonic deques to track the
+    highest high and lowest low over the trailing ``timeperiod``
+    bars so each ``update`` is amortized ``O(1)``
+
+    .. code-block:: python
+
+        willr = WILLR(timeperiod=14)
+        for high, low, close in bars:
+            value = willr.update(high, low, close)
+    """
+
+    inputs = ('high', 'low', 'close')
+
+    def __init__(
+            self,
+            timeperiod=14):
+        """__init__
+
+        :param timeperiod: number of bars in the trailing window
+            (default is ``14``)
+        """
+        self.timeperiod = int(timeperiod)
+        self.num_bars = 0
+        self.highs = collections.deque()
+        self.lows = collections.deque()
+        self.value = NAN
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.num_bars = 0
+        self.highs.clear()
+        self.lows.clear()
+        self.value = NAN
+    # end of reset
+
+    def update(
+            self,
+            high,
+            low,
+            close):
+        """update
+
+        Advance the kernel by one bar and return the latest
+        Williams %R value (``nan`` until ``timeperiod`` bars
+        have been seen)
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        :param close: close (or any price) for the new bar
+        """
+        idx = self.num_bars
+        highs = self.highs
+        lows = self.lows
+        while highs and highs[-1][1] <= high:
+            highs.pop()
+        highs.append((idx, high))
+        while lows and lows[-1][1] >= low:
+            lows.pop()
+        lows.append((idx, low))
+
+        trailing_idx = idx - self.timeperiod + 1
+        while highs[0][0] < trailing_idx:
+            highs.popleft()
+        while lows[0][0] < trailing_idx:
+            lows.popleft()
+
+        self.num_bars += 1
+        if self.num_bars < self.timeperiod:
+            self.value = NAN
+            return self.value
+
+        # same operation order as TA-Lib's WILLR so results
+        # are identical to the batch function
+        highest = highs[0][1]
+        lowest = lows[0][1]
+        diff = highest - lowest
+        if diff != 0.0:
+            self.value = (highest - close) / diff * -100.0
+        else:
+            self.value = 0.0
+        return self.value
+    # end of update
+
+    def seed(
+            self,
+            high,
+            low,
+            close):
+        """seed
+
+        Reset the kernel and replay a history of bars
+
+        :param high: list of highs
+        :param low: list of lows
+        :param close: list of closes
+        """
+        self.reset()
+        for idx in range(len(close)):
+            self.update(
+                high[idx],
+                low[idx],
+                close[idx])
+        return self.value
+    # end of seed
+
+# end of WILLR
+
+
+def is_zero(
+        value):
+    """is_zero
+
+    TA-Lib ``TA_IS_ZERO`` check
+
+    :param value: float
+    """
+    return -ZERO_TOLERANCE < value < ZERO_TOLERANCE
+# end of is_zero
+
+
+def true_range(
+        high,
+        low,
+        prev_close):
+    """true_range
+
+    :param high: high for the bar
+    :param low: low for the bar
+    :param prev_close: close for the previous bar
+    """
+    greatest = high - low
+    diff = abs(prev_close - high)
+    if diff > greatest:
+        greatest = diff
+    diff = abs(prev_close - low)
+    if diff > greatest:
+        greatest = diff
+    return greatest
+# end of true_range
+
+
+class TrailingHighLow:
+    """TrailingHighLow
+
+    Highest high and lowest low over the trailing ``timeperiod``
+    bars using monotonic deques
+    """
+
+    def __init__(
+            self,
+            timeperiod):
+        """__init__
+
+        :param timeperiod: number of bars in the trailing window
+        """
+        self.timeperiod = int(timeperiod)
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.num_bars = 0
+        self.highs = collections.deque()
+        self.lows = collections.deque()
+    # end of reset
+
+    def update(
+            self,
+            high,
+            low):
+        """update
+
+        Add a bar and return ``(highest, lowest)`` for the
+        trailing window
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        """
+        idx = self.num_bars
+        highs = self.highs
+        lows = self.lows
+        while highs and highs[-1][1] <= high:
+            highs.pop()
+        highs.append((idx, high))
+        while lows and lows[-1][1] >= low:
+            lows.pop()
+        lows.append((idx, low))
+        trailing_idx = idx - self.timeperiod + 1
+        while highs[0][0] < trailing_idx:
+            highs.popleft()
+        while lows[0][0] < trailing_idx:
+            lows.popleft()
+        self.num_bars += 1
+        return highs[0][1], lows[0][1]
+    # end of update
+
+# end of TrailingHighLow
+
+
+class SMA(StreamKernel):
+    """SMA
+
+    Simple moving average with a running total
+    """
+
+    def __init__(
+            self,
+            timeperiod=30):
+        """__init__
+
+        :param timeperiod: number of bars
+            (default is ``30``)
+        """
+        self.timeperiod = int(timeperiod)
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.values = collections.deque()
+        self.total = 0.0
+        self.value = NAN
+    # end of reset
+
+    def update(
+            self,
+            close):
+        """update
+
+        :param close: value for the new bar
+        """
+        self.values.append(close)
+        self.total += close
+        if len(self.values) < self.timeperiod:
+            return NAN
+        self.value = self.total / self.timeperiod
+        self.total -= self.values.popleft()
+        return self.value
+    # end of update
+
+# end of SMA
+
+
+class EMA(StreamKernel):
+    """EMA
+
+    Exponential moving average seeded with the simple average
+    of the first ``timeperiod`` bars
+    """
+
+    def __init__(
+            self,
+            timeperiod=30):
+        """__init__
+
+        :param timeperiod: number of bars
+            (default is ``30``)
+        """
+        self.timeperiod = int(timeperiod)
+        self.k = 2.0 / (self.timeperiod + 1)
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.num_bars = 0
+        self.total = 0.0
+        self.value = NAN
+    # end of reset
+
+    def update(
+            self,
+            close):
+        """update
+
+        :param close: value for the new bar
+        """
+        self.num_bars += 1
+        if self.num_bars > self.timeperiod:
+            self.value = ((close - self.value) * self.k) + self.value
+            return self.value
+        self.total += close
+        if self.num_bars == self.timeperiod:
+            self.value = self.total / self.timeperiod
+        return self.value
+    # end of update
+
+# end of EMA
+
+
+class WMA(StreamKernel):
+    """WMA
+
+    Weighted moving average with TA-Lib's running weighted
+    sum and running sum
+    """
+
+    def __init__(
+            self,
+            timeperiod=30):
+        """__init__
+
+        :param timeperiod: number of bars
+            (default is ``30``)
+        """
+        self.timeperiod = int(timeperiod)
+        self.divider = (self.timeperiod * (self.timeperiod + 1)) >> 1
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.values = collections.deque()
+        self.period_sum = 0.0
+        self.period_sub = 0.0
+        self.trailing_value = 0.0
+        self.value = NAN
+    # end of reset
+
+    def update(
+            self,
+            close):
+        """update
+
+        :param close: value for the new bar
+        """
+        self.values.append(close)
+        num_values = len(self.values)
+        if num_values < self.timeperiod:
+            self.period_sub += close
+            self.period_sum += close * num_values
+            return NAN
+        self.period_sub += close
+        self.period_sub -= self.trailing_value
+        self.period_sum += close * self.timeperiod
+        self.trailing_value = self.values.popleft()
+        self.value = self.period_sum / self.divider
+        self.period_sum -= self.period_sub
+        return self.value
+    # end of update
+
+# end of WMA
+
+
+# matype to kernel for the kernels with moving average arguments
+MA_KERNELS = {
+    0: SMA,
+    1: EMA,
+    2: WMA
+}
+
+
+def build_ma(
+        timeperiod,
+        matype=0):
+    """build_ma
+
+    Build the moving average kernel for a TA-Lib ``matype``
+
+    :param timeperiod: number of bars
+    :param matype: ``0`` SMA, ``1`` EMA or ``2`` WMA
+    """
+    if int(timeperiod) == 1:
+        return SMA(timeperiod=1)
+    kernel = MA_KERNELS.get(int(matype), None)
+    if not kernel:
+        raise Exception(
+            f'unsupported matype={matype} streaming kernels '
+            f'support: {sorted(MA_KERNELS)}')
+    return kernel(timeperiod=timeperiod)
+# end of build_ma
+
+
+class BBANDS(StreamKernel):
+    """BBANDS
+
+    Bollinger Bands returning ``(upperband, middleband, lowerband)``
+    """
+
+    def __init__(
+            self,
+            timeperiod=5,
+            nbdevup=2.0,
+            nbdevdn=2.0,
+            matype=0):
+        """__init__
+
+        :param timeperiod: number of bars
+            (default is ``5``)
+        :param nbdevup: standard deviations for the upper band
+        :param nbdevdn: standard deviations for the lower band
+        :param matype: moving average type for the middle band
+        """
+        self.timeperiod = int(timeperiod)
+        self.nbdevup = float(nbdevup)
+        self.nbdevdn = float(nbdevdn)
+        self.middle = build_ma(
+            timeperiod=self.timeperiod,
+            matype=matype)
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.middle.reset()
+        self.values = collections.deque()
+        self.total = 0.0
+        self.total_squares = 0.0
+        self.value = (NAN, NAN, NAN)
+    # end of reset
+
+    def update(
+            self,
+            close):
+        """update
+
+        :param close: value for the new bar
+        """
+        middle = self.middle.update(close)
+        self.values.append(close)
+        self.total += close
+        self.total_squares += close * close
+        if len(self.values) < self.timeperiod:
+            return self.value
+        mean = self.total / self.timeperiod
+        variance = self.total_squares / self.timeperiod - mean * mean
+        oldest = self.values.popleft()
+        self.total -= oldest
+        self.total_squares -= oldest * oldest
+        stddev = 0.0
+        if variance >= ZERO_TOLERANCE:
+            stddev = variance ** 0.5
+        self.value = (
+            middle + self.nbdevup * stddev,
+            middle,
+            middle - self.nbdevdn * stddev)
+        return self.value
+    # end of update
+
+# end of BBANDS
+
+
+class MOM(StreamKernel):
+    """MOM"""
+
+    def __init__(
+            self,
+            timeperiod=10):
+        """__init__
+
+        :param timeperiod: number of bars
+            (default is ``10``)
+        """
+        self.timeperiod = int(timeperiod)
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.values = collections.deque(
+            maxlen=self.timeperiod + 1)
+        self.value = NAN
+    # end of reset
+
+    def update(
+            self,
+            close):
+        """update
+
+        :param close: value for the new bar
+        """
+        self.values.append(close)
+        if len(self.values) <= self.timeperiod:
+            return NAN
+        self.value = close - self.values[0]
+        return self.value
+    # end of update
+
+# end of MOM
+
+
+class ROC(MOM):
+    """ROC"""
+
+    def update(
+            self,
+            close):
+        """update
+
+        :param close: value for the new bar
+        """
+        self.values.append(close)
+        if len(self.values) <= self.timeperiod:
+            return NAN
+        prev = self.values[0]
+        if prev != 0.0:
+            self.value = ((close / prev) - 1.0) * 100.0
+        else:
+            self.value = 0.0
+        return self.value
+    # end of update
+
+# end of ROC
+
+
+class RSI(StreamKernel):
+    """RSI
+
+    Wilder's relative strength index
+    """
+
+    def __init__(
+            self,
+            timeperiod=14):
+        """__init__
+
+        :param timeperiod: number of bars
+            (default is ``14``)
+        """
+        self.timeperiod = int(timeperiod)
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.num_diffs = -1
+        self.prev_close = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.value = NAN
+    # end of reset
+
+    def update(
+            self,
+            close):
+        """update
+
+        :param close: value for the new bar
+        """
+        self.num_diffs += 1
+        if self.prev_close is None:
+            self.prev_close = close
+            return NAN
+        diff = close - self.prev_close
+        self.prev_close = close
+        timeperiod = self.timeperiod
+        if self.num_diffs <= timeperiod:
+            if diff < 0:
+                self.avg_loss -= diff
+            else:
+                self.avg_gain += diff
+            if self.num_diffs < timeperiod:
+                return NAN
+            self.avg_loss /= timeperiod
+            self.avg_gain /= timeperiod
+        else:
+            self.avg_loss *= (timeperiod - 1)
+            self.avg_gain *= (timeperiod - 1)
+            if diff < 0:
+                self.avg_loss -= diff
+            else:
+                self.avg_gain += diff
+            self.avg_loss /= timeperiod
+            self.avg_gain /= timeperiod
+        total = self.avg_gain + self.avg_loss
+        if not is_zero(total):
+            self.value = 100.0 * (self.avg_gain / total)
+        else:
+            self.value = 0.0
+        return self.value
+    # end of update
+
+# end of RSI
+
+
+class MACD(StreamKernel):
+    """MACD
+
+    Returns ``(macd, macdsignal, macdhist)``. Like TA-Lib the fast
+    EMA is seeded over the ``fastperiod`` bars that end where the
+    slow EMA starts
+    """
+
+    def __init__(
+            self,
+            fastperiod=12,
+            slowperiod=26,
+            signalperiod=9):
+        """__init__
+
+        :param fastperiod: fast EMA period
+        :param slowperiod: slow EMA period
+        :param signalperiod: signal EMA period
+        """
+        fastperiod = int(fastperiod)
+        slowperiod = int(slowperiod)
+        if slowperiod < fastperiod:
+            fastperiod, slowperiod = slowperiod, fastperiod
+        self.fastperiod = fastperiod
+        self.slowperiod = slowperiod
+        self.fast_k = 2.0 / (fastperiod + 1)
+        self.slow_k = 2.0 / (slowperiod + 1)
+        self.signal = EMA(
+            timeperiod=signalperiod)
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.num_bars = 0
+        self.slow_total = 0.0
+        self.recent = collections.deque(
+            maxlen=self.fastperiod)
+        self.fast_ema = None
+        self.slow_ema = None
+        self.signal.reset()
+        self.value = (NAN, NAN, NAN)
+    # end of reset
+
+    def update(
+            self,
+            close):
+        """update
+
+        :param close: value for the new bar
+        """
+        self.num_bars += 1
+        if self.slow_ema is None:
+            self.slow_total += close
+            self.recent.append(close)
+            if self.num_bars < self.slowperiod:
+                return self.value
+            self.slow_ema = self.slow_total / self.slowperiod
+            fast_total = 0.0
+            for value in self.recent:
+                fast_total += value
+            self.fast_ema = fast_total / self.fastperiod
+            self.recent = None
+        else:
+            self.fast_ema = (
+                ((close - self.fast_ema) * self.fast_k) + self.fast_ema)
+            self.slow_ema = (
+                ((close - self.slow_ema) * self.slow_k) + self.slow_ema)
+        macd = self.fast_ema - self.slow_ema
+        signal = self.signal.update(macd)
+        if signal == signal:
+            self.value = (macd, signal, macd - signal)
+        return self.value
+    # end of update
+
+# end of MACD
+
+
+class MFI(StreamKernel):
+    """MFI
+
+    Money flow index with running positive and negative
+    money flow totals
+    """
+
+    inputs = ('high', 'low', 'close', 'volume')
+
+    def __init__(
+            self,
+            timeperiod=14):
+        """__init__
+
+        :param timeperiod: number of bars
+            (default is ``14``)
+        """
+        self.timeperiod = int(timeperiod)
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.flows = collections.deque()
+        self.prev_typical = None
+        self.positive = 0.0
+        self.negative = 0.0
+        self.value = NAN
+    # end of reset
+
+    def update(
+            self,
+            high,
+            low,
+            close,
+            volume):
+        """update
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        :param close: close for the new bar
+        :param volume: volume for the new bar
+        """
+        typical = (high + low + close) / 3.0
+        if self.prev_typical is None:
+            self.prev_typical = typical
+            return NAN
+        if len(self.flows) == self.timeperiod:
+            positive, negative = self.flows.popleft()
+            self.positive -= positive
+            self.negative -= negative
+        diff = typical - self.prev_typical
+        self.prev_typical = typical
+        money_flow = typical * volume
+        positive = 0.0
+        negative = 0.0
+        if diff < 0:
+            negative = money_flow
+            self.negative += money_flow
+        elif diff > 0:
+            positive = money_flow
+            self.positive += money_flow
+        self.flows.append((positive, negative))
+        if len(self.flows) < self.timeperiod:
+            return NAN
+        total = self.positive + self.negative
+        if total < 1.0:
+            self.value = 0.0
+        else:
+            self.value = 100.0 * (self.positive / total)
+        return self.value
+    # end of update
+
+# end of MFI
+
+
+class STOCHF(StreamKernel):
+    """STOCHF
+
+    Fast stochastic returning ``(fastk, fastd)``
+    """
+
+    inputs = ('high', 'low', 'close')
+
+    def __init__(
+            self,
+            fastk_period=5,
+            fastd_period=3,
+            fastd_matype=0):
+        """__init__
+
+        :param fastk_period: fast %K period
+        :param fastd_period: fast %D period
+        :param fastd_matype: fast %D moving average type
+        """
+        self.fastk_period = int(fastk_period)
+        self.high_low = TrailingHighLow(
+            timeperiod=self.fastk_period)
+        self.fastd = build_ma(
+            timeperiod=fastd_period,
+            matype=fastd_matype)
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.high_low.reset()
+        self.fastd.reset()
+        self.value = (NAN, NAN)
+    # end of reset
+
+    def update_fastk(
+            self,
+            high,
+            low,
+            close):
+        """update_fastk
+
+        Return the fast %K for the new bar or ``None``
+        during the lookback
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        :param close: close for the new bar
+        """
+        highest, lowest = self.high_low.update(
+            high,
+            low)
+        if self.high_low.num_bars < self.fastk_period:
+            return None
+        diff = (highest - lowest) / 100.0
+        if diff != 0.0:
+            return (close - lowest) / diff
+        return 0.0
+    # end of update_fastk
+
+    def update(
+            self,
+            high,
+            low,
+            close):
+        """update
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        :param close: close for the new bar
+        """
+        fastk = self.update_fastk(
+            high,
+            low,
+            close)
+        if fastk is None:
+            return self.value
+        fastd = self.fastd.update(fastk)
+        if fastd == fastd:
+            self.value = (fastk, fastd)
+        return self.value
+    # end of update
+
+# end of STOCHF
+
+
+class STOCH(STOCHF):
+    """STOCH
+
+    Slow stochastic returning ``(slowk, slowd)``
+    """
+
+    def __init__(
+            self,
+            fastk_period=5,
+            slowk_period=3,
+            slowk_matype=0,
+            slowd_period=3,
+            slowd_matype=0):
+        """__init__
+
+        :param fastk_period: fast %K period
+        :param slowk_period: slow %K period
+        :param slowk_matype: slow %K moving average type
+        :param slowd_period: slow %D period
+        :param slowd_matype: slow %D moving average type
+        """
+        self.slowk = build_ma(
+            timeperiod=slowk_period,
+            matype=slowk_matype)
+        super().__init__(
+            fastk_period=fastk_period,
+            fastd_period=slowd_period,
+            fastd_matype=slowd_matype)
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.slowk.reset()
+        super().reset()
+    # end of reset
+
+    def update(
+            self,
+            high,
+            low,
+            close):
+        """update
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        :param close: close for the new bar
+        """
+        fastk = self.update_fastk(
+            high,
+            low,
+            close)
+        if fastk is None:
+            return self.value
+        slowk = self.slowk.update(fastk)
+        if slowk != slowk:
+            return self.value
+        slowd = self.fastd.update(slowk)
+        if slowd == slowd:
+            self.value = (slowk, slowd)
+        return self.value
+    # end of update
+
+# end of STOCH
+
+
+class ADX(StreamKernel):
+    """ADX
+
+    Average directional movement index following TA-Lib's
+    Wilder smoothing of the directional movement and true range
+    """
+
+    inputs = ('high', 'low', 'close')
+
+    def __init__(
+            self,
+            timeperiod=14):
+        """__init__
+
+        :param timeperiod: number of bars
+            (default is ``14``)
+        """
+        self.timeperiod = int(timeperiod)
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.num_bars = 0
+        self.prev_high = None
+        self.prev_low = None
+        self.prev_close = None
+        self.minus_dm = 0.0
+        self.plus_dm = 0.0
+        self.tr = 0.0
+        self.sum_dx = 0.0
+        self.value = NAN
+    # end of reset
+
+    def update(
+            self,
+            high,
+            low,
+            close):
+        """update
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        :param close: close for the new bar
+        """
+        self.num_bars += 1
+        if self.num_bars == 1:
+            self.prev_high = high
+            self.prev_low = low
+            self.prev_close = close
+            return NAN
+        timeperiod = self.timeperiod
+        diff_plus = high - self.prev_high
+        diff_minus = self.prev_low - low
+        tr = true_range(
+            high,
+            low,
+            self.prev_close)
+        self.prev_high = high
+        self.prev_low = low
+        self.prev_close = close
+
+        if self.num_bars <= timeperiod:
+            if diff_minus > 0 and diff_plus < diff_minus:
+                self.minus_dm += diff_minus
+            elif diff_plus > 0 and diff_plus > diff_minus:
+                self.plus_dm += diff_plus
+            self.tr += tr
+            return NAN
+
+        self.minus_dm -= self.minus_dm / timeperiod
+        self.plus_dm -= self.plus_dm / timeperiod
+        if diff_minus > 0 and diff_plus < diff_minus:
+            self.minus_dm += diff_minus
+        elif diff_plus > 0 and diff_plus > diff_minus:
+            self.plus_dm += diff_plus
+        self.tr = self.tr - (self.tr / timeperiod) + tr
+
+        dx = None
+        if not is_zero(self.tr):
+            minus_di = 100.0 * (self.minus_dm / self.tr)
+            plus_di = 100.0 * (self.plus_dm / self.tr)
+            total = minus_di + plus_di
+            if not is_zero(total):
+                dx = 100.0 * (abs(minus_di - plus_di) / total)
+
+        if self.num_bars <= 2 * timeperiod:
+            if dx is not None:
+                self.sum_dx += dx
+            if self.num_bars == 2 * timeperiod:
+                self.value = self.sum_dx / timeperiod
+            return self.value
+
+        if dx is not None:
+            self.value = (
+                (self.value * (timeperiod - 1)) + dx) / timeperiod
+        return self.value
+    # end of update
+
+# end of ADX
+
+
+class AD(StreamKernel):
+    """AD
+
+    Chaikin accumulation/distribution line
+    """
+
+    inputs = ('high', 'low', 'close', 'volume')
+
+    def __init__(
+            self):
+        """__init__"""
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.ad = 0.0
+        self.value = NAN
+    # end of reset
+
+    def update(
+            self,
+            high,
+            low,
+            close,
+            volume):
+        """update
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        :param close: close for the new bar
+        :param volume: volume for the new bar
+        """
+        spread = high - low
+        if spread > 0.0:
+            self.ad += (((close - low) - (high - close)) / spread) * volume
+        self.value = self.ad
+        return self.value
+    # end of update
+
+# end of AD
+
+
+class ADOSC(AD):
+    """ADOSC
+
+    Chaikin A/D oscillator. Like TA-Lib both EMAs are seeded
+    with the first A/D value
+    """
+
+    def __init__(
+            self,
+            fastperiod=3,
+            slowperiod=10):
+        """__init__
+
+        :param fastperiod: fast EMA period
+        :param slowperiod: slow EMA period
+        """
+        self.fast_k = 2.0 / (int(fastperiod) + 1)
+        self.slow_k = 2.0 / (int(slowperiod) + 1)
+        self.lookback = max(int(fastperiod), int(slowperiod)) - 1
+        super().__init__()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        super().reset()
+        self.num_bars = 0
+        self.fast_ema = 0.0
+        self.slow_ema = 0.0
+    # end of reset
+
+    def update(
+            self,
+            high,
+            low,
+            close,
+            volume):
+        """update
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        :param close: close for the new bar
+        :param volume: volume for the new bar
+        """
+        ad = super().update(
+            high,
+            low,
+            close,
+            volume)
+        self.num_bars += 1
+        if self.num_bars == 1:
+            self.fast_ema = ad
+            self.slow_ema = ad
+        else:
+            self.fast_ema = (
+                (self.fast_k * ad) + ((1.0 - self.fast_k) * self.fast_ema))
+            self.slow_ema = (
+                (self.slow_k * ad) + ((1.0 - self.slow_k) * self.slow_ema))
+        if self.num_bars <= self.lookback:
+            self.value = NAN
+        else:
+            self.value = self.fast_ema - self.slow_ema
+        return self.value
+    # end of update
+
+# end of ADOSC
+
+
+class OBV(StreamKernel):
+    """OBV"""
+
+    inputs = ('close', 'volume')
+
+    def __init__(
+            self):
+        """__init__"""
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.prev_close = None
+        self.value = NAN
+    # end of reset
+
+    def update(
+            self,
+            close,
+            volume):
+        """update
+
+        :param close: close for the new bar
+        :param volume: volume for the new bar
+        """
+        if self.prev_close is None:
+            self.value = volume
+        elif close > self.prev_close:
+            self.value += volume
+        elif close < self.prev_close:
+            self.value -= volume
+        self.prev_close = close
+        return self.value
+    # end of update
+
+# end of OBV
+
+
+class TRANGE(StreamKernel):
+    """TRANGE"""
+
+    inputs = ('high', 'low', 'close')
+
+    def __init__(
+            self):
+        """__init__"""
+        self.reset()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        self.prev_close = None
+        self.value = NAN
+    # end of reset
+
+    def update(
+            self,
+            high,
+            low,
+            close):
+        """update
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        :param close: close for the new bar
+        """
+        if self.prev_close is not None:
+            self.value = true_range(
+                high,
+                low,
+                self.prev_close)
+        self.prev_close = close
+        return self.value
+    # end of update
+
+# end of TRANGE
+
+
+class ATR(TRANGE):
+    """ATR
+
+    Wilder's average true range seeded with the simple
+    average of the first ``timeperiod`` true ranges
+    """
+
+    def __init__(
+            self,
+            timeperiod=14):
+        """__init__
+
+        :param timeperiod: number of bars
+            (default is ``14``)
+        """
+        self.timeperiod = int(timeperiod)
+        super().__init__()
+    # end of __init__
+
+    def reset(
+            self):
+        """reset"""
+        super().reset()
+        self.num_ranges = 0
+        self.total = 0.0
+        self.atr = NAN
+    # end of reset
+
+    def update_atr(
+            self,
+            high,
+            low,
+            close):
+        """update_atr
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        :param close: close for the new bar
+        """
+        has_range = self.prev_close is not None
+        tr = super().update(
+            high,
+            low,
+            close)
+        if not has_range:
+            return NAN
+        self.num_ranges += 1
+        timeperiod = self.timeperiod
+        if self.num_ranges < timeperiod:
+            self.total += tr
+        elif self.num_ranges == timeperiod:
+            self.total += tr
+            self.atr = self.total / timeperiod
+        else:
+            self.atr *= (timeperiod - 1)
+            self.atr += tr
+            self.atr /= timeperiod
+        return self.atr
+    # end of update_atr
+
+    def update(
+            self,
+            high,
+            low,
+            close):
+        """update
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        :param close: close for the new bar
+        """
+        self.value = self.update_atr(
+            high,
+            low,
+            close)
+        return self.value
+    # end of update
+
+# end of ATR
+
+
+class NATR(ATR):
+    """NATR"""
+
+    def update(
+            self,
+            high,
+            low,
+            close):
+        """update
+
+        :param high: high for the new bar
+        :param low: low for the new bar
+        :param close: close for the new bar
+        """
+        atr = self.update_atr(
+            high,
+            low,
+            close)
+        if atr != atr:
+            self.value = NAN
+        elif not is_zero(close):
+            self.value = (atr / close) * 100.0
+        else:
+            self.value = 0.0
+        return self.value
+    # end of update
+
+# end of NATR
@@ -0,0 +1,399 @@
+"""
+Run many algorithm config variants against one shared
+algorithm-ready dataset
+
+The dataset is loaded (and decoded) once in the parent process.
+Each config variant runs in a forked worker process that inherits
+the already-decoded ``pandas.DataFrame`` datasets copy-on-write,
+so only the integer index of the config is sent to a worker and
+only a small metrics dictionary comes back.
+
+.. code-block:: python
+
+    import json
+    import analysis_engine.sweep_algo as sweep_algo
+
+    config_dict = json.loads(open('./cfg/default_algo.json').read())
+    ranked_df = sweep_algo.run_sweep(
+        config_dict=config_dict,
+        sweep_params={
+            'wr_80_20.num_points': [10, 20, 40],
+            'wr_80_20.buy_below': [-90, -80, -70],
+            'wr_80_20.sell_above': [-30, -20, -10]
+        },
+        load_from_file='/tmp/SPY-latest.json',
+        num_workers=4)
+    print(ranked_df)
+
+Sweep parameter names are either a top-level algo config key
+(like ``buy_shares``) or ``<indicator name>.<indicator key>`` for
+changing a key in one of the config's ``indicators``.
+"""
+
+import copy
+import itertools
+import multiprocessing
+import concurrent.futures
+import pandas as pd
+import analysis_engine.consts as ae_consts
+import analysis_engine.algo as base_algo
+import analysis_engine.load_dataset as load_dataset
+import spylunking.log.setup_logging as log_utils
+
+log = log_utils.build_colorized_logger(name=__name__)
+
+
+# shared dataset and configs inherited by forked sweep workers
+SWEEP_DATA = None
+SWEEP_CONFIGS = None
+SWEEP_ALGO_ARGS = None
+
+
+def set_config_value(
+        config_dict,
+        name,
+        value):
+    """set_config_value
+
+    Set a sweep parameter in an algo config dictionary
+
+    :param config_dict: algo config dictionary to change
+    :param name: top-level config key or
+        ``<indicator name>.<indicator key>``
+    :param value: new value
+    """
+    if '.' not in name:
+        config_dict[name] = value
+        return
+
+    ind_name, ind_key = name.split('.', 1)
+    for ind_node in config_dict.get('indicators', []):
+        if ind_node.get('name', None) == ind_name:
+            ind_node[ind_key] = value
+            return
+    # end of for all indicators
+
+    raise Exception(
+        f'unable to find indicator name={ind_name} for sweep '
+        f'parameter={name} in the algo config indicators')
+# end of set_config_value
+
+
+def build_sweep_configs(
+        config_dict,
+        sweep_params):
+    """build_sweep_configs
+
+    Build the cartesian product of all ``sweep_params`` values
+    as a list of ``(params, config_dict)`` tuples
+
+    :param config_dict: base algo config dictionary
+    :param sweep_params: dictionary of sweep parameter names to a
+        list of values (see ``set_config_value`` for names)
+    """
+    names = list(sweep_params.keys())
+    configs = []
+    for values in itertools.product(*[sweep_params[k] for k in names]):
+        params = dict(zip(names, values))
+        new_config = copy.deepcopy(config_dict)
+        for name in params:
+            set_config_value(
+                config_dict=new_config,
+                name=name,
+                value=params[name])
+        configs.append((params, new_config))
+    # end of for all combinations
+    return configs
+# end of build_sweep_configs
+
+
+def copy_dataset_nodes(
+        data):
+    """copy_dataset_nodes
+
+    Shallow copy each ticker's dataset nodes so an algorithm can
+    swap dataframes in ``node['data']`` without changing the shared
+    dataset (the ``pandas.DataFrame`` objects are not copied)
+
+    :param data: algorithm-ready dataset dictionary
+    """
+    new_data = {}
+    for ticker in data:
+        new_data[ticker] = []
+        for node in data[ticker]:
+            new_node = dict(node)
+            new_node['data'] = dict(node['data'])
+            new_data[ticker].append(new_node)
+    return new_data
+# end of copy_dataset_nodes
+
+
+def get_max_drawdown(
+        values):
+    """get_max_drawdown
+
+    Largest peak-to-trough drop as a fraction of the peak
+
+    :param values: list of account values in time order
+    """
+    max_drawdown = 0.0
+    peak = None
+    for value in values:
+        if value is None:
+            continue
+        if peak is None or value > peak:
+            peak = value
+        elif peak > 0:
+            drawdown = (peak - value) / peak
+            if drawdown > max_drawdown:
+                max_drawdown = drawdown
+    return max_drawdown
+# end of get_max_drawdown
+
+
+def build_sweep_result(
+        config_idx,
+        params,
+        algo):
+    """build_sweep_result
+
+    Summarize a finished algorithm for the ranked sweep table
+
+    :param config_idx: index of the config in the sweep
+    :param params: sweep parameters for this config
+    :param algo: ``BaseAlgo`` that finished its backtest
+    """
+    num_buys = len(algo.buys)
+    num_sells = len(algo.sells)
+    values = [
+        balance if net_value is None else net_value
+        for net_value, balance in zip(
+            algo.get_history_column('net_value'),
+            algo.get_history_column('balance'))
+    ]
+    res = {
+        'config_idx': config_idx,
+        'balance': algo.get_balance(),
+        'net_value': values[-1] if values else algo.get_balance(),
+        'num_trades': num_buys + num_sells,
+        'num_buys': num_buys,
+        'num_sells': num_sells,
+        'max_drawdown': get_max_drawdown(values)
+    }
+    res.update(params)
+    return res
+# end of build_sweep_result
+
+
+def run_sweep_config(
+        config_idx):
+    """run_sweep_config
+
+    Run one config from the shared sweep state. This is
+    the task function for forked sweep workers
+
+    :param config_idx: index of the config in ``SWEEP_CONFIGS``
+    """
+    params, config_dict = SWEEP_CONFIGS[config_idx]
+    algo_class = SWEEP_ALGO_ARGS['algo_class']
+    algo = algo_class(
+        ticker=config_dict.get(
+            'ticker',
+            SWEEP_ALGO_ARGS['ticker']),
+        balance=config_dict.get(
+            'balance',
+            SWEEP_ALGO_ARGS['balance']),
+        commission=config_dict.get(
+            'commission',
+            SWEEP_ALGO_ARGS['commission']),
+        config_dict=config_dict,
+        publish_to_slack=False,
+        publish_to_s3=False,
+        publish_to_redis=False,
+        raise_on_err=SWEEP_ALGO_ARGS['raise_on_err'])
+    algo.handle_data(
+        data=copy_dataset_nodes(SWEEP_DATA))
+    return build_sweep_result(
+        config_idx=config_idx,
+        params=params,
+        algo=algo)
+# end of run_sweep_config
+
+
+def init_sweep_worker(
+        data,
+        configs,
+        algo_args):
+    """init_sweep_worker
+
+    ``ProcessPoolExecutor`` initializer that stores the shared
+    sweep state in the forked worker
+
+    :param data: algorithm-ready dataset dictionary
+    :param configs: list of ``(params, config_dict)`` tuples
+    :param algo_args: dictionary of algorithm constructor values
+    """
+    global SWEEP_DATA
+    global SWEEP_CONFIGS
+    global SWEEP_ALGO_ARGS
+    SWEEP_DATA = data
+    SWEEP_CONFIGS = configs
+    SWEEP_ALGO_ARGS = algo_args
+# end of init_sweep_worker
+
+
+def run_sweep(
+        config_dict=None,
+        sweep_params=None,
+        configs=None,
+        data=None,
+        load_from_file=None,
+        load_from_s3_bucket=None,
+        load_from_s3_key=None,
+        load_from_redis_key=None,
+        load_compress=False,
+        algo_class=None,
+        ticker='SPY',
+        balance=10000.0,
+        commission=6.0,
+        num_workers=None,
+        sort_by='net_value',
+        raise_on_err=True,
+        verbose=False):
+    """run_sweep
+
+    Load an algorithm-ready dataset once and backtest every
+    config variant against it. Returns a ``pandas.DataFrame``
+    ranked by ``sort_by`` (best first) with columns:
+    ``rank``, ``config_idx``, ``balance``, ``net_value``,
+    ``num_trades``, ``num_buys``, ``num_sells``,
+    ``max_drawdown`` and one column per sweep parameter
+
+    :param config_dict: base algo config dictionary
+        used with ``sweep_params``
+    :param sweep_params: dictionary of sweep parameter names
+        to a list of values (see ``build_sweep_configs``)
+    :param configs: optional - list of ``(params, config_dict)``
+        tuples to run instead of ``config_dict`` and
+        ``sweep_params``
+    :param data: optional - already loaded algorithm-ready
+        dataset dictionary
+    :param load_from_file: optional - path to an
+        algorithm-ready dataset file
+    :param load_from_s3_bucket: optional - s3 bucket holding
+        an algorithm-ready dataset
+    :param load_from_s3_key: optional - s3 key for an
+        algorithm-ready dataset
+    :param load_from_redis_key: optional - redis key for an
+        algorithm-ready dataset
+    :param load_compress: optional - boolean flag for
+        decompressing the loaded dataset
+    :param algo_class: optional - derived ``BaseAlgo`` class
+        (default is ``analysis_engine.algo.BaseAlgo``)
+    :param ticker: ticker if the config does not set one
+    :param balance: balance if the config does not set one
+    :param commission: commission if the config does not set one
+    :param num_workers: optional - number of forked worker
+        processes (default is the number of cpus). ``1``
+        runs every config in this process
+    :param sort_by: column for ranking the results
+        (default is ``net_value`` which includes the value of
+        any shares still owned) - ``max_drawdown`` ranks
+        the smallest drawdown first
+    :param raise_on_err: boolean - raise algorithm errors
+    :param verbose: optional - boolean for more logging
+    """
+    if not configs:
+        if not config_dict or not sweep_params:
+            raise Exception(
+                'please provide configs or a config_dict '
+                'with sweep_params to run a sweep')
+        configs = build_sweep_configs(
+            config_dict=config_dict,
+            sweep_params=sweep_params)
+
+    if not data:
+        data = load_dataset.load_dataset(
+            path_to_file=load_from_file,
+            compress=load_compress,
+            redis_enabled=(load_from_redis_key is not None),
+            redis_key=load_from_redis_key,
+            redis_address=ae_consts.REDIS_ADDRESS,
+            redis_db=ae_consts.REDIS_DB,
+            redis_password=ae_consts.REDIS_PASSWORD,
+            s3_enabled=(load_from_s3_key is not None),
+            s3_key=load_from_s3_key,
+            s3_bucket=load_from_s3_bucket,
+            s3_address=ae_consts.S3_ADDRESS,
+            s3_access_key=ae_consts.S3_ACCESS_KEY,
+            s3_secret_key=ae_consts.S3_SECRET_KEY,
+            s3_region_name=ae_consts.S3_REGION_NAME,
+            s3_secure=ae_consts.S3_SECURE,
+            verbose=verbose)
+    if not data:
+        raise Exception(
+            'unable to load a dataset for the sweep from '
+            f'file={load_from_file} s3={load_from_s3_key} '
+            f'redis={load_from_redis_key}')
+
+    algo_args = {
+        'algo_class': algo_class or base_algo.BaseAlgo,
+        'ticker': ticker,
+        'balance': balance,
+        'commission': commission,
+        'raise_on_err': raise_on_err
+    }
+
+    num_configs = len(configs)
+    if not num_workers:
+        num_workers = multiprocessing.cpu_count()
+    num_workers = min(
+        num_workers,
+        num_configs)
+    use_workers = (
+        num_workers > 1 and
+        'fork' in multiprocessing.get_all_start_methods())
+
+    log.info(
+        f'sweep start - configs={num_configs} '
+        f'workers={num_workers if use_workers else 1}')
+
+    if use_workers:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context('fork'),
+                initializer=init_sweep_worker,
+                initargs=(data, configs, algo_args)) as executor:
+            results = list(executor.map(
+                run_sweep_config,
+                range(num_configs)))
+    else:
+        init_sweep_worker(
+            data=data,
+            configs=configs,
+            algo_args=algo_args)
+        results = []
+        for config_idx in range(num_configs):
+            results.append(run_sweep_config(config_idx))
+            if verbose:
+                log.info(
+                    f'sweep - done {config_idx + 1}/{num_configs}')
+    # end of running all configs
+
+    # a smaller drawdown is better, everything else ranks
+    # the largest value first
+    best_is_lowest = (sort_by == 'max_drawdown')
+    ranked_df = pd.DataFrame(results)
+    ranked_df = ranked_df.sort_values(
+        by=[sort_by, 'config_idx'],
+        ascending=[best_is_lowest, True]).reset_index(drop=True)
+    ranked_df.insert(
+        0,
+        'rank',
+        range(1, len(ranked_df.index) + 1))
+
+    log.info(
+        f'sweep done - configs={num_configs} '
+        f'best {sort_by}={ranked_df[sort_by].iloc[0]}')
+    return ranked_df
+# end of run_sweep
@@ -0,0 +1,173 @@
+"""
+Per-bar memoization for TA-Lib calls shared by indicators
+
+Algorithm configs often hold several indicators that make the same
+TA-Lib call with different buy and sell thresholds (like two
+``williamsr`` indicators with the same ``num_points``). The
+``IndicatorProcessor`` owns one ``TACache`` and clears it at the
+start of every ``process`` call, and ``ae_talib.cached`` stores each
+result under the function, inputs, parameters, dataset and bar so
+the same computation only runs once per bar.
+
+``TACache.get_summary()`` returns the totals for the run (also in
+the algorithm's ``get_result()['perf']['ta_cache']``):
+
+.. code-block:: python
+
+    {
+        'enabled': True,
+        'hits': 990,
+        'misses': 990,
+        'hit_rate': 50.0
+    }
+
+Set ``"ta_cache": false`` in the algorithm config to turn it off.
+The cache is shared by the ``indicator_workers`` threads. A thread
+that asks for a key another thread is still computing waits for
+that result, so the counts match a run without threads.
+"""
+
+import threading
+import concurrent.futures
+
+
+class TACache:
+    """TACache
+
+    Memoize ``ae_talib`` results for the current bar
+    """
+
+    def __init__(
+            self,
+            enabled=True):
+        """__init__
+
+        :param enabled: optional - boolean for storing results
+            (default is ``True``)
+        """
+        self.enabled = enabled
+        self.values = {}
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_bar_hits = 0
+        self.num_bar_misses = 0
+        self.lock = threading.Lock()
+    # end of __init__
+
+    def __getstate__(
+            self):
+        """__getstate__
+
+        Drop the lock and the current bar's results
+        when pickling
+        """
+        state = self.__dict__.copy()
+        del state['lock']
+        state['values'] = {}
+        return state
+    # end of __getstate__
+
+    def __setstate__(
+            self,
+            state):
+        """__setstate__
+
+        :param state: pickled dictionary
+        """
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+    # end of __setstate__
+
+    def start_bar(
+            self):
+        """start_bar
+
+        Drop the previous bar's results and reset
+        the per-bar counters
+        """
+        if self.values:
+            self.values = {}
+        self.num_bar_hits = 0
+        self.num_bar_misses = 0
+    # end of start_bar
+
+    def reset_counts(
+            self):
+        """reset_counts
+
+        Reset the total and per-bar counters
+        """
+        self.num_hits = 0
+        self.num_misses = 0
+        self.num_bar_hits = 0
+        self.num_bar_misses = 0
+    # end of reset_counts
+
+    def get(
+            self,
+            key,
+            compute):
+        """get
+
+        Return the stored result for ``key`` (waiting if another
+        thread is still computing it) or call ``compute()`` and
+        store its result
+
+        :param key: hashable key for the computation
+        :param compute: function with no arguments
+        """
+        if not self.enabled:
+            return compute()
+        is_owner = False
+        try:
+            hash(key)
+        except TypeError:
+            # unhashable parameters are not memoized
+            return compute()
+        with self.lock:
+            pending = self.values.get(key, None)
+            if pending is not None:
+                self.num_hits += 1
+                self.num_bar_hits += 1
+            else:
+                self.num_misses += 1
+                self.num_bar_misses += 1
+                pending = concurrent.futures.Future()
+                self.values[key] = pending
+                is_owner = True
+        if not is_owner:
+            return pending.result()
+        try:
+            res = compute()
+        except Exception as e:
+            pending.set_exception(e)
+            with self.lock:
+                if self.values.get(key, None) is pending:
+                    del self.values[key]
+            raise
+        pending.set_result(res)
+        return res
+    # end of get
+
+    def get_summary(
+            self):
+        """get_summary
+
+        Get the total hits and misses as a
+        JSON-serializable dictionary
+        """
+        num_calls = self.num_hits + self.num_misses
+        hit_rate = 0.0
+        if num_calls:
+            hit_rate = round(
+                100.0 * self.num_hits / num_calls,
+                2)
+        return {
+            'enabled': self.enabled,
+            'hits': self.num_hits,
+            'misses': self.num_misses,
+            'hit_rate': hit_rate
+        }
+    # end of get_summary
+
+# end of TACache
@@ -30,6 +30,7 @@ def extract_option_calls_dataset(
         date=None,
         work_dict=None,
         scrub_mode='sort-by-date',
+        redis_rec=None,
         verbose=False):
     """extract_option_calls_dataset
 
@@ -52,6 +53,8 @@ def extract_option_calls_dataset(
     :param work_dict: dictionary of args
     :param scrub_mode: optional - string type of
         scrubbing handler to run
+    :param redis_rec: optional - ``get_data_from_redis_key``
+        result already fetched for the redis key
     :param verbose: optional - boolean for turning on logging
     """
     label = 'extract_td_calls'
@@ -94,14 +97,15 @@ def extract_option_calls_dataset(
     calls_df = None
     status = ae_consts.NOT_RUN
     try:
-        redis_rec = redis_get.get_data_from_redis_key(
-            label=label,
-            host=redis_host,
-            port=redis_port,
-            db=redis_db,
-            password=redis_password,
-            key=redis_key,
-            decompress_df=True)
+        if not redis_rec:
+            redis_rec = redis_get.get_data_from_redis_key(
+                label=label,
+                host=redis_host,
+                port=redis_port,
+                db=redis_db,
+                password=redis_password,
+                key=redis_key,
+                decompress_df=True)
 
         status = redis_rec['status']
         if verbose:
@@ -111,21 +115,28 @@ def extract_option_calls_dataset(
 
         if status == ae_consts.SUCCESS:
             calls_json = None
-            if 'tdcalls' in redis_rec['rec']['data']:
+            if ae_consts.is_df(df=redis_rec['rec']['data']):
+                calls_json = redis_rec['rec']['data']
+            elif 'tdcalls' in redis_rec['rec']['data']:
                 calls_json = redis_rec['rec']['data']['tdcalls']
             elif 'calls' in redis_rec['rec']['data']:
                 calls_json = redis_rec['rec']['data']['calls']
             else:
                 calls_json = redis_rec['rec']['data']
-            if not calls_json:
+            if (
+                    not ae_consts.is_df(df=calls_json) and
+                    not calls_json):
                 return ae_consts.SUCCESS, pd.DataFrame([])
             if verbose:
                 log.info(f'{label} - {df_str} redis convert calls to df')
             exp_date_str = None
             try:
-                calls_df = pd.read_json(
-                    calls_json,
-                    orient='records')
+                if ae_consts.is_df(df=calls_json):
+                    calls_df = calls_json
+                else:
+                    calls_df = pd.read_json(
+                        calls_json,
+                        orient='records')
                 if len(calls_df.index) == 0:
                     return ae_consts.SUCCESS, pd.DataFrame([])
                 if 'date' not in calls_df:
@@ -244,6 +255,7 @@ def extract_option_puts_dataset(
         date=None,
         work_dict=None,
         scrub_mode='sort-by-date',
+        redis_rec=None,
         verbose=False):
     """extract_option_puts_dataset
 
@@ -266,6 +278,8 @@ def extract_option_puts_dataset(
     :param work_dict: dictionary of args
     :param scrub_mode: optional - string type of
         scrubbing handler to run
+    :param redis_rec: optional - ``get_data_from_redis_key``
+        result already fetched for the redis key
     :param verbose: optional - boolean for turning on logging
     """
     label = 'extract_td_puts'
@@ -308,14 +322,15 @@ def extract_option_puts_dataset(
     puts_df = None
     status = ae_consts.NOT_RUN
     try:
-        redis_rec = redis_get.get_data_from_redis_key(
-            label=label,
-            host=redis_host,
-            port=redis_port,
-            db=redis_db,
-            password=redis_password,
-            key=redis_key,
-            decompress_df=True)
+        if not redis_rec:
+            redis_rec = redis_get.get_data_from_redis_key(
+                label=label,
+                host=redis_host,
+                port=redis_port,
+                db=redis_db,
+                password=redis_password,
+                key=redis_key,
+                decompress_df=True)
 
         status = redis_rec['status']
         if verbose:
@@ -325,20 +340,27 @@ def extract_option_puts_dataset(
 
         if status == ae_consts.SUCCESS:
             puts_json = None
-            if 'tdputs' in redis_rec['rec']['data']:
+            if ae_consts.is_df(df=redis_rec['rec']['data']):
+                puts_json = redis_rec['rec']['data']
+            elif 'tdputs' in redis_rec['rec']['data']:
                 puts_json = redis_rec['rec']['data']['tdputs']
             if 'puts' in redis_rec['rec']['data']:
                 puts_json = redis_rec['rec']['data']['puts']
             else:
                 puts_json = redis_rec['rec']['data']
-            if not puts_json:
+            if (
+                    not ae_consts.is_df(df=puts_json) and
+                    not puts_json):
                 return ae_consts.SUCCESS, pd.DataFrame([])
             if verbose:
                 log.info(f'{label} - {df_str} redis convert puts to df')
             try:
-                puts_df = pd.read_json(
-                    puts_json,
-                    orient='records')
+                if ae_consts.is_df(df=puts_json):
+                    puts_df = puts_json
+                else:
+                    puts_df = pd.read_json(
+                        puts_json,
+                        orient='records')
                 if len(puts_df.index) == 0:
                     return ae_consts.SUCCESS, pd.DataFrame([])
                 if 'date' not in puts_df:
@@ -0,0 +1,217 @@
+"""
+Aligned ``(tickers, bars)`` pricing matrices for computing an
+indicator across many tickers at once
+
+``TickerMatrix`` lines up each ticker's ``daily`` or ``minute``
+``pd.DataFrame`` on the union of their ``date`` values. Each
+``open``, ``high``, ``low``, ``close`` and ``volume`` column becomes
+a ``(tickers, dates)`` ``float64`` matrix with ``nan`` where a
+ticker has no row for the date.
+
+``compute`` calls ``analysis_engine.ae_talib.rows`` once for each
+group of tickers covering the same contiguous run of dates (usually
+the whole universe) and returns every ticker's values indexed by
+the ticker's own rows, so they match calling the wrapper on the
+ticker's ``pd.DataFrame``. Tickers with gaps (or without a ``date``
+column) are computed on their own.
+
+.. code-block:: python
+
+    import analysis_engine.ticker_matrix as ticker_matrix
+    matrix = ticker_matrix.TickerMatrix(
+        frames={
+            'SPY': spy_daily_df,
+            'QQQ': qqq_daily_df
+        },
+        uses_data='daily')
+    closes = matrix.arrays['close']
+    willr = matrix.compute(
+        func='WILLR',
+        cols=['high', 'low', 'close'],
+        timeperiod=14)
+    spy_willr = willr['SPY']
+"""
+
+import numpy as np
+import pandas as pd
+import analysis_engine.ae_talib as ae_talib
+import analysis_engine.ohlcv_bundle as ohlcv_bundle
+
+
+class TickerMatrix:
+    """TickerMatrix
+
+    Align many tickers' pricing columns into
+    ``(tickers, dates)`` matrices
+    """
+
+    def __init__(
+            self,
+            frames,
+            columns=None,
+            uses_data=None,
+            date_column='date'):
+        """__init__
+
+        :param frames: dictionary of ticker to ``pd.DataFrame``
+        :param columns: optional - list of columns to convert
+            (default is ``OHLCV_COLUMNS``)
+        :param uses_data: optional - name of the dataset
+            like ``minute`` or ``daily``
+        :param date_column: optional - name of the column
+            the rows are aligned on (default is ``date``)
+        """
+        self.uses_data = uses_data
+        self.columns = columns
+        if not self.columns:
+            self.columns = ohlcv_bundle.OHLCV_COLUMNS
+        self.tickers = []
+        self.bundles = {}
+        ticker_dates = {}
+        for ticker, df in frames.items():
+            if not hasattr(df, 'index') or len(df.index) == 0:
+                continue
+            self.tickers.append(ticker)
+            self.bundles[ticker] = ohlcv_bundle.OHLCVBundle(
+                df=df,
+                columns=self.columns,
+                uses_data=uses_data)
+            ticker_dates[ticker] = None
+            if date_column in df:
+                dates = pd.to_datetime(
+                    df[date_column],
+                    errors='coerce',
+                    utc=True).dt.tz_localize(None).to_numpy()
+                # unsorted, duplicated or missing dates
+                # cannot be aligned
+                if (not np.isnat(dates).any() and
+                        (np.diff(dates) > np.timedelta64(0)).all()):
+                    ticker_dates[ticker] = dates
+        # end of for all tickers
+
+        self.rows = {
+            ticker: row
+            for row, ticker in enumerate(self.tickers)
+        }
+        aligned = [
+            dates
+            for dates in ticker_dates.values()
+            if dates is not None
+        ]
+        if aligned:
+            self.dates = np.unique(np.concatenate(aligned))
+        else:
+            self.dates = np.array([], dtype='datetime64[ns]')
+        self.num_dates = len(self.dates)
+
+        # (start, end) columns for tickers covering a contiguous
+        # run of dates or None for tickers computed on their own
+        self.spans = {}
+        self.positions = {}
+        for ticker in self.tickers:
+            dates = ticker_dates[ticker]
+            self.spans[ticker] = None
+            if dates is None:
+                continue
+            positions = np.searchsorted(self.dates, dates)
+            self.positions[ticker] = positions
+            start = int(positions[0])
+            end = int(positions[-1]) + 1
+            if end - start == len(positions):
+                self.spans[ticker] = (start, end)
+        # end of for all tickers
+
+        self.arrays = {}
+        for col in self.columns:
+            values = np.full(
+                (len(self.tickers), self.num_dates),
+                np.nan,
+                dtype=np.float64)
+            for ticker, positions in self.positions.items():
+                bundle = self.bundles[ticker]
+                if col in bundle:
+                    values[self.rows[ticker], positions] = bundle.get(col)
+            values.setflags(write=False)
+            self.arrays[col] = values
+        # end of for all columns
+    # end of __init__
+
+    def __len__(
+            self):
+        """__len__"""
+        return len(self.tickers)
+    # end of __len__
+
+    def get_groups(
+            self):
+        """get_groups
+
+        Get a list of ``(tickers, span)`` tuples where each
+        group's tickers cover the same ``(start, end)`` columns
+        of the matrices. Tickers that cannot be aligned are in
+        their own group with a ``None`` span
+        """
+        groups = {}
+        alone = []
+        for ticker in self.tickers:
+            span = self.spans[ticker]
+            if span is None:
+                alone.append(([ticker], None))
+            else:
+                groups.setdefault(span, []).append(ticker)
+        return [
+            (tickers, span)
+            for span, tickers in groups.items()
+        ] + alone
+    # end of get_groups
+
+    def compute(
+            self,
+            func,
+            cols,
+            timeperiod):
+        """compute
+
+        Call ``ae_talib.rows`` for every group of aligned
+        tickers and return a dictionary of ticker to a
+        ``numpy.float64`` array with a value for each of the
+        ticker's rows. Tickers missing one of the ``cols``
+        are not in the dictionary
+
+        :param func: name of the ``ae_talib`` wrapper
+            like ``WILLR`` or ``RSI``
+        :param cols: list of column names in the
+            wrapper's argument order
+        :param timeperiod: period for the wrapper
+        """
+        values = {}
+        for tickers, span in self.get_groups():
+            tickers = [
+                ticker
+                for ticker in tickers
+                if all(col in self.bundles[ticker] for col in cols)
+            ]
+            if not tickers:
+                continue
+            if span is None:
+                inputs = [
+                    self.bundles[tickers[0]].get(col)[None, :]
+                    for col in cols
+                ]
+            else:
+                rows = [self.rows[ticker] for ticker in tickers]
+                inputs = [
+                    self.arrays[col][rows, span[0]:span[1]]
+                    for col in cols
+                ]
+            res = ae_talib.rows(
+                func,
+                timeperiod,
+                *inputs)
+            for idx, ticker in enumerate(tickers):
+                values[ticker] = res[idx]
+        # end of for all groups
+        return values
+    # end of compute
+
+# end of TickerMatrix
@@ -0,0 +1,365 @@
+"""
+Columnar trading history recorder
+
+Stores each trading history record's keys in typed, growable
+columns instead of keeping one dictionary per bar. ``bool``, ``int``
+and ``float`` values go into ``numpy`` arrays that double their
+capacity when full, and every other value (strings, ``None``,
+dates) goes into a python list. A column that sees a value of a
+different type is converted to a python list so every value
+round-trips exactly. Columns that keep the same value on every
+row (like the unused option spread keys) only store that value
+once.
+
+The recorder supports the same ``append``, ``extend``, ``len``,
+iteration and indexing as the ``list`` of dictionaries in
+``BaseAlgo.order_history``, and only builds dictionaries or a
+``pandas.DataFrame`` when exporting:
+
+.. code-block:: python
+
+    import analysis_engine.trade_history_recorder as history_recorder
+    recorder = history_recorder.TradeHistoryRecorder()
+    recorder.append({'ticker': 'SPY', 'close': 280.1, 'num_owned': 10})
+    recorder.append({'ticker': 'SPY', 'close': 280.3, 'num_owned': 20})
+    print(recorder.get_column('close'))
+    print(recorder.to_df())
+    records = recorder.to_records()
+
+``append`` also takes a list of ``keys`` and ``values`` (like the
+``IndicatorProcessor.get_flat_report()`` buffer) that are written
+into the row's columns after the record's keys without merging them
+into the record dictionary first.
+"""
+
+import itertools
+import numpy as np
+import pandas as pd
+
+
+# python type to numpy dtype for typed columns
+COLUMN_DTYPES = {
+    bool: np.bool_,
+    int: np.int64,
+    float: np.float64
+}
+
+
+class TradeHistoryRecorder:
+    """TradeHistoryRecorder
+
+    Columnar store for trading history records
+    """
+
+    def __init__(
+            self,
+            capacity=1024):
+        """__init__
+
+        :param capacity: optional - starting number of rows
+            for each typed column (default is ``1024``)
+        """
+        self.capacity = max(1, int(capacity))
+        self.num_rows = 0
+        # column name to a typed numpy.ndarray, a python list
+        # or None for constant columns in the order the keys
+        # were first seen
+        self.columns = {}
+        # column name to the python type stored in a typed column
+        self.column_types = {}
+        # column name to the single value of a constant column
+        self.constants = {}
+        # column name to a set of row positions missing the key
+        self.missing = {}
+    # end of __init__
+
+    def __len__(
+            self):
+        """__len__"""
+        return self.num_rows
+    # end of __len__
+
+    def __iter__(
+            self):
+        """__iter__
+
+        Yield each row as a trading history dictionary
+        """
+        return iter(self.to_records())
+    # end of __iter__
+
+    def __getitem__(
+            self,
+            idx):
+        """__getitem__
+
+        Build the trading history dictionary for one row
+
+        :param idx: row position (supports negative positions)
+        """
+        if idx < 0:
+            idx += self.num_rows
+        if idx < 0 or idx >= self.num_rows:
+            raise IndexError(
+                f'history row={idx} out of range rows={self.num_rows}')
+        row = {}
+        for key, values in self.columns.items():
+            if idx in self.missing[key]:
+                continue
+            if values is None:
+                row[key] = self.constants[key]
+            elif key in self.column_types:
+                row[key] = values[idx].item()
+            else:
+                row[key] = values[idx]
+        return row
+    # end of __getitem__
+
+    def add_column(
+            self,
+            key,
+            val):
+        """add_column
+
+        Create a constant column for a new key and mark all
+        previous rows as missing the key
+
+        :param key: column name
+        :param val: first value for the column
+        """
+        self.columns[key] = None
+        self.constants[key] = val
+        self.missing[key] = set(range(self.num_rows))
+    # end of add_column
+
+    def convert_constant(
+            self,
+            key,
+            val):
+        """convert_constant
+
+        Convert a constant column to a typed column if ``val``
+        has the same ``bool``, ``int`` or ``float`` type as the
+        constant value, otherwise to a python list
+
+        :param key: column name
+        :param val: next value for the column
+        """
+        const_val = self.constants.pop(key)
+        const_type = type(const_val)
+        if const_type is type(val) and const_type in COLUMN_DTYPES:
+            try:
+                values = np.zeros(
+                    self.capacity,
+                    dtype=COLUMN_DTYPES[const_type])
+                values[:self.num_rows] = const_val
+                self.columns[key] = values
+                self.column_types[key] = const_type
+                return
+            except OverflowError:
+                pass
+        self.columns[key] = [const_val] * self.num_rows
+    # end of convert_constant
+
+    def convert_to_list(
+            self,
+            key):
+        """convert_to_list
+
+        Convert a typed column to a python list for storing
+        values of any type
+
+        :param key: column name
+        """
+        self.columns[key] = self.columns[key][:self.num_rows].tolist()
+        self.column_types.pop(key, None)
+    # end of convert_to_list
+
+    def grow(
+            self):
+        """grow
+
+        Double the capacity of every typed column
+        """
+        self.capacity *= 2
+        for key in self.column_types:
+            values = self.columns[key]
+            new_values = np.zeros(
+                self.capacity,
+                dtype=values.dtype)
+            new_values[:self.num_rows] = values[:self.num_rows]
+            self.columns[key] = new_values
+    # end of grow
+
+    def append(
+            self,
+            record,
+            keys=None,
+            values=None):
+        """append
+
+        Add one trading history dictionary as a new row
+
+        :param record: trading history dictionary
+        :param keys: optional - list of more keys for the row
+            (a key already in ``record`` is overwritten)
+        :param values: optional - list of values for ``keys``
+        """
+        row_idx = self.num_rows
+        if row_idx >= self.capacity:
+            self.grow()
+
+        items = record.items()
+        row_keys = record
+        if keys is not None:
+            items = itertools.chain(
+                items,
+                zip(keys, values))
+            row_keys = set(record)
+            row_keys.update(keys)
+
+        for key, val in items:
+            if key not in self.columns:
+                self.add_column(
+                    key=key,
+                    val=val)
+            if self.columns[key] is None:
+                if val is self.constants[key]:
+                    continue
+                self.convert_constant(
+                    key=key,
+                    val=val)
+            val_type = self.column_types.get(key, None)
+            if val_type is not None:
+                if type(val) is val_type:
+                    try:
+                        self.columns[key][row_idx] = val
+                        continue
+                    except OverflowError:
+                        pass
+                self.convert_to_list(key)
+            col_values = self.columns[key]
+            if len(col_values) == row_idx:
+                col_values.append(val)
+            else:
+                col_values[row_idx] = val
+        # end of for all keys in the record
+
+        # keep each python list column aligned with the rows
+        if len(row_keys) != len(self.columns):
+            for key, col_values in self.columns.items():
+                if key in row_keys:
+                    continue
+                self.missing[key].add(row_idx)
+                if (col_values is not None and
+                        key not in self.column_types):
+                    col_values.append(None)
+        # end of marking keys missing from this record
+
+        self.num_rows += 1
+    # end of append
+
+    def extend(
+            self,
+            records):
+        """extend
+
+        Add each trading history dictionary in ``records``
+
+        :param records: ``list`` of trading history dictionaries
+            or another ``TradeHistoryRecorder``
+        """
+        for record in records:
+            self.append(record)
+    # end of extend
+
+    def get_column(
+            self,
+            key):
+        """get_column
+
+        Get a python list of every row's value for ``key``
+        (``None`` for rows missing the key)
+
+        :param key: column name
+        """
+        if key not in self.columns:
+            return [None] * self.num_rows
+        values = self.columns[key]
+        if values is None:
+            values = [self.constants[key]] * self.num_rows
+        elif key in self.column_types:
+            values = values[:self.num_rows].tolist()
+        else:
+            values = list(values)
+        for row_idx in self.missing[key]:
+            values[row_idx] = None
+        return values
+    # end of get_column
+
+    def to_records(
+            self):
+        """to_records
+
+        Export the rows as a ``list`` of trading history
+        dictionaries matching the default ``BaseAlgo.order_history``
+        """
+        keys = list(self.columns.keys())
+        column_values = [
+            self.get_column(key)
+            for key in keys
+        ]
+        has_missing = any(
+            self.missing[key]
+            for key in keys)
+        records = []
+        for row_idx, row_values in enumerate(zip(*column_values)):
+            row = dict(zip(keys, row_values))
+            if has_missing:
+                for key in keys:
+                    if row_idx in self.missing[key]:
+                        row.pop(key)
+            records.append(row)
+        # end of for all rows
+        if not keys:
+            records = [{} for _ in range(self.num_rows)]
+        return records
+    # end of to_records
+
+    def to_df(
+            self):
+        """to_df
+
+        Export the rows as a ``pandas.DataFrame`` with one
+        column per history key
+        """
+        df_columns = {}
+        for key in self.columns:
+            if key in self.column_types and not self.missing[key]:
+                df_columns[key] = self.columns[key][:self.num_rows]
+            else:
+                df_columns[key] = self.get_column(key)
+        return pd.DataFrame(
+            df_columns,
+            index=range(self.num_rows))
+    # end of to_df
+
+    def get_nbytes(
+            self):
+        """get_nbytes
+
+        Approximate number of bytes used by the columns
+        (typed arrays plus the list pointers)
+        """
+        nbytes = 0
+        for key, values in self.columns.items():
+            if values is None:
+                nbytes += 8
+            elif key in self.column_types:
+                nbytes += values.nbytes
+            else:
+                nbytes += 8 * len(values)
+        return nbytes
+    # end of get_nbytes
+
+# end of TradeHistoryRecorder
@@ -48,9 +48,9 @@ analysis_engine/api_requests.py#L300>`__
 """
 
 import datetime
-import redis
 import celery.task as celery_task
 import analysis_engine.consts as ae_consts
+import analysis_engine.redis_pool as redis_pool
 import analysis_engine.build_result as build_result
 import analysis_engine.api_requests as api_requests
 import analysis_engine.get_data_from_redis_key as redis_get
@@ -213,7 +213,7 @@ def prepare_pricing_dataset(
                 f'{label} connecting redis={redis_host}:{redis_port} '
                 f'db={redis_db} key={redis_key} '
                 f'updated={updated} expire={redis_expire}')
-            rc = redis.Redis(
+            rc = redis_pool.get_client(
                 host=redis_host,
                 port=redis_port,
                 password=redis_password,
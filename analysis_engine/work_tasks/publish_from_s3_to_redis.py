@@ -40,9 +40,9 @@ analysis_engine/api_requests.py#L386>`__
 """
 
 import boto3
-import redis
 import celery.task as celery_task
 import analysis_engine.consts as ae_consts
+import analysis_engine.redis_pool as redis_pool
 import analysis_engine.build_result as build_result
 import analysis_engine.get_task_results as get_task_results
 import analysis_engine.work_tasks.custom_task as custom_task
@@ -265,7 +265,7 @@ def publish_from_s3_to_redis(
                         f'expire={redis_expire}')
                 # end of if/else
 
-                rc = redis.Redis(
+                rc = redis_pool.get_client(
                     host=redis_host,
                     port=redis_port,
                     password=redis_password,
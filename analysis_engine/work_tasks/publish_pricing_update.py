@@ -41,11 +41,12 @@ analysis_engine/api_requests.py#L344>`__
 """
 
 import boto3
-import redis
 import json
 import zlib
 import analysis_engine.consts as ae_consts
+import analysis_engine.redis_pool as redis_pool
 import analysis_engine.build_result as build_result
+import analysis_engine.compress_data as compress_data
 import analysis_engine.get_task_results as get_task_results
 import analysis_engine.work_tasks.custom_task as custom_task
 import analysis_engine.set_data_in_redis_key as redis_set
@@ -70,6 +71,11 @@ def publish_pricing_update(
     - news - turn off with ``work_dict.get_news = False``
     - options - turn off with ``work_dict.get_options = False``
 
+    Set ``df`` in ``work_dict`` to cache the ``pandas.DataFrame``
+    in redis with ``compress_data`` (like with
+    ``DF_SERIALIZER=columnar``) while S3 still gets ``data``
+    (the dates use the same ``iso`` format as ``data``)
+
     :param work_dict: dictionary for key/values
     """
 
@@ -124,6 +130,9 @@ def publish_pricing_update(
         data = work_dict.get(
             'data',
             None)
+        data_df = work_dict.get(
+            'df',
+            None)
         updated = work_dict.get(
             'updated',
             None)
@@ -260,7 +269,7 @@ def publish_pricing_update(
                     f'db={redis_db} key={redis_key} '
                     f'updated={updated} expire={redis_expire}')
 
-                rc = redis.Redis(
+                rc = redis_pool.get_client(
                     host=redis_host,
                     port=redis_port,
                     password=redis_password,
@@ -269,9 +278,15 @@ def publish_pricing_update(
                 already_compressed = False
                 uses_data = data
                 try:
-                    uses_data = zlib.compress(json.dumps(data).encode(
-                        encoding),
-                        9)
+                    if data_df is not None:
+                        uses_data = compress_data.compress_data(
+                            data=data_df,
+                            encoding=encoding,
+                            date_format='iso')
+                    else:
+                        uses_data = zlib.compress(json.dumps(data).encode(
+                            encoding),
+                            9)
                     already_compressed = True
                 except Exception as p:
                     log.critical(
@@ -44,10 +44,10 @@ analysis_engine/api_requests.py#L426>`__
 import boto3
 import json
 import re
-import redis
 import zlib
 import celery.task as celery_task
 import analysis_engine.consts as ae_consts
+import analysis_engine.redis_pool as redis_pool
 import analysis_engine.build_result as build_result
 import analysis_engine.get_task_results as get_task_results
 import analysis_engine.work_tasks.custom_task as custom_task
@@ -375,7 +375,7 @@ def publish_ticker_aggregate_from_s3(
                         f'updated={updated} expire={redis_expire}')
                 # end of if/else
 
-                rc = redis.Redis(
+                rc = redis_pool.get_client(
                     host=redis_host,
                     port=redis_port,
                     password=redis_password,
@@ -295,16 +295,21 @@ def extract_option_calls_dataset(
 
         if status == ae_consts.SUCCESS:
             calls_json = None
-            if 'calls' in redis_rec['rec']['data']:
+            if ae_consts.is_df(df=redis_rec['rec']['data']):
+                calls_json = redis_rec['rec']['data']
+            elif 'calls' in redis_rec['rec']['data']:
                 calls_json = redis_rec['rec']['data']['calls']
             else:
                 calls_json = redis_rec['rec']['data']
             log.debug(f'{label} - {df_str} redis convert calls to df')
             exp_date_str = None
             try:
-                calls_df = pd.read_json(
-                    calls_json,
-                    orient='records')
+                if ae_consts.is_df(df=calls_json):
+                    calls_df = calls_json
+                else:
+                    calls_df = pd.read_json(
+                        calls_json,
+                        orient='records')
                 exp_epoch_value = calls_df['expiration'].iloc[-1]
                 exp_date_str = ae_utils.convert_epoch_to_datetime_string(
                     epoch=exp_epoch_value,
@@ -407,15 +412,20 @@ def extract_option_puts_dataset(
 
         if status == ae_consts.SUCCESS:
             puts_json = None
-            if 'puts' in redis_rec['rec']['data']:
+            if ae_consts.is_df(df=redis_rec['rec']['data']):
+                puts_json = redis_rec['rec']['data']
+            elif 'puts' in redis_rec['rec']['data']:
                 puts_json = redis_rec['rec']['data']['puts']
             else:
                 puts_json = redis_rec['rec']['data']
             log.debug(f'{label} - {df_str} redis convert puts to df')
             try:
-                puts_df = pd.read_json(
-                    puts_json,
-                    orient='records')
+                if ae_consts.is_df(df=puts_json):
+                    puts_df = puts_json
+                else:
+                    puts_df = pd.read_json(
+                        puts_json,
+                        orient='records')
                 exp_epoch_value = puts_df['expiration'].iloc[-1]
                 exp_date_str = ae_utils.convert_epoch_to_datetime_string(
                     epoch=exp_epoch_value,
@@ -117,6 +117,7 @@ setup(
         'analysis_engine/scripts/run_backtest_and_plot_history.py',
         'analysis_engine/scripts/sa.py',
         'analysis_engine/scripts/start_algo.py',
+        'analysis_engine/scripts/sweep_algo_configs.py',
         'analysis_engine/scripts/train_dnn_from_history.py',
         'tools/backfill-minute-data.sh',
         'tools/logs-dataset-collection.sh',
@@ -146,6 +147,9 @@ setup(
             (
                 'ae = start_algo'
                 ':start_algo'),
+            (
+                'sweep = sweep_algo_configs'
+                ':run_sweep_tool'),
         ],
     },
     classifiers=[
@@ -0,0 +1,264 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.algo.BaseAlgo - ``indicator_mode``
+- analysis_engine.indicators.indicator_processor - ``seed_incremental``
+    and ``precompute_signals``
+- analysis_engine.indicators.williamsr - ``process_incremental``
+    and ``process_precomputed``
+- analysis_engine.indicators.williamsr_open - ``process_incremental``
+    and ``process_precomputed``
+- analysis_engine.stream_talib
+
+"""
+
+import json
+import numpy as np
+import pandas as pd
+import analysis_engine.consts as ae_consts
+import analysis_engine.algo as base_algo
+import analysis_engine.ae_talib as ae_talib
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestAlgoIndicatorModes(base_test.BaseTestCase):
+    """TestAlgoIndicatorModes"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        self.ticker = 'SPY'
+        self.minute_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-minute.json', 'r').read()))
+        self.minute_df['date'] = pd.to_datetime(
+            self.minute_df['date'])
+        self.daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+        self.daily_df['date'] = pd.to_datetime(
+            self.daily_df['date'])
+        self.indicators = [
+            {
+                'name': 'willr_10',
+                'module_path': 'analysis_engine/indicators/williamsr.py',
+                'category': 'technical',
+                'type': 'momentum',
+                'uses_data': 'minute',
+                'num_points': 10,
+                'buy_below': -70,
+                'sell_above': -30
+            },
+            {
+                'name': 'willr_15',
+                'module_path': 'analysis_engine/indicators/williamsr.py',
+                'category': 'technical',
+                'type': 'momentum',
+                'uses_data': 'minute',
+                'num_points': 15,
+                'buy_below': -90,
+                'sell_above': -10
+            },
+            {
+                'name': 'willr_open_12',
+                'module_path': (
+                    'analysis_engine/indicators/williamsr_open.py'),
+                'category': 'technical',
+                'type': 'momentum',
+                'uses_data': 'minute',
+                'num_points': 12,
+                'buy_below': -80,
+                'sell_above': -20
+            }
+        ]
+    # end of setUp
+
+    def run_algo(
+            self,
+            minute_df,
+            indicator_mode=None):
+        """run_algo
+
+        :param minute_df: minute ``pd.DataFrame`` to backtest
+        :param indicator_mode: optional - ``indicator_mode`` for the
+            algo config
+        """
+        config_dict = {
+            'name': 'test_indicator_modes',
+            'timeseries': 'minute',
+            'trade_horizon': 5,
+            'buy_shares': 10,
+            'balance': 10000.0,
+            'buy_rules': {
+                'min_indicators': 1
+            },
+            'sell_rules': {
+                'min_indicators': 1
+            },
+            'indicators': self.indicators
+        }
+        if indicator_mode:
+            config_dict['indicator_mode'] = indicator_mode
+        data = {
+            self.ticker: [
+                {
+                    'id': f'{self.ticker}_2018-11-07',
+                    'date': '2018-11-07',
+                    'data': {
+                        'daily': self.daily_df,
+                        'minute': minute_df.copy()
+                    }
+                }
+            ]
+        }
+        algo = base_algo.BaseAlgo(
+            ticker=self.ticker,
+            balance=10000.0,
+            config_dict=config_dict)
+        algo.handle_data(
+            data=data)
+        return algo
+    # end of run_algo
+
+    def get_indicator_values(
+            self,
+            algo):
+        """get_indicator_values
+
+        :param algo: ``BaseAlgo`` that finished a backtest
+        """
+        values = []
+        for report in algo.iproc.reports:
+            values.append({
+                k: report[k]
+                for k in report
+                if k not in [
+                    'id',
+                    'buys',
+                    'sells']
+            })
+        return values
+    # end of get_indicator_values
+
+    def compare_modes(
+            self,
+            minute_df,
+            indicator_mode='incremental'):
+        """compare_modes
+
+        :param minute_df: minute ``pd.DataFrame`` to backtest
+        :param indicator_mode: ``indicator_mode`` to compare
+            against the default ``process`` mode
+        """
+        process_algo = self.run_algo(
+            minute_df=minute_df)
+        inc_algo = self.run_algo(
+            minute_df=minute_df,
+            indicator_mode=indicator_mode)
+        self.assertEqual(
+            process_algo.indicator_mode_value,
+            ae_consts.ALGO_INDICATOR_MODE_PROCESS)
+        self.assertEqual(
+            inc_algo.indicator_mode_value,
+            ae_consts.ALGO_INDICATOR_MODES[indicator_mode])
+        for ind_id in inc_algo.iproc.get_indicators():
+            ind_obj = inc_algo.iproc.get_indicators()[ind_id]['obj']
+            if indicator_mode == 'precompute':
+                self.assertTrue(ind_obj.is_precomputed)
+            else:
+                self.assertTrue(ind_obj.is_incremental)
+
+        self.assertEqual(
+            self.get_indicator_values(process_algo),
+            self.get_indicator_values(inc_algo))
+        process_res = process_algo.get_result()
+        inc_res = inc_algo.get_result()
+        self.assertEqual(
+            len(process_res['history']),
+            len(inc_res['history']))
+        self.assertEqual(
+            len(process_res['buys']),
+            len(inc_res['buys']))
+        self.assertEqual(
+            len(process_res['sells']),
+            len(inc_res['sells']))
+        self.assertEqual(
+            process_res['balance'],
+            inc_res['balance'])
+        return process_res
+    # end of compare_modes
+
+    def test_incremental_matches_process(self):
+        """test_incremental_matches_process"""
+        if not self.has_ta_lib:
+            return
+        res = self.compare_modes(
+            minute_df=self.minute_df)
+        self.assertTrue(len(res['buys']) > 0)
+    # end of test_incremental_matches_process
+
+    def test_incremental_matches_process_with_missing_values(self):
+        """test_incremental_matches_process_with_missing_values"""
+        if not self.has_ta_lib:
+            return
+        minute_df = self.minute_df.copy()
+        minute_df.loc[[5, 30, 31, 60], 'close'] = np.nan
+        minute_df.loc[[45], 'open'] = np.nan
+        minute_df.loc[[70], 'volume'] = np.nan
+        self.compare_modes(
+            minute_df=minute_df)
+    # end of test_incremental_matches_process_with_missing_values
+
+    def test_precompute_matches_process(self):
+        """test_precompute_matches_process"""
+        if not self.has_ta_lib:
+            return
+        res = self.compare_modes(
+            minute_df=self.minute_df,
+            indicator_mode='precompute')
+        self.assertTrue(len(res['buys']) > 0)
+    # end of test_precompute_matches_process
+
+    def test_precompute_matches_process_with_missing_values(self):
+        """test_precompute_matches_process_with_missing_values"""
+        if not self.has_ta_lib:
+            return
+        minute_df = self.minute_df.copy()
+        minute_df.loc[[5, 30, 31, 60], 'close'] = np.nan
+        minute_df.loc[[45], 'open'] = np.nan
+        self.compare_modes(
+            minute_df=minute_df,
+            indicator_mode='precompute')
+    # end of test_precompute_matches_process_with_missing_values
+
+    def test_stream_willr_matches_talib(self):
+        """test_stream_willr_matches_talib"""
+        if not self.has_ta_lib:
+            return
+        highs = self.minute_df['high'].values
+        lows = self.minute_df['low'].values
+        closes = self.minute_df['close'].values
+        for timeperiod in [3, 14, 20]:
+            expected = ae_talib.WILLR(
+                highs,
+                lows,
+                closes,
+                timeperiod)
+            willr = ae_talib.stream.WILLR(
+                timeperiod=timeperiod)
+            for idx in range(len(closes)):
+                value = willr.update(
+                    highs[idx],
+                    lows[idx],
+                    closes[idx])
+                if idx + 1 < timeperiod:
+                    self.assertTrue(np.isnan(value))
+                else:
+                    self.assertEqual(
+                        value,
+                        expected[idx])
+            self.assertEqual(
+                willr.seed(highs, lows, closes),
+                expected[-1])
+    # end of test_stream_willr_matches_talib
+
+# end of TestAlgoIndicatorModes
@@ -0,0 +1,202 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.algo.BaseAlgo.handle_data_stream
+- analysis_engine.stream_datasets.prefetch_nodes
+- analysis_engine.stream_datasets.iter_ticker_nodes
+
+"""
+
+import json
+import mock
+import pandas as pd
+import analysis_engine.algo as base_algo
+import analysis_engine.stream_datasets as stream_datasets
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestAlgoStreamDatasets(base_test.BaseTestCase):
+    """TestAlgoStreamDatasets"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        self.minute_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-minute.json', 'r').read()))
+        self.minute_df['date'] = pd.to_datetime(
+            self.minute_df['date'])
+        self.daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+        self.daily_df['date'] = pd.to_datetime(
+            self.daily_df['date'])
+        self.num_nodes = 4
+    # end of setUp
+
+    def build_nodes(
+            self):
+        """build_nodes
+
+        Generator for ``(ticker, node)`` tuples
+        """
+        for idx in range(self.num_nodes):
+            yield 'SPY', {
+                'id': f'SPY_2018-11-0{idx + 1}',
+                'date': f'2018-11-0{idx + 1}',
+                'data': {
+                    'daily': self.daily_df,
+                    'minute': self.minute_df
+                }
+            }
+    # end of build_nodes
+
+    def build_algo(
+            self,
+            stream_window=None,
+            ticker_workers=None):
+        """build_algo
+
+        :param stream_window: optional - number of nodes to keep
+        :param ticker_workers: optional - number of ticker workers
+        """
+        config_dict = {
+            'name': 'test_stream_datasets',
+            'timeseries': 'minute',
+            'trade_horizon': 5,
+            'buy_shares': 10,
+            'balance': 10000.0,
+            'buy_rules': {
+                'min_indicators': 1
+            },
+            'sell_rules': {
+                'min_indicators': 1
+            },
+            'indicators': [
+                {
+                    'name': 'willr_10',
+                    'module_path': (
+                        'analysis_engine/indicators/williamsr.py'),
+                    'category': 'technical',
+                    'type': 'momentum',
+                    'uses_data': 'minute',
+                    'num_points': 10,
+                    'buy_below': -70,
+                    'sell_above': -30
+                }
+            ]
+        }
+        if stream_window:
+            config_dict['stream_window'] = stream_window
+        if ticker_workers:
+            config_dict['ticker_workers'] = ticker_workers
+        return base_algo.BaseAlgo(
+            ticker='SPY',
+            balance=10000.0,
+            config_dict=config_dict)
+    # end of build_algo
+
+    def test_stream_matches_list(self):
+        """test_stream_matches_list"""
+        if not self.has_ta_lib:
+            return
+        list_algo = self.build_algo()
+        list_algo.handle_data(
+            data={
+                'SPY': [node for ticker, node in self.build_nodes()]
+            })
+        stream_algo = self.build_algo(
+            stream_window=2)
+        stream_algo.handle_data(
+            data=stream_datasets.prefetch_nodes(
+                nodes=self.build_nodes()))
+        self.assertEqual(
+            stream_algo.stream_window,
+            2)
+        list_res = list_algo.get_result()
+        stream_res = stream_algo.get_result()
+        self.assertTrue(len(list_res['history']) > 0)
+        self.assertEqual(
+            [node['close'] for node in list_res['history']],
+            [node['close'] for node in stream_res['history']])
+        self.assertEqual(
+            len(list_res['buys']),
+            len(stream_res['buys']))
+        self.assertEqual(
+            list_res['balance'],
+            stream_res['balance'])
+
+        # only the window of recent nodes is kept
+        self.assertEqual(
+            len(list_algo.last_handle_data['SPY']),
+            self.num_nodes)
+        self.assertEqual(
+            [node['id'] for node in stream_algo.last_handle_data['SPY']],
+            ['SPY_2018-11-03', 'SPY_2018-11-04'])
+        self.assertEqual(
+            len(stream_algo.create_report_dataset()['SPY']),
+            2)
+    # end of test_stream_matches_list
+
+    def test_stream_warns_unsupported_modes(self):
+        """test_stream_warns_unsupported_modes"""
+        with mock.patch.object(base_algo.log, 'warning') as mock_warning:
+            algo = self.build_algo(
+                stream_window=2)
+            algo.handle_data(
+                data=self.build_nodes())
+            self.assertEqual(
+                mock_warning.call_count,
+                0)
+            algo = self.build_algo(
+                stream_window=2,
+                ticker_workers=2)
+            algo.handle_data(
+                data=self.build_nodes())
+            self.assertEqual(
+                mock_warning.call_count,
+                1)
+            self.assertIn(
+                'ticker_workers=2',
+                mock_warning.call_args[0][0])
+        self.assertEqual(
+            len(algo.last_handle_data['SPY']),
+            2)
+    # end of test_stream_warns_unsupported_modes
+
+    def test_prefetch_nodes(self):
+        """test_prefetch_nodes"""
+        nodes = list(stream_datasets.prefetch_nodes(
+            nodes=stream_datasets.iter_ticker_nodes(
+                data={
+                    'SPY': iter([1, 2]),
+                    'QQQ': [3]
+                },
+                tickers=['QQQ', 'SPY']),
+            num_prefetch=2))
+        self.assertEqual(
+            nodes,
+            [('QQQ', 3), ('SPY', 1), ('SPY', 2)])
+
+        def failing_nodes():
+            yield 'SPY', 1
+            raise Exception('extract failed')
+
+        found = []
+        with self.assertRaises(Exception):
+            for item in stream_datasets.prefetch_nodes(
+                    nodes=failing_nodes()):
+                found.append(item)
+        self.assertEqual(
+            found,
+            [('SPY', 1)])
+
+        # stopping early does not hang on the background thread
+        stream = stream_datasets.prefetch_nodes(
+            nodes=(('SPY', idx) for idx in range(100)))
+        self.assertEqual(
+            next(stream),
+            ('SPY', 0))
+        stream.close()
+    # end of test_prefetch_nodes
+
+# end of TestAlgoStreamDatasets
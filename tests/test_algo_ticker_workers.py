@@ -0,0 +1,237 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.algo.BaseAlgo.handle_tickers_in_workers
+- analysis_engine.algo.init_ticker_worker
+- analysis_engine.algo.run_ticker_worker
+
+"""
+
+import json
+import pandas as pd
+import analysis_engine.algo as base_algo
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestAlgoTickerWorkers(base_test.BaseTestCase):
+    """TestAlgoTickerWorkers"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        self.tickers = [
+            'SPY',
+            'QQQ',
+            'IWM'
+        ]
+        minute_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-minute.json', 'r').read()))
+        minute_df['date'] = pd.to_datetime(
+            minute_df['date'])
+        daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+        daily_df['date'] = pd.to_datetime(
+            daily_df['date'])
+        self.data = {}
+        for idx, ticker in enumerate(self.tickers):
+            use_df = minute_df.copy()
+            for col in ['open', 'high', 'low', 'close']:
+                use_df[col] = use_df[col] * (1.0 + (0.01 * idx))
+            self.data[ticker] = [
+                {
+                    'id': f'{ticker}_2018-11-07',
+                    'date': '2018-11-07',
+                    'data': {
+                        'daily': daily_df,
+                        'minute': use_df
+                    }
+                }
+            ]
+        # end of for all tickers
+    # end of setUp
+
+    def run_algo(
+            self,
+            ticker_workers=None):
+        """run_algo
+
+        :param ticker_workers: optional - number of ticker workers
+        """
+        config_dict = {
+            'name': 'test_ticker_workers',
+            'timeseries': 'minute',
+            'trade_horizon': 5,
+            'buy_shares': 10,
+            'balance': 1000000.0,
+            'buy_rules': {
+                'min_indicators': 1
+            },
+            'sell_rules': {
+                'min_indicators': 1
+            },
+            'indicators': [
+                {
+                    'name': 'willr_10',
+                    'module_path': (
+                        'analysis_engine/indicators/williamsr.py'),
+                    'category': 'technical',
+                    'type': 'momentum',
+                    'uses_data': 'minute',
+                    'num_points': 10,
+                    'buy_below': -70,
+                    'sell_above': -30
+                }
+            ]
+        }
+        if ticker_workers:
+            config_dict['ticker_workers'] = ticker_workers
+        algo = base_algo.BaseAlgo(
+            ticker=self.tickers[0],
+            tickers=self.tickers,
+            balance=1000000.0,
+            config_dict=config_dict)
+        data = {
+            ticker: [
+                {
+                    'id': node['id'],
+                    'date': node['date'],
+                    'data': dict(node['data'])
+                }
+                for node in self.data[ticker]
+            ]
+            for ticker in self.data
+        }
+        algo.handle_data(
+            data=data)
+        return algo
+    # end of run_algo
+
+    def assert_rows_equal(
+            self,
+            rows,
+            expected_rows,
+            skip_keys=None):
+        """assert_rows_equal
+
+        :param rows: list of dictionaries
+        :param expected_rows: list of expected dictionaries
+        :param skip_keys: optional - keys that are not compared
+        """
+        if not skip_keys:
+            skip_keys = []
+        self.assertEqual(
+            len(rows),
+            len(expected_rows))
+        for row, expected_row in zip(rows, expected_rows):
+            self.assertEqual(
+                sorted(row),
+                sorted(expected_row))
+            for key, expected_val in expected_row.items():
+                if key in skip_keys:
+                    continue
+                val = row[key]
+                if isinstance(expected_val, float):
+                    if expected_val != expected_val:
+                        self.assertTrue(val != val)
+                    else:
+                        self.assertAlmostEqual(
+                            val,
+                            expected_val,
+                            places=6,
+                            msg=f'{key} row={expected_row}')
+                else:
+                    self.assertEqual(
+                        val,
+                        expected_val,
+                        msg=f'{key} row={expected_row}')
+        # end of for all rows
+    # end of assert_rows_equal
+
+    def test_ticker_workers_merge_results(self):
+        """test_ticker_workers_merge_results"""
+        serial_algo = self.run_algo()
+        worker_algo = self.run_algo(
+            ticker_workers=2)
+        self.assertEqual(
+            worker_algo.ticker_workers,
+            2)
+        serial_res = serial_algo.get_result()
+        worker_res = worker_algo.get_result()
+
+        # tickers are merged back in order with the balance
+        # each row would have had in a serial run
+        self.assertTrue(len(worker_res['buys']) > 0)
+        self.assertTrue(len(worker_res['sells']) > 0)
+        self.assert_rows_equal(
+            rows=worker_res['history'],
+            expected_rows=serial_res['history'])
+        self.assert_rows_equal(
+            rows=worker_res['buys'],
+            expected_rows=serial_res['buys'],
+            skip_keys=[
+                'created'
+            ])
+        self.assert_rows_equal(
+            rows=worker_res['sells'],
+            expected_rows=serial_res['sells'],
+            skip_keys=[
+                'created'
+            ])
+        for ticker in self.tickers:
+            self.assertEqual(
+                serial_res['open_positions'][ticker]['shares'],
+                worker_res['open_positions'][ticker]['shares'])
+        self.assertEqual(
+            sorted(worker_algo.ticker_balances),
+            sorted(self.tickers))
+
+        # the balance is large enough that sharing it did not
+        # change any trades so the net change is the same
+        self.assertAlmostEqual(
+            serial_res['balance'],
+            worker_res['balance'])
+
+        # each ticker's counters are only merged once
+        serial_perf = serial_algo.perf.get_summary()
+        worker_perf = worker_algo.perf.get_summary()
+        for counters in ['phases', 'indicators']:
+            self.assertEqual(
+                sorted(worker_perf[counters]),
+                sorted(serial_perf[counters]))
+            for name, counter in serial_perf[counters].items():
+                self.assertEqual(
+                    worker_perf[counters][name]['calls'],
+                    counter['calls'],
+                    msg=f'{counters} {name}')
+        self.assertEqual(
+            worker_perf['ta_cache'],
+            serial_perf['ta_cache'])
+        self.assertEqual(
+            serial_perf['phases']['bar']['calls'],
+            len(serial_res['history']))
+    # end of test_ticker_workers_merge_results
+
+    def test_ticker_workers_rebase_start_price(self):
+        """test_ticker_workers_rebase_start_price"""
+        for idx, ticker in enumerate(self.tickers):
+            node = self.data[ticker][0]
+            daily_df = node['data']['daily'].copy()
+            daily_df['close'] = daily_df['close'] + idx
+            node['data']['daily'] = daily_df
+        # end of giving each ticker its own start price
+
+        serial_res = self.run_algo().get_result()
+        worker_res = self.run_algo(
+            ticker_workers=3).get_result()
+        self.assertEqual(
+            len(set(
+                node['algo_start_price']
+                for node in worker_res['history'])),
+            1)
+        self.assert_rows_equal(
+            rows=worker_res['history'],
+            expected_rows=serial_res['history'])
+    # end of test_ticker_workers_rebase_start_price
+
+# end of TestAlgoTickerWorkers
@@ -0,0 +1,94 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.bar_cursor.BarCursor
+
+"""
+
+import json
+import pandas as pd
+import analysis_engine.bar_cursor as bar_cursor
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestBarCursor(base_test.BaseTestCase):
+    """TestBarCursor"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        self.minute_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-minute.json', 'r').read()))
+        self.minute_df['date'] = pd.to_datetime(
+            self.minute_df['date'])
+    # end of setUp
+
+    def test_bars_match_iterrows(self):
+        """test_bars_match_iterrows"""
+        cursor = bar_cursor.BarCursor(
+            df=self.minute_df)
+        self.assertEqual(
+            len(cursor),
+            len(self.minute_df.index))
+        expected = list(self.minute_df[5:].iterrows())
+        bar_idxs = list(cursor.bars(start_row=5))
+        self.assertEqual(
+            len(bar_idxs),
+            len(expected))
+        cursor = bar_cursor.BarCursor(
+            df=self.minute_df)
+        for (minute_idx, row), bar_idx in zip(
+                expected,
+                cursor.bars(start_row=5)):
+            self.assertEqual(minute_idx, bar_idx)
+            for col in bar_cursor.BAR_COLUMNS:
+                self.assertEqual(
+                    getattr(cursor, col),
+                    row.get(col, None))
+                self.assertEqual(
+                    type(getattr(cursor, col)),
+                    type(row.get(col, None)))
+    # end of test_bars_match_iterrows
+
+    def test_last_and_window(self):
+        """test_last_and_window"""
+        cursor = bar_cursor.BarCursor(
+            df=self.minute_df)
+        cursor.last()
+        self.assertEqual(
+            cursor.idx,
+            len(self.minute_df.index) - 1)
+        self.assertEqual(
+            cursor.close,
+            self.minute_df['close'].iloc[-1])
+        self.assertEqual(
+            cursor.get('high', -2),
+            self.minute_df['high'].iloc[-2])
+        window = cursor.window('close', 10)
+        self.assertEqual(
+            list(window),
+            list(self.minute_df['close'].values[-10:]))
+        self.assertEqual(
+            len(cursor.window('close', 10, idx=3)),
+            4)
+    # end of test_last_and_window
+
+    def test_missing_columns(self):
+        """test_missing_columns"""
+        cursor = bar_cursor.BarCursor(
+            df=self.minute_df[['date', 'close']])
+        self.assertFalse(cursor.has_column('high'))
+        self.assertIsNone(cursor.get('high', 0))
+        cursor.seek(0)
+        self.assertIsNone(cursor.high)
+        self.assertEqual(
+            cursor.close,
+            self.minute_df['close'].iloc[0])
+        empty_cursor = bar_cursor.BarCursor(
+            df=pd.DataFrame([]))
+        self.assertEqual(len(empty_cursor), 0)
+        self.assertEqual(list(empty_cursor.bars()), [])
+    # end of test_missing_columns
+
+# end of TestBarCursor
@@ -0,0 +1,232 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.build_dataset_node.build_dataset_node
+- analysis_engine.build_dataset_node.build_dataset_nodes
+- analysis_engine.get_data_from_redis_key.get_data_from_redis_keys
+
+"""
+
+import mock
+import pandas as pd
+import analysis_engine.consts as ae_consts
+import analysis_engine.compress_data as compress_data
+import analysis_engine.redis_pool as redis_pool
+import analysis_engine.build_dataset_node as build_ds_node
+import analysis_engine.get_data_from_redis_key as redis_get
+import analysis_engine.mocks.mock_redis as mock_redis
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestBuildDatasetNode(base_test.BaseTestCase):
+    """TestBuildDatasetNode"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        redis_pool.clear_pools()
+        self.ticker = 'SPY'
+        self.date = '2019-02-15'
+        self.datasets = [
+            'daily',
+            'minute',
+            'quote',
+            'news',
+            'tdcalls'
+        ]
+        self.daily_df = pd.DataFrame({
+            'date': [
+                '2019-02-13',
+                '2019-02-15',
+                '2019-02-14'
+            ],
+            'close': [
+                270.0,
+                272.0,
+                271.0
+            ]
+        })
+        self.minute_df = pd.DataFrame({
+            'date': [
+                '2019-02-15 09:30:00',
+                '2019-02-15 09:31:00'
+            ],
+            'close': [
+                271.5,
+                271.8
+            ]
+        })
+    # end of setUp
+
+    def tearDown(
+            self):
+        """tearDown"""
+        redis_pool.clear_pools()
+    # end of tearDown
+
+    def publish(
+            self):
+        """publish
+
+        Store the compressed daily and minute datasets
+        (the quote, news and tdcalls keys are missing)
+        """
+        client = redis_pool.get_client(
+            address=ae_consts.REDIS_ADDRESS,
+            db=ae_consts.REDIS_DB)
+        client.set(
+            name=f'{self.ticker}_{self.date}_daily',
+            value=compress_data.compress_data(
+                data=self.daily_df))
+        client.set(
+            name=f'{self.ticker}_{self.date}_minute',
+            value=compress_data.compress_data(
+                data=self.minute_df))
+    # end of publish
+
+    def build_node(
+            self,
+            batch_extract):
+        """build_node
+
+        :param batch_extract: bool for one ``MGET``
+        """
+        return build_ds_node.build_dataset_node(
+            ticker=self.ticker,
+            datasets=self.datasets,
+            date=self.date,
+            s3_enabled=False,
+            batch_extract=batch_extract)
+    # end of build_node
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    def test_get_data_from_redis_keys(self):
+        """test_get_data_from_redis_keys"""
+        self.publish()
+        keys = [
+            f'{self.ticker}_{self.date}_daily',
+            f'{self.ticker}_{self.date}_quote',
+            f'{self.ticker}_{self.date}_daily'
+        ]
+        res = redis_get.get_data_from_redis_keys(
+            host='localhost',
+            port=6379,
+            db=0,
+            keys=keys,
+            decompress_df=True)
+        self.assertEqual(
+            list(res),
+            keys[0:2])
+        for key in keys[0:2]:
+            self.assertEqual(
+                res[key]['status'],
+                ae_consts.SUCCESS)
+        self.assertEqual(
+            res[keys[0]]['rec']['data'],
+            self.daily_df.to_json(
+                orient='records'))
+        self.assertIsNone(res[keys[1]]['rec']['data'])
+    # end of test_get_data_from_redis_keys
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    def test_batch_extract_matches_per_key(self):
+        """test_batch_extract_matches_per_key"""
+        self.publish()
+        expected = self.build_node(
+            batch_extract=False)
+        with mock.patch(
+                'analysis_engine.get_data_from_redis_key.'
+                'get_data_from_redis_key',
+                wraps=redis_get.get_data_from_redis_key) as get_key:
+            res = self.build_node(
+                batch_extract=True)
+            self.assertEqual(get_key.call_count, 0)
+        self.assertEqual(
+            list(res),
+            list(expected))
+        for name in res:
+            if expected[name] is None:
+                self.assertIsNone(res[name])
+            else:
+                pd.testing.assert_frame_equal(
+                    res[name],
+                    expected[name])
+        # end of for all datasets
+        self.assertEqual(
+            list(res['daily']['close']),
+            list(self.daily_df['close']))
+        self.assertEqual(
+            len(res['minute'].index),
+            2)
+        self.assertIsNone(res['stats'])
+    # end of test_batch_extract_matches_per_key
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    def test_build_dataset_nodes_in_order(self):
+        """test_build_dataset_nodes_in_order"""
+        client = redis_pool.get_client(
+            address=ae_consts.REDIS_ADDRESS,
+            db=ae_consts.REDIS_DB)
+        dates = [
+            '2019-02-13',
+            '2019-02-14',
+            '2019-02-15'
+        ]
+        extract_requests = []
+        for ticker_idx, ticker in enumerate(['SPY', 'QQQ']):
+            for date_idx, date in enumerate(dates):
+                daily_df = self.daily_df.copy()
+                daily_df['close'] += 10 * ticker_idx + date_idx
+                client.set(
+                    name=f'{ticker}_{date}_daily',
+                    value=compress_data.compress_data(
+                        data=daily_df))
+                extract_requests.append({
+                    'id': f'{ticker}_{date}',
+                    'ticker': ticker,
+                    'date': date
+                })
+        # end of publishing the datasets
+        expected = [
+            build_ds_node.build_dataset_node(
+                ticker=req['ticker'],
+                date=req['date'],
+                datasets=self.datasets,
+                s3_enabled=False,
+                batch_extract=False)
+            for req in extract_requests
+        ]
+        for num_workers in [0, 3]:
+            with mock.patch(
+                    'analysis_engine.get_data_from_redis_key.'
+                    'get_data_from_redis_key',
+                    wraps=redis_get.get_data_from_redis_key) as get_key:
+                nodes = list(build_ds_node.build_dataset_nodes(
+                    extract_requests=extract_requests,
+                    datasets=self.datasets,
+                    chunk_size=4,
+                    num_workers=num_workers))
+                self.assertEqual(get_key.call_count, 0)
+            self.assertEqual(
+                [(ticker, node['id']) for ticker, node in nodes],
+                [(req['ticker'], req['id']) for req in extract_requests])
+            for (ticker, node), expected_data in zip(nodes, expected):
+                pd.testing.assert_frame_equal(
+                    node['data']['daily'],
+                    expected_data['daily'])
+                self.assertIsNone(node['data']['quote'])
+            # end of for all nodes
+        # end of for all worker counts
+        self.assertEqual(
+            list(nodes[4][1]['data']['daily']['close']),
+            list(self.daily_df['close'] + 11))
+    # end of test_build_dataset_nodes_in_order
+
+# end of TestBuildDatasetNode
@@ -0,0 +1,347 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.extract_async.build_dataset_node_async
+- analysis_engine.extract_async.build_dataset_nodes_async
+- analysis_engine.extract_async.load_dataset_nodes
+- analysis_engine.extract_async.build_df_from_redis_async
+
+"""
+
+import asyncio
+import threading
+import mock
+import pandas as pd
+import analysis_engine.consts as ae_consts
+import analysis_engine.compress_data as compress_data
+import analysis_engine.redis_pool as redis_pool
+import analysis_engine.build_df_from_redis as build_df
+import analysis_engine.build_dataset_node as build_ds_node
+import analysis_engine.extract_async as extract_async
+import analysis_engine.get_data_from_redis_key as redis_get
+import analysis_engine.mocks.mock_redis as mock_redis
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestExtractAsync(base_test.BaseTestCase):
+    """TestExtractAsync"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        redis_pool.clear_pools()
+        self.datasets = [
+            'daily',
+            'minute',
+            'quote',
+            'news',
+            'tdcalls'
+        ]
+        self.dates = [
+            '2019-02-13',
+            '2019-02-14',
+            '2019-02-15'
+        ]
+        self.daily_df = pd.DataFrame({
+            'date': [
+                '2019-02-13',
+                '2019-02-14',
+                '2019-02-15'
+            ],
+            'close': [
+                270.0,
+                271.0,
+                272.0
+            ]
+        })
+        self.extract_requests = []
+    # end of setUp
+
+    def tearDown(
+            self):
+        """tearDown"""
+        redis_pool.clear_pools()
+    # end of tearDown
+
+    def publish(
+            self):
+        """publish
+
+        Store a compressed daily dataset for each ticker and
+        date (the other datasets are missing)
+        """
+        client = redis_pool.get_client(
+            address=ae_consts.REDIS_ADDRESS,
+            db=ae_consts.REDIS_DB)
+        for ticker_idx, ticker in enumerate(['SPY', 'QQQ']):
+            for date_idx, date in enumerate(self.dates):
+                daily_df = self.daily_df.copy()
+                daily_df['close'] += 10 * ticker_idx + date_idx
+                client.set(
+                    name=f'{ticker}_{date}_daily',
+                    value=compress_data.compress_data(
+                        data=daily_df))
+                self.extract_requests.append({
+                    'id': f'{ticker}_{date}',
+                    'ticker': ticker,
+                    'date': date
+                })
+        # end of publishing the datasets
+    # end of publish
+
+    def build_expected(
+            self):
+        """build_expected
+
+        Build the nodes with the synchronous extract
+        """
+        return [
+            build_ds_node.build_dataset_node(
+                ticker=req['ticker'],
+                date=req['date'],
+                datasets=self.datasets,
+                s3_enabled=False,
+                batch_extract=False)
+            for req in self.extract_requests
+        ]
+    # end of build_expected
+
+    def assert_nodes_match(
+            self,
+            nodes,
+            expected):
+        """assert_nodes_match
+
+        :param nodes: list of dataset dictionaries
+        :param expected: list of dataset dictionaries
+        """
+        self.assertEqual(len(nodes), len(expected))
+        for node, expected_node in zip(nodes, expected):
+            self.assertEqual(
+                list(node),
+                list(expected_node))
+            for name in node:
+                if expected_node[name] is None:
+                    self.assertIsNone(node[name])
+                else:
+                    pd.testing.assert_frame_equal(
+                        node[name],
+                        expected_node[name])
+            # end of for all datasets
+        # end of for all nodes
+    # end of assert_nodes_match
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    @mock.patch(
+        ('redis.asyncio.Redis'),
+        new=mock_redis.MockAsyncRedis)
+    def test_build_dataset_node_async(self):
+        """test_build_dataset_node_async"""
+        self.publish()
+        expected = self.build_expected()
+
+        async def build_nodes():
+            return await asyncio.gather(*[
+                extract_async.build_dataset_node_async(
+                    ticker=req['ticker'],
+                    datasets=self.datasets,
+                    date=req['date'])
+                for req in self.extract_requests
+            ])
+        # end of build_nodes
+
+        nodes = asyncio.run(build_nodes())
+        self.assert_nodes_match(
+            nodes=nodes,
+            expected=expected)
+        self.assertEqual(
+            list(nodes[4]['daily']['close']),
+            list(self.daily_df['close'] + 11))
+    # end of test_build_dataset_node_async
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    @mock.patch(
+        ('redis.asyncio.Redis'),
+        new=mock_redis.MockAsyncRedis)
+    def test_build_dataset_nodes_async_in_order(self):
+        """test_build_dataset_nodes_async_in_order"""
+        self.publish()
+        expected = self.build_expected()
+        for chunk_size, max_in_flight in [(1, 8), (4, 2)]:
+            nodes = extract_async.load_dataset_nodes(
+                extract_requests=self.extract_requests,
+                datasets=self.datasets,
+                chunk_size=chunk_size,
+                max_in_flight=max_in_flight)
+            self.assertEqual(
+                [(ticker, node['id']) for ticker, node in nodes],
+                [
+                    (req['ticker'], req['id'])
+                    for req in self.extract_requests
+                ])
+            self.assert_nodes_match(
+                nodes=[
+                    node['data']
+                    for ticker, node in nodes
+                ],
+                expected=expected)
+        # end of for all chunk sizes
+    # end of test_build_dataset_nodes_async_in_order
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    @mock.patch(
+        ('redis.asyncio.Redis'),
+        new=mock_redis.MockAsyncRedis)
+    def test_build_df_from_redis_async(self):
+        """test_build_df_from_redis_async"""
+        self.publish()
+        res = asyncio.run(extract_async.build_df_from_redis_async(
+            address=ae_consts.REDIS_ADDRESS,
+            db=ae_consts.REDIS_DB,
+            key='SPY_2019-02-13_daily'))
+        self.assertEqual(res['status'], ae_consts.SUCCESS)
+        pd.testing.assert_frame_equal(
+            res['rec']['data'],
+            build_df.build_df_from_redis(
+                address=ae_consts.REDIS_ADDRESS,
+                db=ae_consts.REDIS_DB,
+                key='SPY_2019-02-13_daily')['rec']['data'])
+        self.assertEqual(
+            list(res['rec']['data']['close']),
+            list(self.daily_df['close']))
+        res = asyncio.run(extract_async.build_df_from_redis_async(
+            address=ae_consts.REDIS_ADDRESS,
+            db=ae_consts.REDIS_DB,
+            key='SPY_2019-02-13_quote'))
+        self.assertEqual(res['status'], ae_consts.SUCCESS)
+        self.assertIsNone(res['rec']['data'])
+    # end of test_build_df_from_redis_async
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    @mock.patch(
+        ('redis.asyncio.Redis'),
+        new=mock_redis.MockAsyncRedis)
+    def test_decode_off_the_event_loop(self):
+        """test_decode_off_the_event_loop"""
+        self.publish()
+        expected = self.build_expected()
+        decode_threads = []
+        build_node = build_ds_node.build_node
+        build_dataset_node = build_ds_node.build_dataset_node
+
+        def record_build_node(**kwargs):
+            decode_threads.append(threading.get_ident())
+            return build_node(**kwargs)
+
+        def record_build_dataset_node(**kwargs):
+            decode_threads.append(threading.get_ident())
+            return build_dataset_node(**kwargs)
+
+        async def build_nodes():
+            nodes = [
+                node['data']
+                async for ticker, node in (
+                    extract_async.build_dataset_nodes_async(
+                        extract_requests=self.extract_requests,
+                        datasets=self.datasets,
+                        chunk_size=2))
+            ]
+            nodes.append(await extract_async.build_dataset_node_async(
+                ticker=self.extract_requests[0]['ticker'],
+                datasets=self.datasets,
+                date=self.extract_requests[0]['date']))
+            return nodes
+        # end of build_nodes
+
+        with mock.patch.object(
+                build_ds_node,
+                'build_node',
+                new=record_build_node), \
+                mock.patch.object(
+                    build_ds_node,
+                    'build_dataset_node',
+                    new=record_build_dataset_node):
+            nodes = asyncio.run(build_nodes())
+        # build_node calls build_dataset_node for each request
+        self.assertEqual(
+            len(decode_threads),
+            2 * len(self.extract_requests) + 1)
+        self.assertNotIn(
+            threading.get_ident(),
+            decode_threads)
+        self.assert_nodes_match(
+            nodes=nodes,
+            expected=expected + expected[0:1])
+    # end of test_decode_off_the_event_loop
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    @mock.patch(
+        ('redis.asyncio.Redis'),
+        new=mock_redis.MockAsyncRedis)
+    def test_failed_mget_reads_keys_async(self):
+        """test_failed_mget_reads_keys_async"""
+        self.publish()
+        expected = self.build_expected()
+
+        async def failed_mget(*args, **kwargs):
+            raise ConnectionError('mget failed')
+
+        with mock.patch.object(
+                mock_redis.MockAsyncRedis,
+                'mget',
+                new=failed_mget), \
+                mock.patch.object(
+                    redis_get,
+                    'get_data_from_redis_key',
+                    side_effect=AssertionError('blocking get')) as get:
+            nodes = extract_async.load_dataset_nodes(
+                extract_requests=self.extract_requests,
+                datasets=self.datasets,
+                chunk_size=2)
+        self.assertEqual(get.call_count, 0)
+        self.assert_nodes_match(
+            nodes=[
+                node['data']
+                for ticker, node in nodes
+            ],
+            expected=expected)
+    # end of test_failed_mget_reads_keys_async
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    @mock.patch(
+        ('redis.asyncio.Redis'),
+        new=mock_redis.MockAsyncRedis)
+    def test_load_dataset_nodes_in_running_loop(self):
+        """test_load_dataset_nodes_in_running_loop"""
+        self.publish()
+        expected = self.build_expected()
+
+        async def load_nodes():
+            return extract_async.load_dataset_nodes(
+                extract_requests=self.extract_requests,
+                datasets=self.datasets)
+        # end of load_nodes
+
+        nodes = asyncio.run(load_nodes())
+        self.assert_nodes_match(
+            nodes=[
+                node['data']
+                for ticker, node in nodes
+            ],
+            expected=expected)
+    # end of test_load_dataset_nodes_in_running_loop
+
+# end of TestExtractAsync
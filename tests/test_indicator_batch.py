@@ -0,0 +1,347 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.np_talib - ``WILLR_MULTI`` and ``RSI_MULTI``
+- analysis_engine.ae_talib - ``multi``
+- analysis_engine.indicators.build_indicator_node - ``build_indicator_variants``
+- analysis_engine.indicators.indicator_processor - ``precompute_batch``
+
+"""
+
+import json
+import mock
+import pytest
+import numpy as np
+import pandas as pd
+import analysis_engine.ae_talib as ae_talib
+import analysis_engine.consts as ae_consts
+import analysis_engine.np_talib as np_talib
+import analysis_engine.mocks.base_test as base_test
+import analysis_engine.indicators.build_indicator_node as build_indicator
+import analysis_engine.indicators.indicator_processor as ind_proc
+
+
+class TestIndicatorBatch(base_test.BaseTestCase):
+    """TestIndicatorBatch"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        rng = np.random.RandomState(7)
+        num_bars = 300
+        self.close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, num_bars))
+        self.high = self.close + rng.uniform(0.0, 1.0, num_bars)
+        self.low = self.close - rng.uniform(0.0, 1.0, num_bars)
+        # flat bars exercise the zero-range branches
+        self.high[20:25] = self.close[20:25]
+        self.low[20:25] = self.close[20:25]
+        self.daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+    # end of setUp
+
+    def test_multi_matches_single_calls(self):
+        """test_multi_matches_single_calls"""
+        periods = [1, 2, 5, 14, 16, 33, 299, 300, 400]
+        willr = np_talib.WILLR_MULTI(
+            self.high,
+            self.low,
+            self.close,
+            timeperiods=periods)
+        rsi = np_talib.RSI_MULTI(
+            self.close,
+            timeperiods=periods)
+        self.assertEqual(willr.shape, (len(periods), len(self.close)))
+        for row, period in enumerate(periods):
+            self.assertTrue(np.array_equal(
+                willr[row],
+                np_talib.WILLR(
+                    self.high,
+                    self.low,
+                    self.close,
+                    timeperiod=period),
+                equal_nan=True))
+            self.assertTrue(np.array_equal(
+                rsi[row],
+                np_talib.RSI(
+                    self.close,
+                    timeperiod=period),
+                equal_nan=True))
+        # wrappers without a _MULTI version run once per period
+        ema = ae_talib.multi(
+            'EMA',
+            [5, 10],
+            self.close)
+        self.assertTrue(np.allclose(
+            ema[1],
+            ae_talib.EMA(self.close, timeperiod=10),
+            equal_nan=True))
+        self.assertEqual(
+            ae_talib.multi('RSI', [], self.close).shape,
+            (0, len(self.close)))
+    # end of test_multi_matches_single_calls
+
+    def test_build_indicator_variants(self):
+        """test_build_indicator_variants"""
+        node = {
+            'name': 'willr',
+            'num_points': 14,
+            'sell_above': -20,
+            'variants': {
+                'num_points': [10, 20],
+                'buy_below': [-80, -90, -95]
+            }
+        }
+        nodes = build_indicator.build_indicator_variants(
+            node=node)
+        self.assertEqual(len(nodes), 6)
+        self.assertEqual(nodes[0]['name'], 'willr_10_-80')
+        self.assertEqual(nodes[-1]['name'], 'willr_20_-95')
+        self.assertEqual(nodes[-1]['num_points'], 20)
+        self.assertEqual(nodes[-1]['sell_above'], -20)
+        self.assertNotIn('variants', nodes[0])
+        self.assertIn('variants', node)
+        self.assertEqual(
+            build_indicator.build_indicator_variants(
+                node={'name': 'single'}),
+            [{'name': 'single'}])
+    # end of test_build_indicator_variants
+
+    def build_processor(
+            self):
+        """build_processor"""
+        return ind_proc.IndicatorProcessor(
+            config_dict={
+                'name': 'test_indicator_batch',
+                'indicators': [
+                    {
+                        'name': 'willr',
+                        'module_path': (
+                            'analysis_engine/indicators/williamsr.py'),
+                        'category': 'technical',
+                        'type': 'momentum',
+                        'uses_data': 'daily',
+                        'sell_above': -20,
+                        'variants': {
+                            'num_points': [5, 9, 14],
+                            'buy_below': [-80, -60]
+                        }
+                    },
+                    {
+                        'name': 'willr_open',
+                        'module_path': (
+                            'analysis_engine/indicators/williamsr_open.py'),
+                        'category': 'technical',
+                        'type': 'momentum',
+                        'uses_data': 'daily',
+                        'num_points': 9,
+                        'buy_below': -80,
+                        'sell_above': -20
+                    }
+                ]
+            })
+    # end of build_processor
+
+    def test_precompute_batch_matches_process(self):
+        """test_precompute_batch_matches_process"""
+        daily_df = self.daily_df.copy()
+        daily_df.loc[[30], 'close'] = np.nan
+        batched = self.build_processor()
+        per_bar = self.build_processor()
+        self.assertEqual(batched.get_num_indicators(), 7)
+        self.assertEqual(
+            batched.precompute_signals(
+                algo_id='test',
+                ticker='SPY',
+                dataset={
+                    'data': {
+                        'daily': daily_df
+                    }
+                },
+                uses_data='daily'),
+            7)
+        batched_objs = [
+            node['obj']
+            for node in batched.get_indicators().values()
+        ]
+        per_bar_objs = [
+            node['obj']
+            for node in per_bar.get_indicators().values()
+        ]
+        self.assertEqual(
+            [ind_obj.num_points for ind_obj in batched_objs],
+            [5, 5, 9, 9, 14, 14, 9])
+        expected = ae_talib.WILLR(
+            daily_df['high'].values,
+            daily_df['low'].values,
+            daily_df['close'].values,
+            14)
+        self.assertEqual(
+            str(batched_objs[5].pre_values),
+            str([ae_consts.to_f(value) for value in expected]))
+        num_buys = 0
+        for bar_idx in range(len(daily_df.index)):
+            dataset = {
+                'date': daily_df['date'].iloc[bar_idx],
+                'data': {
+                    'daily': daily_df.iloc[0:bar_idx + 1]
+                }
+            }
+            batched_report = batched.process(
+                algo_id='test',
+                ticker='SPY',
+                dataset=dataset,
+                bar_idx=bar_idx)
+            per_bar_report = per_bar.process(
+                algo_id='test',
+                ticker='SPY',
+                dataset=dataset)
+            for key in ['buys', 'sells']:
+                self.assertEqual(
+                    [node['name'] for node in batched_report[key]],
+                    [node['name'] for node in per_bar_report[key]])
+            num_buys += len(batched_report['buys'])
+            for batched_obj, per_bar_obj in zip(batched_objs, per_bar_objs):
+                for key in ['willr_value', 'willr_open_value']:
+                    self.assertEqual(
+                        str(getattr(batched_obj, key, None)),
+                        str(getattr(per_bar_obj, key, None)))
+        # end of for all bars
+        self.assertTrue(num_buys > 0)
+    # end of test_precompute_batch_matches_process
+
+    def check_batched_indicators_match_process(
+            self):
+        """check_batched_indicators_match_process
+
+        Check every batched indicator reports the same values,
+        buys and sells as ``process`` on every bar with the
+        current ``ae_talib`` backend
+        """
+        percents = {
+            'category': 'technical',
+            'type': 'momentum',
+            'uses_data': 'daily',
+            'buy_below_percent': 0.5,
+            'buy_above_percent': 0.5,
+            'sell_below_percent': 0.5,
+            'sell_above_percent': 0.5,
+            'variants': {
+                'num_points': [7, 14]
+            }
+        }
+        indicators = [
+            dict(
+                percents,
+                name=name,
+                module_path=f'analysis_engine/indicators/{name}.py')
+            for name in [
+                'williamsr',
+                'williamsr_open',
+                'wma',
+                'rsi',
+                'mom',
+                'trange'
+            ]
+        ]
+        for node in indicators[0:2]:
+            node['buy_below'] = -80
+            node['sell_above'] = -20
+
+        def build_proc():
+            return ind_proc.IndicatorProcessor(
+                config_dict={
+                    'name': 'test_batched_indicators',
+                    'indicators': indicators
+                })
+        # end of build_proc
+
+        # only the indicators that read just the trailing
+        # num_points rows share an ae_talib.multi call
+        self.assertEqual(
+            sorted(set(
+                node['obj'].get_batch_call()[0]
+                for node in build_proc().get_indicators().values()
+                if node['obj'].get_batch_call() is not None)),
+            ['WILLR'])
+
+        daily_df = self.daily_df.copy()
+        missing_df = self.daily_df.copy()
+        missing_df.loc[[30], 'close'] = np.nan
+        for use_df in [daily_df, missing_df]:
+            batched = build_proc()
+            per_bar = build_proc()
+            batched.precompute_signals(
+                algo_id='test',
+                ticker='SPY',
+                dataset={
+                    'data': {
+                        'daily': use_df
+                    }
+                },
+                uses_data='daily')
+            batched_objs = [
+                node['obj']
+                for node in batched.get_indicators().values()
+            ]
+            for ind_obj in batched_objs:
+                self.assertEqual(
+                    ind_obj.is_precomputed,
+                    ind_obj.get_batch_call() is not None)
+            num_signals = 0
+            for bar_idx in range(len(use_df.index)):
+                dataset = {
+                    'date': use_df['date'].iloc[bar_idx],
+                    'data': {
+                        'daily': use_df.iloc[0:bar_idx + 1]
+                    }
+                }
+                batched_report = batched.process(
+                    algo_id='test',
+                    ticker='SPY',
+                    dataset=dataset,
+                    bar_idx=bar_idx)
+                per_bar_report = per_bar.process(
+                    algo_id='test',
+                    ticker='SPY',
+                    dataset=dataset)
+                for key in ['buys', 'sells']:
+                    self.assertEqual(
+                        [node['name'] for node in batched_report[key]],
+                        [node['name'] for node in per_bar_report[key]])
+                    num_signals += len([
+                        node
+                        for node in batched_report[key]
+                        if node['name'].startswith('wma')
+                    ])
+                for key in ['wma_7', 'wma_14']:
+                    self.assertEqual(
+                        str(getattr(
+                            batched.get_indicators()[key]['obj'],
+                            'wma_value',
+                            None)),
+                        str(getattr(
+                            per_bar.get_indicators()[key]['obj'],
+                            'wma_value',
+                            None)))
+            # end of for all bars
+            self.assertTrue(num_signals > 0)
+        # end of for all datasets
+    # end of check_batched_indicators_match_process
+
+    def test_batched_indicators_match_process(self):
+        """test_batched_indicators_match_process"""
+        with mock.patch.object(ae_talib, 'ta', np_talib), \
+                mock.patch.object(ae_talib, 'BACKEND', 'numpy'):
+            self.check_batched_indicators_match_process()
+    # end of test_batched_indicators_match_process
+
+    def test_batched_indicators_match_process_talib(self):
+        """test_batched_indicators_match_process_talib"""
+        talib = pytest.importorskip('talib')
+        with mock.patch.object(ae_talib, 'ta', talib), \
+                mock.patch.object(ae_talib, 'BACKEND', 'talib'):
+            self.check_batched_indicators_match_process()
+    # end of test_batched_indicators_match_process_talib
+
+# end of TestIndicatorBatch
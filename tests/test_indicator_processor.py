@@ -6,7 +6,10 @@ Test file for classes and functions:
 
 """
 
+import json
+import pandas as pd
 import analysis_engine.consts as ae_consts
+import analysis_engine.indicators.base_indicator as base_indicator
 import analysis_engine.mocks.base_test as base_test
 import analysis_engine.indicators.indicator_processor as ind_proc
 
@@ -94,4 +97,176 @@ class TestIndicatorProcessor(base_test.BaseTestCase):
                     self.example_module_path)
     # end of test_build_indicator_processor
 
+    def test_report_layout_keys_are_stable(self):
+        """test_report_layout_keys_are_stable"""
+        ind = base_indicator.BaseIndicator(
+            name='base',
+            config_dict={
+                'name': 'base',
+                'type': 'momentum',
+                'num_points': 10,
+                'report_ignore_keys': []
+            })
+        first = ind.get_report()
+        second = ind.get_report()
+        # the configurable "type" collides with the report "type"
+        # and keeps the same suffixed key on every call
+        self.assertEqual(list(first), list(second))
+        self.assertEqual(len(first), len(ind.get_report_keys()))
+        self.assertEqual(
+            len([key for key in first if key.startswith('base_type')]),
+            2)
+        self.assertEqual(first['base_num_points'], 10)
+        ind.num_points = 20
+        self.assertEqual(ind.get_report()['base_num_points'], 20)
+        self.assertTrue(ind.get_report_values() is ind.report_values)
+    # end of test_report_layout_keys_are_stable
+
+    def test_flat_report_matches_latest_report(self):
+        """test_flat_report_matches_latest_report"""
+        daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+        config_dict = {
+            'indicators': [
+                {
+                    'name': f'willr_{num_points}',
+                    'module_path': (
+                        'analysis_engine/indicators/williamsr.py'),
+                    'category': 'technical',
+                    'type': 'momentum',
+                    'uses_data': 'daily',
+                    'num_points': num_points,
+                    'buy_below': -60,
+                    'sell_above': -40
+                }
+                for num_points in [5, 10]
+            ]
+        }
+        proc = ind_proc.IndicatorProcessor(
+            config_dict=config_dict)
+        ignore_keys = [
+            'buys',
+            'date',
+            'id',
+            'sells',
+            'ticker'
+        ]
+        num_signals = 0
+        for end_idx in range(20, len(daily_df.index)):
+            report = proc.process(
+                algo_id='test',
+                ticker='SPY',
+                dataset={
+                    'date': str(end_idx),
+                    'data': {
+                        'daily': daily_df.iloc[0:end_idx]
+                    }
+                })
+            keys, values = proc.get_flat_report()
+            self.assertEqual(
+                dict(zip(keys, values)),
+                {
+                    key: report[key]
+                    for key in report
+                    if key not in ignore_keys
+                })
+            for node in report['buys'] + report['sells']:
+                num_signals += 1
+                self.assertEqual(
+                    node['report'],
+                    proc.get_indicators()[node['id']]['obj'].get_report())
+        # end of for all bars
+        self.assertTrue(num_signals > 0)
+    # end of test_flat_report_matches_latest_report
+
+    def test_lookback_window_matches_full_dataset(self):
+        """test_lookback_window_matches_full_dataset"""
+        daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+        rules = {
+            'williamsr': {
+                'buy_below': -60,
+                'sell_above': -40
+            },
+            'rsi': {
+                'buy_below_percent': 5,
+                'buy_above_percent': 5,
+                'sell_below_percent': 5,
+                'sell_above_percent': 5
+            }
+        }
+        rules['obv'] = rules['rsi']
+        indicators = []
+        for name in rules:
+            for num_points in [5, 12]:
+                indicators.append({
+                    'name': f'{name}_{num_points}',
+                    'module_path': f'analysis_engine/indicators/{name}.py',
+                    'category': 'technical',
+                    'type': 'momentum',
+                    'uses_data': 'daily',
+                    'num_points': num_points,
+                    **rules[name]
+                })
+        # end of for all indicators
+        window_proc = ind_proc.IndicatorProcessor(
+            config_dict={
+                'indicators': indicators
+            })
+        full_proc = ind_proc.IndicatorProcessor(
+            config_dict={
+                'lookback_window': False,
+                'indicators': indicators
+            })
+        self.assertEqual(window_proc.get_lookback('daily'), 13)
+        self.assertIsNone(window_proc.get_lookback('minute'))
+        self.assertIsNone(full_proc.get_lookback('daily'))
+        num_signals = 0
+        for end_idx in range(1, len(daily_df.index)):
+            dataset = {
+                'date': str(end_idx),
+                'data': {
+                    'daily': daily_df.iloc[0:end_idx]
+                }
+            }
+            window_report = window_proc.process(
+                algo_id='test',
+                ticker='SPY',
+                dataset=dataset)
+            full_report = full_proc.process(
+                algo_id='test',
+                ticker='SPY',
+                dataset=dataset)
+            self.assertEqual(window_report, full_report)
+            self.assertEqual(len(dataset['data']['daily'].index), end_idx)
+            for ind_node in window_proc.get_indicators().values():
+                self.assertEqual(
+                    len(ind_node['obj'].previous_df['data']['daily'].index),
+                    min(end_idx, 13))
+            num_signals += len(full_report['buys'] + full_report['sells'])
+        # end of for all bars
+        self.assertTrue(num_signals > 0)
+
+        # an indicator without a lookback sees every row
+        indicators.append({
+            'name': 'example',
+            'module_path': self.example_module_path,
+            'category': 'technical',
+            'type': 'momentum',
+            'uses_data': 'daily',
+            'num_points': 5
+        })
+        proc = ind_proc.IndicatorProcessor(
+            config_dict={
+                'indicators': indicators
+            })
+        self.assertIsNone(proc.get_lookback('daily'))
+        dataset = {
+            'data': {
+                'daily': daily_df
+            }
+        }
+        self.assertTrue(proc.get_window_dataset(dataset) is dataset)
+    # end of test_lookback_window_matches_full_dataset
+
 # end of TestIndicatorProcessor
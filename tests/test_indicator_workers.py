@@ -0,0 +1,120 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.indicators.indicator_processor - ``indicator_workers``
+
+"""
+
+import json
+import pickle
+import pandas as pd
+import analysis_engine.mocks.base_test as base_test
+import analysis_engine.indicators.indicator_processor as ind_proc
+
+
+class TestIndicatorWorkers(base_test.BaseTestCase):
+    """TestIndicatorWorkers"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        self.daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+    # end of setUp
+
+    def build_processor(
+            self,
+            indicator_workers):
+        """build_processor
+
+        :param indicator_workers: number of threads
+        """
+        indicators = []
+        for idx, name in enumerate([
+                'williamsr',
+                'williamsr',
+                'williamsr_open',
+                'trange',
+                'bollinger_bands',
+                'obv',
+                'wma']):
+            indicators.append({
+                'name': f'{name}_{idx}',
+                'module_path': f'analysis_engine/indicators/{name}.py',
+                'category': 'technical',
+                'type': 'momentum',
+                'uses_data': 'daily',
+                'num_points': 12,
+                'buy_below': -80 + idx,
+                'sell_above': -20 - idx,
+                'upper_stdev': 2,
+                'lower_stdev': 2,
+                'matype': 0,
+                'buy_below_percent': 5,
+                'buy_above_percent': 5,
+                'sell_below_percent': 5,
+                'sell_above_percent': 5
+            })
+        return ind_proc.IndicatorProcessor(
+            config_dict={
+                'name': 'test_indicator_workers',
+                'indicator_workers': indicator_workers,
+                'indicators': indicators
+            })
+    # end of build_processor
+
+    def run_processor(
+            self,
+            proc):
+        """run_processor
+
+        :param proc: ``IndicatorProcessor`` to run
+        """
+        reports = []
+        for end_idx in range(10, len(self.daily_df.index) + 1):
+            report = proc.process(
+                algo_id='test',
+                ticker='SPY',
+                dataset={
+                    'date': self.daily_df['date'].iloc[end_idx - 1],
+                    'data': {
+                        'daily': self.daily_df.iloc[0:end_idx]
+                    }
+                })
+            reports.append(json.dumps(
+                report,
+                sort_keys=False,
+                default=str))
+        return reports
+    # end of run_processor
+
+    def test_workers_match_serial(self):
+        """test_workers_match_serial"""
+        serial = self.build_processor(
+            indicator_workers=0)
+        threaded = self.build_processor(
+            indicator_workers=4)
+        self.assertEqual(
+            self.run_processor(serial),
+            self.run_processor(threaded))
+        self.assertIsNone(serial.executor)
+        self.assertIsNotNone(threaded.executor)
+        self.assertEqual(
+            serial.get_ta_cache_summary(),
+            threaded.get_ta_cache_summary())
+        self.assertTrue(threaded.get_ta_cache_summary()['hits'] > 0)
+
+        # a forked copy starts its own pool
+        executor = threaded.executor
+        threaded.executor_pid = -1
+        self.assertFalse(threaded.get_executor() is executor)
+        copied = pickle.loads(pickle.dumps(threaded.ta_cache))
+        self.assertEqual(
+            copied.get_summary(),
+            threaded.get_ta_cache_summary())
+        threaded.shutdown()
+        self.assertIsNone(threaded.executor)
+    # end of test_workers_match_serial
+
+# end of TestIndicatorWorkers
@@ -6,6 +6,9 @@ Test file for classes and functions:
 
 """
 
+import os
+import shutil
+import tempfile
 import mock
 import analysis_engine.mocks.mock_talib as mock_talib
 import analysis_engine.consts as ae_consts
@@ -142,4 +145,79 @@ class TestLoadIndicatorFromFile(base_test.BaseTestCase):
             log_label_3)
     # end of test_load_indicator_from_example_indicator_file
 
+    def test_module_cache_reuses_class(self):
+        """test_module_cache_reuses_class"""
+        load_ind.clear_indicator_module_cache()
+        ind_1 = load_ind.load_indicator_from_module(
+            module_name='ExampleIndicatorWilliamsR',
+            log_label='my_ind_1',
+            path_to_module=self.example_module_path,
+            ind_dict=dict(self.test_data['indicators'][0]))
+        ind_2 = load_ind.load_indicator_from_module(
+            module_name='ExampleIndicatorWilliamsR',
+            log_label='my_ind_2',
+            path_to_module=self.example_module_path,
+            ind_dict=dict(self.test_data['indicators'][1]))
+        self.assertTrue(type(ind_1) is type(ind_2))
+        self.assertEqual(
+            len(load_ind.INDICATOR_MODULE_CACHE),
+            1)
+        self.assertEqual(ind_2.get_name(), 'my_ind_2')
+        self.assertEqual(ind_2.num_points, 15)
+
+        ind_3 = load_ind.load_indicator_from_module(
+            module_name='ExampleIndicatorWilliamsR',
+            log_label='my_ind_3',
+            path_to_module=self.example_module_path,
+            ind_dict=dict(self.test_data['indicators'][0]),
+            use_cache=False)
+        self.assertFalse(type(ind_1) is type(ind_3))
+        load_ind.clear_indicator_module_cache()
+        self.assertEqual(
+            len(load_ind.INDICATOR_MODULE_CACHE),
+            0)
+    # end of test_module_cache_reuses_class
+
+    def test_module_cache_invalidated_on_change(self):
+        """test_module_cache_invalidated_on_change"""
+        load_ind.clear_indicator_module_cache()
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            module_path = os.path.join(
+                tmp_dir,
+                'example_indicator_williamsr.py')
+            shutil.copyfile(
+                self.example_module_path,
+                module_path)
+
+            def load():
+                return type(load_ind.load_indicator_from_module(
+                    module_name='ExampleIndicatorWilliamsR',
+                    path_to_module=module_path,
+                    ind_dict=dict(self.test_data['indicators'][0])))
+
+            first_class = load()
+            self.assertTrue(load() is first_class)
+
+            # same modification time with new content
+            stat = os.stat(module_path)
+            with open(module_path, 'a') as module_file:
+                module_file.write('\n# changed\n')
+            os.utime(
+                module_path,
+                ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            second_class = load()
+            self.assertFalse(second_class is first_class)
+            self.assertTrue(load() is second_class)
+
+            # same content with a new modification time
+            os.utime(
+                module_path,
+                ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            self.assertFalse(load() is second_class)
+        finally:
+            shutil.rmtree(tmp_dir)
+            load_ind.clear_indicator_module_cache()
+    # end of test_module_cache_invalidated_on_change
+
 # end of TestLoadIndicatorFromFile
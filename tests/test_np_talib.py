@@ -0,0 +1,315 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.np_talib
+- the volume indicators with the ``numpy`` backend
+
+"""
+
+import json
+import mock
+import numpy as np
+import pandas as pd
+import analysis_engine.ae_talib as ae_talib
+import analysis_engine.algo as base_algo
+import analysis_engine.np_talib as np_talib
+import analysis_engine.mocks.base_test as base_test
+
+try:
+    import talib
+except Exception:
+    talib = None
+# end of loading talib if available
+
+
+class TestNumpyTALib(base_test.BaseTestCase):
+    """TestNumpyTALib"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        rng = np.random.RandomState(7)
+        num_bars = 300
+        self.close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, num_bars))
+        self.high = self.close + rng.uniform(0.0, 1.0, num_bars)
+        self.low = self.close - rng.uniform(0.0, 1.0, num_bars)
+        self.volume = rng.randint(100, 10000, num_bars).astype(np.float64)
+        # flat bars exercise the zero-range branches
+        self.high[20:25] = self.close[20:25]
+        self.low[20:25] = self.close[20:25]
+        h = self.high
+        l = self.low  # noqa
+        c = self.close
+        v = self.volume
+        self.calls = {
+            'BBANDS': lambda ta: ta.BBANDS(
+                c, timeperiod=5, nbdevup=2.0, nbdevdn=1.5, matype=0),
+            'BBANDS_EMA': lambda ta: ta.BBANDS(
+                c, timeperiod=7, nbdevup=2.0, nbdevdn=2.0, matype=1),
+            'EMA': lambda ta: ta.EMA(c, timeperiod=30),
+            'WMA': lambda ta: ta.WMA(c, timeperiod=30),
+            'ADX': lambda ta: ta.ADX(h, l, c, timeperiod=14),
+            'MACD': lambda ta: ta.MACD(
+                c, fastperiod=12, slowperiod=26, signalperiod=9),
+            'MFI': lambda ta: ta.MFI(h, l, c, v, timeperiod=14),
+            'MOM': lambda ta: ta.MOM(c, timeperiod=10),
+            'ROC': lambda ta: ta.ROC(c, timeperiod=10),
+            'RSI': lambda ta: ta.RSI(c, timeperiod=14),
+            'STOCH': lambda ta: ta.STOCH(
+                h, l, c, fastk_period=14, slowk_period=3, slowk_matype=1,
+                slowd_period=4, slowd_matype=2),
+            'STOCHF': lambda ta: ta.STOCHF(
+                h, l, c, fastk_period=5, fastd_period=3, fastd_matype=0),
+            'WILLR': lambda ta: ta.WILLR(h, l, c, timeperiod=14),
+            'AD': lambda ta: ta.AD(h, l, c, v),
+            'ADOSC': lambda ta: ta.ADOSC(
+                h, l, c, v, fastperiod=3, slowperiod=10),
+            'OBV': lambda ta: ta.OBV(c, v),
+            'ATR': lambda ta: ta.ATR(h, l, c, timeperiod=14),
+            'NATR': lambda ta: ta.NATR(h, l, c, timeperiod=14),
+            'TRANGE': lambda ta: ta.TRANGE(h, l, c)
+        }
+    # end of setUp
+
+    def assert_same_values(
+            self,
+            name,
+            expected,
+            found):
+        """assert_same_values
+
+        :param name: function name for failure messages
+        :param expected: ``talib`` output
+        :param found: ``np_talib`` output
+        """
+        if not isinstance(expected, tuple):
+            expected = (expected,)
+            found = (found,)
+        self.assertEqual(
+            len(expected),
+            len(found),
+            name)
+        for expected_values, found_values in zip(expected, found):
+            self.assertEqual(
+                expected_values.shape,
+                found_values.shape,
+                name)
+            self.assertTrue(
+                np.array_equal(
+                    np.isnan(expected_values),
+                    np.isnan(found_values)),
+                f'{name} has a different lookback')
+            valid = ~np.isnan(expected_values)
+            self.assertTrue(
+                np.allclose(
+                    expected_values[valid],
+                    found_values[valid],
+                    rtol=1e-9,
+                    atol=1e-9),
+                f'{name} values do not match talib')
+    # end of assert_same_values
+
+    def test_matches_talib(self):
+        """test_matches_talib"""
+        if not talib:
+            return
+        for name, call in self.calls.items():
+            self.assert_same_values(
+                name=name,
+                expected=call(talib),
+                found=call(np_talib))
+    # end of test_matches_talib
+
+    def test_short_inputs_match_talib(self):
+        """test_short_inputs_match_talib"""
+        if not talib:
+            return
+        for num_bars in [0, 1, 5, 14, 27, 34]:
+            h = self.high[:num_bars]
+            l = self.low[:num_bars]  # noqa
+            c = self.close[:num_bars]
+            v = self.volume[:num_bars]
+            for name, call in [
+                    ('EMA', lambda ta: ta.EMA(c, timeperiod=14)),
+                    ('RSI', lambda ta: ta.RSI(c, timeperiod=14)),
+                    ('ADX', lambda ta: ta.ADX(h, l, c, timeperiod=7)),
+                    ('MACD', lambda ta: ta.MACD(c)),
+                    ('ADOSC', lambda ta: ta.ADOSC(h, l, c, v)),
+                    ('OBV', lambda ta: ta.OBV(c, v)),
+                    ('ATR', lambda ta: ta.ATR(h, l, c, timeperiod=14))]:
+                self.assert_same_values(
+                    name=f'{name}_{num_bars}',
+                    expected=call(talib),
+                    found=call(np_talib))
+    # end of test_short_inputs_match_talib
+
+    def test_known_values(self):
+        """test_known_values"""
+        closes = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        found = np_talib.MOM(closes, timeperiod=2)
+        self.assertTrue(np.isnan(found[:2]).all())
+        self.assertEqual(
+            found[2:].tolist(),
+            [2.0, 2.0, 2.0, 2.0])
+        self.assertEqual(
+            np_talib.SMA(closes, timeperiod=3)[2:].tolist(),
+            [2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(
+            np_talib.WILLR(
+                [3.0, 4.0, 5.0],
+                [1.0, 2.0, 3.0],
+                [2.0, 3.0, 5.0],
+                timeperiod=3)[-1],
+            0.0)
+        self.assertEqual(
+            np_talib.OBV(
+                [1.0, 2.0, 1.0],
+                [10.0, 20.0, 5.0]).tolist(),
+            [10.0, 30.0, 25.0])
+        # a long recurrence matches a per-bar loop
+        inputs = np.arange(200, dtype=np.float64)
+        expected = []
+        prev = 5.0
+        for value in inputs:
+            prev = 0.9 * prev + value
+            expected.append(prev)
+        self.assertTrue(np.allclose(
+            np_talib.run_recurrence(
+                inputs=inputs,
+                decay=0.9,
+                initial=5.0),
+            expected))
+        with self.assertRaises(Exception):
+            np_talib.MA(closes, timeperiod=3, matype=8)
+    # end of test_known_values
+
+    def test_series_outputs(self):
+        """test_series_outputs"""
+        index = pd.RangeIndex(
+            start=1000,
+            stop=1000 + len(self.close))
+        h = pd.Series(self.high, index=index)
+        lo = pd.Series(self.low, index=index)
+        c = pd.Series(self.close, index=index)
+        v = pd.Series(self.volume, index=index)
+        for name, call in [
+                ('ADOSC', lambda: np_talib.ADOSC(
+                    h, lo, c, v, fastperiod=3, slowperiod=10)),
+                ('AD', lambda: np_talib.AD(h, lo, c, v)),
+                ('MFI', lambda: np_talib.MFI(h, lo, c, v, timeperiod=14)),
+                ('OBV', lambda: np_talib.OBV(c, v)),
+                ('BBANDS', lambda: np_talib.BBANDS(
+                    c, timeperiod=5, nbdevup=2.0, nbdevdn=1.5, matype=0)),
+                ('MACD', lambda: np_talib.MACD(
+                    c, fastperiod=12, slowperiod=26, signalperiod=9))]:
+            found = call()
+            expected = self.calls[name](np_talib)
+            if not isinstance(found, tuple):
+                found = (found,)
+                expected = (expected,)
+            for found_values, expected_values in zip(found, expected):
+                self.assertTrue(
+                    isinstance(found_values, pd.Series),
+                    name)
+                self.assertTrue(
+                    found_values.index.equals(index),
+                    name)
+                self.assert_same_values(
+                    name=name,
+                    expected=expected_values,
+                    found=found_values.to_numpy())
+        # end of for all series calls
+
+        # arrays in, arrays out
+        self.assertTrue(isinstance(
+            np_talib.OBV(self.close, v.values),
+            np.ndarray))
+        self.assertEqual(
+            np_talib.OBV(c, v.values).iloc[-1],
+            np_talib.OBV(self.close, self.volume)[-1])
+    # end of test_series_outputs
+
+    def test_volume_indicators_without_talib(self):
+        """test_volume_indicators_without_talib"""
+        daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+        daily_df['date'] = pd.to_datetime(
+            daily_df['date'])
+        value_keys = {
+            'chaikin': 'chaikin_value',
+            'chaikin_osc': 'chaikinosc_value',
+            'mfi': 'mfi_value',
+            'obv': 'obv_value'
+        }
+        indicators = [
+            {
+                'name': name,
+                'module_path': f'analysis_engine/indicators/{name}.py',
+                'category': 'technical',
+                'type': 'volume',
+                'uses_data': 'daily',
+                'num_points': 20,
+                'fast_period': 3,
+                'slow_period': 10,
+                'buy_below': 20,
+                'sell_above': 80,
+                'buy_below_percent': 5,
+                'buy_above_percent': 5,
+                'sell_below_percent': 5,
+                'sell_above_percent': 5
+            }
+            for name in value_keys
+        ]
+        with mock.patch.object(ae_talib, 'ta', np_talib):
+            algo = base_algo.BaseAlgo(
+                ticker='SPY',
+                balance=10000.0,
+                config_dict={
+                    'name': 'test_volume_indicators_without_talib',
+                    'timeseries': 'day',
+                    'trade_horizon': 5,
+                    'buy_shares': 10,
+                    'balance': 10000.0,
+                    'buy_rules': {
+                        'min_indicators': 1
+                    },
+                    'sell_rules': {
+                        'min_indicators': 1
+                    },
+                    'indicators': indicators
+                })
+            # run each indicator's process method on the
+            # pandas.Series inputs
+            for node in algo.iproc.get_indicators().values():
+                node['obj'].uses_ohlcv_arrays = False
+            algo.handle_data(
+                data={
+                    'SPY': [
+                        {
+                            'id': 'SPY_2018-11-07',
+                            'date': '2018-11-07',
+                            'data': {
+                                'daily': daily_df
+                            }
+                        }
+                    ]
+                })
+        # end of running with the numpy backend
+
+        for node in algo.iproc.get_indicators().values():
+            ind_obj = node['obj']
+            name = ind_obj.name
+            value = getattr(ind_obj, value_keys[name])
+            self.assertIsNotNone(
+                value,
+                name)
+            # mfi only gets num_points rows which is inside
+            # its lookback
+            if name != 'mfi':
+                self.assertFalse(
+                    np.isnan(value),
+                    name)
+    # end of test_volume_indicators_without_talib
+
+# end of TestNumpyTALib
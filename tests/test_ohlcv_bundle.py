@@ -0,0 +1,269 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.ohlcv_bundle.OHLCVBundle
+- analysis_engine.indicators.indicator_processor - ``get_ohlcv_bundle``
+- analysis_engine.indicators.base_indicator - ``process_arrays``
+
+"""
+
+import json
+import numpy as np
+import pandas as pd
+import analysis_engine.algo as base_algo
+import analysis_engine.ohlcv_bundle as ohlcv_bundle
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestOHLCVBundle(base_test.BaseTestCase):
+    """TestOHLCVBundle"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        self.minute_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-minute.json', 'r').read()))
+        self.minute_df['date'] = pd.to_datetime(
+            self.minute_df['date'])
+        self.daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+        self.daily_df['date'] = pd.to_datetime(
+            self.daily_df['date'])
+    # end of setUp
+
+    def test_bundle_arrays(self):
+        """test_bundle_arrays"""
+        df = pd.DataFrame({
+            'date': ['a', 'b', 'c', 'd'],
+            'close': [1.0, 2.0, 3.0, 4.0],
+            'volume': [10, 20, 30, 40],
+            'label': ['x', None, 'z', 'w']
+        })
+        source = ohlcv_bundle.OHLCVBundle(
+            df=df)
+        self.assertEqual(len(source), 4)
+        self.assertTrue('close' in source)
+        self.assertFalse('high' in source)
+        with self.assertRaises(KeyError):
+            source.get('high')
+        volumes = source.get('volume')
+        self.assertEqual(volumes.dtype, np.float64)
+        self.assertTrue(volumes.flags['C_CONTIGUOUS'])
+        self.assertFalse(volumes.flags['WRITEABLE'])
+        with self.assertRaises(ValueError):
+            volumes[0] = 1.0
+        # the source frame is still writeable
+        df.loc[0, 'close'] = 1.5
+        self.assertEqual(df['close'].iloc[0], 1.5)
+
+        self.assertEqual(
+            source.window('close', 2).tolist(),
+            [3.0, 4.0])
+        self.assertEqual(source.last('volume'), 40.0)
+        bundle = source.head(2)
+        self.assertEqual(bundle.num_rows, 2)
+        self.assertEqual(bundle.last('volume'), 20.0)
+        self.assertEqual(
+            bundle.window('volume', 5).tolist(),
+            [10.0, 20.0])
+        self.assertTrue(np.shares_memory(
+            bundle.get('volume'),
+            volumes))
+        # row 1 has a missing label
+        self.assertTrue(bundle.has_missing(1))
+        self.assertFalse(source.head(1).has_missing(1))
+        self.assertFalse(source.has_missing(2))
+        self.assertTrue(source.has_missing(3))
+        self.assertTrue(source.is_prefix(df.iloc[0:3]))
+        self.assertFalse(source.is_prefix(df.iloc[1:3]))
+        self.assertFalse(source.is_prefix(df.iloc[0:0]))
+
+        # trailing windows are views of the source rows
+        self.assertEqual(source.get_start_row(df.iloc[0:3]), 0)
+        self.assertEqual(source.get_start_row(df.iloc[2:4]), 2)
+        self.assertIsNone(source.get_start_row(df.iloc[[1, 3]]))
+        self.assertIsNone(source.get_start_row(df.iloc[0:0]))
+        window = source.rows(2, 4)
+        self.assertEqual(window.num_rows, 2)
+        self.assertEqual(window.start_row, 2)
+        self.assertEqual(
+            window.window('volume', 5).tolist(),
+            [30.0, 40.0])
+        self.assertTrue(np.shares_memory(
+            window.get('volume'),
+            volumes))
+        self.assertEqual(
+            window.get_num_missing().tolist(),
+            [0, 0, 0])
+        self.assertEqual(
+            source.rows(1, 3).get_num_missing().tolist(),
+            [0, 1, 1])
+    # end of test_bundle_arrays
+
+    def run_algo(
+            self,
+            minute_df,
+            use_arrays=True,
+            lookback_window=True):
+        """run_algo
+
+        :param minute_df: minute ``pd.DataFrame`` to backtest
+        :param use_arrays: set ``False`` to force every
+            indicator to use ``process``
+        :param lookback_window: set ``False`` to pass
+            every minute so far to the indicators
+        """
+        indicators = []
+        for name in [
+                'williamsr',
+                'williamsr_open',
+                'trange',
+                'bollinger_bands',
+                'chaikin_osc',
+                'obv',
+                'wma']:
+            indicators.append({
+                'name': name,
+                'module_path': f'analysis_engine/indicators/{name}.py',
+                'category': 'technical',
+                'type': 'momentum',
+                'uses_data': 'minute',
+                'num_points': 12,
+                'buy_below': -80,
+                'sell_above': -20,
+                'upper_stdev': 2,
+                'lower_stdev': 2,
+                'matype': 0,
+                'fast_period': 3,
+                'slow_period': 10,
+                'buy_below_percent': 5,
+                'buy_above_percent': 5,
+                'sell_below_percent': 5,
+                'sell_above_percent': 5
+            })
+        algo = base_algo.BaseAlgo(
+            ticker='SPY',
+            balance=10000.0,
+            config_dict={
+                'name': 'test_ohlcv_bundle',
+                'timeseries': 'minute',
+                'trade_horizon': 5,
+                'buy_shares': 10,
+                'balance': 10000.0,
+                'buy_rules': {
+                    'min_indicators': 1
+                },
+                'sell_rules': {
+                    'min_indicators': 1
+                },
+                'lookback_window': lookback_window,
+                'indicators': indicators
+            })
+        values = []
+        num_rows = []
+        ind_objs = [
+            node['obj']
+            for node in algo.iproc.get_indicators().values()
+        ]
+        for ind_obj in ind_objs:
+            self.assertTrue(ind_obj.uses_ohlcv_arrays)
+            if not use_arrays:
+                ind_obj.uses_ohlcv_arrays = False
+        process = algo.iproc.process
+
+        def track_values(
+                **kwargs):
+            num_rows.append(len(
+                kwargs['dataset']['data']['minute'].index))
+            res = process(**kwargs)
+            values.append([
+                (str(getattr(ind_obj, key, None)),
+                 ind_obj.is_buy,
+                 ind_obj.is_sell)
+                for ind_obj in ind_objs
+                for key in [
+                    'willr_value',
+                    'willr_open_value',
+                    'trange_value',
+                    'upperband',
+                    'lowerband',
+                    'chaikinosc_value',
+                    'obv_value',
+                    'wma_value']
+            ])
+            if use_arrays:
+                self.assertEqual(
+                    list(algo.iproc.ohlcv_bundles),
+                    ['minute'])
+            return res
+        # end of track_values
+
+        algo.iproc.process = track_values
+        algo.handle_data(
+            data={
+                'SPY': [
+                    {
+                        'id': 'SPY_2018-11-07',
+                        'date': '2018-11-07',
+                        'data': {
+                            'daily': self.daily_df,
+                            'minute': minute_df.copy()
+                        }
+                    }
+                ]
+            })
+        if lookback_window:
+            # the algorithm only slices the trailing minutes
+            self.assertEqual(
+                max(num_rows),
+                13)
+        else:
+            self.assertEqual(
+                num_rows,
+                list(range(1, len(minute_df.index) + 1)))
+        return values, algo.get_result()
+    # end of run_algo
+
+    def test_arrays_match_process(self):
+        """test_arrays_match_process"""
+        if not self.has_ta_lib:
+            return
+        minute_df = self.minute_df.copy()
+        minute_df.loc[[30, 31], 'close'] = np.nan
+        minute_df.loc[[50], 'label'] = np.nan
+        frame_values, frame_res = self.run_algo(
+            minute_df=minute_df,
+            use_arrays=False)
+        array_values, array_res = self.run_algo(
+            minute_df=minute_df)
+        self.assertEqual(
+            frame_values,
+            array_values)
+        self.assertEqual(
+            frame_res['balance'],
+            array_res['balance'])
+        self.assertEqual(
+            len(frame_res['buys']),
+            len(array_res['buys']))
+        self.assertTrue(len(array_res['buys']) > 0)
+
+        # every minute so far gives the same results
+        full_values, full_res = self.run_algo(
+            minute_df=minute_df,
+            lookback_window=False)
+        self.assertEqual(
+            full_values,
+            array_values)
+        self.assertEqual(
+            [
+                str({k: v for k, v in row.items() if k != 'created'})
+                for row in full_res['history']
+            ],
+            [
+                str({k: v for k, v in row.items() if k != 'created'})
+                for row in array_res['history']
+            ])
+    # end of test_arrays_match_process
+
+# end of TestOHLCVBundle
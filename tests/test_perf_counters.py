@@ -0,0 +1,188 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.perf_counters.PerfCounters
+- analysis_engine.algo.BaseAlgo.get_result perf summary
+
+"""
+
+import json
+import tracemalloc
+import pandas as pd
+import analysis_engine.algo as base_algo
+import analysis_engine.perf_counters as perf_utils
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestPerfCounters(base_test.BaseTestCase):
+    """TestPerfCounters"""
+
+    def test_phase_and_indicator_counters(self):
+        """test_phase_and_indicator_counters"""
+        perf = perf_utils.PerfCounters()
+        perf.start_run()
+        for idx in range(3):
+            perf.mark()
+            perf.lap('indicator')
+            perf.lap('trade')
+            perf.add_indicator(
+                name='willr_10',
+                seconds=0.5)
+        perf.finish_run()
+        summary = perf.get_summary()
+        self.assertTrue(summary['enabled'])
+        self.assertEqual(
+            summary['phases']['indicator']['calls'],
+            3)
+        self.assertEqual(
+            summary['phases']['trade']['calls'],
+            3)
+        self.assertEqual(
+            summary['indicators']['willr_10']['seconds'],
+            1.5)
+        self.assertEqual(
+            summary['indicators']['willr_10']['avg_us'],
+            500000.0)
+        self.assertNotIn(
+            'memory',
+            summary)
+        json.dumps(summary)
+
+        other = perf_utils.PerfCounters()
+        other.add_indicator(
+            name='willr_10',
+            seconds=0.5)
+        perf.merge(other)
+        self.assertEqual(
+            perf.get_summary()['indicators']['willr_10']['calls'],
+            4)
+    # end of test_phase_and_indicator_counters
+
+    def test_disabled_counters(self):
+        """test_disabled_counters"""
+        perf = perf_utils.PerfCounters(
+            enabled=False)
+        perf.start_run()
+        perf.mark()
+        perf.lap('indicator')
+        perf.finish_run()
+        summary = perf.get_summary()
+        self.assertFalse(summary['enabled'])
+        self.assertEqual(
+            summary['phases'],
+            {})
+        self.assertEqual(
+            summary['total_seconds'],
+            0.0)
+    # end of test_disabled_counters
+
+    def test_trace_memory(self):
+        """test_trace_memory"""
+        was_tracing = tracemalloc.is_tracing()
+        perf = perf_utils.PerfCounters(
+            trace_memory=True,
+            num_top_allocations=3)
+        perf.start_run()
+        values = [str(idx) for idx in range(1000)]
+        perf.snapshot_memory(
+            label='SPY_2018-11-07')
+        perf.finish_run()
+        summary = perf.get_summary()
+        self.assertEqual(
+            summary['memory']['snapshots'][0]['label'],
+            'SPY_2018-11-07')
+        self.assertTrue(summary['memory']['peak_bytes'] > 0)
+        self.assertTrue(len(summary['memory']['top']) <= 3)
+        self.assertEqual(
+            tracemalloc.is_tracing(),
+            was_tracing)
+        self.assertEqual(
+            len(values),
+            1000)
+    # end of test_trace_memory
+
+    def test_algo_result_has_perf_summary(self):
+        """test_algo_result_has_perf_summary"""
+        if not self.has_ta_lib:
+            return
+        minute_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-minute.json', 'r').read()))
+        minute_df['date'] = pd.to_datetime(
+            minute_df['date'])
+        daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+        daily_df['date'] = pd.to_datetime(
+            daily_df['date'])
+        algo = base_algo.BaseAlgo(
+            ticker='SPY',
+            balance=10000.0,
+            config_dict={
+                'name': 'test_perf_counters',
+                'timeseries': 'minute',
+                'trade_horizon': 5,
+                'buy_shares': 10,
+                'balance': 10000.0,
+                'buy_rules': {
+                    'min_indicators': 1
+                },
+                'sell_rules': {
+                    'min_indicators': 1
+                },
+                'indicators': [
+                    {
+                        'name': 'willr_10',
+                        'module_path': (
+                            'analysis_engine/indicators/williamsr.py'),
+                        'category': 'technical',
+                        'type': 'momentum',
+                        'uses_data': 'minute',
+                        'num_points': 10,
+                        'buy_below': -70,
+                        'sell_above': -30
+                    }
+                ]
+            })
+        algo.handle_data(
+            data={
+                'SPY': [
+                    {
+                        'id': 'SPY_2018-11-07',
+                        'date': '2018-11-07',
+                        'data': {
+                            'daily': daily_df,
+                            'minute': minute_df
+                        }
+                    }
+                ]
+            })
+        res = algo.get_result()
+        num_bars = len(res['history'])
+        perf = res['perf']
+        self.assertTrue(perf['total_seconds'] > 0)
+        for phase in ['load', 'indicator', 'process', 'trade', 'history']:
+            self.assertIn(
+                phase,
+                perf['phases'])
+        self.assertEqual(
+            perf['phases']['indicator']['calls'],
+            num_bars)
+        self.assertEqual(
+            perf['indicators']['willr_10']['calls'],
+            num_bars)
+        # the ae_talib.cached counters are in the perf summary
+        # instead of every bar's indicator report
+        self.assertEqual(
+            perf['ta_cache'],
+            algo.iproc.get_ta_cache_summary())
+        self.assertNotIn(
+            'ta_cache_hits',
+            algo.iproc.latest_report)
+        self.assertNotIn(
+            'ta_cache_hits',
+            res['history'][-1])
+        self.assertEqual(
+            algo.create_report_dataset()['perf']['total_seconds'],
+            perf['total_seconds'])
+    # end of test_algo_result_has_perf_summary
+
+# end of TestPerfCounters
@@ -0,0 +1,210 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.position_ledger.OrderRecord
+- analysis_engine.position_ledger.PositionLedger
+
+"""
+
+import json
+import pickle
+import analysis_engine.consts as ae_consts
+import analysis_engine.build_buy_order as buy_utils
+import analysis_engine.build_sell_order as sell_utils
+import analysis_engine.position_ledger as position_ledger
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestPositionLedger(base_test.BaseTestCase):
+    """TestPositionLedger"""
+
+    def build_buy(
+            self,
+            num_owned=0,
+            balance=1000.0):
+        """build_buy
+
+        :param num_owned: shares owned before the buy
+        :param balance: balance before the buy
+        """
+        return buy_utils.build_buy_order(
+            ticker='SPY',
+            close=280.0,
+            num_owned=num_owned,
+            shares=1,
+            balance=balance,
+            commission=6.0,
+            date='2018-11-07',
+            minute='2018-11-07 09:31:00',
+            use_key='SPY_2018-11-07',
+            details={'close': 280.0},
+            reason='test')
+    # end of build_buy
+
+    def test_order_record(self):
+        """test_order_record"""
+        order = self.build_buy()
+        record = position_ledger.OrderRecord(order)
+        self.assertEqual(
+            record,
+            order)
+        self.assertEqual(
+            record['close'],
+            280.0)
+        self.assertEqual(
+            record.get('not_a_key', 'missing'),
+            'missing')
+        self.assertEqual(
+            list(record.keys()),
+            list(order.keys()))
+        self.assertEqual(
+            record.to_dict(),
+            order)
+        self.assertEqual(
+            json.dumps(position_ledger.to_dicts([record, order])),
+            json.dumps([order, order]))
+        self.assertEqual(
+            pickle.loads(pickle.dumps(record)),
+            order)
+        # records built from the same function share one layout
+        other_record = position_ledger.OrderRecord(self.build_buy())
+        self.assertTrue(
+            record.layout is other_record.layout)
+        with self.assertRaises(TypeError):
+            record['close'] = 1.0
+    # end of test_order_record
+
+    def test_record_orders(self):
+        """test_record_orders"""
+        ledger = position_ledger.PositionLedger()
+        self.assertEqual(
+            ledger.get_position('SPY'),
+            (None, None, None, 0, 0))
+        self.assertEqual(
+            ledger.get_owned_shares('SPY'),
+            0)
+
+        buy, created_position = ledger.record_order(
+            ticker='SPY',
+            order=self.build_buy(),
+            is_buy=True)
+        self.assertTrue(created_position)
+        self.assertEqual(
+            buy['status'],
+            ae_consts.TRADE_FILLED)
+        buy, created_position = ledger.record_order(
+            ticker='SPY',
+            order=self.build_buy(
+                num_owned=1,
+                balance=buy['balance']),
+            is_buy=True)
+        self.assertFalse(created_position)
+        sell, created_position = ledger.record_order(
+            ticker='SPY',
+            order=sell_utils.build_sell_order(
+                ticker='SPY',
+                close=281.0,
+                num_owned=2,
+                shares=1,
+                balance=buy['balance'],
+                commission=6.0,
+                date='2018-11-07',
+                minute='2018-11-07 09:32:00',
+                use_key='SPY_2018-11-07',
+                details={'close': 281.0}),
+            is_buy=False)
+        self.assertFalse(created_position)
+        (num_owned,
+         buys,
+         sells,
+         num_buys,
+         num_sells) = ledger.get_position('SPY')
+        self.assertEqual(num_owned, 1)
+        self.assertEqual(num_buys, 2)
+        self.assertEqual(num_sells, 1)
+        self.assertEqual(
+            sells[0],
+            sell)
+        self.assertAlmostEqual(
+            ledger.get_net_value('SPY'),
+            sell['sell_price'] - sum(
+                order['buy_price'] for order in buys))
+        self.assertEqual(
+            ledger.get_net_value('QQQ'),
+            0.0)
+
+        # orders that are not filled do not change the position
+        not_filled, created_position = ledger.record_order(
+            ticker='SPY',
+            order=self.build_buy(
+                num_owned=1,
+                balance=0.0),
+            is_buy=True)
+        self.assertEqual(
+            not_filled['status'],
+            ae_consts.TRADE_NOT_ENOUGH_FUNDS)
+        self.assertEqual(
+            ledger.get_position('SPY')[3],
+            2)
+
+        positions = position_ledger.positions_to_dicts(
+            ledger.positions)
+        self.assertEqual(
+            positions['SPY']['shares'],
+            1)
+        self.assertTrue(
+            isinstance(positions['SPY']['buys'][0], dict))
+        json.dumps(positions)
+    # end of test_record_orders
+
+    def test_set_positions(self):
+        """test_set_positions"""
+        ledger = position_ledger.PositionLedger()
+        buy, _ = ledger.record_order(
+            ticker='SPY',
+            order=self.build_buy(),
+            is_buy=True)
+        expected_counters = dict(ledger.counters['SPY'])
+
+        # replacing positions rebuilds the counters
+        other_ledger = position_ledger.PositionLedger()
+        other_ledger.set_position(
+            ticker='SPY',
+            position=ledger.positions['SPY'])
+        self.assertEqual(
+            other_ledger.counters['SPY'],
+            expected_counters)
+        other_ledger.set_positions(
+            positions=dict(ledger.positions))
+        self.assertEqual(
+            other_ledger.get_position('SPY')[3:],
+            (1, 0))
+
+        # positions added without the ledger are counted on use
+        other_ledger.positions['QQQ'] = {
+            'shares': 1,
+            'buys': [buy],
+            'sells': []
+        }
+        self.assertEqual(
+            other_ledger.get_position('QQQ')[3:],
+            (1, 0))
+        other_ledger.record_order(
+            ticker='QQQ',
+            order=self.build_buy(
+                num_owned=1,
+                balance=buy['balance']),
+            is_buy=True)
+        (num_owned,
+         _,
+         _,
+         num_buys,
+         _) = other_ledger.get_position('QQQ')
+        self.assertEqual(num_owned, 2)
+        self.assertEqual(num_buys, 2)
+        self.assertAlmostEqual(
+            other_ledger.get_net_value('QQQ'),
+            -2 * buy['buy_price'])
+    # end of test_set_positions
+
+# end of TestPositionLedger
@@ -0,0 +1,105 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.redis_pool
+
+"""
+
+import os
+import mock
+import analysis_engine.consts as ae_consts
+import analysis_engine.redis_pool as redis_pool
+import analysis_engine.get_data_from_redis_key as redis_get
+import analysis_engine.set_data_in_redis_key as redis_set
+import analysis_engine.mocks.mock_redis as mock_redis
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestRedisPool(base_test.BaseTestCase):
+    """TestRedisPool"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        redis_pool.clear_pools()
+    # end of setUp
+
+    def tearDown(
+            self):
+        """tearDown"""
+        redis_pool.clear_pools()
+        os.environ.pop('REDIS_POOL_ENABLED', None)
+    # end of tearDown
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    def test_get_client_is_shared(self):
+        """test_get_client_is_shared"""
+        client = redis_pool.get_client(
+            host='localhost',
+            port=6379,
+            db=0)
+        self.assertTrue(isinstance(client, mock_redis.MockRedis))
+        self.assertTrue(client is redis_pool.get_client(
+            address='localhost:6379',
+            db=0))
+        self.assertTrue(client is redis_pool.get_client(
+            host='localhost',
+            port='6379',
+            db='0'))
+        self.assertFalse(client is redis_pool.get_client(
+            host='localhost',
+            port=6379,
+            db=1))
+        self.assertFalse(client is redis_pool.get_client(
+            host='localhost',
+            port=6379,
+            db=0,
+            password='secret'))
+        self.assertEqual(redis_pool.get_num_pools(), 3)
+
+        # a forked process starts with an empty registry
+        redis_pool.REDIS_POOLS_PID = -1
+        self.assertEqual(redis_pool.get_num_pools(), 0)
+        self.assertFalse(client is redis_pool.get_client(
+            host='localhost',
+            port=6379,
+            db=0))
+
+        os.environ['REDIS_POOL_ENABLED'] = '0'
+        self.assertFalse(
+            redis_pool.get_client(address='localhost:6379') is
+            redis_pool.get_client(address='localhost:6379'))
+    # end of test_get_client_is_shared
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    def test_set_and_get_share_the_client(self):
+        """test_set_and_get_share_the_client"""
+        set_res = redis_set.set_data_in_redis_key(
+            host='localhost',
+            port=6379,
+            db=0,
+            key='SPY_2019-02-15_daily',
+            data={
+                'close': 287.5
+            })
+        self.assertEqual(set_res['status'], ae_consts.SUCCESS)
+        get_res = redis_get.get_data_from_redis_key(
+            host='localhost',
+            port=6379,
+            db=0,
+            key='SPY_2019-02-15_daily')
+        self.assertEqual(get_res['status'], ae_consts.SUCCESS)
+        self.assertEqual(
+            get_res['rec']['data'],
+            {
+                'close': 287.5
+            })
+        self.assertEqual(redis_pool.get_num_pools(), 1)
+    # end of test_set_and_get_share_the_client
+
+# end of TestRedisPool
@@ -0,0 +1,181 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.resampled_bars.ResampledBars
+- analysis_engine.indicators.indicator_processor.IndicatorProcessor -
+  timeframe ``uses_data`` specs like ``minute:5m``
+
+"""
+
+import numpy as np
+import pandas as pd
+import analysis_engine.resampled_bars as resampled_bars
+import analysis_engine.indicators.indicator_processor as ind_proc
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestResampledBars(base_test.BaseTestCase):
+    """TestResampledBars"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        num_rows = 200
+        rnd = np.random.RandomState(7)
+        closes = 100.0 + np.cumsum(rnd.randn(num_rows))
+        dates = pd.date_range(
+            '2019-02-15 09:30:00',
+            periods=num_rows + 15,
+            freq='1min')
+        # a gap in the minutes
+        dates = dates[0:80].append(dates[95:num_rows + 15])
+        self.df = pd.DataFrame({
+            'date': dates[0:num_rows].strftime('%Y-%m-%d %H:%M:%S'),
+            'open': closes + rnd.randn(num_rows) * 0.1,
+            'high': closes + 0.5,
+            'low': closes - 0.5,
+            'close': closes,
+            'volume': rnd.randint(100, 1000, num_rows).astype(float)
+        })
+        self.df.loc[10, 'high'] = np.nan
+        self.df.loc[11, 'close'] = np.nan
+        self.df.loc[12, 'volume'] = np.nan
+    # end of setUp
+
+    def resample(
+            self,
+            df,
+            rule):
+        """resample
+
+        :param df: minute ``pd.DataFrame``
+        :param rule: pandas resample rule
+        """
+        use_df = df.copy()
+        use_df['date'] = pd.to_datetime(use_df['date'])
+        resampler = use_df.set_index('date').resample(rule)
+        res = resampler.agg({
+            'open': 'first',
+            'high': 'max',
+            'low': 'min',
+            'close': 'last',
+            'volume': 'sum'
+        })
+        res = res[resampler.size() > 0].reset_index()
+        res['date'] = res['date'].astype('datetime64[ns]')
+        return res
+    # end of resample
+
+    def test_parse_timeframe(self):
+        """test_parse_timeframe"""
+        self.assertIsNone(resampled_bars.parse_timeframe('minute'))
+        self.assertEqual(
+            resampled_bars.parse_timeframe('minute:5m'),
+            ('minute', 300))
+        self.assertEqual(
+            resampled_bars.parse_timeframe('minute:1h'),
+            ('minute', 3600))
+        with self.assertRaises(Exception):
+            resampled_bars.parse_timeframe('minute:5x')
+    # end of test_parse_timeframe
+
+    def test_update_matches_pandas_resample(self):
+        """test_update_matches_pandas_resample"""
+        bars = resampled_bars.ResampledBars(
+            uses_data='minute:15m')
+        for end_idx in range(1, len(self.df.index) + 1):
+            prefix_df = self.df.iloc[0:end_idx]
+            bars.update(
+                df=prefix_df)
+            pd.testing.assert_frame_equal(
+                bars.get_df(),
+                self.resample(prefix_df, '15min'))
+        # end of for all minutes
+        pd.testing.assert_frame_equal(
+            bars.get_df(num_bars=3),
+            self.resample(self.df, '15min').iloc[-3:])
+
+        # a new day starts over
+        next_df = self.df.iloc[0:30].copy()
+        next_df['date'] = (
+            pd.to_datetime(next_df['date']) +
+            pd.Timedelta(days=1)).dt.strftime('%Y-%m-%d %H:%M:%S')
+        bars.update(
+            df=next_df)
+        pd.testing.assert_frame_equal(
+            bars.get_df(),
+            self.resample(next_df, '15min'))
+    # end of test_update_matches_pandas_resample
+
+    def test_processor_timeframe(self):
+        """test_processor_timeframe"""
+        indicator = {
+            'name': 'willr',
+            'module_path': 'analysis_engine/indicators/williamsr.py',
+            'category': 'technical',
+            'type': 'momentum',
+            'uses_data': 'minute:5m',
+            'num_points': 5,
+            'buy_below': -60,
+            'sell_above': -40
+        }
+        proc = ind_proc.IndicatorProcessor(
+            config_dict={
+                'indicators': [
+                    indicator,
+                    dict(indicator, name='willr_2')
+                ]
+            })
+        self.assertEqual(list(proc.resampled), ['minute:5m'])
+        self.assertEqual(proc.get_lookback('minute:5m'), 6)
+        # convert the source minutes once
+        proc.set_ohlcv_source(
+            df=self.df,
+            uses_data='minute')
+        expected_proc = ind_proc.IndicatorProcessor(
+            config_dict={
+                'indicators': [
+                    dict(indicator, uses_data='daily')
+                ]
+            })
+        num_signals = 0
+        for end_idx in range(1, len(self.df.index) + 1):
+            prefix_df = self.df.iloc[0:end_idx]
+            report = proc.process(
+                algo_id='test',
+                ticker='SPY',
+                dataset={
+                    'data': {
+                        'minute': prefix_df
+                    }
+                })
+            expected_report = expected_proc.process(
+                algo_id='test',
+                ticker='SPY',
+                dataset={
+                    'data': {
+                        'daily': self.resample(prefix_df, '5min')
+                    }
+                })
+            self.assertEqual(
+                getattr(
+                    proc.get_indicators()['willr']['obj'],
+                    'willr_value',
+                    None),
+                getattr(
+                    expected_proc.get_indicators()['willr']['obj'],
+                    'willr_value',
+                    None))
+            self.assertEqual(
+                len(report['buys']),
+                2 * len(expected_report['buys']))
+            self.assertEqual(
+                len(report['sells']),
+                2 * len(expected_report['sells']))
+            num_signals += len(report['buys'] + report['sells'])
+        # end of for all minutes
+        self.assertTrue(num_signals > 0)
+    # end of test_processor_timeframe
+
+# end of TestResampledBars
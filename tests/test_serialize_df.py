@@ -0,0 +1,348 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.serialize_df
+- analysis_engine.compress_data.compress_data
+- analysis_engine.get_data_from_redis_key.decode_data
+- analysis_engine.iex.extract_df_from_redis.extract_daily_dataset
+
+"""
+
+import mock
+import numpy as np
+import pandas as pd
+import analysis_engine.consts as ae_consts
+import analysis_engine.compress_data as compress_data
+import analysis_engine.redis_pool as redis_pool
+import analysis_engine.serialize_df as serialize_df
+import analysis_engine.build_df_from_redis as build_df
+import analysis_engine.get_data_from_redis_key as redis_get
+import analysis_engine.iex.extract_df_from_redis as iex_extract
+import analysis_engine.td.extract_df_from_redis as td_extract
+import analysis_engine.mocks.mock_redis as mock_redis
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestSerializeDF(base_test.BaseTestCase):
+    """TestSerializeDF"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        redis_pool.clear_pools()
+        self.ticker = 'SPY'
+        self.date = '2019-02-15'
+        self.minute_df = pd.DataFrame({
+            'date': pd.date_range(
+                '2019-02-15 09:30:00',
+                periods=4,
+                freq='min'),
+            'open': [
+                271.0,
+                271.5,
+                np.nan,
+                272.0
+            ],
+            'close': [
+                271.5,
+                272.0,
+                272.0,
+                272.5
+            ],
+            'volume': [
+                1000,
+                2000,
+                1500,
+                3000
+            ]
+        })
+        self.calls_df = pd.DataFrame({
+            'date': pd.to_datetime([
+                '2019-02-15 15:59:00',
+                '2019-02-15 15:59:00'
+            ]),
+            'exp_date': [
+                '2019-02-22',
+                '2019-02-22'
+            ],
+            'strike': [
+                270.0,
+                275.0
+            ],
+            'symbol': [
+                'SPY_022219C270',
+                None
+            ],
+            'in_the_money': [
+                True,
+                False
+            ],
+            'trade_date': pd.date_range(
+                '2019-02-15 15:00:00',
+                periods=2,
+                freq='h',
+                tz='US/Eastern')
+        })
+    # end of setUp
+
+    def tearDown(
+            self):
+        """tearDown"""
+        redis_pool.clear_pools()
+    # end of tearDown
+
+    def decode_json(
+            self,
+            df,
+            date_format=None):
+        """decode_json
+
+        Load ``df`` the way ``build_df_from_redis`` loads
+        the compressed json cache
+
+        :param df: ``pandas.DataFrame`` to cache
+        :param date_format: optional - ``to_json`` date format
+        """
+        return build_df.build_df_from_redis(
+            key='json',
+            redis_res=redis_get.decode_data(
+                key='json',
+                raw_data=compress_data.compress_data(
+                    data=df,
+                    date_format=date_format,
+                    serializer='json'),
+                decompress_df=True))['rec']['data']
+    # end of decode_json
+
+    def test_serialize_df_round_trip(self):
+        """test_serialize_df_round_trip"""
+        inf_df = pd.DataFrame({
+            'close': [
+                271.5,
+                np.inf,
+                -np.inf,
+                272.25
+            ],
+            'volume': [
+                1000.0,
+                np.inf,
+                1500.0,
+                3000.0
+            ]
+        })
+        empty_df = self.minute_df.iloc[0:0]
+        for df in [inf_df, empty_df, self.minute_df, self.calls_df]:
+            for compress in [True, False]:
+                for date_format in [None, 'iso']:
+                    data = serialize_df.serialize_df(
+                        df=df,
+                        compress=compress,
+                        date_format=date_format)
+                    self.assertTrue(serialize_df.is_serialized_df(data))
+                    res = serialize_df.deserialize_df(
+                        data=data)
+                    pd.testing.assert_frame_equal(
+                        res,
+                        self.decode_json(
+                            df=df,
+                            date_format=date_format))
+                # end of for all date formats
+            # end of for compressed and not
+        # end of for all frames
+
+        # json writes inf as null
+        res = serialize_df.deserialize_df(
+            data=serialize_df.serialize_df(
+                df=inf_df))
+        self.assertEqual(
+            list(res['close'].isna()),
+            [False, True, True, False])
+        self.assertEqual(res['volume'].dtype, np.float64)
+        # json has no columns without any rows
+        res = serialize_df.deserialize_df(
+            data=serialize_df.serialize_df(
+                df=empty_df))
+        self.assertEqual(len(res.columns), 0)
+
+        res = serialize_df.deserialize_df(
+            data=serialize_df.serialize_df(
+                df=self.calls_df))
+        # the frame can be changed in place like one from json
+        res.loc[0, 'strike'] = 265.0
+        self.assertEqual(res['strike'].iloc[0], 265.0)
+
+        empty_df = serialize_df.deserialize_df(
+            data=serialize_df.serialize_df(
+                df=pd.DataFrame([])))
+        self.assertEqual(len(empty_df.index), 0)
+    # end of test_serialize_df_round_trip
+
+    def test_detect_header(self):
+        """test_detect_header"""
+        json_data = compress_data.compress_data(
+            data=self.minute_df,
+            serializer='json')
+        self.assertFalse(serialize_df.is_serialized_df(json_data))
+        self.assertFalse(serialize_df.is_serialized_df(b'[]'))
+        self.assertFalse(serialize_df.is_serialized_df(None))
+
+        data = serialize_df.serialize_df(
+            df=self.minute_df)
+        future_data = (
+            serialize_df.HEADER +
+            bytes([serialize_df.VERSION + 1]) +
+            data[len(serialize_df.HEADER) + 1:])
+        with self.assertRaises(ValueError):
+            serialize_df.deserialize_df(
+                data=future_data)
+        res = redis_get.decode_data(
+            key='SPY_2019-02-15_minute',
+            raw_data=future_data,
+            decompress_df=True)
+        self.assertEqual(res['status'], ae_consts.ERR)
+    # end of test_detect_header
+
+    def test_compress_data_serializer(self):
+        """test_compress_data_serializer"""
+        with mock.patch(
+                'analysis_engine.consts.DF_SERIALIZER',
+                'columnar'):
+            data = compress_data.compress_data(
+                data=self.minute_df)
+            self.assertTrue(serialize_df.is_serialized_df(data))
+            # dictionaries are still json
+            data = compress_data.compress_data(
+                data={
+                    'close': 272.5
+                })
+            self.assertFalse(serialize_df.is_serialized_df(data))
+        data = compress_data.compress_data(
+            data=self.minute_df)
+        self.assertFalse(serialize_df.is_serialized_df(data))
+    # end of test_compress_data_serializer
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    def test_read_columnar_and_json_keys(self):
+        """test_read_columnar_and_json_keys"""
+        client = redis_pool.get_client(
+            address=ae_consts.REDIS_ADDRESS,
+            db=ae_consts.REDIS_DB)
+        for serializer in ['json', 'columnar']:
+            client.set(
+                name=f'{self.ticker}_{self.date}_minute_{serializer}',
+                value=compress_data.compress_data(
+                    data=self.minute_df,
+                    serializer=serializer))
+        # end of publishing both formats
+
+        json_res = build_df.build_df_from_redis(
+            address=ae_consts.REDIS_ADDRESS,
+            db=ae_consts.REDIS_DB,
+            key=f'{self.ticker}_{self.date}_minute_json')
+        res = build_df.build_df_from_redis(
+            address=ae_consts.REDIS_ADDRESS,
+            db=ae_consts.REDIS_DB,
+            key=f'{self.ticker}_{self.date}_minute_columnar')
+        for extract_res in [json_res, res]:
+            self.assertEqual(extract_res['status'], ae_consts.SUCCESS)
+            self.assertTrue(extract_res['rec']['valid_df'])
+        pd.testing.assert_frame_equal(
+            res['rec']['data'],
+            json_res['rec']['data'])
+    # end of test_read_columnar_and_json_keys
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    def test_extract_iex_daily_matches_json(self):
+        """test_extract_iex_daily_matches_json"""
+        # like the IEX daily chart after the fetch
+        daily_df = pd.DataFrame({
+            'date': [
+                '2019-02-13',
+                '2019-02-14',
+                '2019-02-15'
+            ],
+            'open': [
+                270.0,
+                271.0,
+                np.nan
+            ],
+            'close': [
+                271.0,
+                272.0,
+                273.0
+            ],
+            'volume': [
+                1000,
+                2000,
+                3000
+            ],
+            'label': [
+                'Feb 13',
+                'Feb 14',
+                None
+            ],
+            'changeOverTime': [
+                0.0,
+                0.0036,
+                0.0073
+            ]
+        })
+        client = redis_pool.get_client(
+            address=ae_consts.REDIS_ADDRESS,
+            db=ae_consts.REDIS_DB)
+        extracted = {}
+        for serializer in ['json', 'columnar']:
+            for date_format in [None, 'iso']:
+                client.set(
+                    name=f'{self.ticker}_{self.date}_daily',
+                    value=compress_data.compress_data(
+                        data=daily_df,
+                        date_format=date_format,
+                        serializer=serializer))
+                status, extracted[(serializer, date_format)] = \
+                    iex_extract.extract_daily_dataset(
+                        ticker=self.ticker,
+                        date=self.date)
+                self.assertEqual(status, ae_consts.SUCCESS)
+        # end of extracting both formats
+
+        for date_format in [None, 'iso']:
+            json_df = extracted[('json', date_format)]
+            self.assertEqual(json_df['date'].dtype.kind, 'M')
+            pd.testing.assert_frame_equal(
+                extracted[('columnar', date_format)],
+                json_df)
+    # end of test_extract_iex_daily_matches_json
+
+    @mock.patch(
+        ('redis.Redis'),
+        new=mock_redis.MockRedis)
+    def test_extract_columnar_td_calls(self):
+        """test_extract_columnar_td_calls"""
+        client = redis_pool.get_client(
+            address=ae_consts.REDIS_ADDRESS,
+            db=ae_consts.REDIS_DB)
+        client.set(
+            name=f'{self.ticker}_{self.date}_tdcalls',
+            value=compress_data.compress_data(
+                data=self.calls_df,
+                serializer='columnar'))
+        status, calls_df = td_extract.extract_option_calls_dataset(
+            ticker=self.ticker,
+            date=self.date)
+        self.assertEqual(status, ae_consts.SUCCESS)
+        self.assertEqual(
+            list(calls_df['strike']),
+            list(self.calls_df['strike']))
+        self.assertEqual(
+            calls_df['date'].iloc[0],
+            self.calls_df['date'].iloc[0].strftime(
+                ae_consts.COMMON_TICK_DATE_FORMAT))
+    # end of test_extract_columnar_td_calls
+
+# end of TestSerializeDF
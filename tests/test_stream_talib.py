@@ -0,0 +1,355 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.stream_talib
+- analysis_engine.indicators.base_indicator - ``process_incremental``
+    with ``build_stream_kernel``
+
+"""
+
+import json
+import numpy as np
+import pandas as pd
+import analysis_engine.algo as base_algo
+import analysis_engine.stream_talib as stream_talib
+import analysis_engine.mocks.base_test as base_test
+
+try:
+    import talib
+except Exception:
+    talib = None
+# end of loading talib if available
+
+
+class TestStreamTALib(base_test.BaseTestCase):
+    """TestStreamTALib"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        rng = np.random.RandomState(11)
+        num_bars = 400
+        self.close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, num_bars))
+        self.high = self.close + rng.uniform(0.0, 1.0, num_bars)
+        self.low = self.close - rng.uniform(0.0, 1.0, num_bars)
+        self.volume = rng.randint(100, 10000, num_bars).astype(np.float64)
+        # flat bars exercise the zero-range branches
+        self.high[20:25] = self.close[20:25]
+        self.low[20:25] = self.close[20:25]
+        self.close[40:43] = self.close[39]
+        self.columns = {
+            'high': self.high,
+            'low': self.low,
+            'close': self.close,
+            'volume': self.volume
+        }
+        hi = self.high
+        lo = self.low
+        cl = self.close
+        vol = self.volume
+        self.cases = [
+            (stream_talib.SMA(timeperiod=10),
+                lambda: talib.SMA(cl, timeperiod=10)),
+            (stream_talib.EMA(timeperiod=10),
+                lambda: talib.EMA(cl, timeperiod=10)),
+            (stream_talib.WMA(timeperiod=10),
+                lambda: talib.WMA(cl, timeperiod=10)),
+            (stream_talib.BBANDS(
+                timeperiod=5, nbdevup=2.0, nbdevdn=1.5, matype=0),
+                lambda: talib.BBANDS(
+                    cl, timeperiod=5, nbdevup=2.0, nbdevdn=1.5, matype=0)),
+            (stream_talib.BBANDS(
+                timeperiod=7, nbdevup=2.0, nbdevdn=2.0, matype=1),
+                lambda: talib.BBANDS(
+                    cl, timeperiod=7, nbdevup=2.0, nbdevdn=2.0, matype=1)),
+            (stream_talib.MOM(timeperiod=10),
+                lambda: talib.MOM(cl, timeperiod=10)),
+            (stream_talib.ROC(timeperiod=10),
+                lambda: talib.ROC(cl, timeperiod=10)),
+            (stream_talib.RSI(timeperiod=14),
+                lambda: talib.RSI(cl, timeperiod=14)),
+            (stream_talib.MACD(
+                fastperiod=12, slowperiod=26, signalperiod=9),
+                lambda: talib.MACD(
+                    cl, fastperiod=12, slowperiod=26, signalperiod=9)),
+            (stream_talib.MFI(timeperiod=14),
+                lambda: talib.MFI(hi, lo, cl, vol, timeperiod=14)),
+            (stream_talib.STOCHF(
+                fastk_period=5, fastd_period=3, fastd_matype=0),
+                lambda: talib.STOCHF(
+                    hi, lo, cl, fastk_period=5, fastd_period=3,
+                    fastd_matype=0)),
+            (stream_talib.STOCH(
+                fastk_period=14, slowk_period=3, slowk_matype=1,
+                slowd_period=4, slowd_matype=2),
+                lambda: talib.STOCH(
+                    hi, lo, cl, fastk_period=14, slowk_period=3,
+                    slowk_matype=1, slowd_period=4, slowd_matype=2)),
+            (stream_talib.WILLR(timeperiod=14),
+                lambda: talib.WILLR(hi, lo, cl, timeperiod=14)),
+            (stream_talib.ADX(timeperiod=14),
+                lambda: talib.ADX(hi, lo, cl, timeperiod=14)),
+            (stream_talib.AD(),
+                lambda: talib.AD(hi, lo, cl, vol)),
+            (stream_talib.ADOSC(fastperiod=3, slowperiod=10),
+                lambda: talib.ADOSC(
+                    hi, lo, cl, vol, fastperiod=3, slowperiod=10)),
+            (stream_talib.OBV(),
+                lambda: talib.OBV(cl, vol)),
+            (stream_talib.TRANGE(),
+                lambda: talib.TRANGE(hi, lo, cl)),
+            (stream_talib.ATR(timeperiod=14),
+                lambda: talib.ATR(hi, lo, cl, timeperiod=14)),
+            (stream_talib.NATR(timeperiod=14),
+                lambda: talib.NATR(hi, lo, cl, timeperiod=14))
+        ]
+    # end of setUp
+
+    def test_kernels_match_talib(self):
+        """test_kernels_match_talib"""
+        if not talib:
+            return
+        for kernel, call in self.cases:
+            name = kernel.__class__.__name__
+            expected = call()
+            if not isinstance(expected, tuple):
+                expected = (expected,)
+            columns = [
+                self.columns[column].tolist()
+                for column in kernel.inputs
+            ]
+            found = []
+            for values in zip(*columns):
+                value = kernel.update(*values)
+                if not isinstance(value, tuple):
+                    value = (value,)
+                found.append(value)
+            found = np.array(found, dtype=np.float64).T
+            for expected_values, found_values in zip(expected, found):
+                self.assertTrue(
+                    np.array_equal(
+                        np.isnan(expected_values),
+                        np.isnan(found_values)),
+                    f'{name} has a different lookback')
+                valid = ~np.isnan(expected_values)
+                self.assertTrue(
+                    np.allclose(
+                        expected_values[valid],
+                        found_values[valid],
+                        rtol=1e-8,
+                        atol=1e-8),
+                    f'{name} values do not match talib')
+            # seeding a history replays the same bars
+            last_value = np.array(kernel.value, dtype=np.float64)
+            kernel.update(*[column[0] for column in columns])
+            seed_value = np.array(
+                kernel.seed(*columns),
+                dtype=np.float64)
+            self.assertTrue(
+                np.array_equal(last_value, seed_value),
+                f'{name} seed does not match update')
+        # end of for all kernels
+    # end of test_kernels_match_talib
+
+    def test_known_values(self):
+        """test_known_values"""
+        sma = stream_talib.SMA(timeperiod=3)
+        self.assertTrue(np.isnan(sma.update(1.0)))
+        self.assertTrue(np.isnan(sma.update(2.0)))
+        self.assertEqual(sma.update(3.0), 2.0)
+        self.assertEqual(sma.update(4.0), 3.0)
+        obv = stream_talib.OBV()
+        self.assertEqual(
+            obv.seed(
+                [1.0, 2.0, 1.0],
+                [10.0, 20.0, 5.0]),
+            25.0)
+        self.assertEqual(
+            stream_talib.TRANGE().seed(
+                [3.0, 4.0],
+                [1.0, 2.0],
+                [2.0, 3.0]),
+            2.0)
+        self.assertTrue(isinstance(
+            stream_talib.build_ma(timeperiod=5, matype=1),
+            stream_talib.EMA))
+        with self.assertRaises(Exception):
+            stream_talib.build_ma(timeperiod=5, matype=8)
+        with self.assertRaises(NotImplementedError):
+            stream_talib.StreamKernel().update(1.0)
+    # end of test_known_values
+
+    def test_incremental_built_in_indicators(self):
+        """test_incremental_built_in_indicators"""
+        if not self.has_ta_lib:
+            return
+        minute_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-minute.json', 'r').read()))
+        minute_df['date'] = pd.to_datetime(
+            minute_df['date'])
+        daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+        daily_df['date'] = pd.to_datetime(
+            daily_df['date'])
+        percents = {
+            'category': 'technical',
+            'type': 'momentum',
+            'uses_data': 'minute',
+            'num_points': 10,
+            'buy_below_percent': 0.01,
+            'buy_above_percent': 0.01,
+            'sell_below_percent': 0.01,
+            'sell_above_percent': 0.01
+        }
+        kernel_indicators = [
+            dict(
+                percents,
+                name='trange_10',
+                module_path='analysis_engine/indicators/trange.py'),
+            dict(
+                percents,
+                name='wma_10',
+                module_path='analysis_engine/indicators/wma.py'),
+            dict(
+                percents,
+                name='bbands_10',
+                module_path='analysis_engine/indicators/bollinger_bands.py',
+                upper_stdev=2,
+                lower_stdev=2,
+                matype=0)
+        ]
+        process_indicators = [
+            dict(
+                percents,
+                name='ema_10',
+                module_path='analysis_engine/indicators/ema.py'),
+            dict(
+                percents,
+                name='rsi_10',
+                module_path='analysis_engine/indicators/rsi.py',
+                buy_below=30,
+                sell_above=70),
+            dict(
+                percents,
+                name='obv_10',
+                module_path='analysis_engine/indicators/obv.py')
+        ]
+
+        def run_algo(
+                use_indicators,
+                use_df,
+                indicator_mode=None):
+            config_dict = {
+                'name': 'test_stream_talib',
+                'timeseries': 'minute',
+                'trade_horizon': 5,
+                'buy_shares': 10,
+                'balance': 10000.0,
+                'buy_rules': {
+                    'min_indicators': 1
+                },
+                'sell_rules': {
+                    'min_indicators': 1
+                },
+                'indicators': use_indicators
+            }
+            if indicator_mode:
+                config_dict['indicator_mode'] = indicator_mode
+            algo = base_algo.BaseAlgo(
+                ticker='SPY',
+                balance=10000.0,
+                config_dict=config_dict)
+            algo.handle_data(
+                data={
+                    'SPY': [
+                        {
+                            'id': 'SPY_2018-11-07',
+                            'date': '2018-11-07',
+                            'data': {
+                                'daily': daily_df,
+                                'minute': use_df.copy()
+                            }
+                        }
+                    ]
+                })
+            return algo
+        # end of run_algo
+
+        def assert_same_results(
+                process_res,
+                inc_res):
+            for key in ['history', 'buys', 'sells']:
+                self.assertEqual(
+                    len(process_res[key]),
+                    len(inc_res[key]))
+                for process_row, inc_row in zip(
+                        process_res[key],
+                        inc_res[key]):
+                    self.assertEqual(
+                        {
+                            name: str(value)
+                            for name, value in process_row.items()
+                            if name != 'created'
+                        },
+                        {
+                            name: str(value)
+                            for name, value in inc_row.items()
+                            if name != 'created'
+                        })
+            self.assertEqual(
+                process_res['balance'],
+                inc_res['balance'])
+        # end of assert_same_results
+
+        # rows with missing closes inside the window
+        # fall back to process
+        missing_df = minute_df.copy()
+        missing_df.loc[[30, 31], 'close'] = np.nan
+        for use_df in [minute_df, missing_df]:
+            for ind in kernel_indicators + process_indicators:
+                process_algo = run_algo(
+                    use_indicators=[ind],
+                    use_df=use_df)
+                inc_algo = run_algo(
+                    use_indicators=[ind],
+                    use_df=use_df,
+                    indicator_mode='incremental')
+                inc_ind = inc_algo.iproc.get_indicators()[
+                    ind['name']]['obj']
+                self.assertEqual(
+                    inc_ind.is_incremental,
+                    ind in kernel_indicators)
+                process_res = process_algo.get_result()
+                if inc_ind.is_incremental:
+                    self.assertTrue(
+                        len(process_res['buys']) +
+                        len(process_res['sells']) > 0)
+                assert_same_results(
+                    process_res=process_res,
+                    inc_res=inc_algo.get_result())
+            # end of for all indicators
+        # end of for all datasets
+
+        # full_series lets the recursive kernels follow every bar
+        full_algo = run_algo(
+            use_indicators=process_indicators + [
+                dict(
+                    percents,
+                    name='macd_20',
+                    module_path='analysis_engine/indicators/macd.py',
+                    num_points=20,
+                    fast_period=12,
+                    slow_period=26,
+                    signal_period=9)
+            ],
+            use_df=minute_df,
+            indicator_mode='full_series')
+        for ind_id, node in full_algo.iproc.get_indicators().items():
+            self.assertTrue(node['obj'].is_incremental)
+        macd_ind = full_algo.iproc.get_indicators()['macd_20']['obj']
+        self.assertFalse(np.isnan(macd_ind.macd_value))
+        self.assertFalse(np.isnan(macd_ind.macd_signal))
+    # end of test_incremental_built_in_indicators
+
+# end of TestStreamTALib
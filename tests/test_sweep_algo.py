@@ -0,0 +1,154 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.sweep_algo.run_sweep
+- analysis_engine.sweep_algo.build_sweep_configs
+- analysis_engine.sweep_algo.get_max_drawdown
+
+"""
+
+import json
+import pandas as pd
+import analysis_engine.sweep_algo as sweep_algo
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestSweepAlgo(base_test.BaseTestCase):
+    """TestSweepAlgo"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        minute_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-minute.json', 'r').read()))
+        minute_df['date'] = pd.to_datetime(
+            minute_df['date'])
+        daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+        daily_df['date'] = pd.to_datetime(
+            daily_df['date'])
+        self.data = {
+            'SPY': [
+                {
+                    'id': 'SPY_2018-11-07',
+                    'date': '2018-11-07',
+                    'data': {
+                        'daily': daily_df,
+                        'minute': minute_df
+                    }
+                }
+            ]
+        }
+        self.config_dict = {
+            'name': 'test_sweep',
+            'ticker': 'SPY',
+            'timeseries': 'minute',
+            'trade_horizon': 5,
+            'buy_shares': 10,
+            'balance': 10000.0,
+            'buy_rules': {
+                'min_indicators': 1
+            },
+            'sell_rules': {
+                'min_indicators': 1
+            },
+            'indicators': [
+                {
+                    'name': 'willr',
+                    'module_path': (
+                        'analysis_engine/indicators/williamsr.py'),
+                    'category': 'technical',
+                    'type': 'momentum',
+                    'uses_data': 'minute',
+                    'num_points': 20,
+                    'buy_below': -80,
+                    'sell_above': -20
+                }
+            ]
+        }
+    # end of setUp
+
+    def test_build_sweep_configs(self):
+        """test_build_sweep_configs"""
+        configs = sweep_algo.build_sweep_configs(
+            config_dict=self.config_dict,
+            sweep_params={
+                'willr.num_points': [10, 20, 30],
+                'buy_shares': [5, 10]
+            })
+        self.assertEqual(len(configs), 6)
+        params, config_dict = configs[-1]
+        self.assertEqual(
+            params,
+            {
+                'willr.num_points': 30,
+                'buy_shares': 10
+            })
+        self.assertEqual(
+            config_dict['indicators'][0]['num_points'],
+            30)
+        self.assertEqual(
+            self.config_dict['indicators'][0]['num_points'],
+            20)
+        with self.assertRaises(Exception):
+            sweep_algo.build_sweep_configs(
+                config_dict=self.config_dict,
+                sweep_params={
+                    'missing.num_points': [10]
+                })
+    # end of test_build_sweep_configs
+
+    def test_get_max_drawdown(self):
+        """test_get_max_drawdown"""
+        self.assertEqual(
+            sweep_algo.get_max_drawdown([100.0, 110.0, 99.0, 120.0]),
+            0.1)
+        self.assertEqual(
+            sweep_algo.get_max_drawdown([]),
+            0.0)
+    # end of test_get_max_drawdown
+
+    def test_run_sweep_ranked_results(self):
+        """test_run_sweep_ranked_results"""
+        if not self.has_ta_lib:
+            return
+        sweep_params = {
+            'willr.num_points': [10, 20],
+            'willr.buy_below': [-90, -70]
+        }
+        worker_df = sweep_algo.run_sweep(
+            config_dict=self.config_dict,
+            sweep_params=sweep_params,
+            data=self.data,
+            num_workers=2)
+        serial_df = sweep_algo.run_sweep(
+            config_dict=self.config_dict,
+            sweep_params=sweep_params,
+            data=self.data,
+            num_workers=1)
+        self.assertEqual(len(worker_df.index), 4)
+        self.assertTrue(worker_df.equals(serial_df))
+        self.assertEqual(
+            list(worker_df['rank']),
+            [1, 2, 3, 4])
+        self.assertEqual(
+            list(worker_df['net_value']),
+            sorted(worker_df['net_value'], reverse=True))
+        for col in [
+                'balance',
+                'num_trades',
+                'max_drawdown',
+                'willr.num_points',
+                'willr.buy_below']:
+            self.assertTrue(col in worker_df)
+        self.assertTrue(worker_df['num_trades'].sum() > 0)
+
+        # the shared dataset is not changed by the runs
+        self.assertEqual(
+            len(self.data['SPY'][0]['data']['minute'].index),
+            len(json.loads(
+                open('tests/datasets/spy-minute.json', 'r').read())))
+    # end of test_run_sweep_ranked_results
+
+# end of TestSweepAlgo
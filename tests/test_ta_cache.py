@@ -0,0 +1,143 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.ta_cache.TACache
+- analysis_engine.ae_talib - ``cached``
+
+"""
+
+import json
+import numpy as np
+import pandas as pd
+import analysis_engine.ae_talib as ae_talib
+import analysis_engine.ohlcv_bundle as ohlcv_bundle
+import analysis_engine.ta_cache as ta_cache
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestTACache(base_test.BaseTestCase):
+    """TestTACache"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        self.minute_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-minute.json', 'r').read()))
+    # end of setUp
+
+    def build_bundle(
+            self,
+            cache,
+            num_rows):
+        """build_bundle
+
+        :param cache: ``TACache`` for the bundle
+        :param num_rows: number of leading rows
+        """
+        bundle = ohlcv_bundle.OHLCVBundle(
+            df=self.minute_df,
+            uses_data='minute').head(num_rows)
+        bundle.ta_cache = cache
+        return bundle
+    # end of build_bundle
+
+    def test_hits_and_misses(self):
+        """test_hits_and_misses"""
+        cache = ta_cache.TACache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        cache.start_bar()
+        self.assertEqual(cache.get(('a', 1), compute), 1)
+        self.assertEqual(cache.get(('a', 1), compute), 1)
+        self.assertEqual(cache.get(('a', 2), compute), 2)
+        self.assertEqual(cache.num_bar_hits, 1)
+        self.assertEqual(cache.num_bar_misses, 2)
+        cache.start_bar()
+        self.assertEqual(cache.num_bar_hits, 0)
+        self.assertEqual(cache.get(('a', 1), compute), 3)
+        # unhashable keys are computed every time
+        self.assertEqual(cache.get((['a'], 1), compute), 4)
+        summary = cache.get_summary()
+        self.assertEqual(summary['hits'], 1)
+        self.assertEqual(summary['misses'], 3)
+        self.assertEqual(summary['hit_rate'], 25.0)
+        json.dumps(summary)
+    # end of test_hits_and_misses
+
+    def test_disabled_cache(self):
+        """test_disabled_cache"""
+        cache = ta_cache.TACache(
+            enabled=False)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        cache.get('a', compute)
+        cache.get('a', compute)
+        self.assertEqual(len(calls), 2)
+        summary = cache.get_summary()
+        self.assertFalse(summary['enabled'])
+        self.assertEqual(summary['hits'], 0)
+        self.assertEqual(summary['hit_rate'], 0.0)
+    # end of test_disabled_cache
+
+    def test_cached_talib_call(self):
+        """test_cached_talib_call"""
+        cache = ta_cache.TACache()
+        cache.start_bar()
+        bundle = self.build_bundle(
+            cache=cache,
+            num_rows=40)
+        inputs = {
+            'high': 'high',
+            'low': 'low',
+            'close': 'close'
+        }
+        first = ae_talib.cached(
+            ohlcv=bundle,
+            func='WILLR',
+            inputs=inputs,
+            num_points=14,
+            timeperiod=14)
+        second = ae_talib.cached(
+            ohlcv=bundle,
+            func='WILLR',
+            inputs=inputs,
+            num_points=14,
+            timeperiod=14)
+        self.assertTrue(first is second)
+        self.assertFalse(first.flags['WRITEABLE'])
+        expected = ae_talib.WILLR(
+            high=bundle.window('high', 14),
+            low=bundle.window('low', 14),
+            close=bundle.window('close', 14),
+            timeperiod=14)
+        np.testing.assert_array_equal(first, expected)
+
+        # a different period or bar is a separate computation
+        ae_talib.cached(
+            ohlcv=bundle,
+            func='WILLR',
+            inputs=inputs,
+            num_points=10,
+            timeperiod=10)
+        ae_talib.cached(
+            ohlcv=self.build_bundle(
+                cache=cache,
+                num_rows=41),
+            func='WILLR',
+            inputs=inputs,
+            num_points=14,
+            timeperiod=14)
+        self.assertEqual(cache.num_bar_hits, 1)
+        self.assertEqual(cache.num_bar_misses, 3)
+    # end of test_cached_talib_call
+
+# end of TestTACache
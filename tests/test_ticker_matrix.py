@@ -0,0 +1,276 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.ticker_matrix.TickerMatrix
+- analysis_engine.ae_talib - ``rows``
+- analysis_engine.indicators.indicator_processor.IndicatorProcessor -
+  ``precompute_tickers`` and ``load_ticker_batches``
+- analysis_engine.algo.BaseAlgo - ``cross_ticker``
+
+"""
+
+import json
+import numpy as np
+import pandas as pd
+import analysis_engine.ae_talib as ae_talib
+import analysis_engine.algo as base_algo
+import analysis_engine.ticker_matrix as ticker_matrix
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestTickerMatrix(base_test.BaseTestCase):
+    """TestTickerMatrix"""
+
+    def setUp(
+            self):
+        """setUp"""
+        super().setUp()
+        self.tickers = [
+            'SPY',
+            'QQQ',
+            'IWM'
+        ]
+        self.daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+        self.frames = {}
+        for idx, ticker in enumerate(self.tickers):
+            use_df = self.daily_df.copy()
+            for col in ['open', 'high', 'low', 'close']:
+                use_df[col] = use_df[col] * (1.0 + (0.01 * idx))
+            # scramble the prices so each ticker has its own signals
+            use_df['close'] = use_df['close'].values[
+                np.random.RandomState(idx).permutation(len(use_df.index))]
+            use_df['high'] = np.maximum(use_df['high'], use_df['close'])
+            use_df['low'] = np.minimum(use_df['low'], use_df['close'])
+            self.frames[ticker] = use_df
+        # end of for all tickers
+    # end of setUp
+
+    def test_rows_match_single_calls(self):
+        """test_rows_match_single_calls"""
+        closes = np.vstack([
+            self.frames[ticker]['close'].values
+            for ticker in self.tickers
+        ])
+        highs = np.vstack([
+            self.frames[ticker]['high'].values
+            for ticker in self.tickers
+        ])
+        lows = np.vstack([
+            self.frames[ticker]['low'].values
+            for ticker in self.tickers
+        ])
+        willr = ae_talib.rows(
+            'WILLR',
+            14,
+            highs,
+            lows,
+            closes)
+        rsi = ae_talib.rows(
+            'RSI',
+            10,
+            closes)
+        self.assertEqual(willr.shape, closes.shape)
+        for row in range(len(self.tickers)):
+            np.testing.assert_allclose(
+                willr[row],
+                ae_talib.WILLR(
+                    highs[row],
+                    lows[row],
+                    closes[row],
+                    timeperiod=14))
+            np.testing.assert_allclose(
+                rsi[row],
+                ae_talib.RSI(
+                    closes[row],
+                    timeperiod=10))
+        # end of for all rows
+        self.assertEqual(
+            ae_talib.rows('RSI', 10, closes[0:0]).shape,
+            (0, closes.shape[1]))
+    # end of test_rows_match_single_calls
+
+    def test_align_tickers(self):
+        """test_align_tickers"""
+        frames = dict(self.frames)
+        # a later listing and a ticker with a missing date
+        frames['QQQ'] = frames['QQQ'].iloc[20:]
+        frames['IWM'] = frames['IWM'].drop(
+            frames['IWM'].index[50])
+        frames['DIA'] = self.frames['SPY'].drop(columns=['date'])
+        matrix = ticker_matrix.TickerMatrix(
+            frames=frames,
+            uses_data='daily')
+        num_rows = len(self.daily_df.index)
+        self.assertEqual(len(matrix), 4)
+        self.assertEqual(matrix.num_dates, num_rows)
+        self.assertEqual(
+            matrix.arrays['close'].shape,
+            (4, num_rows))
+        self.assertEqual(matrix.spans['SPY'], (0, num_rows))
+        self.assertEqual(matrix.spans['QQQ'], (20, num_rows))
+        self.assertIsNone(matrix.spans['IWM'])
+        self.assertIsNone(matrix.spans['DIA'])
+        self.assertTrue(np.isnan(matrix.arrays['close'][1, 0:20]).all())
+        self.assertTrue(np.isnan(matrix.arrays['close'][2, 50]))
+        self.assertEqual(len(matrix.get_groups()), 4)
+
+        willr = matrix.compute(
+            func='WILLR',
+            cols=['high', 'low', 'close'],
+            timeperiod=14)
+        rsi = matrix.compute(
+            func='RSI',
+            cols=['close'],
+            timeperiod=10)
+        for ticker, df in frames.items():
+            np.testing.assert_allclose(
+                willr[ticker],
+                ae_talib.WILLR(
+                    df['high'].values,
+                    df['low'].values,
+                    df['close'].values,
+                    timeperiod=14))
+            np.testing.assert_allclose(
+                rsi[ticker],
+                ae_talib.RSI(
+                    df['close'].values,
+                    timeperiod=10))
+        # end of for all tickers
+
+        # tickers without the columns are left out
+        self.assertEqual(
+            matrix.compute(
+                func='RSI',
+                cols=['missing'],
+                timeperiod=10),
+            {})
+    # end of test_align_tickers
+
+    def run_algo(
+            self,
+            cross_ticker=False):
+        """run_algo
+
+        :param cross_ticker: boolean for ``cross_ticker``
+        """
+        indicators = []
+        for num_points in [10, 14]:
+            for name in ['williamsr', 'williamsr_open']:
+                indicators.append({
+                    'name': f'{name}_{num_points}',
+                    'module_path': (
+                        f'analysis_engine/indicators/{name}.py'),
+                    'category': 'technical',
+                    'type': 'momentum',
+                    'uses_data': 'daily',
+                    'num_points': num_points,
+                    'buy_below': -70,
+                    'sell_above': -30
+                })
+        indicators.append({
+            'name': 'obv',
+            'module_path': 'analysis_engine/indicators/obv.py',
+            'category': 'technical',
+            'type': 'momentum',
+            'uses_data': 'daily',
+            'num_points': 10,
+            'buy_below_percent': 5,
+            'buy_above_percent': 5,
+            'sell_below_percent': 5,
+            'sell_above_percent': 5
+        })
+        config_dict = {
+            'name': 'test_cross_ticker',
+            'timeseries': 'day',
+            'trade_horizon': 5,
+            'buy_shares': 10,
+            'balance': 1000000.0,
+            'buy_rules': {
+                'min_indicators': 2
+            },
+            'sell_rules': {
+                'min_indicators': 2
+            },
+            'cross_ticker': cross_ticker,
+            'indicators': indicators
+        }
+        algo = base_algo.BaseAlgo(
+            ticker=self.tickers[0],
+            tickers=self.tickers,
+            balance=1000000.0,
+            config_dict=config_dict)
+        data = {}
+        for ticker in self.tickers:
+            df = self.frames[ticker]
+            data[ticker] = []
+            for end_idx in range(20, len(df.index) + 1):
+                date = str(df['date'].iloc[end_idx - 1])[0:10]
+                data[ticker].append({
+                    'id': f'{ticker}_{date}',
+                    'date': date,
+                    'data': {
+                        'daily': df.iloc[0:end_idx]
+                    }
+                })
+        # end of for all tickers
+        algo.handle_data(
+            data=data)
+        return algo
+    # end of run_algo
+
+    def test_cross_ticker_matches_process(self):
+        """test_cross_ticker_matches_process"""
+        if not self.has_ta_lib:
+            return
+        serial_algo = self.run_algo()
+        cross_algo = self.run_algo(
+            cross_ticker=True)
+        self.assertTrue(cross_algo.cross_ticker)
+        self.assertEqual(cross_algo.cross_ticker_datasets, {})
+
+        def get_signals(
+                algo):
+            return [
+                (
+                    report['ticker'],
+                    report['date'],
+                    [node['id'] for node in report['buys']],
+                    [node['id'] for node in report['sells']]
+                )
+                for report in algo.iproc.reports
+            ]
+
+        serial_signals = get_signals(serial_algo)
+        self.assertEqual(
+            serial_signals,
+            get_signals(cross_algo))
+        self.assertTrue(any(node[2] for node in serial_signals))
+        self.assertTrue(any(node[3] for node in serial_signals))
+
+        serial_res = serial_algo.get_result()
+        cross_res = cross_algo.get_result()
+        self.assertEqual(
+            [(node['ticker'], node['close'])
+             for node in serial_res['history']],
+            [(node['ticker'], node['close'])
+             for node in cross_res['history']])
+        self.assertEqual(
+            len(serial_res['buys']),
+            len(cross_res['buys']))
+        self.assertEqual(
+            len(serial_res['sells']),
+            len(cross_res['sells']))
+        self.assertAlmostEqual(
+            serial_res['balance'],
+            cross_res['balance'])
+
+        # the williamsr indicators were looked up
+        for ind_id in cross_algo.iproc.ind_dict:
+            ind_obj = cross_algo.iproc.ind_dict[ind_id]['obj']
+            self.assertEqual(
+                ind_obj.is_precomputed,
+                ind_obj.get_batch_call() is not None)
+    # end of test_cross_ticker_matches_process
+
+# end of TestTickerMatrix
@@ -0,0 +1,279 @@
+"""
+Test file for classes and functions:
+
+- analysis_engine.trade_history_recorder.TradeHistoryRecorder
+- analysis_engine.algo.BaseAlgo.get_history
+- analysis_engine.algo.BaseAlgo.get_history_df
+
+"""
+
+import json
+import pandas as pd
+import analysis_engine.algo as base_algo
+import analysis_engine.trade_history_recorder as history_recorder
+import analysis_engine.mocks.base_test as base_test
+
+
+class TestTradeHistoryRecorder(base_test.BaseTestCase):
+    """TestTradeHistoryRecorder"""
+
+    def build_records(
+            self,
+            num_records=10):
+        """build_records
+
+        :param num_records: number of history records
+        """
+        records = []
+        for idx in range(num_records):
+            records.append({
+                'ticker': 'SPY',
+                'minute': f'2018-11-07 09:{30 + idx}:00',
+                'close': 280.0 + (0.25 * idx),
+                'num_owned': idx * 10,
+                'buy_now': (idx % 2 == 0),
+                'stop_loss': None,
+                'prev_num_owned': None if idx == 0 else float(idx),
+                'version': 1
+            })
+        return records
+    # end of build_records
+
+    def test_records_round_trip(self):
+        """test_records_round_trip"""
+        records = self.build_records(
+            num_records=50)
+        recorder = history_recorder.TradeHistoryRecorder(
+            capacity=4)
+        for record in records:
+            recorder.append(record)
+        self.assertEqual(
+            len(recorder),
+            50)
+        self.assertEqual(
+            recorder.to_records(),
+            records)
+        self.assertEqual(
+            recorder[-1],
+            records[-1])
+        for exported, record in zip(recorder, records):
+            for key in record:
+                self.assertEqual(
+                    type(exported[key]),
+                    type(record[key]))
+        self.assertEqual(
+            recorder.get_column('close'),
+            [record['close'] for record in records])
+        self.assertEqual(
+            recorder.get_column('not_a_key'),
+            [None] * 50)
+        # constant and mixed type columns
+        self.assertIn(
+            'stop_loss',
+            recorder.constants)
+        self.assertNotIn(
+            'prev_num_owned',
+            recorder.column_types)
+        self.assertIn(
+            'close',
+            recorder.column_types)
+    # end of test_records_round_trip
+
+    def test_missing_and_new_keys(self):
+        """test_missing_and_new_keys"""
+        records = self.build_records(
+            num_records=5)
+        records[2]['note'] = 'bought'
+        records[3].pop('close')
+        recorder = history_recorder.TradeHistoryRecorder()
+        recorder.extend(records)
+        self.assertEqual(
+            recorder.to_records(),
+            records)
+        self.assertEqual(
+            recorder.get_column('note'),
+            [None, None, 'bought', None, None])
+    # end of test_missing_and_new_keys
+
+    def test_append_keys_and_values(self):
+        """test_append_keys_and_values"""
+        records = self.build_records(
+            num_records=6)
+        keys = [
+            'willr_value',
+            'close',
+            'note'
+        ]
+        recorder = history_recorder.TradeHistoryRecorder(
+            capacity=2)
+        expected = []
+        for idx, record in enumerate(records):
+            values = [
+                -50.0 - idx,
+                300.0 + idx,
+                'bought' if idx == 3 else None
+            ]
+            recorder.append(
+                dict(record),
+                keys=keys,
+                values=values)
+            record.update(zip(keys, values))
+            expected.append(record)
+        # a row without the extra keys
+        recorder.append(self.build_records(1)[0])
+        expected.append(self.build_records(1)[0])
+        recorder.append({'ticker': 'SPY'})
+        expected.append({'ticker': 'SPY'})
+        self.assertEqual(
+            recorder.to_records(),
+            expected)
+        self.assertEqual(
+            recorder.get_column('note'),
+            [None, None, None, 'bought', None, None, None, None])
+        self.assertEqual(
+            recorder.get_column('willr_value')[0:6],
+            [-50.0 - idx for idx in range(6)])
+    # end of test_append_keys_and_values
+
+    def test_to_df(self):
+        """test_to_df"""
+        records = self.build_records(
+            num_records=20)
+        recorder = history_recorder.TradeHistoryRecorder()
+        recorder.extend(records)
+        pd.testing.assert_frame_equal(
+            recorder.to_df(),
+            pd.DataFrame(records))
+    # end of test_to_df
+
+    def run_algo(
+            self,
+            history_mode=None,
+            flat_reports=False):
+        """run_algo
+
+        :param history_mode: optional - trading history mode
+        :param flat_reports: optional - boolean for
+            ``flat_reports``
+        """
+        minute_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-minute.json', 'r').read()))
+        minute_df['date'] = pd.to_datetime(
+            minute_df['date'])
+        daily_df = pd.DataFrame(json.loads(
+            open('tests/datasets/spy-daily.json', 'r').read()))
+        daily_df['date'] = pd.to_datetime(
+            daily_df['date'])
+        config_dict = {
+            'name': 'test_history_mode',
+            'timeseries': 'minute',
+            'trade_horizon': 5,
+            'buy_shares': 10,
+            'balance': 10000.0,
+            'buy_rules': {
+                'min_indicators': 1
+            },
+            'sell_rules': {
+                'min_indicators': 1
+            },
+            'indicators': [
+                {
+                    'name': 'willr_10',
+                    'module_path': (
+                        'analysis_engine/indicators/williamsr.py'),
+                    'category': 'technical',
+                    'type': 'momentum',
+                    'uses_data': 'minute',
+                    'num_points': 10,
+                    'buy_below': -70,
+                    'sell_above': -30
+                }
+            ]
+        }
+        if history_mode:
+            config_dict['history_mode'] = history_mode
+        if flat_reports:
+            config_dict['flat_reports'] = flat_reports
+        algo = base_algo.BaseAlgo(
+            ticker='SPY',
+            balance=10000.0,
+            config_dict=config_dict)
+        algo.handle_data(
+            data={
+                'SPY': [
+                    {
+                        'id': 'SPY_2018-11-07',
+                        'date': '2018-11-07',
+                        'data': {
+                            'daily': daily_df,
+                            'minute': minute_df
+                        }
+                    }
+                ]
+            })
+        return algo
+    # end of run_algo
+
+    def test_columnar_history_mode_matches_dict(self):
+        """test_columnar_history_mode_matches_dict"""
+        if not self.has_ta_lib:
+            return
+        dict_algo = self.run_algo()
+        columnar_algo = self.run_algo(
+            history_mode='columnar')
+        self.assertTrue(
+            isinstance(
+                columnar_algo.order_history,
+                history_recorder.TradeHistoryRecorder))
+        dict_res = dict_algo.get_result()
+        columnar_res = columnar_algo.get_result()
+        self.assertTrue(len(dict_res['history']) > 0)
+        self.assertEqual(
+            dict_res['history'],
+            columnar_res['history'])
+        self.assertEqual(
+            dict_res['num_processed'],
+            columnar_res['num_processed'])
+        self.assertEqual(
+            dict_algo.get_history_column('net_value'),
+            columnar_algo.get_history_column('net_value'))
+        self.assertEqual(
+            len(columnar_algo.get_history_df().index),
+            len(dict_res['history']))
+    # end of test_columnar_history_mode_matches_dict
+
+    def test_flat_reports_match_dict(self):
+        """test_flat_reports_match_dict"""
+        if not self.has_ta_lib:
+            return
+        dict_algo = self.run_algo()
+        flat_algo = self.run_algo(
+            history_mode='columnar',
+            flat_reports=True)
+        self.assertTrue(flat_algo.flat_reports)
+        self.assertIsNotNone(flat_algo.iproc.get_flat_report())
+        dict_res = dict_algo.get_result()
+        flat_res = flat_algo.get_result()
+        self.assertTrue(len(dict_res['history']) > 0)
+        self.assertEqual(
+            dict_res['history'][-1]['willr_10_num_points'],
+            10)
+        self.assertEqual(
+            dict_res['history'],
+            flat_res['history'])
+
+        # the report dictionary is only built when it is read
+        self.assertFalse(dict_algo.iproc.lazy_report)
+        self.assertTrue(flat_algo.iproc.lazy_report)
+        self.assertTrue(any(
+            'willr_10_num_points' not in report
+            for report in flat_algo.iproc.reports))
+        self.assertEqual(
+            flat_algo.get_latest_ind_report(),
+            dict_algo.get_latest_ind_report())
+        self.assertEqual(
+            flat_algo.latest_ind_report['willr_10_num_points'],
+            10)
+    # end of test_flat_reports_match_dict
+
+# end of TestTradeHistoryRecorder